@@ -1,10 +1,50 @@
+import math
+import os
+import sys
+import time
+
 import pygame
 import numpy as np
 from pygame.locals import *
 from OpenGL.GL import *
-from OpenGL.GLU import *
+
+import scene_clip
+import tessellation
+from camera2d import ZOOM_STEP, Camera2D
+from clipping import (
+    OUTSIDE,
+    CROSSING,
+    FULLY_INSIDE,
+    bboxes_touch,
+    classify_bboxes,
+    outline_segments,
+    swept_bands,
+)
+from history import Command, History
+from input_log import MouseState, Recorder
+from profiler import FrameProfiler
+from render_state import RenderMode
+from renderer import SceneRenderer2D
+from scene_store import TYPE_CODES, TYPE_NAMES, SceneStore
+from spatial import SpatialGrid
+from static_geometry import StaticGeometry, floor_grid, grid_rect
+from tessellation import (
+    ellipse_outline,
+    ellipse_vertices,
+    screen_radius,
+    segments_for,
+)
+from ui_text import TextCache
 
 WIDTH, HEIGHT = 800, 600
+PX_PER_UNIT = (WIDTH / 20, HEIGHT / 20)   # tampilan awal kamera 2D (zoom 1)
+MAX_FPS = 60              # batas frame rate loop berbasis event
+GRID_EXTENT = 10          # grid 2D & lantai 3D: [-GRID_EXTENT, GRID_EXTENT]
+GRID_SPACINGS = (0.125, 0.25, 0.5, 1.0, 2.0, 5.0)   # pilihan [ / ]
+GRID_MAX_LINES = 200      # per sumbu; saat zoom out jarak grid 2D digandakan
+CULL_MARGIN_PX = 4        # titik (5 px) & garis tebal melewati bbox-nya
+FOVY, Z_NEAR, Z_FAR = 45, 0.1, 50   # proyeksi 3D (juga dipakai frustum culling)
+CAPTION = "Project UAS Grafika Komputer I | 202310370311436 - 202310370311433"
 BG_COLOR = (0.1, 0.1, 0.1, 1.0)
 COLORS = {
     "red": (1, 0, 0),
@@ -17,7 +57,8 @@ COLORS = {
 }
 
 current_mode = "2D"
-objects_2d: list = []
+scene = SceneStore()
+objects_2d = scene.objects              # view Object2D, urut tumpukan
 current_type = None
 current_color = COLORS["red"]
 line_thickness = 1.0
@@ -31,12 +72,59 @@ last_mouse_pos = None
 
 selected_object = None
 transform_mode = None
+scene_message = None      # galat Ctrl+S / Ctrl+O terakhir, ditampilkan draw_ui
 
 line_pivot = None
 line_unit_dir = (0.0, 0.0)
 line_init_len = 0.0
 
-cube = None
+# True: gambar ulang hanya bila ada event (MOUSEMOTION digabung per batch);
+# False: loop lama, gambar terus + wait(10). Toggle F4.
+event_driven = True
+
+# posisi & tombol mouse diambil dari event yang sudah diproses (bukan status
+# OS) supaya sesi rekaman GRAFKOM_RECORD=path.gkr bisa diputar ulang persis
+# oleh replay.py; input_player (input_log.Player) menggantikan pygame.event
+mouse = MouseState()
+input_player = None
+recorder = None          # input_log.Recorder sesi GRAFKOM_RECORD (dibuat main)
+external_gl = False      # True: konteks GL sudah dibuat di luar SDL (headless.py)
+rng = None               # np.random.Generator; dibuat saat pertama dipakai (startup)
+
+scene_version = 0
+_scene_pack: dict = {}
+_clip_state: dict = {}
+
+PICK_TOL = 0.5
+# bbox objek (+ PICK_TOL) untuk picking, sekaligus culling frame 2D
+pick_index = SpatialGrid(cell_size=1.0)
+# Ctrl+Z / Ctrl+Y; anggaran memori riwayat (byte) bisa diatur lewat env
+history = History(int(os.environ.get("GRAFKOM_HISTORY_BUDGET", 64 << 20)))
+SCENE_PATH = os.environ.get("GRAFKOM_SCENE", "scene.gks")   # Ctrl+S / Ctrl+O
+# pan (drag tombol tengah) & zoom (roda mouse) mode 2D; Home = tampilan awal
+camera = Camera2D(WIDTH, HEIGHT)
+scene_renderer = SceneRenderer2D(objects_2d, PX_PER_UNIT, matrices=(camera.home, np.eye(4)))
+ui_text = TextCache("Arial", 18)
+hud_text = TextCache("Courier New", 14)
+# F3: overlay profiler; F6: trace log JSONL (atau env GRAFKOM_TRACE=path)
+profiler = FrameProfiler()
+# F9: tangkap satu frame (PNG); F10: tangkap setiap frame ke direktori PNG
+# (atau env GRAFKOM_CAPTURE=dir / file.rgba sejak awal); FrameCapture dibuat
+# saat tangkapan pertama (frame_capture)
+capture = None
+
+# jarak grid 2D (unit dunia); lantai 3D memakai dua kalinya
+grid_spacing = 1.0
+grid_2d = StaticGeometry(GL_LINES, grid_rect)
+floor_3d = StaticGeometry(GL_LINES, floor_grid)
+
+# scene 3D: model & transformasinya (kolom NumPy), digambar dengan culling + LOD.
+# Modul 3D (scene3d, mesh, instancing) diimpor dan scene-nya dibangun saat mode
+# 3D pertama kali dipakai (setup_3d), bukan saat startup
+scene_3d = None
+cube = None                              # model utama yang digerakkan drag mouse
+model_paths = []                         # file .obj / .ply dari argumen main()
+show_voxels = False                      # V: medan voxel (lihat ``voxels``)
 camera_pos = [0, 0, 5]
 camera_target = [0, 0, 0]
 camera_up = [0, 1, 0]
@@ -45,23 +133,152 @@ def is_transforming() -> bool:
     return transform_mode in ("Translasi", "rotate", "scale")
 
 class Point2D:
+    __slots__ = ("x", "y")
+
     def __init__(self, x: float, y: float):
         self.x = x
         self.y = y
 
 class Object2D:
-    def __init__(self, obj_type: str, points: list[Point2D], color, thickness=1.0):
-        self.obj_type = obj_type
-        self.points = points                             
-        self.original_points = [Point2D(p.x, p.y) for p in points]
-        self.color = color
-        self.original_color = color
-        self.thickness = thickness
-        self.translation = [0.0, 0.0]
-        self.rotation = 0.0                               
-        self.scale = [1.0, 1.0]
-
-    # --------- gambar ----------
+    """
+    View ke satu baris SceneStore. Membuat Object2D langsung menyimpan
+    geometrinya di store (default: scene), jadi objeknya langsung muncul di
+    objects_2d. Dua view dengan store & indeks sama dianggap objek yang sama.
+    """
+    __slots__ = ("store", "index")
+
+    def __init__(self, obj_type: str, points: list[Point2D], color, thickness=1.0, store=None):
+        self.store = scene if store is None else store
+        self.index = self.store.add(
+            obj_type, [(p.x, p.y) for p in points], color, thickness
+        )
+
+    @classmethod
+    def bind(cls, store, index):
+        """View untuk baris yang sudah ada di store."""
+        obj = cls.__new__(cls)
+        obj.store = store
+        obj.index = index
+        return obj
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, Object2D)
+            and self.index == other.index
+            and self.store is other.store
+        )
+
+    def __hash__(self):
+        # indeks sudah unik dalam satu store; store lain dibedakan oleh __eq__
+        return self.index
+
+    @property
+    def tessellation(self):
+        """Cache verteks elips (lihat tessellation.ellipse_outline)."""
+        return self.store.tess_cache.get(self.index)
+
+    @tessellation.setter
+    def tessellation(self, value):
+        self.store.tess_cache[self.index] = value
+
+    @property
+    def obj_type(self):
+        return TYPE_NAMES[self.store.types[self.index]]
+
+    @property
+    def points(self):
+        return self.store.points(self.index)
+
+    @points.setter
+    def points(self, pts):
+        self.store.set_points(self.index, pts)
+
+    @property
+    def original_points(self):
+        return self.store.original_points(self.index)
+
+    def coords(self):
+        """Koordinat tampil (N, 2); kosong jika objek tersembunyi."""
+        if not self.store.visible[self.index]:
+            return np.empty((0, 2))
+        return self.points.array()
+
+    def original_coords(self):
+        return self.original_points.array()
+
+    @property
+    def color(self):
+        return tuple(self.store.color[self.index].tolist())
+
+    @color.setter
+    def color(self, rgb):
+        self.store.color[self.index] = rgb
+
+    @property
+    def original_color(self):
+        return tuple(self.store.orig_color[self.index].tolist())
+
+    @property
+    def thickness(self):
+        return float(self.store.thickness[self.index])
+
+    @thickness.setter
+    def thickness(self, value):
+        self.store.thickness[self.index] = value
+
+    @property
+    def translation(self):
+        return self.store.translation[self.index]       # view, bisa di-+=
+
+    @translation.setter
+    def translation(self, value):
+        self.store.translation[self.index] = value
+        self.store.invalidate_transform(self.index)
+
+    @property
+    def rotation(self):
+        return float(self.store.rotation[self.index])
+
+    @rotation.setter
+    def rotation(self, value):
+        self.store.rotation[self.index] = value
+        self.store.invalidate_transform(self.index)
+
+    @property
+    def scale(self):
+        return self.store.scale[self.index]             # view, bisa di-+=
+
+    @scale.setter
+    def scale(self, value):
+        self.store.scale[self.index] = value
+        self.store.invalidate_transform(self.index)
+
+    def invalidate_transform(self):
+        """Wajib setelah mengubah view translation/scale di tempat (``+=``)."""
+        self.store.invalidate_transform(self.index)
+
+    @property
+    def matrix(self):
+        """Matriks affine 3x3 (cache) titik asli ➜ dunia."""
+        return self.store.matrices([self.index])[0]
+
+    @property
+    def inverse_matrix(self):
+        return self.store.inverse_matrices([self.index])[0]
+
+    def to_local(self, x, y):
+        """Titik dunia (x, y) ke koordinat titik asli objek ini."""
+        store, i = self.store, self.index
+        if store.xform_dirty[i]:
+            store.update_transforms([i])
+        (a, b, c), (d, e, f) = store.affine_inv[i, :2].tolist()
+        return a * x + b * y + c, d * x + e * y + f
+
+    # --------- gambar (immediate mode; acuan untuk renderer.py) ----------
+    def clipped_outline(self):
+        """(verts dunia, flag sisi tepi window) hasil kliping bentuk, atau None."""
+        return self.store.clipped.get(self.index)
+
     def draw(self):
         if len(self.points) == 0:
             return
@@ -71,6 +288,16 @@ class Object2D:
         glColor3fv(self.color)
         glLineWidth(self.thickness)
 
+        # Bentuk yang terpotong window: outline hasil kliping (koordinat dunia)
+        clipped = self.clipped_outline()
+        if clipped is not None:
+            verts, boundary = clipped
+            glBegin(GL_LINES)
+            for x, y in outline_segments(verts, [len(verts)], boundary).reshape(-1, 2).tolist():
+                glVertex2f(x, y)
+            glEnd()
+            return
+
         # Garis digambar langsung (tanpa matrix) supaya pivot‑transform mudah
         if self.obj_type == "line":
             glBegin(GL_LINES)
@@ -135,79 +362,213 @@ class Object2D:
             glScalef(*self.scale, 1)
 
             glBegin(GL_LINE_LOOP)
-            for i in range(100):
-                ang = 2 * np.pi * i / 100
-                glVertex2f(radius.x * np.cos(ang), radius.y * np.sin(ang))
+            for vx, vy in ellipse_outline(self, PX_PER_UNIT).tolist():
+                glVertex2f(vx, vy)
             glEnd()
             glPopMatrix()
             return
 
+        # tipe lain (polygon) belum punya gambar; jangan bocorkan push matrix
+        glPopMatrix()
+
     def bounding_box(self):
-        xs = [p.x for p in self.original_points]
-        ys = [p.y for p in self.original_points]
-        return min(xs), min(ys), max(xs), max(ys)
+        """Bbox dunia (setelah transformasi), dari cache store."""
+        return tuple(float(v[0]) for v in self.store.world_bboxes([self.index]))
 
-class Cube3D:
-    def __init__(self):
-        self.vertices = [
-            [1, 1, 1], [1, 1, -1], [1, -1, 1], [1, -1, -1],
-            [-1, 1, 1], [-1, 1, -1], [-1, -1, 1], [-1, -1, -1]
-        ]
-        self.faces = [
-            [0, 1, 3, 2], [4, 5, 7, 6], [0, 1, 5, 4],
-            [2, 3, 7, 6], [0, 2, 6, 4], [1, 3, 7, 5]
-        ]
-        self.colors = [
-            [1, 0, 0], [0, 1, 0], [0, 0, 1],
-            [1, 1, 0], [1, 0, 1], [0, 1, 1]
-        ]
-        self.rotation = [0, 0, 0]
-        self.translation = [0, 0, 0]
+scene.view_factory = Object2D.bind
+
+class Model3D:
+    """
+    View (scene, indeks) ke satu objek Scene3D. ``rotation`` (derajat per
+    sumbu) dan ``translation`` adalah baris array scene, jadi diubah di
+    tempat oleh drag mouse di mode 3D.
+    """
+
+    def __init__(self, mesh, color=(0.8, 0.8, 0.8), scene=None):
+        from scene3d import LodMesh, Scene3D
+        self.scene = scene if scene is not None else Scene3D()
+        lod = mesh if isinstance(mesh, LodMesh) else LodMesh(mesh)
+        self.index = self.scene.add(lod, color=color)
+
+    @classmethod
+    def load(cls, path, scene=None):
+        """Model dari file .obj / .ply, dipusatkan & diskalakan seukuran kubus bawaan."""
+        from mesh import load_mesh
+        return cls(load_mesh(path).normalized(2.0), scene=scene)
+
+    @property
+    def lod(self):
+        return self.scene.lods[self.scene.model[self.index]]
+
+    @property
+    def mesh(self):
+        return self.lod.mesh
+
+    @property
+    def gpu(self):
+        return self.lod.gpu[0]
+
+    # baris diambil ulang setiap akses karena scene bisa realokasi saat tumbuh
+    @property
+    def translation(self):
+        return self.scene.translation[self.index]
+
+    @translation.setter
+    def translation(self, value):
+        self.scene.translation[self.index] = value
+
+    @property
+    def rotation(self):
+        return self.scene.rotation[self.index]
+
+    @rotation.setter
+    def rotation(self, value):
+        self.scene.rotation[self.index] = value
 
     def draw(self):
-        glPushMatrix()
-        glTranslatef(*self.translation)
-        glRotatef(self.rotation[0], 1, 0, 0)
-        glRotatef(self.rotation[1], 0, 1, 0)
-        glRotatef(self.rotation[2], 0, 0, 1)
-        glBegin(GL_QUADS)
-        for i, face in enumerate(self.faces):
-            glColor3fv(self.colors[i])
-            for v in face:
-                glVertex3fv(self.vertices[v])
-        glEnd()
-        glPopMatrix()
+        """Gambar model ini saja dengan detail penuh (tanpa culling)."""
+        self.scene.draw_object(self.index)
+
+class Cube3D(Model3D):
+    """Kubus bawaan: 6 sisi berwarna, tiap sisi dua segitiga dengan normal sisi."""
+
+    vertices = [
+        [1, 1, 1], [1, 1, -1], [1, -1, 1], [1, -1, -1],
+        [-1, 1, 1], [-1, 1, -1], [-1, -1, 1], [-1, -1, -1]
+    ]
+    faces = [
+        [0, 1, 3, 2], [4, 5, 7, 6], [0, 1, 5, 4],
+        [2, 3, 7, 6], [0, 2, 6, 4], [1, 3, 7, 5]
+    ]
+    colors = [
+        [1, 0, 0], [0, 1, 0], [0, 0, 1],
+        [1, 1, 0], [1, 0, 1], [0, 1, 1]
+    ]
+
+    def __init__(self, scene=None):
+        super().__init__(self.box(), scene=scene)
+
+    @classmethod
+    def box(cls, size=1.0):
+        """Mesh kubus dengan setengah sisi ``size`` (kubus bawaan: 1)."""
+        from mesh import box_mesh
+        return box_mesh(np.asarray(cls.vertices) * size, cls.faces, cls.colors)
+
+# medan voxel: ribuan kubus kecil lewat instanced rendering (build_voxels)
+VOXEL_GRID = 64
+voxels = None
+
+def setup_3d():
+    """
+    Impor modul 3D dan bangun scene 3D saat pertama dibutuhkan (F2, argumen
+    model): model dari ``model_paths`` (yang pertama digerakkan mouse) atau
+    kubus bawaan, plus status render "3D". Mengembalikan scene_3d.
+    """
+    global scene_3d, cube
+    if scene_3d is not None:
+        return scene_3d
+    import mesh
+    import scene3d
+    if "3D" not in render_modes:
+        render_modes["3D"] = RenderMode(
+            "3D", scene3d.perspective(FOVY, WIDTH / HEIGHT, Z_NEAR, Z_FAR),
+            enable=(GL_DEPTH_TEST, GL_LIGHTING, GL_LIGHT0, GL_COLOR_MATERIAL), setup=setup_lighting,
+        )
+    profiler.gl_calls.watch(mesh, scene3d)
+    scene_3d = scene3d.Scene3D()
+    cube = Model3D.load(model_paths[0], scene_3d) if model_paths else Cube3D(scene_3d)
+    for k, path in enumerate(model_paths[1:], 1):
+        Model3D.load(path, scene_3d).translation = (3.0 * k, 0, 0)
+    return scene_3d
+
+def frame_capture():
+    """FrameCapture aplikasi; capture.py diimpor saat tangkapan pertama."""
+    global capture
+    if capture is None:
+        from capture import FrameCapture
+        # tanpa layar (replay.py) hasil blit tidak dilihat siapa pun
+        capture = FrameCapture(WIDTH, HEIGHT, present=not external_gl)
+    return capture
+
+def window_scissor_rect(width=WIDTH, height=HEIGHT):
+    """Window kliping sebagai kotak scissor (x, y, w, h) piksel, y dari bawah."""
+    return camera.scissor_rect(window_bounds(), width, height)
 
 def apply_window_scissor():
     if len(window_clipping) != 2:
         glDisable(GL_SCISSOR_TEST)
         return
-
-    p1, p2 = window_clipping
-    xmin, ymin = min(p1.x, p2.x), min(p1.y, p2.y)
-    xmax, ymax = max(p1.x, p2.x), max(p1.y, p2.y)
-
-    # --- dunia ➜ pixel ---
-    x_px = int((xmin + 10) / 20 * WIDTH)
-    y_px = int((ymin + 10) / 20 * HEIGHT)       
-    w_px = int((xmax - xmin) / 20 * WIDTH)
-    h_px = int((ymax - ymin) / 20 * HEIGHT)
-
     glEnable(GL_SCISSOR_TEST)
-    glScissor(x_px, y_px, max(1, w_px), max(1, h_px))
+    glScissor(*window_scissor_rect())
+
+def grid_view():
+    """
+    Kotak & jarak grid 2D untuk tampilan kamera: batasnya kelipatan jarak
+    grid (VBO dibangun ulang hanya saat pan melewati satu sel), jaraknya
+    digandakan bila garisnya lebih dari GRID_MAX_LINES per sumbu.
+    """
+    xmin, ymin, xmax, ymax = camera.bounds
+    s = grid_spacing
+    while max(xmax - xmin, ymax - ymin) / s > GRID_MAX_LINES:
+        s *= 2
+    return (
+        math.floor(xmin / s) * s, math.floor(ymin / s) * s,
+        math.ceil(xmax / s) * s, math.ceil(ymax / s) * s, s,
+    )
 
 def draw_grid():
-    prev = glGetFloatv(GL_LINE_WIDTH)
+    # tanpa glGetFloatv(GL_LINE_WIDTH): semua gambar sesudahnya mengatur
+    # ketebalannya sendiri, jadi tidak perlu dipulihkan (dan tidak ada stall)
     glColor3f(0.3, 0.3, 0.3)
     glLineWidth(1)
-    glBegin(GL_LINES)
-    for i in range(-10, 11):
-        glVertex2f(i, -10)
-        glVertex2f(i, 10)
-        glVertex2f(-10, i)
-        glVertex2f(10, i)
-    glEnd()
-    glLineWidth(prev)
+    grid_2d.draw(*grid_view())
+
+def draw_floor_grid():
+    glColor3f(0.4, 0.4, 0.4)
+    glLineWidth(1)
+    floor_3d.draw(GRID_EXTENT, 2 * grid_spacing)
+
+def scatter_models(n=100, extent=25.0, seed=None):
+    """
+    Tambah ``n`` salinan model utama di posisi & rotasi acak pada lantai
+    [-extent, extent]²; mesh dan buffer GL-nya dipakai bersama.
+    """
+    global rng
+    if seed is not None:
+        gen = np.random.default_rng(seed)
+    else:
+        if rng is None:
+            rng = np.random.default_rng()
+        gen = rng
+    pos = np.column_stack((
+        gen.uniform(-extent, extent, n), gen.uniform(-1, 3, n), gen.uniform(-extent, extent, n)
+    ))
+    palette = np.array(list(COLORS.values()), dtype=np.float32)
+    scene_3d.add_many(
+        cube.lod, pos, gen.uniform(0, 360, (n, 3)), scale=1.0,
+        colors=palette[gen.integers(len(palette), size=n)],
+    )
+
+def build_voxels(n=VOXEL_GRID, spacing=0.32):
+    """Medan voxel n x n di lantai: tinggi & warna dari gelombang sinus."""
+    global voxels
+    if voxels is None:
+        import instancing
+        voxels = instancing.InstancedMesh(Cube3D.box(0.15), capacity=VOXEL_GRID * VOXEL_GRID)
+        profiler.gl_calls.watch(instancing)
+    k = (np.arange(n) - (n - 1) / 2) * spacing
+    x, z = np.meshgrid(k, k)
+    y = 0.6 * np.sin(x * 0.8) * np.cos(z * 0.8) - 1.5
+    h = (y - y.min()) / max(float(np.ptp(y)), 1e-9)
+    colors = np.column_stack((h, 0.4 + 0.4 * (1 - h), 1 - h))
+    voxels.clear()
+    voxels.add(np.column_stack((x.ravel(), y.ravel(), z.ravel())), colors=colors.reshape(-1, 3))
+
+def draw_scene_3d():
+    """Semua model 3D dengan frustum culling & LOD dari kamera saat ini."""
+    return scene_3d.draw(
+        camera_pos, camera_target, camera_up, FOVY, WIDTH / HEIGHT, Z_NEAR, Z_FAR, HEIGHT
+    )
 
 def draw_window_clipping():
     if len(window_clipping) == 2:
@@ -263,49 +624,577 @@ def cohen_sutherland_clip(x0, y0, x1, y1, xmin, ymin, xmax, ymax):
             x1, y1 = x, y
             c1 = code(x1, y1)
 
+def mark_scene_dirty():
+    """Panggil setiap kali objects_2d atau original_points berubah."""
+    global scene_version
+    scene_version += 1
+
+def pick_bbox(obj):
+    """
+    Bbox untuk indeks picking, diperlebar toleransi pick. Bentuk: bbox dunia
+    dari cache transformasi (kliping bentuk tidak mengubah titiknya). Garis:
+    gabungan titik asli & titik tampil; titik hasil kliping selalu berada di
+    dalam bbox asli, jadi kliping tidak perlu memperbarui indeks.
+    """
+    if obj.obj_type == "line":
+        pts = np.concatenate((obj.original_coords(), obj.coords()))
+        if not len(pts):
+            return None
+        (xmin, ymin), (xmax, ymax) = pts.min(axis=0).tolist(), pts.max(axis=0).tolist()
+    elif not scene.count[obj.index]:
+        return None
+    else:
+        xmin, ymin, xmax, ymax = obj.bounding_box()
+    return xmin - PICK_TOL, ymin - PICK_TOL, xmax + PICK_TOL, ymax + PICK_TOL
+
+def invalidate_clip():
+    """Titik tampil / warna diubah di luar clip_objects: kliping berikutnya penuh."""
+    _clip_state.clear()
+
+def reindex_object(obj):
+    scene.invalidate_transform(obj.index)
+    pick_index.update(obj, pick_bbox(obj))
+    scene_renderer.invalidate(obj)
+    invalidate_clip()
+
+def add_object(obj):
+    # obj sudah ada di scene/objects_2d sejak dibuat; di sini cukup didaftarkan
+    pick_index.insert(obj, pick_bbox(obj))
+    scene_renderer.add(obj)
+    mark_scene_dirty()
+
+def clear_objects():
+    """Kosongkan scene tanpa undo (riwayat ikut dibuang); tombol C memakai ClearScene."""
+    scene.clear()
+    pick_index.clear()
+    scene_renderer.clear()
+    history.clear()
+    mark_scene_dirty()
+
+def pack_scene():
+    """
+    Indeks garis/bentuk lain dan geometri aslinya dari scene store.
+    Hasilnya di-cache sampai mark_scene_dirty() dipanggil, jadi drag window
+    tidak perlu mengumpulkan ulang koordinat setiap MOUSEMOTION.
+    """
+    if _scene_pack.get("version") == scene_version:
+        return _scene_pack
+    _scene_pack.clear()
+    _scene_pack.update(scene_clip.pack(scene), version=scene_version)
+    return _scene_pack
+
+def shape_outlines(idx):
+    """
+    Outline dunia bentuk idx (kotak, elips tersesselasi, polygon) dalam format
+    packed ``(verts (N, 2), counts)``. Jumlah segmen elips sama dengan yang
+    digambar (ellipse_outline), jadi hasil klipingnya sama dengan yang tampil.
+    Scene besar dikerjakan per potongan (parallel.py).
+    """
+    import parallel
+    parts = parallel.map_chunks(
+        lambda a, b: tessellation.shape_outlines(scene, idx[a:b], PX_PER_UNIT), len(idx)
+    )
+    if len(parts) == 1:
+        return parts[0]
+    return np.concatenate([v for v, _ in parts]), np.concatenate([c for _, c in parts])
+
+def window_bounds():
+    p1, p2 = window_clipping
+    return (
+        min(p1.x, p2.x), min(p1.y, p2.y),
+        max(p1.x, p2.x), max(p1.y, p2.y),
+    )
+
+def _part(sel, a, b):
+    """Potongan [a, b) dari ``sel`` (array indeks, atau slice(None) = semua)."""
+    return slice(a, b) if isinstance(sel, slice) else sel[a:b]
+
+def _clip_lines(pack, sel, bounds):
+    """
+    Kliping garis pack["lines"][sel]; mengembalikan klasifikasi bbox-nya.
+    Scene besar dikerjakan per potongan (parallel.py); tiap potongan hanya
+    menulis baris garisnya sendiri.
+    """
+    import parallel
+    total = len(pack["lines"]) if isinstance(sel, slice) else len(sel)
+    parts = parallel.map_chunks(lambda a, b: scene_clip.clip_lines(scene, pack, _part(sel, a, b), bounds), total)
+    return parts[0] if len(parts) == 1 else np.concatenate(parts)
+
+def _clip_shapes(pack, sel, bounds):
+    """
+    Bentuk non-garis pack["shapes"][sel], diklasifikasi dari bbox dunianya.
+    Yang memotong tepi window diklip secara geometris (Sutherland–Hodgman
+    batch) dan outline hasilnya disimpan di scene.clipped; titik aslinya
+    tidak pernah berubah.
+    """
+    import parallel
+    shapes = pack["shapes"][sel]
+    if len(shapes) <= len(scene.clipped):
+        stale = np.array([i for i in shapes.tolist() if i in scene.clipped], dtype=np.intp)
+    else:
+        stale = np.intersect1d(np.fromiter(scene.clipped, dtype=np.intp), shapes)
+    for i in stale.tolist():
+        del scene.clipped[i]
+    # potongan dikerjakan paralel; scene.clipped & renderer diisi di sini, urut
+    parts = parallel.map_chunks(
+        lambda a, b: scene_clip.clip_shapes(scene, pack, _part(sel, a, b), bounds, PX_PER_UNIT), len(shapes)
+    )
+    for _, idx, clipped in parts:
+        scene.clipped.update(clipped)
+        scene_renderer.invalidate_indices(idx)
+    scene_renderer.invalidate_indices(stale)
+    return parts[0][0] if len(parts) == 1 else np.concatenate([cls for cls, _, _ in parts])
+
+@profiler.timed("clip")
 def clip_objects():
+    """
+    Kliping semua objek terhadap window. Selama scene tidak berubah dan
+    window hanya digeser/diubah ukurannya, hanya objek yang bbox-nya menyentuh
+    pita sapuan tepi window yang dihitung ulang (lihat clip_window_delta).
+    """
+    if len(window_clipping) == 2 and _clip_state.get("version") == scene_version:
+        clip_window_delta(window_bounds())
+        return
+
+    n, nv = scene.n, scene.nv
+    old_visible = scene.visible[:n].copy()
+    old_color = scene.color[:n].copy()
+    old_disp = scene.disp[:nv].copy()
+    scene_renderer.invalidate_indices(list(scene.clipped))
+
+    _clip_state.clear()
+    if len(window_clipping) != 2:
+        scene.reset_display()
+    else:
+        bounds = window_bounds()
+        pack = pack_scene()
+        everything = slice(None)
+        cls = np.full(n, OUTSIDE, dtype=np.uint8)
+        if len(pack["lines"]):
+            cls[pack["lines"]] = _clip_lines(pack, everything, bounds)
+        if len(pack["shapes"]):
+            cls[pack["shapes"]] = _clip_shapes(pack, everything, bounds)
+        _clip_state.update(version=scene_version, bounds=bounds, cls=cls)
+
+    # beri tahu renderer hanya objek yang benar-benar berubah
+    moved = np.any(scene.disp[:nv] != old_disp, axis=1)
+    changed = (scene.visible[:n] != old_visible) | np.any(scene.color[:n] != old_color, axis=1)
+    if moved.any():
+        changed[np.repeat(np.arange(n), scene.count[:n])[moved]] = True
+    scene_renderer.invalidate_indices(np.flatnonzero(changed))
+
+def reclip_shape(obj):
+    """
+    Transformasi bentuk berubah: buang cache matriksnya, perbarui bbox dunianya
+    di pack & indeks picking, dan klip ulang objek itu saja. Bila state
+    kliping sudah basi (mis. ada garis yang digeser) state-nya dibiarkan;
+    kliping berikutnya tetap penuh.
+    """
+    scene.invalidate_transform(obj.index)
+    scene_renderer.invalidate(obj)
+    pick_index.update(obj, pick_bbox(obj))
+    if _scene_pack.get("version") == scene_version:
+        sel = np.searchsorted(_scene_pack["shapes"], [obj.index])
+        for arr, v in zip(_scene_pack["bbox"], scene.world_bboxes([obj.index])):
+            arr[sel] = v
     if len(window_clipping) != 2:
-        for obj in objects_2d:
-            obj.points = [Point2D(p.x, p.y) for p in obj.original_points]
-            obj.color = obj.original_color
         return
+    fresh = _clip_state.get("version") == scene_version
+    bounds = _clip_state["bounds"] if fresh else window_bounds()
+    pack = pack_scene()
+    sel = np.searchsorted(pack["shapes"], [obj.index])
+    cls = _clip_shapes(pack, sel, bounds)[0]
+    if fresh:
+        _clip_state["cls"][obj.index] = cls
+
+def reclip_line(obj):
+    """
+    Titik asli garis digeser: perbarui barisnya di pack lalu klip ulang garis
+    itu saja, tanpa membuang cache pack & state kliping seluruh scene.
+    """
+    scene.invalidate_transform(obj.index)
+    scene_renderer.invalidate(obj)
+    if _scene_pack.get("version") == scene_version:
+        sel = np.searchsorted(_scene_pack["lines"], [obj.index])
+        (x0, y0), (x1, y1) = obj.original_coords().tolist()
+        _scene_pack["seg"][sel] = (x0, y0, x1, y1)
+        for arr, v in zip(_scene_pack["line_bbox"], (min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1))):
+            arr[sel] = v
+        if len(window_clipping) == 2 and _clip_state.get("version") == scene_version:
+            _clip_state["cls"][obj.index] = _clip_lines(_scene_pack, sel, _clip_state["bounds"])[0]
+    pick_index.update(obj, pick_bbox(obj))
+
+def clip_window_delta(bounds):
+    """
+    Kliping inkremental setelah window berubah dari _clip_state["bounds"] ke
+    ``bounds``. Objek yang seluruhnya di dalam atau di luar kedua window tidak
+    disentuh; hasilnya identik dengan kliping penuh.
+    """
+    bands = swept_bands(_clip_state["bounds"], bounds)
+    _clip_state["bounds"] = bounds
+    if not bands:
+        return
+    pack = pack_scene()
+    cls = _clip_state["cls"]
+    touched = []
+    for key, clip in (("lines", _clip_lines), ("shapes", _clip_shapes)):
+        ids = pack[key]
+        if not len(ids):
+            continue
+        box = pack["line_bbox"] if key == "lines" else pack["bbox"]
+        sel = np.flatnonzero(bboxes_touch(*box, bands))
+        if key == "shapes" and len(sel):
+            # bentuk di luar/di dalam penuh hanya bergantung pada klasifikasinya;
+            # yang memotong tepi window selalu diklip ulang
+            new = classify_bboxes(*(a[sel] for a in box), *bounds)
+            sel = sel[(new != cls[ids[sel]]) | (new == CROSSING)]
+        if not len(sel):
+            continue
+        idx = ids[sel]
+        old_visible = scene.visible[idx].copy()
+        old_color = scene.color[idx].copy()
+        rows, owner = scene.vertex_rows(idx)
+        old_disp = scene.disp[rows]
+        cls[idx] = clip(pack, sel, bounds)
+
+        changed = (scene.visible[idx] != old_visible) | np.any(scene.color[idx] != old_color, axis=1)
+        changed[owner[np.any(scene.disp[rows] != old_disp, axis=1)]] = True
+        touched.append(idx[changed])
+    if touched:
+        scene_renderer.invalidate_indices(np.concatenate(touched))
+
+# ---------- undo / redo: perintah delta (lihat history.py) ----------
+def refresh_clip():
+    """Kliping ulang penuh setelah undo/redo mengubah isi scene."""
+    invalidate_clip()
+    if len(window_clipping) == 2:
+        clip_objects()
 
-    p1, p2 = window_clipping
-    xmin, ymin = min(p1.x, p2.x), min(p1.y, p2.y)
-    xmax, ymax = max(p1.x, p2.x), max(p1.y, p2.y)
+def do_edit(cmd):
+    """Terapkan perintah lalu catat di riwayat."""
+    cmd.redo()
+    history.push(cmd)
+
+class CreateObject(Command):
+    """
+    Objek baru (selalu di akhir scene). Undo memotong scene; redo memasang
+    lagi salinan barisnya, karena buffer lama bisa sudah ditimpa objek lain
+    atau dilepas ClearScene.
+    """
 
-    for obj in objects_2d:
-        obj.points = [Point2D(p.x, p.y) for p in obj.original_points]
-        obj.color = obj.original_color
+    def __init__(self, index):
+        self.index = index
+        self.row = scene.copy_row(index)
+
+    @property
+    def nbytes(self):
+        return super().nbytes + sum(v.nbytes for v in self.row.values())
+
+    def undo(self):
+        pick_index.remove(objects_2d[self.index])
+        scene.truncate(self.index)
+        scene_renderer.invalidate_indices([self.index])
+        mark_scene_dirty()
+        invalidate_clip()
+
+    def redo(self):
+        scene.restore_row(self.index, self.row)
+        add_object(objects_2d[self.index])
+        invalidate_clip()
+
+def create_object(obj):
+    """add_object yang dicatat di riwayat undo."""
+    add_object(obj)
+    history.push(CreateObject(obj.index))
+
+class DeleteObject(Command):
+    """Hapus objek: ditandai mati (kolom ``alive``), indeks objek lain tetap."""
+
+    def __init__(self, index):
+        self.index = index
+        self.order = None           # urutan tumpukan di indeks picking
+
+    def redo(self):
+        obj = objects_2d[self.index]
+        self.order = pick_index.order.get(obj)
+        pick_index.remove(obj)
+        scene.alive[self.index] = False
+        scene.visible[self.index] = False
+        scene.clipped.pop(self.index, None)
+        scene_renderer.invalidate(obj)
+        mark_scene_dirty()
+
+    def undo(self):
+        obj = objects_2d[self.index]
+        scene.alive[self.index] = True
+        scene.visible[self.index] = True
+        pick_index.insert(obj, pick_bbox(obj), self.order)
+        scene_renderer.invalidate(obj)
+        mark_scene_dirty()
+        refresh_clip()
+
+class ClearScene(Command):
+    """
+    Tombol C. Buffer scene & indeks picking dilepas apa adanya (tanpa
+    disalin) dan disimpan di entri ini sampai di-undo atau dibuang riwayat.
+    """
 
-        # ---------- LINE ----------
+    def __init__(self):
+        self.state = None
+
+    @property
+    def nbytes(self):
+        if self.state is None:
+            return super().nbytes
+        store_state, grid_state = self.state
+        return super().nbytes + SceneStore.state_nbytes(store_state) + SpatialGrid.state_nbytes(grid_state)
+
+    def redo(self):
+        self.state = (scene.detach(), pick_index.detach())
+        scene_renderer.clear()
+        mark_scene_dirty()
+        invalidate_clip()
+
+    def undo(self):
+        store_state, grid_state = self.state
+        self.state = None
+        scene.attach(store_state)
+        pick_index.attach(grid_state)
+        scene_renderer.invalidate_all()
+        mark_scene_dirty()
+        refresh_clip()
+
+    def release(self):
+        self.state = None
+
+def transform_state(obj):
+    """
+    Transformasi objek sebagai tuple ringkas: bentuk (tx, ty, rot, sx, sy);
+    garis (titiknya diubah langsung) titik asli & tampilnya.
+    """
+    i = obj.index
+    if obj.obj_type == "line":
+        rows = slice(int(scene.offset[i]), int(scene.offset[i] + scene.count[i]))
+        return (*scene.orig[rows].ravel().tolist(), *scene.disp[rows].ravel().tolist())
+    return (*scene.translation[i].tolist(), float(scene.rotation[i]), *scene.scale[i].tolist())
+
+class TransformObject(Command):
+    """Drag T/R/Z; semua MOUSEMOTION satu drag digabung jadi satu entri."""
+
+    def __init__(self, index, before, after):
+        self.index = index
+        self.before = before
+        self.after = after
+
+    @property
+    def nbytes(self):
+        return super().nbytes + 16 * len(self.before)
+
+    def merge(self, other):
+        if type(other) is not TransformObject or other.index != self.index:
+            return False
+        self.after = other.after
+        return True
+
+    def _set(self, state):
+        obj = objects_2d[self.index]
+        i = self.index
         if obj.obj_type == "line":
-            p0, p1_ = obj.original_points
-            clip = cohen_sutherland_clip(
-                p0.x, p0.y, p1_.x, p1_.y, xmin, ymin, xmax, ymax
-            )
-            if clip:
-                x0, y0, x1_, y1_ = clip
-                obj.points = [Point2D(x0, y0), Point2D(x1_, y1_)]
-                inside0 = xmin <= p0.x <= xmax and ymin <= p0.y <= ymax
-                inside1 = xmin <= p1_.x <= xmax and ymin <= p1_.y <= ymax
-                obj.color = (
-                    COLORS["green"] if inside0 and inside1 else obj.original_color
-                )
-            else:
-                obj.points = []
+            rows = slice(int(scene.offset[i]), int(scene.offset[i] + scene.count[i]))
+            k = len(state) // 2
+            scene.orig[rows] = np.reshape(state[:k], (-1, 2))
+            scene.disp[rows] = np.reshape(state[k:], (-1, 2))
+            reclip_line(obj)
+        else:
+            scene.translation[i] = state[0:2]
+            scene.rotation[i] = state[2]
+            scene.scale[i] = state[3:5]
+            reclip_shape(obj)
+
+    def undo(self):
+        self._set(self.before)
+
+    def redo(self):
+        self._set(self.after)
+
+def style_state(obj):
+    return (*obj.original_color, obj.thickness)
+
+class StyleObject(Command):
+    """Warna (1-6) / ketebalan (+ / -) objek yang sudah ada."""
+
+    def __init__(self, index, before, after):
+        self.index = index
+        self.before = before
+        self.after = after
+
+    def _set(self, state):
+        obj = objects_2d[self.index]
+        scene.orig_color[self.index] = state[:3]
+        scene.color[self.index] = state[:3]
+        scene.thickness[self.index] = state[3]
+        # warna tampil bergantung klasifikasi kliping (hijau = di dalam window)
+        if obj.obj_type == "line":
+            reclip_line(obj)
+        else:
+            reclip_shape(obj)
 
-        # ---------- BENTUK LAIN ----------
-        elif obj.obj_type in ("square", "ellipse", "polygon", "point"):
-            bxmin, bymin, bxmax, bymax = obj.bounding_box()
-            if bxmax < xmin or bxmin > xmax or bymax < ymin or bymin > ymax:
-                obj.points = []               
-            else:
-                if xmin <= bxmin and bxmax <= xmax and ymin <= bymin and bymax <= ymax:
-                    obj.color = COLORS["green"]
+    def undo(self):
+        self._set(self.before)
+
+    def redo(self):
+        self._set(self.after)
+
+def restyle_object(obj, color=None, thickness=None):
+    before = style_state(obj)
+    after = (*(before[:3] if color is None else color), before[3] if thickness is None else thickness)
+    if after != before:
+        do_edit(StyleObject(obj.index, before, after))
+
+def window_state():
+    """Window kliping sebagai ((x1, y1), (x2, y2)), atau None bila belum ada."""
+    if len(window_clipping) != 2:
+        return None
+    return tuple((p.x, p.y) for p in window_clipping)
+
+class WindowEdit(Command):
+    """Window kliping dibuat / dihapus (W) / digeser / diubah ukurannya."""
+
+    def __init__(self, before, after, drag=False):
+        self.before = before
+        self.after = after
+        self.drag = drag
+
+    def merge(self, other):
+        if type(other) is not WindowEdit or not (self.drag and other.drag):
+            return False
+        self.after = other.after
+        return True
+
+    def _set(self, state):
+        window_clipping[:] = [Point2D(x, y) for x, y in state] if state else []
+        clip_objects()
+
+    def undo(self):
+        self._set(self.before)
+
+    def redo(self):
+        self._set(self.after)
+
+def render_software(width=WIDTH, height=HEIGHT, grid=True):
+    """
+    Frame 2D (grid, window kliping, objects_2d) dirasterisasi dengan NumPy
+    tanpa OpenGL maupun display. Pemetaan dunia ➜ piksel, scissor window,
+    urutan tumpukan, warna & ketebalan sama dengan frame 2D di main(); polygon
+    digambar sebagai outline. Mengembalikan RGBA (height, width, 4) uint8,
+    baris 0 di atas.
+    """
+    from raster import SoftwareRasterizer    # hanya untuk F8 / benchmark; tidak diimpor saat startup
+
+    xmin, ymin, xmax, ymax = camera.bounds
+    r = SoftwareRasterizer(width, height, world=(xmin, xmax, ymin, ymax))
+    r.clear(BG_COLOR)
+    if grid:
+        verts = grid_rect(*grid_view())
+        r.segments(verts[0::2], verts[1::2], (0.3, 0.3, 0.3))
+    if len(window_clipping) == 2:
+        p1, p2 = window_clipping
+        corners = [(p1.x, p1.y), (p2.x, p1.y), (p2.x, p2.y), (p1.x, p2.y)]
+        r.loops(corners, [4], (1, 1, 0), 2.0)
+        r.set_scissor(window_scissor_rect(width, height))
+
+    # objek belakangan di atas: order = 1 + indeks (0 = grid & window)
+    n = scene.n
+    idx = np.flatnonzero(scene.visible[:n] & (scene.count[:n] > 0))
+    types = scene.types[idx]
+    clipped = np.isin(idx, np.fromiter(scene.clipped, dtype=np.intp))
+    point = (types == TYPE_CODES["point"]) & ~clipped
+    line = (types == TYPE_CODES["line"]) & (scene.count[idx] >= 2)
+    loop = ~(point | line | clipped)
+
+    k = idx[line]
+    r.segments(scene.disp[scene.offset[k]], scene.disp[scene.offset[k] + 1],
+               scene.color[k], scene.thickness[k], k + 1)
+
+    k = idx[loop]
+    if len(k):
+        verts, counts = shape_outlines(k)
+        r.loops(verts, counts, scene.color[k], scene.thickness[k], k + 1)
+
+    k = idx[clipped]
+    if len(k):
+        parts = [scene.clipped[i] for i in k.tolist()]
+        counts = [len(v) for v, _ in parts]
+        boundary = np.concatenate([b for _, b in parts])
+        segs = outline_segments(np.concatenate([v for v, _ in parts]), counts, boundary)
+        owner = k[np.repeat(np.arange(len(k)), counts)[~boundary]]
+        r.segments(segs[:, 0], segs[:, 1], scene.color[owner], scene.thickness[owner], owner + 1)
+
+    k = idx[point]
+    if len(k):
+        xy = scene.to_world(scene.orig[scene.offset[k]], k)
+        r.points(xy, scene.color[k], 5.0, k + 1)
+    return r.image()
+
+def export_png(path, width=WIDTH, height=HEIGHT):
+    from raster import write_png
+
+    write_png(path, render_software(width, height))
+
+def rebuild_pick_index():
+    """
+    Daftarkan ulang semua objek ke indeks picking. Untuk scene yang belum
+    diklip (disp == orig) bbox-nya sama dengan ``pick_bbox``: bbox dunia dari
+    cache transformasi store, dihitung sekaligus dengan NumPy.
+    """
+    pick_index.clear()
+    idx = np.flatnonzero(scene.alive[:scene.n])
+    xmin, ymin, xmax, ymax = scene.world_bboxes(idx)
+    tol = PICK_TOL
+    boxes = np.column_stack((xmin - tol, ymin - tol, xmax + tol, ymax + tol))
+    pick_index.insert_many([Object2D.bind(scene, i) for i in idx.tolist()], boxes)
+
+def save_scene(path=SCENE_PATH):
+    """Simpan scene 2D & window kliping: ``.json`` sebagai JSON, selain itu biner ``.gks``."""
+    import scene_file
+    save = scene_file.export_json if path.endswith(".json") else scene_file.save
+    save(path, scene, window_state())
+
+def load_scene(path=SCENE_PATH):
+    """
+    Ganti scene 2D dengan isi file (lihat save_scene); riwayat undo dikosongkan.
+    File dibaca ke store baru lebih dulu, jadi bila gagal (OSError /
+    ValueError) scene dan riwayat yang sedang terbuka tidak tersentuh.
+    """
+    import scene_file
+    loaded = SceneStore()
+    load = scene_file.import_json if path.endswith(".json") else scene_file.load
+    window = load(path, loaded)
+    clear_objects()
+    scene.attach(loaded.detach())
+    rebuild_pick_index()
+    scene_renderer.invalidate_all()
+    mark_scene_dirty()
+    window_clipping[:] = [Point2D(x, y) for x, y in window] if window else []
+    refresh_clip()
 
 def mouse_to_world(mx, my):
-    return (mx / WIDTH) * 20 - 10, 10 - (my / HEIGHT) * 20
+    return camera.to_world(mx, my)
+
+def pick_tolerance():
+    """PICK_TOL (unit dunia) saat zoom in diperkecil supaya tetap ~sama di layar."""
+    return PICK_TOL / max(camera.zoom, 1.0)
+
+@profiler.timed("cull")
+def visible_objects():
+    """
+    Indeks objek 2D yang bbox-nya (pick_index) menyentuh area kamera, atau
+    None bila lebih dari separuh scene terlihat (gambar semua lebih murah).
+    """
+    keys = pick_index.query_rect(*camera.visible_bounds(CULL_MARGIN_PX), limit=len(pick_index) // 2)
+    if keys is None:
+        return None
+    return np.fromiter((obj.index for obj in keys), dtype=np.intp, count=len(keys))
 
 def point_inside_window(x, y):
     if len(window_clipping) != 2:
@@ -328,53 +1217,84 @@ def point_near_line(px, py, x1, y1, x2, y2, th=0.5) -> bool:
     projy = y1 + u * (y2 - y1)
     return np.hypot(px - projx, py - projy) < th
 
+@profiler.timed("pick")
 def select_object(mx, my):
     wx, wy = mouse_to_world(mx, my)
-    for obj in reversed(objects_2d):
+    tol = pick_tolerance()
+    # kandidat dari grid sudah urut paling atas dulu (sama seperti reversed)
+    for obj in pick_index.query_point(wx, wy):
         if not obj.points:
             continue
-        if obj.obj_type == "point":
-            p = obj.points[0]
-            if abs(p.x - wx) < 0.5 and abs(p.y - wy) < 0.5:
+        kind = obj.obj_type
+        if kind == "point":
+            # titik hanya bisa ditranslasi: jarak lokal = jarak dunia
+            p = obj.original_points[0]
+            lx, ly = obj.to_local(wx, wy)
+            if abs(p.x - lx) < tol and abs(p.y - ly) < tol:
                 return obj
-        elif obj.obj_type == "line":
+        elif kind == "line":
             p1, p2 = obj.points
-            if point_near_line(wx, wy, p1.x, p1.y, p2.x, p2.y):
+            if point_near_line(wx, wy, p1.x, p1.y, p2.x, p2.y, tol):
+                return obj
+        elif kind == "ellipse":
+            # klik dalam koordinat titik asli (matriks invers dari cache), jadi
+            # bentuk yang digeser / diputar / diskalakan dites di tempat tampilnya
+            lx, ly = obj.to_local(wx, wy)
+            (cx, cy), (a, b) = obj.original_coords().tolist()
+            if a and b and ((lx - cx) / a) ** 2 + ((ly - cy) / b) ** 2 <= 1.0:
                 return obj
         else:
-            xs = [p.x for p in obj.points]
-            ys = [p.y for p in obj.points]
-            if min(xs) <= wx <= max(xs) and min(ys) <= wy <= max(ys):
+            lx, ly = obj.to_local(wx, wy)
+            pts = obj.original_coords().tolist()
+            xs, ys = [p[0] for p in pts], [p[1] for p in pts]
+            if min(xs) <= lx <= max(xs) and min(ys) <= ly <= max(ys):
                 return obj
     return None
 
 def init():
-    pygame.init()
-    pygame.font.init()
-    pygame.display.set_mode((WIDTH, HEIGHT), DOUBLEBUF | OPENGL)
-    pygame.display.set_caption("Project UAS Grafika Komputer I | 202310370311436 - 202310370311433")
-    glMatrixMode(GL_PROJECTION)
-    glLoadIdentity()
-    gluOrtho2D(-10, 10, -10, 10)
-    glMatrixMode(GL_MODELVIEW)
-    glLoadIdentity()
+    # hanya subsistem video (event ikut); font dibuka TextCache saat teks pertama
+    pygame.display.init()
+    # depth dipakai renderer 2D untuk menjaga urutan tumpukan objek
+    if external_gl:
+        # jendela SDL hanya untuk event & font (mis. driver dummy di replay.py)
+        pygame.display.set_mode((WIDTH, HEIGHT))
+    else:
+        pygame.display.gl_set_attribute(GL_DEPTH_SIZE, 24)
+        pygame.display.set_mode((WIDTH, HEIGHT), DOUBLEBUF | OPENGL)
+    pygame.display.set_caption(CAPTION)
     glClearColor(*BG_COLOR)
     glPointSize(5)
     glLineWidth(1)
+    render_modes[current_mode].activate()
 
-def init_3d():
-    glEnable(GL_DEPTH_TEST)
-    glEnable(GL_LIGHTING)
-    glEnable(GL_LIGHT0)
+def setup_lighting():
+    """Lampu mode 3D; tersimpan di konteks GL, jadi cukup sekali (render_state)."""
     glLightfv(GL_LIGHT0, GL_POSITION, [2, 5, 2, 1])
     glLightfv(GL_LIGHT0, GL_DIFFUSE, [1, 1, 1, 1])
     glLightfv(GL_LIGHT0, GL_AMBIENT, [0.2, 0.2, 0.2, 1])
-    glEnable(GL_COLOR_MATERIAL)
     glColorMaterial(GL_FRONT, GL_AMBIENT_AND_DIFFUSE)
 
+# F1 / F2 menukar status render yang sudah disiapkan; konteks GL, VBO, tekstur
+# teks dan FBO tangkapan tetap dipakai (dulu F1 = init() ulang). "3D"
+# ditambahkan setup_3d
+render_modes = {
+    "2D": RenderMode("2D", camera.home),       # frame 2D memuat camera.projection
+}
+
+def set_render_mode(name):
+    """F1 / F2: tukar ke status render ``name`` ("2D" / "3D") tanpa init() ulang."""
+    global current_mode, transform_mode
+    if name == "3D":
+        setup_3d()
+    render_modes[name].activate(render_modes[current_mode])
+    current_mode = name
+    transform_mode = None
+
 def draw_text(x, y, txt, font):
     """
     Gambar teks di window‑coords; transparansi dihormati.
+    Jalur lama tanpa cache (render + glDrawPixels tiap panggilan); draw_ui
+    sekarang memakai ui_text.TextCache.
     """
     surf = font.render(txt, True, (255, 255, 255))
     surf = surf.convert_alpha()
@@ -392,15 +1312,14 @@ def draw_text(x, y, txt, font):
     glDisable(GL_BLEND)
 
 def draw_ui():
-    depth_on = glIsEnabled(GL_DEPTH_TEST)
-    light_on = glIsEnabled(GL_LIGHTING)
+    caps = render_modes[current_mode].enable    # tanpa glIsEnabled (round-trip ke driver)
+    depth_on = GL_DEPTH_TEST in caps
+    light_on = GL_LIGHTING in caps
     if depth_on:
         glDisable(GL_DEPTH_TEST)
     if light_on:
         glDisable(GL_LIGHTING)
 
-    font = pygame.font.SysFont("Arial", 18)
-
     color_name = next(
         (name for name, rgb in COLORS.items() if rgb == current_color),
         str(list(current_color))
@@ -408,47 +1327,270 @@ def draw_ui():
     status = (
         f"Mode: {current_mode}   |   Objek: {current_type or '-'}   |   "
         f"Warna: {(color_name)}"
-        + (f"   |   Tebal: {line_thickness}" if current_mode == "2D" else "")
+        + (f"   |   Tebal: {line_thickness}   |   Zoom: {camera.zoom:.3g}x" if current_mode == "2D" else "")
         + (f"   |   Transformasi: {transform_mode}" if transform_mode else "")
         + "   |   H: Bantuan"
     )
-    draw_text(10, HEIGHT - 25, status, font)
+    ui_text.begin(WIDTH, HEIGHT)
+    ui_text.draw(10, HEIGHT - 25, status)
+    if scene_message:
+        ui_text.draw(10, 10, scene_message)
 
     if show_help:
         help_lines = [
             "Bantuan Tombol",
             "MODE         :  F1 → 2D   |   F2 → 3D",
+            "KAMERA 2D    :  Roda Mouse  Zoom   |  Drag Tombol Tengah  Geser   |  Home  Tampilan Awal",
             "2D           :  P  Titik   |  L  Garis   |  S  Persegi   |  E  Lingkaran   |  G  Polygon   |  W  Clip‑Window",
             "WARNA (1‑6)  :  1 R  2 G  3 B  4 Y  5 C  6 M",
             "TRANFORMASI  :  T Translasi   |  R Rotasi   |  Z Scaling",
-            "LAIN         :  + / –  Ketebalan Garis   |  C  Hapus   |  H  Help",
-            "3D Cube      :  Left‑Drag Rotasi   |  Right‑Drag Translasi",
+            "EDIT         :  Ctrl+Z  Undo   |  Ctrl+Y  Redo   |  Del  Hapus Objek di Kursor   |  T/R/Z aktif: 1‑6 & + / –  ubah objek di kursor",
+            "LAIN         :  + / –  Ketebalan Garis   |  C  Hapus   |  Ctrl+S / Ctrl+O  Simpan / Buka Scene   |  H  Help   |  F3  Profiler   |  F4  Redraw Kontinu   |  F6  Trace   |  F8  Simpan PNG   |  F9 / F10  Tangkap Frame / Rekam Frame   |  [ / ]  Grid",
+            "3D Model     :  Left‑Drag Rotasi   |  Right‑Drag Translasi   |  M  Tambah 100 Salinan   |  V  Voxel   |  (python TubesGrafkom.py model.obj/.ply ...)",
             "",
             "ESC → batal transform",
         ]
         y = HEIGHT - 50
         for ln in help_lines:
-            draw_text(10, y, ln, font)
+            ui_text.draw(10, y, ln)
             y -= 22
+    ui_text.end()
+
+    if depth_on:
+        glEnable(GL_DEPTH_TEST)
+    if light_on:
+        glEnable(GL_LIGHTING)
+
+def handle_motion(rel):
+    """
+    Satu MOUSEMOTION (atau gabungan beberapa MOUSEMOTION, ``rel`` = total
+    pergeseran piksel). Semua cabang bergantung pada posisi akhir mouse atau
+    linear terhadap ``rel``, jadi hasil gabungan sama dengan per event.
+    """
+    global last_mouse_pos
+    # pan kamera 2D: drag tombol tengah
+    if current_mode == "2D" and mouse.buttons[1]:
+        camera.pan(*rel)
+        return
+
+    mx, my = mouse.pos
+    wx, wy = mouse_to_world(mx, my)
 
+    # Window move / resize
+    if window_action and last_mouse_pos:
+        dx, dy = wx - last_mouse_pos[0], wy - last_mouse_pos[1]
+        before = window_state()
+        p1, p2 = window_clipping
+        if window_action == "move":
+            p1.x += dx
+            p1.y += dy
+            p2.x += dx
+            p2.y += dy
+        elif window_action == "resize_tl":
+            p1.x += dx
+            p2.y += dy
+        elif window_action == "resize_tr":
+            p2.x += dx
+            p2.y += dy
+        elif window_action == "resize_bl":
+            p1.x += dx
+            p1.y += dy
+        elif window_action == "resize_br":
+            p2.x += dx
+            p1.y += dy
+        last_mouse_pos = (wx, wy)
+        clip_objects()
+        history.push(WindowEdit(before, window_state(), drag=True))
+
+    # Transformasi objek
+    elif mouse.buttons[0] and selected_object and transform_mode:
+        before = transform_state(selected_object)
+        if selected_object.obj_type == "line":
+            if transform_mode == "Translasi":
+                dx, dy = camera.delta_to_world(*rel)
+                for p in selected_object.points:
+                    p.x += dx
+                    p.y += dy
+                for p in selected_object.original_points:
+                    p.x += dx
+                    p.y += dy
+                reclip_line(selected_object)
+                if line_pivot:
+                    line_pivot.x += dx
+                    line_pivot.y += dy
+            elif transform_mode == "rotate":
+                vx, vy = wx - line_pivot.x, wy - line_pivot.y
+                vlen = np.hypot(vx, vy)
+                if vlen > 1e-4:
+                    ux, uy = vx / vlen, vy / vlen
+                    new_end = Point2D(
+                        line_pivot.x + ux * line_init_len,
+                        line_pivot.y + uy * line_init_len,
+                    )
+                    selected_object.points[1] = new_end
+                    reindex_object(selected_object)
+            elif transform_mode == "scale":
+                proj = (wx - line_pivot.x) * line_unit_dir[0] + (
+                    wy - line_pivot.y
+                ) * line_unit_dir[1]
+                new_len = max(0.1, proj)
+                new_end = Point2D(
+                    line_pivot.x + line_unit_dir[0] * new_len,
+                    line_pivot.y + line_unit_dir[1] * new_len,
+                )
+                selected_object.points[1] = new_end
+                reindex_object(selected_object)
+        else:
+            dx, dy = camera.delta_to_world(*rel)
+            if transform_mode == "Translasi":
+                selected_object.translation[0] += dx
+                selected_object.translation[1] += dy
+            elif transform_mode == "rotate" and selected_object.obj_type != "point":
+                selected_object.rotation += dx * 10
+            elif transform_mode == "scale" and selected_object.obj_type != "point":
+                selected_object.scale[0] += dx * 0.1
+                selected_object.scale[1] += dy * 0.1
+            reclip_shape(selected_object)
+        after = transform_state(selected_object)
+        if after != before:
+            history.push(TransformObject(selected_object.index, before, after))
+
+    # 3‑D rotasi kamera
+    if current_mode == "3D":
+        dx, dy = rel
+        if mouse.buttons[0]:
+            cube.rotation[1] += dx * 0.5
+            cube.rotation[0] += dy * 0.5
+        elif mouse.buttons[2]:
+            cube.translation[0] += dx * 0.05
+            cube.translation[1] -= dy * 0.05
+
+_hud_lines: dict = {"t": 0.0, "lines": []}
+
+def draw_profiler_hud():
+    """Overlay profiler (F3); teksnya diperbarui 4x per detik supaya tekstur di-cache."""
+    if not profiler.hud:
+        return
+    now = time.perf_counter()
+    if now - _hud_lines["t"] >= 0.25:
+        _hud_lines["t"] = now
+        lines = profiler.report_lines()
+        lines.append(
+            f"loop {'event' if event_driven else 'kontinu'}   teks cache "
+            f"{ui_text.hits}/{ui_text.hits + ui_text.misses}"
+            + ("   trace ON" if profiler.trace_file is not None else "")
+        )
+        _hud_lines["lines"] = lines
+
+    caps = render_modes[current_mode].enable    # lihat draw_ui
+    depth_on = GL_DEPTH_TEST in caps
+    light_on = GL_LIGHTING in caps
+    if depth_on:
+        glDisable(GL_DEPTH_TEST)
+    if light_on:
+        glDisable(GL_LIGHTING)
+    hud_text.begin(WIDTH, HEIGHT)
+    y = HEIGHT - 50
+    for ln in _hud_lines["lines"]:
+        _, w, _ = hud_text.get(ln)
+        hud_text.draw(WIDTH - w - 10, y, ln)
+        y -= 16
+    hud_text.end()
     if depth_on:
         glEnable(GL_DEPTH_TEST)
     if light_on:
         glEnable(GL_LIGHTING)
 
-def main():
+def main(*paths):
+    """
+    ``paths``: file .obj / .ply; yang pertama menggantikan kubus di mode 3D
+    (digerakkan mouse), sisanya dijajarkan di sebelah kanannya. File scene 2D
+    (.gks / .json) dibuka ke mode 2D.
+    """
+    try:
+        _run(*paths)
+    finally:
+        # exception / Ctrl+C di tengah sesi: rekaman tetap ditutup dengan batch utuh
+        if recorder is not None:
+            recorder.close()
+
+def _run(*paths):
+    """Inisialisasi dan loop utama main()."""
     global current_mode, current_type, drawing, polygon_points
     global current_color, line_thickness, window_clipping
     global selected_object, transform_mode, cube, window_action, last_mouse_pos
-    global line_pivot, line_unit_dir, line_init_len, show_help
+    global line_pivot, line_unit_dir, line_init_len, show_help, scene_message
+    global event_driven, grid_spacing, show_voxels, rng, scene_3d, model_paths, recorder
 
     init()
-    cube = Cube3D()
+    recorder = None
+    if input_player is not None:
+        head = input_player.header
+        event_driven = head["event_driven"]
+        rng = np.random.default_rng(head["seed"])
+        mouse.pos = tuple(head["mouse"])
+    else:
+        mouse.pos = pygame.mouse.get_pos()
+        if os.environ.get("GRAFKOM_RECORD"):
+            seed = int.from_bytes(os.urandom(4), "little")
+            rng = np.random.default_rng(seed)
+            recorder = Recorder(os.environ["GRAFKOM_RECORD"], {
+                "args": list(paths), "width": WIDTH, "height": HEIGHT, "seed": seed,
+                "event_driven": event_driven, "mouse": list(mouse.pos),
+            })
+    model_paths = [p for p in paths if not p.endswith((".gks", ".json"))]
+    for path in paths:
+        if path.endswith((".gks", ".json")):
+            load_scene(path)
+    scene_3d = cube = None
+    if model_paths:
+        # model dari argumen dimuat sekarang supaya file yang salah ketahuan saat start
+        setup_3d()
     show_help = False
+    needs_redraw = True
+    if os.environ.get("GRAFKOM_TRACE"):
+        profiler.start_trace(os.environ["GRAFKOM_TRACE"])
+    if os.environ.get("GRAFKOM_CAPTURE"):
+        frame_capture().start(os.environ["GRAFKOM_CAPTURE"])
 
     while True:
-        for event in pygame.event.get():
+        if input_player is not None:
+            events = input_player.next_events()
+        else:
+            events = pygame.event.get()
+            if event_driven and not events and not needs_redraw:
+                # tidak ada perubahan: tidur sampai ada event (CPU idle ~0)
+                events = [pygame.event.wait()]
+                events += pygame.event.get()
+        if recorder is not None:
+            recorder.write(events)
+        if events:
+            needs_redraw = True
+        frame_t0 = time.perf_counter()
+        profiler.begin_frame()
+
+        # MOUSEMOTION berturut-turut digabung jadi satu pergeseran total;
+        # diproses sebelum event lain supaya urutannya tetap
+        motion = None
+        for event in events:
+            if event.type == MOUSEMOTION and event_driven:
+                mouse.update(event)
+                if motion is None:
+                    motion = event.rel
+                else:
+                    motion = (motion[0] + event.rel[0], motion[1] + event.rel[1])
+                continue
+            if motion is not None:
+                handle_motion(motion)
+                motion = None
+            mouse.update(event)
+
             if event.type == QUIT:
+                profiler.stop_trace()
+                if capture is not None:
+                    capture.close()
+                if recorder is not None:
+                    recorder.close()
                 pygame.quit()
                 return
 
@@ -459,24 +1601,56 @@ def main():
                     selected_object = None
                 elif event.key == K_h:
                     show_help = not show_help
+                elif event.key == K_F3:
+                    profiler.toggle_hud()
+                elif event.key == K_F6:
+                    if profiler.trace_file is None:
+                        profiler.start_trace(time.strftime("trace-%Y%m%d-%H%M%S.jsonl"))
+                    else:
+                        profiler.stop_trace()
+                elif event.key == K_F4:
+                    event_driven = not event_driven
+                elif event.key == K_F8:
+                    export_png(time.strftime("scene-%Y%m%d-%H%M%S.png"))
+                elif event.key == K_F9:
+                    frame_capture().snapshot(time.strftime("frame-%Y%m%d-%H%M%S.png"))
+                elif event.key == K_F10:
+                    if frame_capture().target is None:
+                        capture.start(time.strftime("capture-%Y%m%d-%H%M%S"))
+                    else:
+                        capture.stop()
+                elif event.key in (K_LEFTBRACKET, K_RIGHTBRACKET):
+                    # grid lebih rapat / renggang; VBO grid dibangun ulang sekali
+                    k = GRID_SPACINGS.index(grid_spacing) + (1 if event.key == K_RIGHTBRACKET else -1)
+                    grid_spacing = GRID_SPACINGS[min(max(k, 0), len(GRID_SPACINGS) - 1)]
+                elif event.key == K_HOME and current_mode == "2D":
+                    camera.reset()
                 elif event.key == K_F1:
-                    current_mode = "2D"
-                    transform_mode = None
-                    glMatrixMode(GL_PROJECTION)
-                    glLoadIdentity()
-                    gluOrtho2D(-10, 10, -10, 10)
-                    glDisable(GL_LIGHTING)
-                    glDisable(GL_DEPTH_TEST)
-                    init()
+                    set_render_mode("2D")
                 elif event.key == K_F2:
-                    current_mode = "3D"
-                    transform_mode = None
-                    glMatrixMode(GL_PROJECTION)
-                    glLoadIdentity()
-                    gluPerspective(45, WIDTH / HEIGHT, 0.1, 50)
-                    glMatrixMode(GL_MODELVIEW)
-                    glLoadIdentity()
-                    init_3d()
+                    set_render_mode("3D")
+                elif current_mode == "2D" and event.key in (K_z, K_y) and event.mod & KMOD_CTRL:
+                    # Ctrl+Z undo; Ctrl+Y / Ctrl+Shift+Z redo
+                    if event.key == K_y or event.mod & KMOD_SHIFT:
+                        history.redo()
+                    else:
+                        history.undo()
+                    selected_object = None
+                    line_pivot = None
+                elif current_mode == "2D" and event.key in (K_s, K_o) and event.mod & KMOD_CTRL:
+                    scene_message = None
+                    try:
+                        (save_scene if event.key == K_s else load_scene)()
+                    except (OSError, ValueError) as e:
+                        scene_message = f"Scene {SCENE_PATH}: {e}"
+                    selected_object = None
+                    line_pivot = None
+                elif current_mode == "3D" and event.key == K_m:
+                    scatter_models()
+                elif current_mode == "3D" and event.key == K_v:
+                    show_voxels = not show_voxels
+                    if show_voxels and voxels is None:
+                        build_voxels()
                 elif current_mode == "2D":
                     if event.key == K_p:
                         current_type = "point"
@@ -494,13 +1668,23 @@ def main():
                         current_type = "polygon"
                         transform_mode = None
                     elif event.key == K_w:
+                        before = window_state()
                         window_clipping.clear()
                         clip_objects()
+                        if before is not None:
+                            history.push(WindowEdit(before, None))
                         current_type = "window"
                         transform_mode = None
+                    elif event.key in (K_DELETE, K_BACKSPACE):
+                        target = select_object(*mouse.pos)
+                        if target is not None:
+                            do_edit(DeleteObject(target.index))
+                        selected_object = None
                     elif event.key == K_c:
-                        objects_2d.clear()
+                        do_edit(ClearScene())
                         polygon_points.clear()
+                        selected_object = None
+                        line_pivot = None
                         transform_mode = None
                     elif event.key in (K_1, K_2, K_3, K_4, K_5, K_6):
                         key_map = {
@@ -511,11 +1695,19 @@ def main():
                             K_5: "cyan",
                             K_6: "magenta",
                         }
-                        current_color = COLORS[key_map[event.key]]
-                    elif event.key in (K_EQUALS, K_PLUS):
-                        line_thickness = min(10, line_thickness + 0.5)
-                    elif event.key == K_MINUS:
-                        line_thickness = max(0.5, line_thickness - 0.5)
+                        # mode T/R/Z: ubah objek di bawah kursor (bisa di-undo)
+                        target = select_object(*mouse.pos) if is_transforming() else None
+                        if target is not None:
+                            restyle_object(target, color=COLORS[key_map[event.key]])
+                        else:
+                            current_color = COLORS[key_map[event.key]]
+                    elif event.key in (K_EQUALS, K_PLUS, K_MINUS):
+                        step = -0.5 if event.key == K_MINUS else 0.5
+                        target = select_object(*mouse.pos) if is_transforming() else None
+                        if target is not None:
+                            restyle_object(target, thickness=min(10, max(0.5, target.thickness + step)))
+                        else:
+                            line_thickness = min(10, max(0.5, line_thickness + step))
                     elif event.key == K_t:
                         transform_mode = "Translasi"
                     elif event.key == K_r:
@@ -524,8 +1716,14 @@ def main():
                         transform_mode = "scale"
 
             # ---------------- MOUSE DOWN ----------------
+            if event.type == MOUSEBUTTONDOWN and event.button in (4, 5):
+                # roda mouse (tombol 4 / 5, ikut terekam input_log): zoom di kursor
+                if current_mode == "2D":
+                    camera.zoom_at(*event.pos, ZOOM_STEP if event.button == 4 else 1 / ZOOM_STEP)
+                continue
             if event.type == MOUSEBUTTONDOWN:
-                mx, my = pygame.mouse.get_pos()
+                history.close()
+                mx, my = mouse.pos
                 wx, wy = mouse_to_world(mx, my)
 
                 # Window drag/resize
@@ -536,19 +1734,20 @@ def main():
                     and event.button == 1
                 ):
                     p1, p2 = window_clipping
+                    tol = pick_tolerance()
                     c = {
                         "tl": Point2D(min(p1.x, p2.x), max(p1.y, p2.y)),
                         "tr": Point2D(max(p1.x, p2.x), max(p1.y, p2.y)),
                         "bl": Point2D(min(p1.x, p2.x), min(p1.y, p2.y)),
                         "br": Point2D(max(p1.x, p2.x), min(p1.y, p2.y)),
                     }
-                    if near_corner(wx, wy, c["tl"]):
+                    if near_corner(wx, wy, c["tl"], tol):
                         window_action = "resize_tl"
-                    elif near_corner(wx, wy, c["tr"]):
+                    elif near_corner(wx, wy, c["tr"], tol):
                         window_action = "resize_tr"
-                    elif near_corner(wx, wy, c["bl"]):
+                    elif near_corner(wx, wy, c["bl"], tol):
                         window_action = "resize_bl"
-                    elif near_corner(wx, wy, c["br"]):
+                    elif near_corner(wx, wy, c["br"], tol):
                         window_action = "resize_br"
                     elif point_inside_window(wx, wy):
                         window_action = "move"
@@ -561,7 +1760,7 @@ def main():
                     # Bikin objek baru (jika tidak sedang transform)
                     if not is_transforming():
                         if current_type == "point":
-                            objects_2d.append(
+                            create_object(
                                 Object2D("point", [Point2D(wx, wy)], current_color, line_thickness)
                             )
                         elif current_type in ("line", "square", "ellipse", "polygon"):
@@ -571,7 +1770,7 @@ def main():
                             else:
                                 polygon_points.append(Point2D(wx, wy))
                                 if current_type == "line" and len(polygon_points) == 2:
-                                    objects_2d.append(
+                                    create_object(
                                         Object2D(
                                             "line",
                                             polygon_points.copy(),
@@ -582,7 +1781,7 @@ def main():
                                     drawing = False
                                     polygon_points.clear()
                                 elif current_type == "square" and len(polygon_points) == 2:
-                                    objects_2d.append(
+                                    create_object(
                                         Object2D(
                                             "square",
                                             polygon_points.copy(),
@@ -598,7 +1797,7 @@ def main():
                                         abs(polygon_points[1].x - c.x),
                                         abs(polygon_points[1].y - c.y),
                                     )
-                                    objects_2d.append(
+                                    create_object(
                                         Object2D(
                                             "ellipse",
                                             [c, r],
@@ -614,6 +1813,7 @@ def main():
                                 if len(window_clipping) == 2:
                                     current_type = None
                                     clip_objects()
+                                    history.push(WindowEdit(None, window_state()))
 
                     # Pemilihan objek utk transform
                     if transform_mode and not window_action:
@@ -625,7 +1825,9 @@ def main():
                             and selected_object.obj_type == "line"
                             and transform_mode in ("rotate", "scale")
                         ):
-                            line_pivot = selected_object.points[0]
+                            # salinan, bukan view: pivot tidak ikut bergeser dua kali
+                            p0 = selected_object.points[0]
+                            line_pivot = Point2D(p0.x, p0.y)
                             other = selected_object.points[1]
                             dx, dy = other.x - line_pivot.x, other.y - line_pivot.y
                             line_init_len = np.hypot(dx, dy)
@@ -641,128 +1843,46 @@ def main():
 
             # ---------------- MOUSE MOTION ----------------
             if event.type == MOUSEMOTION:
-                mx, my = pygame.mouse.get_pos()
-                wx, wy = mouse_to_world(mx, my)
-
-                # Window move / resize
-                if window_action and last_mouse_pos:
-                    dx, dy = wx - last_mouse_pos[0], wy - last_mouse_pos[1]
-                    p1, p2 = window_clipping
-                    if window_action == "move":
-                        p1.x += dx
-                        p1.y += dy
-                        p2.x += dx
-                        p2.y += dy
-                    elif window_action == "resize_tl":
-                        p1.x += dx
-                        p2.y += dy
-                    elif window_action == "resize_tr":
-                        p2.x += dx
-                        p2.y += dy
-                    elif window_action == "resize_bl":
-                        p1.x += dx
-                        p1.y += dy
-                    elif window_action == "resize_br":
-                        p2.x += dx
-                        p1.y += dy
-                    last_mouse_pos = (wx, wy)
-                    clip_objects()
-
-                # Transformasi objek
-                elif pygame.mouse.get_pressed()[0] and selected_object and transform_mode:
-                    if selected_object.obj_type == "line":
-                        if transform_mode == "Translasi":
-                            dx = (event.rel[0] / WIDTH) * 20
-                            dy = -(event.rel[1] / HEIGHT) * 20
-                            for p in selected_object.points:
-                                p.x += dx
-                                p.y += dy
-                            for p in selected_object.original_points:
-                                p.x += dx
-                                p.y += dy
-                            if line_pivot:
-                                line_pivot.x += dx
-                                line_pivot.y += dy
-                        elif transform_mode == "rotate":
-                            vx, vy = wx - line_pivot.x, wy - line_pivot.y
-                            vlen = np.hypot(vx, vy)
-                            if vlen > 1e-4:
-                                ux, uy = vx / vlen, vy / vlen
-                                new_end = Point2D(
-                                    line_pivot.x + ux * line_init_len,
-                                    line_pivot.y + uy * line_init_len,
-                                )
-                                selected_object.points[1] = new_end
-                        elif transform_mode == "scale":
-                            proj = (wx - line_pivot.x) * line_unit_dir[0] + (
-                                wy - line_pivot.y
-                            ) * line_unit_dir[1]
-                            new_len = max(0.1, proj)
-                            new_end = Point2D(
-                                line_pivot.x + line_unit_dir[0] * new_len,
-                                line_pivot.y + line_unit_dir[1] * new_len,
-                            )
-                            selected_object.points[1] = new_end
-                    else:
-                        dx = (event.rel[0] / WIDTH) * 20
-                        dy = -(event.rel[1] / HEIGHT) * 20
-                        if transform_mode == "Translasi":
-                            selected_object.translation[0] += dx
-                            selected_object.translation[1] += dy
-                        elif transform_mode == "rotate" and selected_object.obj_type != "point":
-                            selected_object.rotation += dx * 10
-                        elif transform_mode == "scale" and selected_object.obj_type != "point":
-                            selected_object.scale[0] += dx * 0.1
-                            selected_object.scale[1] += dy * 0.1
-
-                # 3‑D rotasi kamera
-                if current_mode == "3D":
-                    dx, dy = event.rel
-                    if pygame.mouse.get_pressed()[0]:
-                        cube.rotation[1] += dx * 0.5
-                        cube.rotation[0] += dy * 0.5
-                    elif pygame.mouse.get_pressed()[2]:
-                        cube.translation[0] += dx * 0.05
-                        cube.translation[1] -= dy * 0.05
+                handle_motion(event.rel)
 
             # ---------------- MOUSE UP ----------------
-            if event.type == MOUSEBUTTONUP:
+            # roda mouse (4 / 5) bukan akhir drag: zoom di tengah drag tidak
+            # memotong drag maupun entri undo-nya
+            if event.type == MOUSEBUTTONUP and event.button not in (4, 5):
+                history.close()
                 window_action = None
                 last_mouse_pos = None
                 selected_object = None
 
+        if motion is not None:
+            handle_motion(motion)
+        needs_redraw = False
+        profiler.lap("events")
+
+        if capture is not None:
+            capture.begin_frame()
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
         if current_mode == "2D":
+            # proyeksi kamera untuk grid, window & preview; renderer memakai camera.view
+            glMatrixMode(GL_PROJECTION)
+            glLoadTransposeMatrixd(camera.projection)
+            glMatrixMode(GL_MODELVIEW)
             draw_grid()
             draw_window_clipping()
             apply_window_scissor()
-            for o in objects_2d:
-                o.draw()
-
-            # --- AKTIFKAN SCISSOR JIKA ADA WINDOW KLIPING ---
-            if len(window_clipping) == 2:
-                p1, p2 = window_clipping
-                xmin, ymin = min(p1.x, p2.x), min(p1.y, p2.y)
-                xmax, ymax = max(p1.x, p2.x), max(p1.y, p2.y)
-
-                # konversi koordinat dunia → pixel
-                x_px = int((xmin + 10) / 20 * WIDTH)
-                y_px = int((10 - ymax) / 20 * HEIGHT)         # OpenGL counts y from bottom
-                w_px = int((xmax - xmin) / 20 * WIDTH)
-                h_px = int((ymax - ymin) / 20 * HEIGHT)
-
-                glEnable(GL_SCISSOR_TEST)
-                glScissor(x_px, y_px, w_px, h_px)
-            else:
-                glDisable(GL_SCISSOR_TEST)
-
+            profiler.lap("grid")
+            visible = visible_objects()
+            scene_renderer.set_px_per_unit(camera.detail)
+            synced = len(scene_renderer.dirty_objects)
+            scene_renderer.draw(camera.view, visible)
             glDisable(GL_SCISSOR_TEST)
+            profiler.lap("scene")
 
             # Preview saat drawing
             if drawing and not is_transforming() and polygon_points:
                 glColor3fv(current_color)
                 glLineWidth(line_thickness)
-                mx, my = pygame.mouse.get_pos()
+                mx, my = mouse.pos
                 wx, wy = mouse_to_world(mx, my)
                 if current_type == "line":
                     p = polygon_points[0]
@@ -781,10 +1901,10 @@ def main():
                 elif current_type == "ellipse":
                     c = polygon_points[0]
                     rx, ry = abs(wx - c.x), abs(wy - c.y)
+                    n = segments_for(screen_radius(rx, ry, 1.0, 1.0, camera.px_per_unit))
                     glBegin(GL_LINE_LOOP)
-                    for i in range(100):
-                        ang = 2 * np.pi * i / 100
-                        glVertex2f(c.x + rx * np.cos(ang), c.y + ry * np.sin(ang))
+                    for vx, vy in ellipse_vertices(rx, ry, n).tolist():
+                        glVertex2f(c.x + vx, c.y + vy)
                     glEnd()
                 elif current_type == "polygon":
                     glBegin(GL_LINE_STRIP)
@@ -792,24 +1912,58 @@ def main():
                         glVertex2f(p.x, p.y)
                     glVertex2f(wx, wy)
                     glEnd()
+            profiler.lap("preview")
         else:
-            glLoadIdentity()
-            gluLookAt(*camera_pos, *camera_target, *camera_up)
+            from scene3d import look_at
+            glLoadTransposeMatrixd(look_at(camera_pos, camera_target, camera_up))
             glDisable(GL_LIGHTING)
-            glColor3f(0.4, 0.4, 0.4)
-            glBegin(GL_LINES)
-            for i in range(-10, 11, 2):
-                glVertex3f(i, 0, -10)
-                glVertex3f(i, 0, 10)
-                glVertex3f(-10, 0, i)
-                glVertex3f(10, 0, i)
-            glEnd()
+            draw_floor_grid()
             glEnable(GL_LIGHTING)
-            cube.draw()
+            draw_scene_3d()
+            if show_voxels:
+                voxels.draw()
+            profiler.lap("3d")
 
         draw_ui()
+        profiler.lap("ui")
+        draw_profiler_hud()
+        profiler.lap("hud")
+        if capture is not None:
+            capture.end_frame()
+        profiler.lap("capture")
         pygame.display.flip()
-        pygame.time.wait(10)
+        profiler.lap("flip")
+        if profiler.enabled:
+            if current_mode == "2D":
+                profiler.end_frame(
+                    objects=scene.n, visible=int(scene.visible[:scene.n].sum()), synced=synced,
+                    drawn=scene_renderer.submitted,
+                )
+            else:
+                profiler.end_frame(
+                    objects=scene_3d.n, instances=voxels.n if show_voxels else 0, **scene_3d.stats
+                )
+
+        if input_player is not None:
+            # replay: secepatnya, waktu frame termasuk kerja GPU
+            glFinish()
+            input_player.frame_done(time.perf_counter() - frame_t0)
+        elif event_driven:
+            # batasi frame rate: sisa anggaran frame dipakai menampung event
+            # berikutnya (yang lalu digabung); frame berat tidak ditunda lagi
+            rest = 1.0 / MAX_FPS - (time.perf_counter() - frame_t0)
+            if rest > 0.001:
+                pygame.time.wait(int(rest * 1000))
+        else:
+            pygame.time.wait(10)
+
+# hitung panggilan GL di modul yang menggambar (hanya saat profiler aktif)
+profiler.gl_calls.watch(
+    sys.modules[__name__],
+    sys.modules[SceneRenderer2D.__module__],
+    sys.modules[TextCache.__module__],
+    sys.modules[StaticGeometry.__module__],
+)     # modul 3D didaftarkan setup_3d / build_voxels saat diimpor
 
 if __name__ == "__main__":
-    main()
+    main(*sys.argv[1:])
@@ -0,0 +1,142 @@
+"""
+Benchmark cache transformasi objek 2D (matriks affine, invers, bbox dunia di
+SceneStore): hitung ulang semua sekaligus (NumPy) vs per objek, query bbox
+dunia dari cache vs dihitung ulang tiap query, dan picking scene yang
+ditransformasi dicocokkan dengan acuan brute force (matriks dibangun ulang
+dari translasi/rotasi/skala, tanpa cache dan tanpa indeks grid).
+
+    python benchmarks/bench_affine.py --n 20000 --picks 2000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import scenegen  # noqa: E402
+from scenegen import app  # noqa: E402
+
+
+def transform_scene(rng, frac=0.5):
+    """Translasi/rotasi/skala acak untuk sebagian bentuk non-garis (seperti drag T/R/Z)."""
+    st = app.scene
+    idx = np.flatnonzero(st.types[:st.n] != app.TYPE_CODES["line"])
+    idx = idx[rng.random(len(idx)) < frac]
+    st.translation[idx] = rng.uniform(-2, 2, (len(idx), 2))
+    turn = idx[st.types[idx] != app.TYPE_CODES["point"]]
+    st.rotation[turn] = rng.uniform(-180, 180, len(turn))
+    st.scale[turn] = rng.uniform(0.5, 1.5, (len(turn), 2))
+    st.invalidate_transform(idx)
+    return idx
+
+
+def reference_matrix(i):
+    """Matriks titik asli ➜ dunia sesuai urutan glTranslatef · glRotatef · glScalef."""
+    st = app.scene
+    kind = app.TYPE_NAMES[st.types[i]]
+    if kind == "line":
+        return np.eye(3)
+    pts = st.orig[st.offset[i]:st.offset[i] + st.count[i]]
+    pivot = {"square": pts.mean(axis=0), "ellipse": pts[0]}.get(kind, np.zeros(2))
+    a = np.radians(st.rotation[i])
+    t = np.eye(3)
+    t[:2, 2] = st.translation[i] + pivot
+    r = np.array([[np.cos(a), -np.sin(a), 0], [np.sin(a), np.cos(a), 0], [0, 0, 1]])
+    s = np.diag([*st.scale[i], 1.0])
+    back = np.eye(3)
+    back[:2, 2] = -pivot
+    return t @ r @ s @ back
+
+
+def reference_pick(wx, wy):
+    """select_object tanpa cache & tanpa grid: semua objek dari paling atas."""
+    st = app.scene
+    for i in range(st.n - 1, -1, -1):
+        obj = app.objects_2d[i]
+        if not obj.points:
+            continue
+        kind = obj.obj_type
+        if kind == "line":
+            (x1, y1), (x2, y2) = obj.coords().tolist()
+            if app.point_near_line(wx, wy, x1, y1, x2, y2, app.PICK_TOL):
+                return i
+            continue
+        lx, ly, _ = np.linalg.solve(reference_matrix(i), [wx, wy, 1.0])
+        pts = obj.original_coords()
+        if kind == "point":
+            hit = abs(pts[0, 0] - lx) < app.PICK_TOL and abs(pts[0, 1] - ly) < app.PICK_TOL
+        elif kind == "ellipse":
+            (cx, cy), (a, b) = pts
+            hit = ((lx - cx) / a) ** 2 + ((ly - cy) / b) ** 2 <= 1.0
+        else:
+            lo, hi = pts.min(axis=0), pts.max(axis=0)
+            hit = lo[0] <= lx <= hi[0] and lo[1] <= ly <= hi[1]
+        if hit:
+            return i
+    return None
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=20_000)
+    ap.add_argument("--picks", type=int, default=2000)
+    ap.add_argument("--check", type=int, default=100, help="klik yang dicocokkan dengan acuan brute force")
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    scenegen.generate(args.n, seed=args.seed)
+    st = app.scene
+    moved = transform_scene(rng)
+    everything = np.arange(st.n)
+    print(f"objek      : {st.n}, ditransformasi {len(moved)}")
+
+    t0 = time.perf_counter()
+    st.update_transforms(everything)
+    t_batch = time.perf_counter() - t0
+    some = rng.choice(st.n, min(st.n, 5000), replace=False)
+    t0 = time.perf_counter()
+    for i in some.tolist():
+        st.update_transforms([i])
+    t_loop = (time.perf_counter() - t0) / len(some) * st.n
+    print(f"update     : batch {t_batch * 1e3:8.2f} ms   per objek {t_loop * 1e3:8.2f} ms"
+          f" (perkiraan)   ({t_loop / t_batch:.0f}x)")
+
+    t0 = time.perf_counter()
+    for _ in range(10):
+        st.world_bboxes(everything)
+    t_cached = (time.perf_counter() - t0) / 10
+    t0 = time.perf_counter()
+    for _ in range(10):
+        st.invalidate_transform(everything)
+        st.world_bboxes(everything)
+    t_fresh = (time.perf_counter() - t0) / 10
+    print(f"bbox dunia : cache {t_cached * 1e3:8.2f} ms   hitung ulang {t_fresh * 1e3:8.2f} ms"
+          f"   ({t_fresh / t_cached:.0f}x)")
+
+    errs = [np.abs(reference_matrix(i) - st.matrices([i])[0]).max() for i in some[:500].tolist()]
+    print(f"matriks    : selisih maks vs acuan {max(errs):.2e}")
+
+    t0 = time.perf_counter()
+    scenegen.build_pick_index()
+    print(f"indeks     : {(time.perf_counter() - t0) * 1e3:8.2f} ms")
+    clicks = rng.integers(0, (app.WIDTH, app.HEIGHT), size=(args.picks, 2)).tolist()
+    t0 = time.perf_counter()
+    hits = [app.select_object(mx, my) for mx, my in clicks]
+    dt = time.perf_counter() - t0
+    rate = sum(h is not None for h in hits) / len(hits)
+    print(f"pick       : {dt / len(clicks) * 1e6:8.1f} us/klik   kena {rate:.0%}")
+
+    wrong = 0
+    for (mx, my), hit in zip(clicks[:args.check], hits):
+        ref = reference_pick(*app.mouse_to_world(mx, my))
+        wrong += (hit.index if hit is not None else None) != ref
+    print(f"cocok acuan: {args.check - wrong}/{args.check}")
+    sys.exit(1 if wrong or max(errs) > 1e-9 else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark kamera 2D + culling: scene acak dengan kepadatan tetap (jumlah
+objek per luas tampilan awal sama) tetapi total objek makin besar. Kamera
+digeser sedikit setiap frame (pan, tanpa membangun ulang verteks); waktu
+frame dengan culling (pick_index.query_rect) harus hampir tetap, tanpa
+culling naik mengikuti ukuran scene. Frame dengan culling dicocokkan piksel
+dengan frame yang menggambar semua objek.
+
+    python benchmarks/bench_camera.py --sizes 5000 20000 80000 320000 --density 2500
+"""
+import argparse
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import headless  # noqa: E402  (harus sebelum OpenGL)
+
+import numpy as np  # noqa: E402
+from OpenGL.GL import *  # noqa: E402,F403
+
+import scenegen  # noqa: E402
+from scenegen import app  # noqa: E402
+from check_render import grab, setup_2d  # noqa: E402
+
+
+def frame(cull):
+    cam = app.camera
+    glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+    glMatrixMode(GL_PROJECTION)
+    glLoadTransposeMatrixd(cam.projection)
+    glMatrixMode(GL_MODELVIEW)
+    app.draw_grid()
+    visible = app.visible_objects() if cull else None
+    app.scene_renderer.set_px_per_unit(cam.detail)
+    app.scene_renderer.draw(cam.view, visible)
+
+
+def run(frames, cull):
+    """Rata-rata ms per frame dan objek terkirim, kamera bergeser 2 px per frame."""
+    app.camera.reset()
+    frame(cull)
+    glFinish()
+    sent = 0
+    t0 = time.perf_counter()
+    for k in range(frames):
+        app.camera.pan(2 if k < frames // 2 else -2, 1)
+        frame(cull)
+        sent += app.scene_renderer.submitted
+    glFinish()
+    return (time.perf_counter() - t0) / frames * 1e3, sent / frames
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes", type=int, nargs="+", default=[5_000, 20_000, 80_000, 320_000])
+    ap.add_argument("--density", type=int, default=2_500, help="objek per luas tampilan awal (20x20)")
+    ap.add_argument("--frames", type=int, default=60)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    headless.create_context(app.WIDTH, app.HEIGHT)
+    setup_2d()
+    print(f"{app.WIDTH}x{app.HEIGHT}, {args.density} objek per tampilan, {args.frames} frame pan")
+    same = True
+    for n in args.sizes:
+        extent = 10.0 * math.sqrt(n / args.density)
+        scenegen.generate(n, seed=args.seed, extent=extent)
+        t0 = time.perf_counter()
+        scenegen.build_pick_index()
+        app.camera.reset()
+        frame(False)
+        glFinish()
+        build = (time.perf_counter() - t0) * 1e3
+
+        app.camera.reset()
+        app.camera.pan(37, -23)
+        frame(True)
+        culled = grab()
+        frame(False)
+        same &= np.array_equal(culled, grab())
+
+        t_cull, sent_cull = run(args.frames, True)
+        t_all, sent_all = run(args.frames, False)
+        q = time.perf_counter()
+        for _ in range(args.frames):
+            app.visible_objects()
+        t_query = (time.perf_counter() - q) / args.frames * 1e3
+        print(f"n {n:7d} (±{extent:5.0f})  bangun {build:8.0f} ms   culling {t_cull:7.2f} ms/frame"
+              f" ({sent_cull:7.0f} objek, query {t_query:5.2f} ms)   semua {t_all:8.2f} ms/frame ({sent_all:7.0f} objek)")
+    print(f"frame culling sama dengan tanpa culling: {same}")
+    sys.exit(0 if same else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark tangkapan frame (capture.py) di konteks GL offscreen: waktu frame
+tanpa tangkapan, dengan glReadPixels sinkron per frame (langsung / plus
+encode PNG di loop), dan dengan FBO + PBO asinkron + thread penulis (file
+mentah .rgba dan PNG, dengan / tanpa blit ke layar). Frame terakhir file
+mentah dicocokkan dengan hasil blit-nya di layar (glReadPixels sinkron).
+
+    python benchmarks/bench_capture.py --n 20000 --frames 120
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import headless  # noqa: E402  (harus sebelum OpenGL)
+
+import numpy as np  # noqa: E402
+from OpenGL.GL import *  # noqa: E402,F403
+
+import scenegen  # noqa: E402
+from scenegen import app  # noqa: E402
+from check_render import grab, setup_2d  # noqa: E402
+
+from capture import FrameCapture  # noqa: E402
+from raster import write_png  # noqa: E402
+
+
+def draw():
+    glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+    app.draw_grid()
+    app.scene_renderer.draw()
+
+
+def run(frames, before=None, after=None):
+    """Rata-rata ms per frame (GPU disinkronkan sekali di akhir)."""
+    draw()
+    glFinish()
+    t0 = time.perf_counter()
+    for _ in range(frames):
+        if before:
+            before()
+        draw()
+        if after:
+            after()
+    glFinish()
+    return (time.perf_counter() - t0) / frames * 1e3
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=20_000)
+    ap.add_argument("--frames", type=int, default=120)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    headless.create_context(app.WIDTH, app.HEIGHT)
+    setup_2d()
+    scenegen.generate(args.n, seed=args.seed)
+    print(f"objek {app.scene.n}, {app.WIDTH}x{app.HEIGHT}, {args.frames} frame")
+
+    base = run(args.frames)
+    rows = [("tanpa tangkapan", base, None)]
+    rows.append(("glReadPixels sinkron", run(args.frames, after=grab), None))
+    with tempfile.TemporaryDirectory() as tmp:
+        png = os.path.join(tmp, "sync.png")
+        rows.append(("sinkron + PNG di loop", run(args.frames, after=lambda: write_png(png, grab()[::-1])), None))
+
+        raw_path = os.path.join(tmp, "frames.rgba")
+        for name, target, present in (("PBO + penulis (.rgba)", raw_path, True),
+                                      ("  tanpa blit ke layar", os.path.join(tmp, "nopresent.rgba"), False),
+                                      ("PBO + penulis (PNG)", os.path.join(tmp, "png"), True)):
+            cap = FrameCapture(app.WIDTH, app.HEIGHT, present=present)
+            cap.start(target)
+            t = run(args.frames, before=cap.begin_frame, after=cap.end_frame)
+            t0 = time.perf_counter()
+            cap.close()
+            drain = (time.perf_counter() - t0) * 1e3
+            if target == raw_path:
+                ref = grab()[::-1]
+            rows.append((name, t, f"end_frame {cap.readback_ms / args.frames:.2f} ms/frame, {cap.frames} frame"
+                                  f" ditulis, tunggu antrean {cap.stall_ms:.0f} ms, sisa tulis {drain:.0f} ms"))
+            cap.release()
+
+        raw = np.fromfile(raw_path, dtype=np.uint8)
+        last = raw[-ref.size:].reshape(ref.shape)
+        same = raw.size == ref.size * args.frames and np.array_equal(last, ref)
+
+    for name, t, note in rows:
+        print(f"{name:24s}: {t:8.2f} ms/frame  (+{(t / base - 1) * 100:6.1f} %)" + (f"   {note}" if note else ""))
+    print(f"frame .rgba sama dengan layar: {same}")
+    sys.exit(0 if same else 1)
+
+
+if __name__ == "__main__":
+    main()
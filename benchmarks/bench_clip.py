@@ -0,0 +1,115 @@
+"""
+Benchmark kliping: jalur lama per-objek vs batch NumPy.
+
+Jalankan dari root repo:
+    python benchmarks/bench_clip.py --n 20000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import TubesGrafkom as app  # noqa: E402
+
+
+def legacy_clip_objects():
+    """Salinan ``clip_objects`` sebelum versi batch, sebagai pembanding."""
+    app.scene.clipped.clear()
+    p1, p2 = app.window_clipping
+    xmin, ymin = min(p1.x, p2.x), min(p1.y, p2.y)
+    xmax, ymax = max(p1.x, p2.x), max(p1.y, p2.y)
+
+    for obj in app.objects_2d:
+        obj.points = [app.Point2D(p.x, p.y) for p in obj.original_points]
+        obj.color = obj.original_color
+        if obj.obj_type == "line":
+            p0, p1_ = obj.original_points
+            clip = app.cohen_sutherland_clip(
+                p0.x, p0.y, p1_.x, p1_.y, xmin, ymin, xmax, ymax
+            )
+            if clip:
+                x0, y0, x1_, y1_ = clip
+                obj.points = [app.Point2D(x0, y0), app.Point2D(x1_, y1_)]
+                inside0 = xmin <= p0.x <= xmax and ymin <= p0.y <= ymax
+                inside1 = xmin <= p1_.x <= xmax and ymin <= p1_.y <= ymax
+                obj.color = (
+                    app.COLORS["green"] if inside0 and inside1 else obj.original_color
+                )
+            else:
+                obj.points = []
+        else:
+            bxmin, bymin, bxmax, bymax = obj.bounding_box()
+            if bxmax < xmin or bxmin > xmax or bymax < ymin or bymin > ymax:
+                obj.points = []
+            elif xmin <= bxmin and bxmax <= xmax and ymin <= bymin and bymax <= ymax:
+                obj.color = app.COLORS["green"]
+
+
+def make_scene(n, seed=0):
+    rng = np.random.default_rng(seed)
+    kinds = ("point", "line", "square", "ellipse")
+    xy = rng.uniform(-10, 10, size=(n, 4)).tolist()
+    objs = []
+    for i, (a, b, c, d) in enumerate(xy):
+        kind = kinds[i % len(kinds)]
+        if kind == "point":
+            pts = [app.Point2D(a, b)]
+        elif kind == "ellipse":
+            pts = [app.Point2D(a, b), app.Point2D(abs(c) / 5, abs(d) / 5)]
+        else:
+            pts = [app.Point2D(a, b), app.Point2D(c, d)]
+        objs.append(app.Object2D(kind, pts, app.COLORS["red"]))
+    return objs
+
+
+def snapshot():
+    # hanya garis: bentuk lain kini diklip secara geometris (Sutherland–Hodgman),
+    # sedangkan jalur lama hanya menguji bbox titik aslinya
+    return [
+        (o.color, [(p.x, p.y) for p in o.points])
+        for o in app.objects_2d if o.obj_type == "line"
+    ]
+
+
+def timeit(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def full_clip():
+    app.invalidate_clip()      # paksa kliping penuh, bukan inkremental
+    app.clip_objects()
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=20000)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    make_scene(args.n)
+    app.mark_scene_dirty()
+    app.window_clipping[:] = [app.Point2D(-4, -3), app.Point2D(5, 6)]
+
+    legacy_clip_objects()
+    ref = snapshot()
+    app.clip_objects()
+    assert snapshot() == ref, "hasil batch berbeda dari jalur lama"
+
+    t_old = timeit(legacy_clip_objects, args.repeat)
+    t_new = timeit(full_clip, args.repeat)
+    print(f"objek      : {args.n}")
+    print(f"per-objek  : {t_old * 1e3:8.2f} ms")
+    print(f"batch NumPy: {t_new * 1e3:8.2f} ms   ({t_old / t_new:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark frustum culling + LOD scene 3D (scene3d.py): semua model digambar
+detail penuh tiap frame vs hanya yang lolos frustum dengan LOD, di konteks
+GL offscreen. Tanpa LOD hasil kedua jalur harus identik piksel-per-piksel.
+
+    python benchmarks/bench_cull.py --n 1000 --tris 20000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import headless  # noqa: E402  (harus sebelum OpenGL)
+
+import numpy as np  # noqa: E402
+from OpenGL.GL import *  # noqa: E402,F403
+from OpenGL.GLU import gluLookAt, gluPerspective  # noqa: E402
+
+import scene3d  # noqa: E402
+import TubesGrafkom as app  # noqa: E402
+from bench_mesh import sphere  # noqa: E402
+from check_render import grab  # noqa: E402
+from mesh import Mesh, fan_triangulate  # noqa: E402
+
+
+def draw_all():
+    sc = app.scene_3d
+    for i in range(sc.n):
+        sc.draw_object(i)
+    return {"drawn": sc.n, "culled": 0, "triangles": sum(sc.lods[m].mesh.n_faces for m in sc.model[:sc.n])}
+
+
+def run(fn, frames):
+    times, stats = [], None
+    for _ in range(frames):
+        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+        glFinish()
+        t0 = time.perf_counter()
+        stats = fn()
+        glFinish()
+        times.append(time.perf_counter() - t0)
+    return grab(), float(np.median(times)) * 1e3, stats
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=1000, help="jumlah model")
+    ap.add_argument("--tris", type=int, default=20000, help="segitiga per model")
+    ap.add_argument("--extent", type=float, default=25.0)
+    ap.add_argument("--frames", type=int, default=5)
+    args = ap.parse_args()
+
+    headless.create_context(app.WIDTH, app.HEIGHT)
+    glViewport(0, 0, app.WIDTH, app.HEIGHT)
+    app.set_render_mode("3D")
+    gluLookAt(*app.camera_pos, *app.camera_target, *app.camera_up)
+    app.scene_3d.clear()            # tanpa kubus bawaan setup_3d
+
+    rows = max(2, int(np.sqrt(args.tris / 4)))
+    verts, quads = sphere(rows, 2 * rows)
+    t0 = time.perf_counter()
+    app.cube = app.Model3D(Mesh(verts, fan_triangulate(quads.ravel(), np.full(len(quads), 4))), scene=app.scene_3d)
+    t_lod = time.perf_counter() - t0
+    app.scatter_models(args.n - 1, extent=args.extent, seed=0)
+    lod = app.cube.lod
+    print(f"model        : {args.n} x {lod.mesh.n_faces} segitiga, LOD {[m.n_faces for m in lod.levels]}"
+          f" (dibangun {t_lod * 1e3:.1f} ms)")
+
+    sc = app.scene_3d
+    clip = scene3d.perspective(app.FOVY, app.WIDTH / app.HEIGHT, app.Z_NEAR, app.Z_FAR) @ \
+        scene3d.look_at(app.camera_pos, app.camera_target, app.camera_up)
+    t0 = time.perf_counter()
+    for _ in range(20):
+        sc.visibility(app.camera_pos, clip, app.FOVY, app.HEIGHT)
+    print(f"uji frustum  : {(time.perf_counter() - t0) / 20 * 1e3:8.3f} ms untuk {sc.n} objek")
+
+    full = run(draw_all, args.frames)
+    culled = run(app.draw_scene_3d, args.frames)
+    pixel_lod = scene3d.LOD_PIXELS
+    scene3d.LOD_PIXELS = (0.0,) * len(pixel_lod)
+    only_cull = run(app.draw_scene_3d, args.frames)
+    scene3d.LOD_PIXELS = pixel_lod
+
+    for name, res in (("semua", full), ("culling", only_cull), ("culling+LOD", culled)):
+        st = res[2]
+        print(f"{name:12s} : {res[1]:8.2f} ms/frame  tergambar {st['drawn']:5d}  terbuang {st['culled']:5d}"
+              f"  segitiga {st['triangles']}")
+    diff = int(np.any(full[0] != only_cull[0], axis=2).sum())
+    print(f"piksel berbeda (tanpa LOD): {diff}")
+    sys.exit(1 if diff else 0)
+
+
+if __name__ == "__main__":
+    main()
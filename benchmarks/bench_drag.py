@@ -0,0 +1,95 @@
+"""
+Benchmark drag window kliping: kliping penuh per MOUSEMOTION vs kliping
+inkremental (hanya objek di pita sapuan tepi window). Hasil keduanya
+dibandingkan di akhir.
+
+    python benchmarks/bench_drag.py --n 100000 --events 200
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import TubesGrafkom as app  # noqa: E402
+
+
+def make_small_scene(n, size=0.5, seed=0):
+    """
+    Objek kecil tersebar di seluruh kanvas (seperti gambar tangan di editor),
+    dibuat lewat scene.add_many supaya cepat untuk n besar.
+    """
+    rng = np.random.default_rng(seed)
+    app.clear_objects()
+    kinds = ("point", "line", "square", "ellipse")
+    for k, kind in enumerate(kinds):
+        m = n // len(kinds) + (k < n % len(kinds))
+        a = rng.uniform(-10, 10, size=(m, 1, 2))
+        if kind == "point":
+            coords = a
+        elif kind == "ellipse":
+            coords = np.concatenate((a, rng.uniform(0.02, size, size=(m, 1, 2))), axis=1)
+        else:
+            coords = np.concatenate((a, a + rng.uniform(-size, size, size=(m, 1, 2))), axis=1)
+        app.scene.add_many(kind, coords, app.COLORS["red"])
+    app.mark_scene_dirty()
+
+
+def drag(deltas, action, incremental):
+    app.window_clipping[:] = [app.Point2D(-4, -3), app.Point2D(5, 6)]
+    app.invalidate_clip()
+    app.clip_objects()
+    t0 = time.perf_counter()
+    for dx, dy in deltas:
+        p1, p2 = app.window_clipping
+        if action == "move":
+            p1.x += dx
+            p1.y += dy
+            p2.x += dx
+            p2.y += dy
+        else:                       # resize_br
+            p2.x += dx
+            p1.y += dy
+        if not incremental:
+            app.invalidate_clip()
+        app.clip_objects()
+    dt = time.perf_counter() - t0
+    n = app.scene.n
+    visible = app.scene.visible[:n].copy()
+    # titik tampil objek tersembunyi tidak bermakna
+    rows = np.repeat(visible, app.scene.count[:n])
+    state = (visible, app.scene.color[:n].copy(), app.scene.disp[:app.scene.nv][rows])
+    return dt / len(deltas), state
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=100_000)
+    ap.add_argument("--events", type=int, default=200)
+    ap.add_argument("--size", type=float, default=0.5, help="ukuran objek (unit dunia)")
+    args = ap.parse_args()
+
+    make_small_scene(args.n, args.size)
+    rng = np.random.default_rng(0)
+    # gerakan mouse kecil: 1-3 piksel per event
+    deltas = rng.uniform(-3, 3, size=(args.events, 2)) * (20 / app.WIDTH, 20 / app.HEIGHT)
+
+    print(f"objek : {args.n} (ukuran <= {args.size}), event : {args.events}")
+    for action in ("move", "resize_br"):
+        t_full, ref = drag(deltas, action, incremental=False)
+        t_inc, out = drag(deltas, action, incremental=True)
+        same = all(np.array_equal(a, b) for a, b in zip(ref, out))
+        print(
+            f"{action:10s}: penuh {t_full * 1e3:7.2f} ms/event   "
+            f"inkremental {t_inc * 1e3:7.2f} ms/event   "
+            f"({t_full / t_inc:.1f}x)  hasil sama: {same}"
+        )
+        if not same:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Benchmark riwayat undo/redo (history.py): memori riwayat per edit untuk
+beberapa ukuran scene dibandingkan dengan satu snapshot scene penuh, waktu
+undo/redo, dan pemeriksaan bahwa undo semua edit mengembalikan scene asal.
+
+    python benchmarks/bench_history.py --sizes 1000 10000 100000 --edits 500
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import scenegen  # noqa: E402
+from scenegen import app  # noqa: E402
+
+
+def snapshot():
+    st = app.scene
+    return (st.n, st.alive[:st.n].copy(), st.translation[:st.n].copy(),
+            st.color[:st.n].copy(), st.thickness[:st.n].copy(), st.orig[:st.nv].copy())
+
+
+def same(a, b):
+    return a[0] == b[0] and all(np.array_equal(x, y) for x, y in zip(a[1:], b[1:]))
+
+
+def edit(rng, k):
+    """Satu edit acak seperti dari UI: drag T (8 langkah), warna, tebal, hapus, atau buat."""
+    st = app.scene
+    i = int(rng.integers(st.n))
+    obj = app.objects_2d[i]
+    kind = k % 5
+    if kind == 0 and obj.obj_type != "line" and st.alive[i]:
+        for _ in range(8):
+            before = app.transform_state(obj)
+            obj.translation[0] += 0.05
+            app.reclip_shape(obj)
+            app.history.push(app.TransformObject(i, before, app.transform_state(obj)))
+    elif kind == 1:
+        app.restyle_object(obj, color=tuple(rng.random(3)))
+    elif kind == 2:
+        app.restyle_object(obj, thickness=float(rng.choice(scenegen.THICKNESSES)))
+    elif kind == 3 and st.alive[i]:
+        app.do_edit(app.DeleteObject(i))
+    else:
+        p = rng.uniform(-5, 5, 2)
+        app.create_object(app.Object2D("square", [app.Point2D(*p), app.Point2D(*(p + 0.5))],
+                                       app.COLORS["red"], 2.0))
+    app.history.close()
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes", type=int, nargs="+", default=[1000, 10_000, 100_000])
+    ap.add_argument("--edits", type=int, default=500)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    ok = True
+    for n in args.sizes:
+        scenegen.generate(n, seed=args.seed)
+        scenegen.build_pick_index()
+        app.history.clear()
+        rng = np.random.default_rng(args.seed)
+        before = snapshot()
+        snap_bytes = app.scene.nbytes()
+
+        t0 = time.perf_counter()
+        for k in range(args.edits):
+            edit(rng, k)
+        t_edit = time.perf_counter() - t0
+        entries, used = len(app.history), app.history.nbytes
+
+        t0 = time.perf_counter()
+        while app.history.undo():
+            pass
+        t_undo = time.perf_counter() - t0
+        restored = same(snapshot(), before)
+        t0 = time.perf_counter()
+        while app.history.redo():
+            pass
+        t_redo = time.perf_counter() - t0
+
+        clear = app.ClearScene()
+        clear.redo()
+        clear_bytes = clear.nbytes
+        app.history.push(clear)
+        kept = "dipindah, bukan disalin" if clear in app.history.undo_stack else "melebihi budget, dibuang"
+        ok &= restored
+        print(f"n={n:7d}  entri {entries:4d}  riwayat {used / 1024:8.1f} KiB ({used / entries:5.0f} B/entri)"
+              f"  snapshot {snap_bytes / 1024:9.1f} KiB  clear {clear_bytes / 1024:9.1f} KiB ({kept})")
+        print(f"           edit {t_edit / args.edits * 1e3:6.2f} ms  undo {t_undo / entries * 1e3:6.2f} ms"
+              f"  redo {t_redo / entries * 1e3:6.2f} ms per entri  undo semua ➜ scene asal: {restored}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
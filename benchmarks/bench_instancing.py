@@ -0,0 +1,132 @@
+"""
+Benchmark instancing (instancing.py): N kubus dengan mesh yang sama digambar
+per objek (glPushMatrix/glRotatef/glColor + glDrawElements per kubus, seperti
+Scene3D.draw_object) vs jalur instanced (satu glDrawElementsInstanced) vs
+jalur batch CPU (satu glDrawElements), di konteks GL offscreen. Tiap frame
+~1% instance diubah untuk mengukur unggah parsial.
+
+    python benchmarks/bench_instancing.py --n 10000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import headless  # noqa: E402  (harus sebelum OpenGL)
+
+import numpy as np  # noqa: E402
+from OpenGL.GL import *  # noqa: E402,F403
+from OpenGL.GLU import gluLookAt, gluPerspective  # noqa: E402
+
+import instancing  # noqa: E402
+import mesh as mesh_mod  # noqa: E402
+import TubesGrafkom as app  # noqa: E402
+from check_render import grab  # noqa: E402
+from instancing import InstancedMesh  # noqa: E402
+from mesh import GpuMesh, Mesh  # noqa: E402
+from profiler import GLCallCounter  # noqa: E402
+
+
+def layout(n, seed):
+    side = int(np.ceil(np.sqrt(n)))
+    i = np.arange(n)
+    t = np.column_stack(((i % side) - side / 2, np.zeros(n), (i // side) - side / 2)) * (6.0 / side)
+    rng = np.random.default_rng(seed)
+    t[:, 1] = rng.uniform(-0.5, 0.5, n)
+    return t, rng.uniform(0, 360, (n, 3)), rng.uniform(0.2, 1.0, (n, 3))
+
+
+def per_object(gpu, t, r, c):
+    def draw():
+        for i in range(len(t)):
+            glPushMatrix()
+            glTranslatef(*t[i])
+            glRotatef(r[i, 0], 1, 0, 0)
+            glRotatef(r[i, 1], 0, 1, 0)
+            glRotatef(r[i, 2], 0, 0, 1)
+            glColor3f(*c[i])
+            gpu.draw()
+            glPopMatrix()
+    return draw
+
+
+def run(draw, change, frames, counter):
+    times = []
+    for k in range(frames):
+        change(k)
+        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+        glFinish()
+        counter.take()
+        t0 = time.perf_counter()
+        draw()
+        glFinish()
+        times.append(time.perf_counter() - t0)
+    return grab(), float(np.median(times)) * 1e3, counter.take()
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=10000, help="jumlah kubus")
+    ap.add_argument("--frames", type=int, default=5)
+    ap.add_argument("--changed", type=float, default=0.01, help="fraksi instance yang berubah per frame")
+    args = ap.parse_args()
+
+    headless.create_context(app.WIDTH, app.HEIGHT)
+    glViewport(0, 0, app.WIDTH, app.HEIGHT)
+    app.set_render_mode("3D")
+    gluLookAt(*app.camera_pos, *app.camera_target, *app.camera_up)
+    glClearColor(*app.BG_COLOR)
+    print(f"instancing   : {'didukung' if instancing.instancing_supported() else 'TIDAK didukung'}")
+
+    # tanpa warna per verteks: warna datang dari glColor / atribut instance
+    cube = app.Cube3D.box(3.0 / np.ceil(np.sqrt(args.n)) * 0.6)
+    box = Mesh(cube.vertices, cube.faces, None, cube.normals)
+    t, r, c = layout(args.n, seed=0)
+    t_ref, c_ref = t.copy(), c.copy()
+    rng = np.random.default_rng(1)
+    picks = [rng.choice(args.n, max(1, int(args.n * args.changed)), replace=False) for _ in range(args.frames)]
+
+    counter = GLCallCounter()
+    counter.watch(sys.modules[__name__], mesh_mod, instancing)
+    counter.install()
+
+    def change_ref(k):
+        t_ref[picks[k], 1] += 0.01
+        c_ref[picks[k]] = c[picks[k]][::-1]
+
+    results = {"per objek": run(per_object(GpuMesh(box), t_ref, r, c_ref), change_ref, args.frames, counter)}
+    for name, inst in (("instanced", True), ("batch CPU", False)):
+        im = InstancedMesh(box, capacity=args.n, instanced=inst)
+        im.add(t, r, c)
+        im.draw()
+        uploads = []
+
+        def change(k, im=im):
+            im.set(picks[k], translation=im.translation[picks[k]] + [0, 0.01, 0], color=c[picks[k]][::-1])
+
+        def draw(im=im, uploads=uploads):
+            im.draw()
+            uploads.append(im.uploaded)
+
+        results[name] = (*run(draw, change, args.frames, counter), max(uploads))
+        if inst and not im.instanced:
+            print("instanced    : jatuh ke jalur batch")
+        im.release()
+    counter.uninstall()
+
+    ref = results["per objek"][0]
+    worst = 0
+    for name, res in results.items():
+        d = np.abs(res[0].astype(int) - ref.astype(int)).max(axis=2)
+        extra = f"  diunggah {res[3]:6d}/frame" if len(res) > 3 else ""
+        print(f"{name:12s} : {res[1]:8.2f} ms/frame  {res[2]:6d} panggilan GL  piksel beda {int((d > 0).sum()):5d}"
+              f" (maks {int(d.max())}){extra}")
+        worst = max(worst, int((d > 2).sum()))
+    # hanya piksel tepi segitiga (rasterisasi shader vs fixed function) yang boleh berbeda
+    sys.exit(1 if worst > args.n else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark loop utama: jalankan main() di driver SDL offscreen dengan event
+sintetis, lalu bandingkan loop kontinu lama dengan loop berbasis event.
+
+Diukur: frame yang digambar saat idle, waktu CPU saat idle, dan berapa kali
+handle_motion dipanggil untuk satu semburan MOUSEMOTION.
+
+    python benchmarks/bench_loop.py --idle 2 --burst 200
+"""
+import argparse
+import os
+import subprocess
+import sys
+import threading
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "offscreen")
+# driver offscreen SDL membuat konteks EGL; PyOpenGL harus memakai platform yang sama
+# (gl*Pointer mencari konteks aktif lewat platform itu)
+os.environ.setdefault("PYOPENGL_PLATFORM", "egl")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+
+def run(event_driven, idle, burst):
+    import pygame
+    from pygame.locals import MOUSEMOTION, QUIT
+
+    import TubesGrafkom as app
+
+    app.event_driven = event_driven
+    stats = {"motion": 0, "frames": 0}
+    handle_motion, draw_ui = app.handle_motion, app.draw_ui
+
+    def counted_motion(rel):
+        stats["motion"] += 1
+        handle_motion(rel)
+
+    def counted_ui():
+        stats["frames"] += 1
+        draw_ui()
+
+    app.handle_motion = counted_motion
+    app.draw_ui = counted_ui
+
+    def feeder():
+        time.sleep(0.5)                  # biarkan init() & frame pertama selesai
+        f0, c0 = stats["frames"], time.thread_time_ns()
+        cpu0 = time.process_time()
+        time.sleep(idle)
+        stats["idle_fps"] = (stats["frames"] - f0) / idle
+        stats["idle_cpu"] = (time.process_time() - cpu0 - (time.thread_time_ns() - c0) / 1e9) / idle
+        for i in range(burst):
+            pygame.event.post(
+                pygame.event.Event(MOUSEMOTION, pos=(i, i), rel=(1, 1), buttons=(0, 0, 0))
+            )
+        time.sleep(0.5)
+        pygame.event.post(pygame.event.Event(QUIT))
+
+    threading.Thread(target=feeder, daemon=True).start()
+    app.main()
+    return stats
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--idle", type=float, default=2.0, help="detik idle yang diukur")
+    ap.add_argument("--burst", type=int, default=200, help="jumlah MOUSEMOTION")
+    ap.add_argument("--mode", choices=("event", "kontinu"))
+    args = ap.parse_args()
+
+    if args.mode:
+        s = run(args.mode == "event", args.idle, args.burst)
+        print(f"{s['idle_fps']} {s['idle_cpu']} {s['motion']}")
+        return
+
+    # tiap mode di proses terpisah: pygame/GL tidak bisa di-init ulang dengan bersih
+    print(f"idle {args.idle:.1f} s, semburan {args.burst} MOUSEMOTION")
+    for mode in ("kontinu", "event"):
+        out = subprocess.run(
+            [sys.executable, __file__, "--mode", mode,
+             "--idle", str(args.idle), "--burst", str(args.burst)],
+            capture_output=True, text=True, check=True,
+        ).stdout.split()
+        fps, cpu, motion = float(out[-3]), float(out[-2]), int(out[-1])
+        print(
+            f"{mode:8s}: idle {fps:6.1f} frame/s, CPU {cpu * 100:5.1f} %"
+            f"   handle_motion {motion} x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Benchmark waktu muat mesh (mesh.py) untuk file besar: bola sintetis ber-quad
+ditulis sebagai OBJ, PLY ASCII dan PLY biner, lalu dimuat ulang. Sebagai
+pembanding, pemuat OBJ naif baris-per-baris (list Python per verteks).
+
+    python benchmarks/bench_mesh.py --tris 1000000
+    python benchmarks/bench_mesh.py --tris 200000 --gl
+
+Dengan ``--gl`` juga diukur unggah VBO + IBO dan satu frame glDrawElements
+di konteks GL offscreen.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import headless  # noqa: E402  (harus sebelum OpenGL)
+
+import numpy as np  # noqa: E402
+
+from mesh import GpuMesh, fan_triangulate, load_obj, load_ply, vertex_normals  # noqa: E402
+
+
+def sphere(rows, cols):
+    """Bola UV (rows x cols quad, urutan CCW dilihat dari luar) sebagai verteks (N, 3) dan quad (M, 4)."""
+    th, ph = np.meshgrid(np.linspace(0, np.pi, rows + 1), np.linspace(0, 2 * np.pi, cols + 1), indexing="ij")
+    verts = np.column_stack((
+        (np.sin(th) * np.cos(ph)).ravel(), np.cos(th).ravel(), (np.sin(th) * np.sin(ph)).ravel()
+    ))
+    idx = np.arange((rows + 1) * (cols + 1)).reshape(rows + 1, cols + 1)
+    quads = np.column_stack((
+        idx[:-1, :-1].ravel(), idx[:-1, 1:].ravel(), idx[1:, 1:].ravel(), idx[1:, :-1].ravel()
+    ))
+    return verts, quads
+
+
+def write_obj(path, verts, quads):
+    with open(path, "w") as f:
+        f.write(("v %.6f %.6f %.6f\n" * len(verts)) % tuple(verts.ravel()))
+        f.write(("f %d/%d %d/%d %d/%d %d/%d\n" * len(quads)) % tuple(np.repeat(quads.ravel() + 1, 2)))
+
+
+def write_ply(path, verts, tris, binary):
+    header = (
+        "ply\nformat {} 1.0\nelement vertex {}\nproperty float x\nproperty float y\n"
+        "property float z\nelement face {}\nproperty list uchar int vertex_indices\nend_header\n"
+    ).format("binary_little_endian" if binary else "ascii", len(verts), len(tris))
+    with open(path, "wb") as f:
+        f.write(header.encode("ascii"))
+        if binary:
+            f.write(verts.astype("<f4").tobytes())
+            rec = np.zeros(len(tris), dtype=[("n", "u1"), ("v", "<i4", 3)])
+            rec["n"] = 3
+            rec["v"] = tris
+            f.write(rec.tobytes())
+        else:
+            f.write((("%.6f %.6f %.6f\n" * len(verts)) % tuple(verts.ravel())).encode("ascii"))
+            f.write((("3 %d %d %d\n" * len(tris)) % tuple(tris.ravel())).encode("ascii"))
+
+
+def naive_obj(path):
+    """Pemuat OBJ baris-per-baris: list Python per verteks dan per sisi."""
+    verts, faces = [], []
+    with open(path) as f:
+        for line in f:
+            tok = line.split()
+            if not tok:
+                continue
+            if tok[0] == "v":
+                verts.append([float(t) for t in tok[1:4]])
+            elif tok[0] == "f":
+                ids = [int(t.split("/")[0]) - 1 for t in tok[1:]]
+                for i in range(1, len(ids) - 1):
+                    faces.append([ids[0], ids[i], ids[i + 1]])
+    return np.array(verts), np.array(faces)
+
+
+def timed(fn, *args, repeat=1):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        res = fn(*args)
+        best = min(best, time.perf_counter() - t0)
+    return res, best
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--tris", type=int, default=1_000_000, help="perkiraan jumlah segitiga")
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--no-naive", action="store_true", help="lewati pemuat naif")
+    ap.add_argument("--gl", action="store_true", help="ukur juga unggah & gambar GL")
+    args = ap.parse_args()
+
+    rows = max(2, int(np.sqrt(args.tris / 4)))
+    verts, quads = sphere(rows, 2 * rows)
+    tris = fan_triangulate(quads.ravel(), np.full(len(quads), 4))
+    print(f"mesh          : {len(verts)} verteks, {len(tris)} segitiga ({len(quads)} quad)")
+
+    with tempfile.TemporaryDirectory() as d:
+        files = {
+            "OBJ (quad)": os.path.join(d, "m.obj"),
+            "PLY ascii": os.path.join(d, "a.ply"),
+            "PLY biner": os.path.join(d, "b.ply"),
+        }
+        write_obj(files["OBJ (quad)"], verts, quads)
+        write_ply(files["PLY ascii"], verts, tris, binary=False)
+        write_ply(files["PLY biner"], verts, tris, binary=True)
+
+        for name, path in files.items():
+            loader = load_obj if path.endswith(".obj") else load_ply
+            m, t = timed(loader, path, repeat=args.repeat)
+            mb = os.path.getsize(path) / 2**20
+            ok = np.array_equal(m.faces, tris) and np.allclose(m.vertices, verts, atol=1e-5)
+            print(
+                f"{name:13s} : {t * 1e3:8.1f} ms  {mb:7.1f} MB  {mb / t:6.1f} MB/s"
+                f"  {len(m.faces) / t / 1e6:5.2f} M segitiga/s  {'ok' if ok else 'BEDA'}"
+            )
+
+        _, t = timed(vertex_normals, verts, tris, repeat=args.repeat)
+        print(f"normal        : {t * 1e3:8.1f} ms (termasuk dalam waktu muat)")
+
+        if not args.no_naive:
+            (nv, nf), t = timed(naive_obj, files["OBJ (quad)"])
+            same = np.array_equal(nf, tris)
+            print(f"OBJ naif      : {t * 1e3:8.1f} ms (tanpa normal)  {'ok' if same else 'BEDA'}")
+
+    if args.gl:
+        from OpenGL.GL import GL_COLOR_BUFFER_BIT, GL_DEPTH_BUFFER_BIT, glClear, glFinish
+
+        headless.create_context(640, 480)
+        gpu = GpuMesh(m)
+        t0 = time.perf_counter()
+        gpu.draw()
+        glFinish()
+        t_first = time.perf_counter() - t0
+        frames = []
+        for _ in range(args.repeat):
+            glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+            t0 = time.perf_counter()
+            gpu.draw()
+            glFinish()
+            frames.append(time.perf_counter() - t0)
+        print(f"GL unggah+gambar: {t_first * 1e3:8.1f} ms, gambar berikutnya {min(frames) * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark kliping & tesselasi paralel (parallel.py): kliping penuh
+(clip_objects) dan outline semua bentuk (shape_outlines) dengan 1, 2, 4, ...
+worker thread. Hasil setiap jumlah worker dicocokkan byte-per-byte dengan
+jalur serial (titik tampil, visible, warna, outline terklip).
+
+    python benchmarks/bench_parallel.py --n 2000000 --workers 1 2 4 8
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import scenegen  # noqa: E402  (menambahkan akar repo ke sys.path)
+from scenegen import app  # noqa: E402
+
+import parallel  # noqa: E402
+
+
+def full_clip():
+    app.invalidate_clip()
+    app.scene.reset_display()
+    t0 = time.perf_counter()
+    app.clip_objects()
+    return time.perf_counter() - t0
+
+
+def result():
+    st = app.scene
+    clipped = sorted(st.clipped.items())
+    return (
+        st.disp[:st.nv].copy(), st.visible[:st.n].copy(), st.color[:st.n].copy(),
+        [i for i, _ in clipped],
+        np.concatenate([v for _, (v, _) in clipped]) if clipped else np.empty((0, 2)),
+        np.concatenate([b for _, (_, b) in clipped]) if clipped else np.empty(0, bool),
+    )
+
+
+def same(a, b):
+    return all(np.array_equal(x, y) for x, y in zip(a, b))
+
+
+def best(fn, repeat):
+    return min(fn() for _ in range(repeat))
+
+
+def main():
+    cores = os.cpu_count() or 1
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=2_000_000)
+    ap.add_argument("--workers", type=int, nargs="+",
+                    default=sorted({1, 2, 4, cores}))
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--min-chunk", type=int, default=parallel.MIN_CHUNK)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    parallel.MIN_CHUNK = args.min_chunk
+    scenegen.generate(args.n, seed=args.seed, size=2.0)
+    # window memotong banyak bentuk supaya Sutherland–Hodgman ikut terukur
+    app.window_clipping[:] = [app.Point2D(-6.3, -4.1), app.Point2D(5.7, 6.9)]
+    shapes = app.pack_scene()["shapes"]
+    shapes = shapes[app.scene.types[shapes] != app.TYPE_CODES["point"]]
+    print(f"objek  : {app.scene.n} ({len(shapes)} kotak/elips/polygon), core {cores}")
+
+    ref = None
+    base = {}
+    ok = True
+    for w in args.workers:
+        parallel.set_workers(w)
+        t_clip = best(full_clip, args.repeat)
+        res = result()
+        t0 = time.perf_counter()
+        for _ in range(args.repeat):
+            outline = app.shape_outlines(shapes)
+        t_outline = (time.perf_counter() - t0) / args.repeat
+        if ref is None:
+            ref, ref_outline = res, outline
+            base = {"clip": t_clip, "outline": t_outline}
+        match = same(res, ref) and same(outline, ref_outline)
+        ok &= match
+        print(f"worker {w:2d}: kliping {t_clip * 1e3:8.1f} ms ({base['clip'] / t_clip:4.2f}x)"
+              f"   outline {t_outline * 1e3:8.1f} ms ({base['outline'] / t_outline:4.2f}x)"
+              f"   sama dengan serial: {match}")
+    parallel.set_workers(1)
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Biaya instrumentasi profiler per frame saat mati vs hidup: begin_frame,
+8 lap, 2 fungsi @timed, end_frame (tanpa GL).
+
+    python benchmarks/bench_profiler.py --frames 100000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from profiler import FrameProfiler  # noqa: E402
+
+PHASES = ("events", "grid", "scene", "preview", "ui", "hud", "flip", "3d")
+
+
+def run(prof, frames):
+    @prof.timed("clip")
+    def clip():
+        pass
+
+    @prof.timed("pick")
+    def pick():
+        pass
+
+    t0 = time.perf_counter()
+    for _ in range(frames):
+        prof.begin_frame()
+        clip()
+        pick()
+        for name in PHASES:
+            prof.lap(name)
+        if prof.enabled:
+            prof.end_frame(objects=0)
+    return (time.perf_counter() - t0) / frames
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--frames", type=int, default=100_000)
+    args = ap.parse_args()
+
+    prof = FrameProfiler()
+    t_off = run(prof, args.frames)
+    prof.toggle_hud()
+    t_on = run(prof, args.frames // 10)
+    prof.toggle_hud()
+    print(f"profiler mati  : {t_off * 1e6:8.3f} us/frame")
+    print(f"profiler hidup : {t_on * 1e6:8.3f} us/frame")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark rasterizer software (raster.py) pada scene sintetis ber-seed,
+tanpa display maupun konteks GL.
+
+    python benchmarks/bench_raster.py --n 100000
+    python benchmarks/bench_raster.py --n 2000 --window --out scene.png
+    python benchmarks/bench_raster.py --n 2000 --window --gl
+
+Dengan ``--gl`` frame yang sama juga digambar lewat OpenGL offscreen (Mesa
+llvmpipe via EGL) dan persentase piksel yang sama dilaporkan. Rasterisasi
+garis tebal GL bergantung driver, jadi hasilnya mendekati, tidak identik.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import headless  # noqa: E402  (harus sebelum OpenGL)
+
+import numpy as np  # noqa: E402
+from OpenGL.GL import (  # noqa: E402
+    GL_COLOR_BUFFER_BIT, GL_DEPTH_BUFFER_BIT, GL_MODELVIEW, GL_PROJECTION, GL_RGBA,
+    GL_SCISSOR_TEST, GL_UNSIGNED_BYTE, glClear, glClearColor, glDisable, glFinish,
+    glLoadIdentity, glMatrixMode, glPointSize, glReadPixels, glViewport,
+)
+from OpenGL.GLU import gluOrtho2D  # noqa: E402
+
+import scenegen  # noqa: E402
+from scenegen import app  # noqa: E402
+from raster import write_png  # noqa: E402
+
+
+def render_gl():
+    """Frame 2D seperti main() (grid, window, scene ter-scissor) via glReadPixels."""
+    glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+    app.draw_grid()
+    app.draw_window_clipping()
+    app.apply_window_scissor()
+    app.scene_renderer.draw()
+    glDisable(GL_SCISSOR_TEST)
+    glFinish()
+    data = glReadPixels(0, 0, app.WIDTH, app.HEIGHT, GL_RGBA, GL_UNSIGNED_BYTE)
+    return np.frombuffer(data, dtype=np.uint8).reshape(app.HEIGHT, app.WIDTH, 4)[::-1]
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=100_000)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--size", type=float, default=0.5, help="ukuran objek (unit dunia)")
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--window", action="store_true", help="klip dengan window")
+    ap.add_argument("--out", help="simpan hasil sebagai PNG")
+    ap.add_argument("--gl", action="store_true", help="bandingkan dengan OpenGL offscreen")
+    args = ap.parse_args()
+
+    if args.gl:
+        headless.create_context(app.WIDTH, app.HEIGHT)
+        glViewport(0, 0, app.WIDTH, app.HEIGHT)
+        glMatrixMode(GL_PROJECTION)
+        glLoadIdentity()
+        gluOrtho2D(-10, 10, -10, 10)
+        glMatrixMode(GL_MODELVIEW)
+        glLoadIdentity()
+        glClearColor(*app.BG_COLOR)
+        glPointSize(5)
+
+    scenegen.generate(args.n, seed=args.seed, size=args.size)
+    if args.window:
+        app.window_clipping[:] = [app.Point2D(-4, -3), app.Point2D(5, 6)]
+        app.clip_objects()
+
+    times = []
+    for _ in range(args.repeat):
+        t0 = time.perf_counter()
+        img = app.render_software()
+        times.append(time.perf_counter() - t0)
+    print(f"objek        : {args.n}  (bentuk terpotong {len(app.scene.clipped)})")
+    print(f"render NumPy : {min(times) * 1e3:8.2f} ms  (rata-rata {np.mean(times) * 1e3:.2f} ms)")
+
+    if args.out:
+        t0 = time.perf_counter()
+        write_png(args.out, img)
+        print(f"PNG          : {args.out} ({(time.perf_counter() - t0) * 1e3:.2f} ms)")
+
+    if args.gl:
+        ref = render_gl()
+        same = np.all(ref == img, axis=2)
+        print(f"sama dengan GL : {same.mean() * 100:.2f} % piksel")
+
+
+if __name__ == "__main__":
+    main()
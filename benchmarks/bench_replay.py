@@ -0,0 +1,103 @@
+"""
+Benchmark replay input (replay.py): buat scene acak ``.gks`` dan rekaman
+sesi edit sintetis (window kliping, drag window, translasi / rotasi objek,
+undo / redo), lalu putar ulang beberapa kali di proses terpisah. Dilaporkan
+persentil latensi per frame; checksum setiap putaran harus sama.
+
+    python benchmarks/bench_replay.py --n 200000 --drags 300 --runs 3
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import scenegen  # noqa: E402  (menambahkan akar repo ke sys.path)
+from scenegen import app  # noqa: E402
+
+import pygame  # noqa: E402
+from pygame.locals import KEYDOWN, KMOD_CTRL, K_r, K_t, K_w, K_y, K_z  # noqa: E402
+from pygame.locals import MOUSEBUTTONDOWN, MOUSEBUTTONUP, MOUSEMOTION  # noqa: E402
+
+import scene_file  # noqa: E402
+from input_log import Recorder  # noqa: E402
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def key(k, mod=0):
+    return [pygame.event.Event(KEYDOWN, key=k, mod=mod, unicode="")]
+
+
+def click(x, y):
+    return [
+        pygame.event.Event(MOUSEMOTION, pos=(x, y), rel=(0, 0), buttons=(0, 0, 0)),
+        pygame.event.Event(MOUSEBUTTONDOWN, pos=(x, y), button=1),
+        pygame.event.Event(MOUSEBUTTONUP, pos=(x, y), button=1),
+    ]
+
+
+def drag(x, y, dx, dy, steps):
+    """Satu batch per langkah, seperti MOUSEMOTION yang datang tiap frame."""
+    batches = [[pygame.event.Event(MOUSEBUTTONDOWN, pos=(x, y), button=1)]]
+    for _ in range(steps):
+        x, y = x + dx, y + dy
+        batches.append([pygame.event.Event(MOUSEMOTION, pos=(x, y), rel=(dx, dy), buttons=(1, 0, 0))])
+    batches.append([pygame.event.Event(MOUSEBUTTONUP, pos=(x, y), button=1)])
+    return batches
+
+
+def session(drags):
+    """Batch event sesi edit sintetis di jendela 800x600."""
+    batches = [key(K_w), click(200, 150), click(600, 450)]
+    for k in range(drags // 60 + 1):
+        step = 1 if k % 2 == 0 else -1
+        batches += drag(400, 300, 2 * step, step, 30)               # geser window
+        batches += [key(K_t)] + drag(300 + k % 200, 250, step, 2 * step, 15)
+        batches += [key(K_r)] + drag(450, 350 - k % 100, 3 * step, 0, 15)
+    batches += [key(K_z, KMOD_CTRL)] * 10 + [key(K_y, KMOD_CTRL)] * 5
+    return batches
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=200_000)
+    ap.add_argument("--drags", type=int, default=300, help="kira-kira jumlah frame drag")
+    ap.add_argument("--runs", type=int, default=3)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        gks, gkr = os.path.join(tmp, "scene.gks"), os.path.join(tmp, "sesi.gkr")
+        scenegen.generate(args.n, seed=args.seed)
+        scene_file.save(gks, app.scene)
+        rec = Recorder(gkr, {
+            "args": [gks], "width": app.WIDTH, "height": app.HEIGHT, "seed": args.seed,
+            "event_driven": True, "mouse": [400, 300],
+        })
+        for batch in session(args.drags):
+            rec.write(batch)
+        rec.close()
+        print(f"scene {args.n} objek, rekaman {rec.events} event / {rec.batches} batch "
+              f"({os.path.getsize(gkr)} byte)")
+
+        sums = set()
+        for k in range(args.runs):
+            out = os.path.join(tmp, f"run{k}.json")
+            subprocess.run([sys.executable, os.path.join(ROOT, "replay.py"), gkr, "--json", out],
+                           check=True, capture_output=True)
+            with open(out) as f:
+                report = json.load(f)
+            lat = report["latency_ms"]
+            sums.add(tuple(sorted(report["checksums"].items())))
+            print(f"putaran {k + 1}: {report['frames']} frame  rata2 {lat['mean']:7.2f} ms  p50 {lat['p50']:7.2f}"
+                  f"  p90 {lat['p90']:7.2f}  p99 {lat['p99']:7.2f}  maks {lat['max']:7.2f} ms")
+    print(f"checksum sama di semua putaran: {len(sums) == 1}")
+    sys.exit(0 if len(sums) == 1 else 1)
+
+
+if __name__ == "__main__":
+    main()
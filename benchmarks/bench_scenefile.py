@@ -0,0 +1,101 @@
+"""
+Benchmark simpan/buka scene (scene_file.py): tulis file biner ``.gks``, buka
+lewat memmap vs baca penuh ke memori, buka di aplikasi (termasuk indeks
+picking), dan ekspor/impor JSON sebagai pembanding format teks. Isi hasil
+buka dicocokkan dengan scene asal.
+
+    python benchmarks/bench_scenefile.py --n 1000000 --json-n 100000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import scenegen  # noqa: E402  (menambahkan akar repo ke sys.path)
+from scenegen import app  # noqa: E402
+
+import scene_file  # noqa: E402
+from scene_store import SceneStore  # noqa: E402
+
+
+def columns(st):
+    return {name: getattr(st, name)[:st.nv if name == "orig" else st.n].copy() for name in scene_file.COLUMNS}
+
+
+def same(a, b):
+    return a.keys() == b.keys() and all(np.array_equal(a[k], b[k]) for k in a)
+
+
+def timed(fn, *args):
+    t0 = time.perf_counter()
+    out = fn(*args)
+    return time.perf_counter() - t0, out
+
+
+def report(name, dt, nbytes=None):
+    rate = f"   {nbytes / dt / 2**20:8.1f} MiB/s" if nbytes else ""
+    print(f"{name:24s}: {dt * 1e3:9.1f} ms{rate}")
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=1_000_000)
+    ap.add_argument("--json-n", type=int, default=100_000, help="ukuran scene untuk JSON (lebih lambat)")
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    ok = True
+    with tempfile.TemporaryDirectory() as tmp:
+        gks = os.path.join(tmp, "scene.gks")
+        scenegen.generate(args.n, seed=args.seed)
+        ref = columns(app.scene)
+        print(f"objek                   : {app.scene.n}, verteks {app.scene.nv}")
+
+        dt, _ = timed(scene_file.save, gks, app.scene, ((-5, -5), (5, 5)))
+        size = os.path.getsize(gks)
+        report("simpan .gks", dt, size)
+        print(f"ukuran file             : {size / 2**20:9.1f} MiB")
+
+        for mmap in (True, False):
+            st = SceneStore()
+            dt, _ = timed(scene_file.load, gks, st, mmap)
+            report("buka (memmap)" if mmap else "buka (baca penuh)", dt, None if mmap else size)
+            ok &= same(columns(st), ref)
+        st = SceneStore()
+        scene_file.load(gks, st)
+        i = args.n // 2
+        dt, _ = timed(lambda: st.orig[st.offset[i]:st.offset[i] + st.count[i]].sum())
+        report("  baca 1 objek (memmap)", dt)
+
+        dt, _ = timed(app.load_scene, gks)
+        report("buka di aplikasi", dt)
+        ok &= same(columns(app.scene), ref) and app.window_state() == ((-5, -5), (5, 5))
+
+        jpath = os.path.join(tmp, "scene.json")
+        scenegen.generate(args.json_n, seed=args.seed)
+        ref = columns(app.scene)
+        dt_gks, _ = timed(scene_file.save, gks, app.scene)
+        dt, _ = timed(scene_file.export_json, jpath, app.scene)
+        print(f"JSON ({args.json_n} objek)")
+        report("  ekspor JSON", dt, os.path.getsize(jpath))
+        report("  simpan .gks", dt_gks, os.path.getsize(gks))
+        st = SceneStore()
+        dt, _ = timed(scene_file.import_json, jpath, st)
+        report("  impor JSON", dt, os.path.getsize(jpath))
+        ok &= same(columns(st), ref)
+        st = SceneStore()
+        dt, _ = timed(scene_file.load, gks, st)
+        report("  buka .gks (memmap)", dt)
+        ok &= same(columns(st), ref)
+
+    print(f"isi sama dengan scene asal: {ok}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Benchmark startup & ganti mode 2D/3D di driver SDL offscreen (konteks EGL).
+
+Setiap putaran adalah proses baru (cold start): waktu ``import TubesGrafkom``,
+init() (jendela + konteks GL), frame 2D pertama (upload VBO, font pertama),
+lalu ganti mode: F2 pertama (modul 3D diimpor & scene 3D dibangun) dengan
+frame-nya, tukar status render (F1 / F2 sekarang, rata-rata per tukar), dan
+F1 lama (init() ulang + semua buffer GL di-upload ulang) sebagai pembanding.
+Dilaporkan median antar putaran.
+
+    python -m compileall -q . && python benchmarks/bench_startup.py --runs 5 --n 20000
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "offscreen")
+# driver offscreen SDL membuat konteks EGL; PyOpenGL harus memakai platform yang sama
+os.environ.setdefault("PYOPENGL_PLATFORM", "egl")
+
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+SWITCHES = 2000
+
+
+def child(n, seed):
+    """Satu cold start; mengembalikan waktu (ms) per tahap."""
+    ms = {}
+    t0 = time.perf_counter()
+    import TubesGrafkom as app
+    ms["import"] = (time.perf_counter() - t0) * 1e3
+
+    from OpenGL.GL import GL_COLOR_BUFFER_BIT, GL_DEPTH_BUFFER_BIT, glClear, glFinish, glLoadTransposeMatrixd
+
+    import scenegen
+
+    def frame_2d():
+        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+        app.draw_grid()
+        app.scene_renderer.draw()
+        app.draw_ui()
+        glFinish()
+
+    def frame_3d():
+        from scene3d import look_at      # diimpor app.setup_3d saat F2 pertama
+
+        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+        glLoadTransposeMatrixd(look_at(app.camera_pos, app.camera_target, app.camera_up))
+        app.draw_floor_grid()
+        app.draw_scene_3d()
+        app.draw_ui()
+        glFinish()
+
+    def timed(key, fn):
+        t = time.perf_counter()
+        fn()
+        ms[key] = (time.perf_counter() - t) * 1e3
+
+    app.show_help = False                # diset main()
+    timed("init", app.init)
+    scenegen.generate(n, seed=seed)
+    timed("frame_2d", frame_2d)
+    ms["cold_start"] = ms["import"] + ms["init"] + ms["frame_2d"]
+
+    timed("switch_3d_frame", lambda: (app.set_render_mode("3D"), frame_3d()))
+    timed("switch_2d_frame", lambda: (app.set_render_mode("2D"), frame_2d()))
+    t = time.perf_counter()
+    for _ in range(SWITCHES // 2):
+        app.set_render_mode("3D")
+        app.set_render_mode("2D")
+    glFinish()
+    ms["switch_us"] = (time.perf_counter() - t) / SWITCHES * 1e6
+
+    def legacy_f1():
+        # jalur F1 sebelum render_state: konteks baru, semua sumber daya GL hilang
+        app.init()
+        for obj in (
+            app.scene_renderer, app.ui_text, app.hud_text, app.capture,
+            app.grid_2d, app.floor_3d, app.scene_3d, app.voxels,
+        ):
+            if obj is not None:
+                obj.invalidate_gl()
+        frame_2d()
+
+    timed("legacy_f1_frame", legacy_f1)
+    return ms
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--n", type=int, default=20_000, help="objek 2D (scenegen)")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.child:
+        print(json.dumps(child(args.n, args.seed)))
+        return
+
+    runs = []
+    for _ in range(args.runs):
+        out = subprocess.run(
+            [sys.executable, __file__, "--child", "--n", str(args.n), "--seed", str(args.seed)],
+            check=True, capture_output=True, text=True,
+        ).stdout
+        runs.append(json.loads(out.strip().splitlines()[-1]))
+    med = {k: statistics.median(r[k] for r in runs) for k in runs[0]}
+
+    print(f"{args.runs} proses, scene {args.n} objek 2D (median)")
+    for key, label in (
+        ("import", "import TubesGrafkom"),
+        ("init", "init() jendela + GL"),
+        ("frame_2d", "frame 2D pertama"),
+        ("cold_start", "total cold start"),
+        ("switch_3d_frame", "F2 + frame 3D pertama"),
+        ("switch_2d_frame", "F1 + frame 2D"),
+        ("legacy_f1_frame", "F1 lama + frame 2D"),
+    ):
+        print(f"{label:24s}: {med[key]:8.2f} ms")
+    print(f"{'tukar status render':24s}: {med['switch_us']:8.2f} µs / tukar")
+
+
+if __name__ == "__main__":
+    main()
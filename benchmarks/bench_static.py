@@ -0,0 +1,144 @@
+"""
+Benchmark geometri statis: grid 2D, lantai grid 3D dan kubus versi lama
+(immediate mode + glGetFloatv tiap frame) vs VBO (StaticGeometry, GpuMesh), di
+konteks GL offscreen. Juga memastikan hasil pikselnya sama.
+
+    python benchmarks/bench_static.py --frames 200
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import headless  # noqa: E402  (harus sebelum OpenGL)
+
+import numpy as np  # noqa: E402
+from OpenGL.GL import *  # noqa: E402,F403
+from OpenGL.GLU import gluLookAt, gluPerspective  # noqa: E402
+
+import TubesGrafkom as app  # noqa: E402
+from check_render import grab, setup_2d  # noqa: E402
+
+
+def legacy_grid(spacing):
+    prev = glGetFloatv(GL_LINE_WIDTH)
+    glColor3f(0.3, 0.3, 0.3)
+    glLineWidth(1)
+    glBegin(GL_LINES)
+    for i in np.linspace(-10, 10, int(round(20 / spacing)) + 1).tolist():
+        glVertex2f(i, -10)
+        glVertex2f(i, 10)
+        glVertex2f(-10, i)
+        glVertex2f(10, i)
+    glEnd()
+    glLineWidth(prev)
+
+
+def cached_grid(spacing):
+    app.grid_spacing = spacing
+    app.draw_grid()
+
+
+def legacy_3d(cube):
+    glColor3f(0.4, 0.4, 0.4)
+    glBegin(GL_LINES)
+    for i in range(-10, 11, 2):
+        glVertex3f(i, 0, -10)
+        glVertex3f(i, 0, 10)
+        glVertex3f(-10, 0, i)
+        glVertex3f(10, 0, i)
+    glEnd()
+    glEnable(GL_LIGHTING)
+    glPushMatrix()
+    glTranslatef(*cube.translation)
+    glRotatef(cube.rotation[0], 1, 0, 0)
+    glRotatef(cube.rotation[1], 0, 1, 0)
+    glRotatef(cube.rotation[2], 0, 0, 1)
+    glBegin(GL_QUADS)
+    for i, face in enumerate(cube.faces):
+        quad = np.asarray(cube.vertices, dtype=float)[face]
+        normal = np.cross(quad[1] - quad[0], quad[2] - quad[0])
+        if np.dot(normal, quad.mean(axis=0)) < 0:     # hadapkan keluar
+            quad[1:] = quad[:0:-1]
+            normal = -normal
+        glNormal3fv(normal / np.linalg.norm(normal))
+        glColor3fv(cube.colors[i])
+        for v in quad:
+            glVertex3fv(v)
+    glEnd()
+    glPopMatrix()
+    glDisable(GL_LIGHTING)
+
+
+def cached_3d(cube):
+    app.grid_spacing = 1.0
+    app.draw_floor_grid()
+    glEnable(GL_LIGHTING)
+    cube.draw()
+    glDisable(GL_LIGHTING)
+
+
+def run(fn, frames, *args):
+    """
+    (gambar, ms submit, ms total, panggilan GL per frame). "submit" = waktu CPU
+    sampai semua perintah terkirim; "total" termasuk glFinish (rasterisasi
+    llvmpipe, yang sama untuk kedua versi).
+    """
+    submit, total = [], []
+    counter = app.profiler.gl_calls
+    counter.install()
+    counter.take()
+    for _ in range(frames):
+        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+        glFinish()
+        t0 = time.perf_counter()
+        fn(*args)
+        t1 = time.perf_counter()
+        glFinish()
+        submit.append(t1 - t0)
+        total.append(time.perf_counter() - t0)
+    calls = counter.take() // frames - 3       # glClear + 2x glFinish
+    counter.uninstall()
+    return grab(), float(np.median(submit)) * 1e3, float(np.median(total)) * 1e3, calls
+
+
+def report(name, legacy, cached):
+    diff = int(np.any(legacy[0] != cached[0], axis=2).sum())
+    print(
+        f"{name:18s} submit {legacy[1]:7.3f} -> {cached[1]:6.3f} ms (x{legacy[1] / cached[1]:5.1f})"
+        f"   total {legacy[2]:6.3f} -> {cached[2]:6.3f} ms"
+        f"   panggilan GL {legacy[3]:4d} -> {cached[3]:3d}   piksel berbeda {diff}"
+    )
+    return diff
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--frames", type=int, default=200)
+    args = ap.parse_args()
+
+    headless.create_context(app.WIDTH, app.HEIGHT)
+    setup_2d()
+    # hitung juga panggilan GL versi lama yang ada di modul ini
+    app.profiler.gl_calls.watch(sys.modules[__name__])
+    bad = 0
+    for spacing in (1.0, 0.25, 0.125):
+        builds = app.grid_2d.builds
+        cached = run(cached_grid, args.frames, spacing)
+        legacy = run(legacy_grid, args.frames, spacing)
+        bad += report(f"grid 2D s={spacing}", legacy, cached)
+        print(f"{'':18s} verteks {app.grid_2d.count}, dibangun {app.grid_2d.builds - builds}x")
+
+    app.set_render_mode("3D")
+    gluLookAt(*app.camera_pos, *app.camera_target, *app.camera_up)
+    glDisable(GL_LIGHTING)
+    cube = app.Cube3D()
+    cube.rotation = [30, 40, 0]
+    bad += report("lantai + kubus 3D", run(legacy_3d, args.frames, cube), run(cached_3d, args.frames, cube))
+    sys.exit(1 if bad else 0)
+
+
+if __name__ == "__main__":
+    main()
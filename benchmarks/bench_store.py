@@ -0,0 +1,94 @@
+"""
+Benchmark memori scene store: buffer kolom NumPy vs objek Python per titik
+(Point2D/Object2D lama berbasis __dict__), plus waktu kliping scene besar.
+
+    python benchmarks/bench_store.py --vertices 1000000
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import TubesGrafkom as app  # noqa: E402
+
+
+class LegacyPoint:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+class LegacyObject:
+    def __init__(self, obj_type, points, color, thickness=1.0):
+        self.obj_type = obj_type
+        self.points = points
+        self.original_points = [LegacyPoint(p.x, p.y) for p in points]
+        self.color = color
+        self.original_color = color
+        self.thickness = thickness
+        self.translation = [0.0, 0.0]
+        self.rotation = 0.0
+        self.scale = [1.0, 1.0]
+
+
+def measure(fn):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    keep = fn()
+    dt = time.perf_counter() - t0
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return keep, current / 2**20, dt
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--vertices", type=int, default=1_000_000)
+    ap.add_argument("--legacy-vertices", type=int, default=200_000)
+    args = ap.parse_args()
+
+    rng = np.random.default_rng(0)
+    segs = rng.uniform(-10, 10, size=(args.vertices // 2, 2, 2))
+
+    def build_store():
+        app.clear_objects()
+        app.scene.add_many("line", segs, app.COLORS["red"])
+        return app.scene
+
+    _, mb_store, t_store = measure(build_store)
+
+    legacy_segs = segs[: args.legacy_vertices // 2].tolist()
+
+    def build_legacy():
+        return [
+            LegacyObject(
+                "line", [LegacyPoint(*a), LegacyPoint(*b)], app.COLORS["red"]
+            )
+            for a, b in legacy_segs
+        ]
+
+    _, mb_legacy, t_legacy = measure(build_legacy)
+    per_v_legacy = mb_legacy / args.legacy_vertices
+
+    app.window_clipping[:] = [app.Point2D(-4, -3), app.Point2D(5, 6)]
+    app.mark_scene_dirty()
+    t0 = time.perf_counter()
+    app.clip_objects()
+    t_clip = time.perf_counter() - t0
+
+    print(f"verteks            : {args.vertices}  ({app.scene.n} garis)")
+    print(f"store NumPy        : {mb_store:8.1f} MB   ({t_store:.2f} s)")
+    print(
+        f"objek Python lama  : {mb_legacy:8.1f} MB untuk {args.legacy_vertices} verteks"
+        f" ({t_legacy:.2f} s)  ~ {per_v_legacy * args.vertices:.0f} MB untuk {args.vertices}"
+    )
+    print(f"clip_objects       : {t_clip * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark pipeline kliping headless (clip_stream.py): scene dibuat sebagai
+``.gks`` dan JSONL, lalu CLI dijalankan sebagai proses terpisah dengan
+beberapa ukuran potongan. Dilaporkan throughput dan puncak RSS proses;
+puncak RSS seharusnya mengikuti ukuran potongan, bukan ukuran input.
+
+    python benchmarks/bench_stream.py --n 2000000 --chunk 16384 65536 262144
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import scenegen  # noqa: E402  (menambahkan akar repo ke sys.path)
+from scenegen import app  # noqa: E402
+
+import scene_file  # noqa: E402
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run(path, out, chunk, extra=()):
+    cmd = [sys.executable, os.path.join(ROOT, "clip_stream.py"), path, "-o", out, "--chunk", str(chunk), *extra]
+    t0 = time.perf_counter()
+    proc = subprocess.run(cmd, capture_output=True, text=True, check=True)
+    dt = time.perf_counter() - t0
+    rss = re.search(r"puncak RSS ([\d.]+) MiB", proc.stderr)
+    return dt, float(rss.group(1)) if rss else float("nan")
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=1_000_000)
+    ap.add_argument("--jsonl-n", type=int, default=200_000, help="ukuran scene untuk input JSONL (lebih lambat)")
+    ap.add_argument("--chunk", type=int, nargs="+", default=[16_384, 65_536, 262_144])
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    window = ((-6.3, -4.1), (5.7, 6.9))
+    with tempfile.TemporaryDirectory() as tmp:
+        out = os.path.join(tmp, "out.jsonl")
+        for n, ext in ((args.n, ".gks"), (args.jsonl_n, ".jsonl")):
+            path = os.path.join(tmp, "scene" + ext)
+            scenegen.generate(n, seed=args.seed, size=2.0)
+            if ext == ".gks":
+                scene_file.save(path, app.scene, window)
+            else:
+                scene_file.export_jsonl(path, app.scene, window)
+            size = os.path.getsize(path)
+            print(f"input {ext:6s}: {n} objek, {size / 2**20:.1f} MiB")
+            for chunk in args.chunk:
+                for extra in ((), ("--visible-only",)):
+                    dt, rss = run(path, out, chunk, extra)
+                    label = f"potongan {chunk:7d}" + (" visible" if extra else "")
+                    print(f"  {label:24s}: {dt:7.2f} s  {n / dt:10,.0f} objek/s  {size / dt / 2**20:7.1f} MiB/s"
+                          f"  keluaran {os.path.getsize(out) / 2**20:7.1f} MiB  puncak RSS {rss:7.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark CPU tesselasi elips per frame: loop lama (100 np.cos/np.sin skalar
+per elips) vs tabel bersama + cache per objek.
+
+    python benchmarks/bench_tessellation.py --n 5000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import TubesGrafkom as app  # noqa: E402
+from tessellation import ellipse_outline  # noqa: E402
+
+
+def legacy(objs):
+    out = []
+    for o in objs:
+        radius = o.points[1]
+        for i in range(100):
+            ang = 2 * np.pi * i / 100
+            out.append((radius.x * np.cos(ang), radius.y * np.sin(ang)))
+    return out
+
+
+def cached(objs):
+    return [ellipse_outline(o, app.PX_PER_UNIT) for o in objs]
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=5000)
+    args = ap.parse_args()
+
+    rng = np.random.default_rng(0)
+    objs = [
+        app.Object2D(
+            "ellipse",
+            [app.Point2D(0, 0), app.Point2D(*rng.uniform(0.02, 6, 2))],
+            app.COLORS["red"],
+        )
+        for _ in range(args.n)
+    ]
+
+    t0 = time.perf_counter()
+    legacy(objs)
+    t_old = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    cached(objs)
+    t_cold = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    cached(objs)
+    t_warm = time.perf_counter() - t0
+
+    segs = [len(o.tessellation[1]) for o in objs]
+    print(f"elips          : {args.n}  (segmen {min(segs)}..{max(segs)}, rata2 {np.mean(segs):.0f})")
+    print(f"loop skalar    : {t_old * 1e3:8.2f} ms/frame")
+    print(f"tabel (dingin) : {t_cold * 1e3:8.2f} ms")
+    print(f"tabel (cache)  : {t_warm * 1e3:8.2f} ms/frame")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Benchmark overlay UI: draw_text lama (SysFont + render + glDrawPixels tiap
+frame) vs TextCache, di konteks GL offscreen. Juga memastikan hasil pikselnya
+sama.
+
+    python benchmarks/bench_ui.py --frames 200
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import headless  # noqa: E402  (harus sebelum OpenGL)
+
+import numpy as np  # noqa: E402
+import pygame  # noqa: E402
+from OpenGL.GL import *  # noqa: E402,F403
+
+import TubesGrafkom as app  # noqa: E402
+from check_render import grab, setup_2d  # noqa: E402
+
+HELP = [
+    "Bantuan Tombol",
+    "MODE         :  F1 → 2D   |   F2 → 3D",
+    "2D           :  P  Titik   |  L  Garis   |  S  Persegi   |  E  Lingkaran",
+    "WARNA (1‑6)  :  1 R  2 G  3 B  4 Y  5 C  6 M",
+    "TRANFORMASI  :  T Translasi   |  R Rotasi   |  Z Scaling",
+    "LAIN         :  + / –  Ketebalan Garis   |  C  Hapus   |  H  Help",
+    "3D Cube      :  Left‑Drag Rotasi   |  Right‑Drag Translasi",
+    "",
+    "ESC → batal transform",
+]
+STATUS = "Mode: 2D   |   Objek: line   |   Warna: red   |   Tebal: 1.0   |   H: Bantuan"
+
+
+def legacy_frame():
+    font = pygame.font.SysFont("Arial", 18)
+    app.draw_text(10, app.HEIGHT - 25, STATUS, font)
+    y = app.HEIGHT - 50
+    for ln in HELP:
+        app.draw_text(10, y, ln, font)
+        y -= 22
+
+
+def cached_frame():
+    app.ui_text.begin(app.WIDTH, app.HEIGHT)
+    app.ui_text.draw(10, app.HEIGHT - 25, STATUS)
+    y = app.HEIGHT - 50
+    for ln in HELP:
+        app.ui_text.draw(10, y, ln)
+        y -= 22
+    app.ui_text.end()
+
+
+def run(fn, frames):
+    times = []
+    for _ in range(frames):
+        glClear(GL_COLOR_BUFFER_BIT)
+        glFinish()
+        t0 = time.perf_counter()
+        fn()
+        glFinish()
+        times.append(time.perf_counter() - t0)
+    return np.array(times) * 1e3, grab()
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--frames", type=int, default=200)
+    args = ap.parse_args()
+
+    headless.create_context(app.WIDTH, app.HEIGHT)
+    setup_2d()
+    pygame.font.init()
+    # draw_text lama memanggil convert_alpha(), yang butuh display pygame
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+
+    t_old, img_old = run(legacy_frame, args.frames)
+    t_new, img_new = run(cached_frame, args.frames)
+
+    diff = int(np.any(img_old != img_new, axis=2).sum())
+    for name, t in (("tanpa cache", t_old), ("TextCache", t_new)):
+        print(
+            f"{name:12s}: rata2 {t.mean():7.3f} ms   p50 {np.percentile(t, 50):7.3f} ms"
+            f"   p99 {np.percentile(t, 99):7.3f} ms"
+        )
+    print(f"cache hit   : {app.ui_text.hits}/{app.ui_text.hits + app.ui_text.misses}")
+    print(f"piksel beda : {diff}")
+    sys.exit(1 if diff else 0)
+
+
+if __name__ == "__main__":
+    main()
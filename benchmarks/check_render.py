@@ -0,0 +1,117 @@
+"""
+Bandingkan hasil SceneRenderer2D dengan Object2D.draw (immediate mode)
+piksel-per-piksel di konteks GL offscreen (Mesa llvmpipe via EGL).
+
+    python benchmarks/check_render.py --n 2000
+    python benchmarks/check_render.py --n 2000 --window --drag 20
+
+Dengan ``--window`` scene diklip dulu (garis & outline bentuk terpotong);
+``--drag`` menggeser window beberapa kali memakai renderer yang sama sebelum
+dibandingkan, untuk memeriksa invalidasi inkremental.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import headless  # noqa: E402  (harus sebelum OpenGL)
+
+import numpy as np  # noqa: E402
+from OpenGL.GL import *  # noqa: E402,F403
+from OpenGL.GLU import gluOrtho2D  # noqa: E402
+
+import TubesGrafkom as app  # noqa: E402
+from bench_clip import make_scene  # noqa: E402
+from renderer import SceneRenderer2D  # noqa: E402
+
+
+def setup_2d():
+    glViewport(0, 0, app.WIDTH, app.HEIGHT)
+    glMatrixMode(GL_PROJECTION)
+    glLoadIdentity()
+    gluOrtho2D(-10, 10, -10, 10)
+    glMatrixMode(GL_MODELVIEW)
+    glLoadIdentity()
+    glClearColor(*app.BG_COLOR)
+    glPointSize(5)
+
+
+def grab():
+    glFinish()
+    data = glReadPixels(0, 0, app.WIDTH, app.HEIGHT, GL_RGBA, GL_UNSIGNED_BYTE)
+    return np.frombuffer(data, dtype=np.uint8).reshape(app.HEIGHT, app.WIDTH, 4)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=2000)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--window", action="store_true", help="klip dengan window")
+    ap.add_argument("--drag", type=int, default=0, help="langkah drag window")
+    args = ap.parse_args()
+
+    headless.create_context(app.WIDTH, app.HEIGHT)
+    setup_2d()
+
+    rng = np.random.default_rng(args.seed)
+    objs = make_scene(args.n, seed=args.seed)
+    palette = list(app.COLORS.values())
+    for o in objs:
+        o.color = palette[rng.integers(len(palette))]
+        o.thickness = float(rng.choice([1.0, 1.5, 3.0]))
+        if o.obj_type != "line" and rng.random() < 0.5:
+            o.translation = list(rng.uniform(-2, 2, 2))
+            if o.obj_type != "point":
+                o.rotation = float(rng.uniform(-180, 180))
+                o.scale = list(rng.uniform(0.5, 1.5, 2))
+
+    app.mark_scene_dirty()
+    r = SceneRenderer2D(app.objects_2d, app.PX_PER_UNIT)
+    for o in objs:
+        r.add(o)
+    if args.window:
+        # renderer aplikasi dipakai supaya ikut menerima invalidasi kliping
+        r = app.scene_renderer
+        r.invalidate_all()
+        app.window_clipping[:] = [app.Point2D(-4, -3), app.Point2D(5, 6)]
+        app.clip_objects()
+        r.draw()
+        for _ in range(args.drag):
+            p1, p2 = app.window_clipping
+            dx, dy = rng.normal(0, 0.4, 2)
+            p1.x += dx
+            p1.y += dy
+            p2.x += dx
+            p2.y += dy
+            app.clip_objects()
+            r.draw()
+        print(f"bentuk terpotong : {len(app.scene.clipped)}")
+
+    glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+    t0 = time.perf_counter()
+    for o in objs:
+        o.draw()
+    ref = grab()
+    t_imm = time.perf_counter() - t0
+
+    glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+    r.draw()
+    glFinish()
+    glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+    t0 = time.perf_counter()
+    r.draw()
+    out = grab()
+    t_vbo = time.perf_counter() - t0
+
+    diff = np.any(ref != out, axis=2)
+    print(f"objek            : {args.n}")
+    print(f"immediate mode   : {t_imm * 1e3:8.2f} ms")
+    print(f"VBO (tanpa sync) : {t_vbo * 1e3:8.2f} ms")
+    print(f"piksel berbeda   : {int(diff.sum())} dari {diff.size}")
+    sys.exit(1 if diff.any() else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+"""
+Suite benchmark headless: kliping, picking, update transformasi, dan
+rendering (OpenGL & rasterizer NumPy) pada scene sintetis ber-seed berukuran
+1k sampai 1M objek.
+
+Rendering dijalankan di konteks GL offscreen (EGL pbuffer, Mesa llvmpipe);
+jika konteks tidak bisa dibuat, kasus render dicatat sebagai "skipped".
+Hasil ditulis ke file JSON supaya bisa dibandingkan antar commit:
+
+    python benchmarks/suite.py --sizes 1000,10000,100000,1000000
+    python benchmarks/suite.py --compare bench-lama.json bench-baru.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import headless  # noqa: E402  (harus sebelum OpenGL)
+
+import numpy as np  # noqa: E402
+from OpenGL.GL import (  # noqa: E402
+    GL_COLOR_BUFFER_BIT, GL_DEPTH_BUFFER_BIT, GL_MODELVIEW, GL_PROJECTION, GL_RENDERER,
+    glClear, glClearColor, glFinish, glGetString, glLoadIdentity, glMatrixMode,
+    glPointSize, glViewport,
+)
+from OpenGL.GLU import gluOrtho2D  # noqa: E402
+
+import scenegen  # noqa: E402
+from scenegen import app  # noqa: E402
+from bench_clip import legacy_clip_objects  # noqa: E402
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+WINDOW = ((-4.0, -3.0), (5.0, 6.0))
+# kasus jalur lama per-objek: di atas batas ini terlalu lama untuk dijalankan
+SLOW_CASES = ("clip_legacy", "render_immediate")
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def measure(fn, repeat, budget=1.0):
+    """
+    Jalankan ``fn`` sampai ``repeat`` kali (berhenti lebih awal bila total
+    melewati ``budget`` detik). Mengembalikan daftar durasi (detik).
+    """
+    times = []
+    total = 0.0
+    while len(times) < repeat and (not times or total < budget):
+        t0 = time.perf_counter()
+        fn()
+        dt = time.perf_counter() - t0
+        times.append(dt)
+        total += dt
+    return times
+
+
+def set_window(p1, p2):
+    app.window_clipping[:] = [app.Point2D(*p1), app.Point2D(*p2)]
+
+
+class Suite:
+    def __init__(self, args):
+        self.args = args
+        self.results = []
+        self.gl = None
+
+    def record(self, case, scene, n, times, ops=1, **extra):
+        best, mean = min(times), sum(times) / len(times)
+        entry = {
+            "case": case, "scene": scene, "n": n, "ops": ops, "runs": len(times),
+            "best_s": best, "mean_s": mean, "per_op_us": best / ops * 1e6,
+        }
+        entry.update(extra)
+        self.results.append(entry)
+        print(
+            f"  {case:22s} {best * 1e3:10.2f} ms"
+            + (f"  ({best / ops * 1e6:9.2f} us/op)" if ops > 1 else "")
+        )
+
+    def skip(self, case, scene, n, reason):
+        self.results.append({"case": case, "scene": scene, "n": n, "skipped": reason})
+        print(f"  {case:22s} dilewati: {reason}")
+
+    # ---------- persiapan ----------
+    def init_gl(self):
+        try:
+            headless.create_context(app.WIDTH, app.HEIGHT)
+        except Exception as exc:     # tanpa EGL/Mesa: kasus render dilewati
+            self.gl = False
+            self.gl_error = str(exc)
+            return
+        glViewport(0, 0, app.WIDTH, app.HEIGHT)
+        glMatrixMode(GL_PROJECTION)
+        glLoadIdentity()
+        gluOrtho2D(-10, 10, -10, 10)
+        glMatrixMode(GL_MODELVIEW)
+        glLoadIdentity()
+        glClearColor(*app.BG_COLOR)
+        glPointSize(5)
+        self.gl = glGetString(GL_RENDERER).decode()
+
+    # ---------- kasus ----------
+    def run_scene(self, scene, n):
+        a = self.args
+        types = scenegen.TYPE_NAMES if scene == "mix" else (scene,)
+        print(f"[{scene}] n={n}")
+        app.window_clipping.clear()
+        app.invalidate_clip()
+        self.record("generate", scene, n, measure(
+            lambda: scenegen.generate(n, seed=a.seed, types=types, size=a.size), 1
+        ))
+        self.record("pick_index_build", scene, n, measure(scenegen.build_pick_index, 1))
+
+        # kliping penuh & inkremental (drag window)
+        def clip_full():
+            app.invalidate_clip()
+            app.clip_objects()
+
+        set_window(*WINDOW)
+        self.record("clip_full", scene, n, measure(clip_full, a.repeat))
+
+        rng = np.random.default_rng(a.seed)
+        deltas = rng.uniform(-3, 3, size=(a.events, 2)) * (20 / app.WIDTH, 20 / app.HEIGHT)
+
+        def drag():
+            for dx, dy in deltas:
+                p1, p2 = app.window_clipping
+                p1.x += dx
+                p1.y += dy
+                p2.x += dx
+                p2.y += dy
+                app.clip_objects()
+
+        clip_full()
+        self.record("clip_drag", scene, n, measure(drag, 1), ops=len(deltas))
+        set_window(*WINDOW)
+        clip_full()
+
+        if n > a.slow_max:
+            self.skip("clip_legacy", scene, n, f"n > --slow-max {a.slow_max}")
+        else:
+            def legacy():
+                legacy_clip_objects()
+                app.invalidate_clip()
+            self.record("clip_legacy", scene, n, measure(legacy, 1))
+            clip_full()
+
+        # picking: klik acak di seluruh layar
+        clicks = rng.integers(0, (app.WIDTH, app.HEIGHT), size=(a.picks, 2)).tolist()
+        hits = []
+
+        def pick():
+            hits[:] = [app.select_object(mx, my) is not None for mx, my in clicks]
+
+        self.record("pick", scene, n, measure(pick, a.repeat), ops=len(clicks),
+                    hit_rate=sum(hits) / len(hits))
+
+        # rasterizer software (tanpa GL): selalu jalan
+        self.record("render_numpy", scene, n, measure(app.render_software, a.repeat))
+
+        if self.gl:
+            self.record("render_sync", scene, n, measure(self.draw_vbo, 1))
+            self.record("render_draw", scene, n, measure(self.draw_vbo, a.repeat))
+
+        # update transformasi lewat handle_motion (mode Translasi, tombol kiri ditekan)
+        targets = rng.integers(0, n, size=a.transforms).tolist()
+
+        def transform():
+            for i in targets:
+                app.selected_object = app.objects_2d[i]
+                app.handle_motion((3, -2))
+
+        app.mouse.buttons = (True, False, False)
+        app.transform_mode = "Translasi"
+        try:
+            self.record("transform", scene, n, measure(transform, 1), ops=len(targets))
+        finally:
+            app.mouse.buttons = (False, False, False)
+            app.transform_mode = None
+            app.selected_object = None
+
+        if not self.gl:
+            for case in ("render_sync", "render_draw", "render_after_transform",
+                         "render_immediate"):
+                self.skip(case, scene, n, f"tidak ada konteks GL: {self.gl_error}")
+            return
+        # frame setelah transformasi: hanya objek kotor yang disinkronkan ulang
+        self.record("render_after_transform", scene, n, measure(self.draw_vbo, 1))
+        if n > a.slow_max:
+            self.skip("render_immediate", scene, n, f"n > --slow-max {a.slow_max}")
+        else:
+            self.record("render_immediate", scene, n, measure(self.draw_immediate, 1))
+
+    def draw_vbo(self):
+        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+        app.scene_renderer.draw()
+        glFinish()
+
+    def draw_immediate(self):
+        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+        for obj in app.objects_2d:
+            obj.draw()
+        glFinish()
+
+    def run(self):
+        a = self.args
+        self.init_gl()
+        for scene in a.scenes:
+            for n in a.sizes:
+                self.run_scene(scene, n)
+        return {
+            "meta": {
+                "commit": git_commit(),
+                "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "python": platform.python_version(),
+                "numpy": np.__version__,
+                "platform": platform.platform(),
+                "gl_renderer": self.gl or None,
+                "seed": a.seed,
+                "size": a.size,
+            },
+            "results": self.results,
+        }
+
+
+# ---------- perbandingan dua file hasil ----------
+def compare(base_path, new_path, threshold):
+    with open(base_path) as f:
+        base = json.load(f)
+    with open(new_path) as f:
+        new = json.load(f)
+    key = lambda r: (r["case"], r["scene"], r["n"])  # noqa: E731
+    old = {key(r): r for r in base["results"] if "best_s" in r}
+    print(f"{base['meta']['commit']} -> {new['meta']['commit']}")
+    worse = 0
+    for r in new["results"]:
+        o = old.get(key(r))
+        if o is None or "best_s" not in r:
+            continue
+        ratio = r["best_s"] / o["best_s"]
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  LEBIH LAMBAT"
+            worse += 1
+        elif ratio < 1 - threshold:
+            flag = "  lebih cepat"
+        print(
+            f"{r['case']:22s} {r['scene']:8s} {r['n']:>8d}  "
+            f"{o['best_s'] * 1e3:10.2f} -> {r['best_s'] * 1e3:10.2f} ms  x{ratio:5.2f}{flag}"
+        )
+    return worse
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes", default=",".join(map(str, SIZES)))
+    ap.add_argument("--scenes", default="mix",
+                    help="'mix' dan/atau tipe objek: " + ",".join(scenegen.TYPE_NAMES))
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--size", type=float, default=0.5, help="ukuran objek (unit dunia)")
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--events", type=int, default=50, help="event drag window")
+    ap.add_argument("--picks", type=int, default=1000)
+    ap.add_argument("--transforms", type=int, default=1000)
+    ap.add_argument("--slow-max", type=int, default=100_000,
+                    help="n maksimum untuk kasus jalur lama (" + ", ".join(SLOW_CASES) + ")")
+    ap.add_argument("--out", help="file JSON hasil (default bench-<commit>.json)")
+    ap.add_argument("--compare", nargs=2, metavar=("LAMA", "BARU"))
+    ap.add_argument("--threshold", type=float, default=0.10,
+                    help="selisih relatif yang dianggap regresi saat --compare")
+    args = ap.parse_args()
+
+    if args.compare:
+        sys.exit(1 if compare(*args.compare, args.threshold) else 0)
+
+    args.sizes = [int(s) for s in args.sizes.split(",")]
+    args.scenes = args.scenes.split(",")
+    for s in args.scenes:
+        if s != "mix" and s not in scenegen.TYPE_NAMES:
+            ap.error(f"scene tidak dikenal: {s}")
+
+    report = Suite(args).run()
+    out = args.out or f"bench-{report['meta']['commit']}.json"
+    with open(out, "w") as f:
+        json.dump(report, f, indent=1)
+    print(f"hasil: {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Kamera 2D: pan & zoom di atas tampilan awal gluOrtho2D(-10, 10, -10, 10).
+
+Semua pemetaan dunia <-> piksel mode 2D (picking, window kliping, scissor,
+grid, ekspor PNG) lewat ``Camera2D``, jadi tidak ada lagi ``/ 20`` dan
+``+ 10`` yang tersebar. Pada tampilan awal hasilnya sama persis dengan rumus
+lama (urutan operasi floating point dipertahankan), sehingga rekaman input
+lama tetap menghasilkan scene yang sama.
+
+Renderer 2D menyimpan verteks di clip space tampilan awal (``home``); kamera
+memberinya ``view`` = proyeksi kamera × invers ``home``, matriks skala +
+translasi yang dipasang saat menggambar. Pan / zoom tidak membangun ulang
+verteks apa pun, dan di tampilan awal ``view`` tepat identitas.
+"""
+import math
+
+import numpy as np
+
+ZOOM_MIN, ZOOM_MAX = 1 / 64, 256
+ZOOM_STEP = 1.25          # per notch roda mouse
+
+
+def ortho(left, right, bottom, top, near=-1.0, far=1.0):
+    """Matriks glOrtho (4, 4); ``near`` / ``far`` bawaan = gluOrtho2D."""
+    m = np.eye(4)
+    m[0, 0], m[1, 1], m[2, 2] = 2 / (right - left), 2 / (top - bottom), -2 / (far - near)
+    m[:3, 3] = -(right + left) / (right - left), -(top + bottom) / (top - bottom), -(far + near) / (far - near)
+    return m
+
+
+class Camera2D:
+    def __init__(self, width, height, half_extent=(10.0, 10.0)):
+        self.width, self.height = width, height
+        self.half_extent = half_extent
+        hx, hy = half_extent
+        self.home = ortho(-hx, hx, -hy, hy)
+        self.version = 0          # naik setiap kali tampilan berubah
+        self.reset()
+
+    def reset(self):
+        """Kembali ke tampilan awal."""
+        self.center = (0.0, 0.0)
+        self.zoom = 1.0
+        self._update()
+
+    def _update(self):
+        (cx, cy), (hx, hy) = self.center, self.half_extent
+        if self.zoom != 1.0:
+            hx, hy = hx / self.zoom, hy / self.zoom
+        self.bounds = (cx - hx, cy - hy, cx + hx, cy + hy)     # xmin, ymin, xmax, ymax
+        xmin, ymin, xmax, ymax = self.bounds
+        self.px_per_unit = (self.width / (xmax - xmin), self.height / (ymax - ymin))
+        self.projection = ortho(xmin, xmax, ymin, ymax)
+        # clip space home -> clip space kamera (analitik supaya identitas tepat di home)
+        z = self.zoom
+        self.view = np.eye(4)
+        self.view[0, 0] = self.view[1, 1] = z
+        self.view[0, 3] = -cx * z / self.half_extent[0]
+        self.view[1, 3] = -cy * z / self.half_extent[1]
+        self.version += 1
+
+    @property
+    def detail(self):
+        """
+        Skala dunia -> piksel untuk tesselasi (jumlah segmen elips): dibulatkan
+        ke bawah per kelipatan 2 dan tidak pernah di bawah tampilan awal, jadi
+        geometri dibangun ulang hanya saat zoom melewati satu oktaf.
+        """
+        level = 2.0 ** max(0, math.floor(math.log2(self.zoom)))
+        hx, hy = self.half_extent
+        return (self.width / (2 * hx) * level, self.height / (2 * hy) * level)
+
+    # ---------- navigasi ----------
+    def pan(self, dx_px, dy_px):
+        """Geser tampilan mengikuti drag mouse ``(dx, dy)`` piksel."""
+        dx, dy = self.delta_to_world(dx_px, dy_px)
+        self.center = (self.center[0] - dx, self.center[1] - dy)
+        self._update()
+
+    def zoom_at(self, mx, my, factor):
+        """Zoom dengan titik dunia di bawah kursor ``(mx, my)`` tetap di tempatnya."""
+        zoom = min(max(self.zoom * factor, ZOOM_MIN), ZOOM_MAX)
+        if zoom == self.zoom:
+            return
+        wx, wy = self.to_world(mx, my)
+        hx, hy = self.half_extent[0] / zoom, self.half_extent[1] / zoom
+        self.zoom = zoom
+        self.center = (
+            wx - (mx / self.width) * 2 * hx + hx,
+            wy + (my / self.height) * 2 * hy - hy,
+        )
+        self._update()
+
+    # ---------- dunia <-> piksel ----------
+    def to_world(self, mx, my):
+        """Posisi mouse (piksel, y dari atas) -> koordinat dunia."""
+        xmin, ymin, xmax, ymax = self.bounds
+        return xmin + (mx / self.width) * (xmax - xmin), ymax - (my / self.height) * (ymax - ymin)
+
+    def delta_to_world(self, dx_px, dy_px):
+        """Pergeseran mouse (piksel) -> pergeseran dunia."""
+        xmin, ymin, xmax, ymax = self.bounds
+        return (dx_px / self.width) * (xmax - xmin), -(dy_px / self.height) * (ymax - ymin)
+
+    def scissor_rect(self, bounds, width=None, height=None):
+        """
+        Kotak dunia ``(xmin, ymin, xmax, ymax)`` sebagai kotak scissor
+        ``(x, y, w, h)`` piksel, y dari bawah; ``width`` / ``height`` untuk
+        target selain viewport (mis. ekspor PNG beresolusi lain).
+        """
+        width = self.width if width is None else width
+        height = self.height if height is None else height
+        vxmin, vymin, vxmax, vymax = self.bounds
+        vw, vh = vxmax - vxmin, vymax - vymin
+        xmin, ymin, xmax, ymax = bounds
+        x_px = int((xmin - vxmin) / vw * width)
+        y_px = int((ymin - vymin) / vh * height)
+        w_px = int((xmax - xmin) / vw * width)
+        h_px = int((ymax - ymin) / vh * height)
+        return x_px, y_px, max(1, w_px), max(1, h_px)
+
+    def visible_bounds(self, margin_px=0.0):
+        """Area dunia yang terlihat, diperlebar ``margin_px`` piksel di setiap sisi."""
+        xmin, ymin, xmax, ymax = self.bounds
+        mx, my = margin_px / self.px_per_unit[0], margin_px / self.px_per_unit[1]
+        return xmin - mx, ymin - my, xmax + mx, ymax + my
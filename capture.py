@@ -0,0 +1,237 @@
+"""
+Tangkap frame yang digambar loop render tanpa menghentikannya.
+
+Selama penangkapan aktif frame digambar ke FBO seukuran viewport aplikasi
+(warna RGBA8 + depth 24) lalu di-blit ke framebuffer layar, jadi tampilan
+tidak berubah dan tangkapan juga berjalan tanpa jendela (konteks EGL
+pbuffer, lihat headless.py). ``glReadPixels`` ditujukan ke salah satu PBO
+(``GL_PIXEL_PACK_BUFFER``): GPU menyalin piksel secara asinkron dan isi PBO
+baru di-map satu frame kemudian, saat salinannya sudah selesai, jadi loop
+tidak menunggu GPU. Piksel diteruskan ke thread penulis yang meng-encode
+PNG (zlib melepas GIL) atau menambahkan frame mentah ke satu file ``.rgba``.
+
+    capture.begin_frame()        # sebelum glClear
+    ...gambar...
+    capture.end_frame()          # sebelum pygame.display.flip()
+
+``snapshot(path)`` menangkap satu frame (di-map langsung, tanpa menunggu
+frame berikutnya); ``start(target)`` / ``stop()`` menangkap setiap frame ke
+direktori PNG atau file ``.rgba`` (RGBA 8 bit, baris teratas dulu, frame
+berurutan tanpa header: ``ffmpeg -f rawvideo -pix_fmt rgba -s WxH``).
+"""
+import ctypes
+import os
+import queue
+import threading
+import time
+
+import numpy as np
+from OpenGL.GL import *
+
+PNG_LEVEL = 1       # zlib: ~10x lebih cepat dari level 6, file ~10 % lebih besar
+
+
+class FrameCapture:
+    def __init__(self, width, height, buffers=2, queue_size=8, present=True):
+        self.width, self.height = width, height
+        self.present = present              # blit ke layar; False bila tidak ada yang melihat (headless)
+        self.size = width * height * 4
+        self.buffers = buffers
+        self.fbo = None
+        self.renderbuffers = None
+        self.pbos = None
+        self.pending = [None] * buffers     # per PBO: tujuan frame yang sedang disalin
+        self.slot = 0
+        self.target = None                  # tangkapan kontinu: direktori / file .rgba
+        self.requests = []                  # snapshot untuk frame berikutnya
+        self.sequence = 0
+        self.queue = queue.Queue(queue_size)
+        self.writer = None
+        # statistik: frame ditulis, waktu di end_frame, waktu menunggu antrean penuh
+        self.frames = 0
+        self.readback_ms = 0.0
+        self.stall_ms = 0.0
+
+    @property
+    def active(self):
+        return self.target is not None or bool(self.requests)
+
+    # ---------- kontrol ----------
+    def snapshot(self, path):
+        """Tangkap frame berikutnya ke ``path`` (.png atau .rgba)."""
+        self.requests.append(path)
+
+    def start(self, target):
+        """Tangkap setiap frame: ``target`` berakhiran .rgba = satu file mentah, selain itu direktori PNG."""
+        if not target.endswith(".rgba"):
+            os.makedirs(target, exist_ok=True)
+        self.target = target
+        self.sequence = 0
+
+    def stop(self):
+        """Hentikan tangkapan kontinu; frame yang masih di PBO ikut ditulis."""
+        if self.target is None:
+            return
+        self.flush()
+        self._put(("close", self.target, None))
+        self.target = None
+
+    def close(self):
+        """Hentikan semua tangkapan dan tunggu thread penulis selesai."""
+        self.stop()
+        self.flush()
+        if self.writer is not None:
+            self.queue.put(None)
+            self.writer.join()
+            self.writer = None
+
+    # ---------- per frame ----------
+    def begin_frame(self):
+        if not self.active:
+            return
+        if self.fbo is None:
+            self._create()
+        glBindFramebuffer(GL_FRAMEBUFFER, self.fbo)
+
+    def end_frame(self):
+        if not self.active or self.fbo is None:
+            return
+        t0 = time.perf_counter()
+        # (path, kind): "single" = satu file per frame, "stream" = ditambahkan ke file .rgba
+        dests = [(path, "single") for path in self.requests]
+        self.requests.clear()
+        if self.target is not None:
+            if self.target.endswith(".rgba"):
+                dests.append((self.target, "stream"))
+            else:
+                dests.append((os.path.join(self.target, f"frame-{self.sequence:06d}.png"), "single"))
+            self.sequence += 1
+
+        # salin asinkron ke PBO slot ini, lalu ambil slot tertua (frame sebelumnya)
+        slot = self.slot
+        glBindFramebuffer(GL_READ_FRAMEBUFFER, self.fbo)
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, self.pbos[slot])
+        # BGRA = format asli framebuffer di kebanyakan driver (tanpa konversi saat salin)
+        glReadPixels(0, 0, self.width, self.height, GL_BGRA, GL_UNSIGNED_BYTE, ctypes.c_void_p(0))
+        self.pending[slot] = dests
+        self.slot = (slot + 1) % self.buffers
+        self._collect(self.slot)
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, 0)
+
+        if self.present:
+            glBindFramebuffer(GL_DRAW_FRAMEBUFFER, 0)
+            glBlitFramebuffer(
+                0, 0, self.width, self.height, 0, 0, self.width, self.height,
+                GL_COLOR_BUFFER_BIT, GL_NEAREST,
+            )
+        glBindFramebuffer(GL_FRAMEBUFFER, 0)
+        if self.target is None:
+            # hanya snapshot: tidak ada frame berikutnya yang pasti datang
+            self.flush()
+        self.readback_ms += (time.perf_counter() - t0) * 1e3
+
+    def flush(self):
+        """Map semua PBO yang masih menunggu (urut frame)."""
+        if self.pbos is None:
+            return
+        for k in range(self.buffers):
+            self._collect((self.slot + k) % self.buffers)
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, 0)
+
+    def _collect(self, slot):
+        dests = self.pending[slot]
+        if not dests:
+            return
+        self.pending[slot] = None
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, self.pbos[slot])
+        addr = glMapBufferRange(GL_PIXEL_PACK_BUFFER, 0, self.size, GL_MAP_READ_BIT)
+        pixels = np.ctypeslib.as_array((ctypes.c_ubyte * self.size).from_address(addr)).copy()
+        glUnmapBuffer(GL_PIXEL_PACK_BUFFER)
+        pixels = pixels.reshape(self.height, self.width, 4)
+        for path, kind in dests:
+            self._put((kind, path, pixels))
+
+    # ---------- thread penulis ----------
+    def _put(self, item):
+        if self.writer is None:
+            self.writer = threading.Thread(target=self._write_loop, name="grafkom-capture", daemon=True)
+            self.writer.start()
+        t0 = time.perf_counter()
+        self.queue.put(item)        # antrean penuh = penulis tertinggal, loop ikut menunggu
+        self.stall_ms += (time.perf_counter() - t0) * 1e3
+
+    def _write_loop(self):
+        from raster import write_png    # di thread penulis, bukan saat aplikasi start
+
+        raw = {}
+        while True:
+            item = self.queue.get()
+            if item is None:
+                break
+            kind, path, pixels = item
+            try:
+                if kind == "close":
+                    f = raw.pop(path, None)
+                    if f is not None:
+                        f.close()
+                    continue
+                # GL: baris 0 di bawah; BGRA -> RGBA
+                image = np.ascontiguousarray(pixels[::-1, :, [2, 1, 0, 3]])
+                if kind == "stream":
+                    if path not in raw:
+                        raw[path] = open(path, "wb")
+                    raw[path].write(image.data)
+                elif path.endswith(".rgba"):
+                    with open(path, "wb") as f:
+                        f.write(image.data)
+                else:
+                    write_png(path, image, PNG_LEVEL)
+                self.frames += 1
+            except Exception as e:       # penulis harus tetap mengosongkan antrean
+                print(f"capture {path}: {e}")
+        for f in raw.values():
+            f.close()
+
+    # ---------- sumber daya GL ----------
+    def _create(self):
+        self.fbo = glGenFramebuffers(1)
+        self.renderbuffers = glGenRenderbuffers(2)
+        glBindFramebuffer(GL_FRAMEBUFFER, self.fbo)
+        for rb, fmt, attach in zip(
+            self.renderbuffers,
+            (GL_RGBA8, GL_DEPTH_COMPONENT24),
+            (GL_COLOR_ATTACHMENT0, GL_DEPTH_ATTACHMENT),
+        ):
+            glBindRenderbuffer(GL_RENDERBUFFER, rb)
+            glRenderbufferStorage(GL_RENDERBUFFER, fmt, self.width, self.height)
+            glFramebufferRenderbuffer(GL_FRAMEBUFFER, attach, GL_RENDERBUFFER, rb)
+        glBindRenderbuffer(GL_RENDERBUFFER, 0)
+        status = glCheckFramebufferStatus(GL_FRAMEBUFFER)
+        glBindFramebuffer(GL_FRAMEBUFFER, 0)
+        if status != GL_FRAMEBUFFER_COMPLETE:
+            self.release()
+            raise RuntimeError(f"FBO tangkapan tidak lengkap (status 0x{status:x})")
+        self.pbos = glGenBuffers(self.buffers)
+        if self.buffers == 1:
+            self.pbos = [self.pbos]
+        for pbo in self.pbos:
+            glBindBuffer(GL_PIXEL_PACK_BUFFER, pbo)
+            glBufferData(GL_PIXEL_PACK_BUFFER, self.size, None, GL_STREAM_READ)
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, 0)
+        self.pending = [None] * self.buffers
+        self.slot = 0
+
+    def release(self):
+        """Hapus FBO & PBO milik konteks GL yang masih aktif."""
+        if self.pbos is not None:
+            glDeleteBuffers(len(self.pbos), list(self.pbos))
+        if self.renderbuffers is not None:
+            glDeleteRenderbuffers(2, list(self.renderbuffers))
+        if self.fbo is not None:
+            glDeleteFramebuffers(1, [self.fbo])
+        self.invalidate_gl()
+
+    def invalidate_gl(self):
+        """Konteks GL dibuat ulang: id lama tidak berlaku, frame yang masih di PBO hilang."""
+        self.fbo = self.renderbuffers = self.pbos = None
+        self.pending = [None] * self.buffers
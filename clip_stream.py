@@ -0,0 +1,192 @@
+"""
+Pipeline kliping headless (tanpa pygame / OpenGL): primitif dibaca sebagai
+stream, diklip per potongan berukuran tetap dengan kernel yang sama seperti
+``clip_objects`` di aplikasi (scene_clip.py), lalu hasilnya ditulis sebagai
+JSONL. Memori dibatasi ukuran potongan, bukan ukuran input, jadi file
+berukuran GB bisa diproses tanpa dimuat seluruhnya.
+
+    python clip_stream.py scene.gks -o hasil.jsonl
+    python clip_stream.py scene.jsonl --window -5 -5 5 5 --chunk 100000
+    cat scene.jsonl | python clip_stream.py - --window 0 0 4 4 --visible-only
+
+Input: file ``.gks`` atau JSONL (``scene_file.export_jsonl``: satu objek per
+baris, baris header opsional berisi ``window``). ``--window`` menimpa window
+dari header file.
+
+Keluaran, satu baris per objek sesuai urutan input::
+
+    {"i": 7, "type": "line", "class": "crossing", "visible": true,
+     "color": [r, g, b], "thickness": 2.0, "points": [[x0, y0], [x1, y1]]}
+
+``class`` = inside / crossing / outside (dari bbox). Setiap objek yang tampil
+membawa ``thickness`` (tebal garis/outline dalam piksel). Geometrinya:
+
+* garis: ``points`` hasil Cohen–Sutherland, koordinat dunia;
+* bentuk yang memotong tepi window: ``outline`` terklip, koordinat dunia,
+  dan ``boundary`` (sisi ke-k berada di tepi window);
+* bentuk lain: ``points`` lokal (geometri asli) + ``translation``,
+  ``rotation`` (derajat) dan ``scale`` yang memetakannya ke dunia.
+
+Objek yang tidak tampil hanya membawa field umum. Ringkasan throughput &
+puncak RSS ke stderr.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+import parallel
+import scene_clip
+import scene_file
+from clipping import CROSSING, FULLY_INSIDE, OUTSIDE
+from scene_store import TYPE_CODES, TYPE_NAMES, SceneStore
+
+try:
+    import resource
+except ImportError:         # Windows
+    resource = None
+
+CHUNK = 65_536                  # objek per potongan
+PX_PER_UNIT = (40.0, 30.0)      # kerapatan tesselasi elips, sama dengan jendela 800x600
+CLASS_NAMES = {FULLY_INSIDE: "inside", CROSSING: "crossing", OUTSIDE: "outside"}
+
+
+def clip_chunk(store, bounds, px_per_unit=PX_PER_UNIT):
+    """
+    Klip seluruh isi ``store`` terhadap ``bounds`` (xmin, ymin, xmax, ymax).
+    Mengembalikan klasifikasi per objek; titik tampil, visible, warna dan
+    ``store.clipped`` ditulis ke store.
+    """
+    pack = scene_clip.pack(store)
+    cls = np.full(store.n, OUTSIDE, dtype=np.uint8)
+    lines, shapes = pack["lines"], pack["shapes"]
+    if len(lines):
+        parts = parallel.map_chunks(
+            lambda a, b: scene_clip.clip_lines(store, pack, slice(a, b), bounds), len(lines)
+        )
+        cls[lines] = np.concatenate(parts)
+    if len(shapes):
+        parts = parallel.map_chunks(
+            lambda a, b: scene_clip.clip_shapes(store, pack, slice(a, b), bounds, px_per_unit),
+            len(shapes),
+        )
+        cls[shapes] = np.concatenate([c for c, _, _ in parts])
+        for _, _, clipped in parts:
+            store.clipped.update(clipped)
+    return cls
+
+
+def records(store, cls, start=0, visible_only=False):
+    """
+    Baris JSONL hasil kliping ``store`` (indeks objek mulai dari ``start``).
+    Setiap objek tampil membawa ``thickness``; ``points`` garis dan
+    ``outline`` bentuk terklip sudah dalam koordinat dunia, sedangkan
+    ``points`` bentuk lain masih lokal dan disertai transformasinya.
+    """
+    n = store.n
+    types = store.types[:n].tolist()
+    count = store.count[:n].tolist()
+    offset = store.offset[:n].tolist()
+    visible = store.visible[:n].tolist()
+    color = store.color[:n].round(6).tolist()
+    thickness = store.thickness[:n].astype(float).tolist()
+    names = [CLASS_NAMES[c] for c in cls.tolist()]
+    line = TYPE_CODES["line"]
+    for i in range(n):
+        if visible_only and not visible[i]:
+            continue
+        rec = {"i": start + i, "type": TYPE_NAMES[types[i]], "class": names[i],
+               "visible": visible[i], "color": color[i]}
+        if visible[i]:
+            rec["thickness"] = thickness[i]
+            if types[i] == line:
+                rec["points"] = store.disp[offset[i]:offset[i] + 2].tolist()
+            elif i in store.clipped:
+                verts, boundary = store.clipped[i]
+                rec["outline"] = verts.tolist()
+                rec["boundary"] = boundary.tolist()
+            else:
+                rec["points"] = store.orig[offset[i]:offset[i] + count[i]].tolist()
+                rec["translation"] = store.translation[i].tolist()
+                rec["rotation"] = float(store.rotation[i])
+                rec["scale"] = store.scale[i].tolist()
+        yield json.dumps(rec)
+
+
+def peak_rss():
+    """Puncak resident set size proses ini dalam byte (None bila tidak tersedia)."""
+    try:
+        # VmHWM milik address space sekarang; ru_maxrss di Linux ikut membawa
+        # puncak proses induk sebelum exec
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024      # Linux: KiB
+
+
+def run(path, out, window=None, chunk=CHUNK, visible_only=False, px_per_unit=PX_PER_UNIT):
+    """
+    Klip ``path`` per potongan dan tulis JSONL ke file ``out``. Mengembalikan
+    statistik ``{"objects", "bytes", "seconds", "peak_rss"}``.
+    """
+    t0 = time.perf_counter()
+    total = 0
+    for file_window, n, nv, cols in scene_file.iter_chunks(path, chunk):
+        win = window or file_window
+        if win is None:
+            raise ValueError(f"{path}: window kliping tidak ada di file, berikan --window")
+        (x1, y1), (x2, y2) = win
+        bounds = (min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))
+        store = SceneStore(capacity=1, vertex_capacity=1)
+        store.adopt(n, nv, cols)
+        cls = clip_chunk(store, bounds, px_per_unit)
+        out.writelines(rec + "\n" for rec in records(store, cls, total, visible_only))
+        total += n
+    size = os.path.getsize(path) if path != "-" else None
+    return {"objects": total, "bytes": size, "seconds": time.perf_counter() - t0, "peak_rss": peak_rss()}
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Kliping scene 2D tanpa jendela, JSONL/.gks -> JSONL.")
+    ap.add_argument("input", help="file .gks / .jsonl, atau - untuk stdin (JSONL)")
+    ap.add_argument("-o", "--output", default="-", help="file keluaran JSONL (default stdout)")
+    ap.add_argument("--window", type=float, nargs=4, metavar=("XMIN", "YMIN", "XMAX", "YMAX"))
+    ap.add_argument("--chunk", type=int, default=CHUNK, help=f"objek per potongan (default {CHUNK})")
+    ap.add_argument("--visible-only", action="store_true", help="lewati objek yang tidak tampil")
+    ap.add_argument("--px-per-unit", type=float, nargs=2, default=PX_PER_UNIT, metavar=("X", "Y"))
+    ap.add_argument("--workers", type=int, help="thread per potongan (0 = semua core), lihat parallel.py")
+    args = ap.parse_args(argv)
+
+    if args.workers is not None:
+        parallel.set_workers(args.workers)
+    window = None if args.window is None else (tuple(args.window[:2]), tuple(args.window[2:]))
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        stats = run(args.input, out, window, max(1, args.chunk), args.visible_only, tuple(args.px_per_unit))
+    except ValueError as e:
+        sys.exit(f"clip_stream: {e}")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    dt = max(stats["seconds"], 1e-9)
+    msg = f"{stats['objects']} objek dalam {dt:.2f} s ({stats['objects'] / dt:,.0f} objek/s"
+    if stats["bytes"] is not None:
+        msg += f", {stats['bytes'] / dt / 2**20:.1f} MiB/s"
+    msg += ")"
+    if stats["peak_rss"] is not None:
+        msg += f", puncak RSS {stats['peak_rss'] / 2**20:.1f} MiB"
+    print(msg, file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+"""
+Kliping batch berbasis NumPy untuk objek 2D.
+
+Semua fungsi di sini bekerja pada array koordinat (struct-of-arrays) dan tidak
+menyentuh pygame / OpenGL, sehingga bisa dipakai dari editor, benchmark,
+maupun pipeline headless.
+"""
+import numpy as np
+
+INSIDE, LEFT, RIGHT, BOTTOM, TOP = 0, 1, 2, 4, 8
+
+# hasil klasifikasi bbox terhadap window kliping
+OUTSIDE, CROSSING, FULLY_INSIDE = 0, 1, 2
+
+
+def outcodes(x, y, xmin, ymin, xmax, ymax):
+    """Region code Cohen–Sutherland untuk banyak titik sekaligus."""
+    cx = np.where(x < xmin, LEFT, np.where(x > xmax, RIGHT, INSIDE))
+    cy = np.where(y < ymin, BOTTOM, np.where(y > ymax, TOP, INSIDE))
+    return (cx | cy).astype(np.uint8)
+
+
+def cohen_sutherland_clip_batch(x0, y0, x1, y1, xmin, ymin, xmax, ymax):
+    """
+    Versi vektor dari ``cohen_sutherland_clip``.
+
+    Urutan pemotongan (TOP, BOTTOM, RIGHT, LEFT) dan rumus interpolasinya sama
+    persis dengan versi skalar, jadi hasil float-nya identik.
+    Mengembalikan ``(visible, x0, y0, x1, y1)``; koordinat baris yang tidak
+    visible tidak bermakna.
+    """
+    x0 = np.array(x0, dtype=np.float64)
+    y0 = np.array(y0, dtype=np.float64)
+    x1 = np.array(x1, dtype=np.float64)
+    y1 = np.array(y1, dtype=np.float64)
+
+    c0 = outcodes(x0, y0, xmin, ymin, xmax, ymax)
+    c1 = outcodes(x1, y1, xmin, ymin, xmax, ymax)
+    visible = np.zeros(x0.shape, dtype=bool)
+    idx = np.arange(x0.size)
+
+    while idx.size:
+        a0, a1 = c0[idx], c1[idx]
+        accept = (a0 | a1) == 0
+        reject = (a0 & a1) != 0
+        visible[idx[accept]] = True
+        keep = ~(accept | reject)
+        idx = idx[keep]
+        if not idx.size:
+            break
+        a0, a1 = a0[keep], a1[keep]
+
+        first = a0 != 0
+        c_out = np.where(first, a0, a1)
+        X0, Y0, X1, Y1 = x0[idx], y0[idx], x1[idx], y1[idx]
+
+        top = (c_out & TOP) != 0
+        bottom = ~top & ((c_out & BOTTOM) != 0)
+        right = ~top & ~bottom & ((c_out & RIGHT) != 0)
+        left = ~(top | bottom | right)
+
+        x = np.empty_like(X0)
+        y = np.empty_like(Y0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x[top] = (X0 + (X1 - X0) * (ymax - Y0) / (Y1 - Y0))[top]
+            y[top] = ymax
+            x[bottom] = (X0 + (X1 - X0) * (ymin - Y0) / (Y1 - Y0))[bottom]
+            y[bottom] = ymin
+            y[right] = (Y0 + (Y1 - Y0) * (xmax - X0) / (X1 - X0))[right]
+            x[right] = xmax
+            y[left] = (Y0 + (Y1 - Y0) * (xmin - X0) / (X1 - X0))[left]
+            x[left] = xmin
+
+        i0, i1 = idx[first], idx[~first]
+        x0[i0], y0[i0] = x[first], y[first]
+        x1[i1], y1[i1] = x[~first], y[~first]
+        c0[i0] = outcodes(x0[i0], y0[i0], xmin, ymin, xmax, ymax)
+        c1[i1] = outcodes(x1[i1], y1[i1], xmin, ymin, xmax, ymax)
+
+    return visible, x0, y0, x1, y1
+
+
+def classify_bboxes(bxmin, bymin, bxmax, bymax, xmin, ymin, xmax, ymax):
+    """OUTSIDE / CROSSING / FULLY_INSIDE untuk setiap bbox."""
+    outside = (bxmax < xmin) | (bxmin > xmax) | (bymax < ymin) | (bymin > ymax)
+    inside = (xmin <= bxmin) & (bxmax <= xmax) & (ymin <= bymin) & (bymax <= ymax)
+    return np.where(
+        outside, OUTSIDE, np.where(inside, FULLY_INSIDE, CROSSING)
+    ).astype(np.uint8)
+
+
+def segment_bboxes(coords, counts):
+    """
+    Bbox per objek dari koordinat yang dipadatkan.
+
+    ``coords`` berbentuk (N, 2) berisi semua titik secara berurutan, ``counts``
+    jumlah titik tiap objek (harus > 0).
+    """
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1])).astype(np.intp)
+    mins = np.minimum.reduceat(coords, starts, axis=0)
+    maxs = np.maximum.reduceat(coords, starts, axis=0)
+    return mins[:, 0], mins[:, 1], maxs[:, 0], maxs[:, 1]
+
+
+def swept_bands(old, new):
+    """
+    Pita yang disapu tepi window saat berubah dari ``old`` ke ``new``
+    (masing-masing ``(xmin, ymin, xmax, ymax)``).
+
+    Hanya tepi yang bergeser yang menghasilkan pita. Objek yang bbox-nya tidak
+    menyentuh pita mana pun berada di sisi yang sama dari setiap tepi sebelum
+    dan sesudah perubahan, jadi hasil kliping & klasifikasinya tidak berubah.
+    """
+    oxmin, oymin, oxmax, oymax = old
+    nxmin, nymin, nxmax, nymax = new
+    # rentang sepanjang tepi: gabungan kedua window
+    ylo, yhi = min(oymin, nymin), max(oymax, nymax)
+    xlo, xhi = min(oxmin, nxmin), max(oxmax, nxmax)
+    bands = []
+    for a, b in ((oxmin, nxmin), (oxmax, nxmax)):
+        if a != b:
+            bands.append((min(a, b), ylo, max(a, b), yhi))
+    for a, b in ((oymin, nymin), (oymax, nymax)):
+        if a != b:
+            bands.append((xlo, min(a, b), xhi, max(a, b)))
+    return bands
+
+
+def bboxes_touch(bxmin, bymin, bxmax, bymax, rects):
+    """Mask bbox yang berpotongan (tepi ikut dihitung) dengan salah satu rect."""
+    hit = np.zeros(np.shape(bxmin), dtype=bool)
+    for xmin, ymin, xmax, ymax in rects:
+        hit |= (bxmin <= xmax) & (bxmax >= xmin) & (bymin <= ymax) & (bymax >= ymin)
+    return hit
+
+
+def clip_polygons(verts, counts, xmin, ymin, xmax, ymax, boundary=None):
+    """
+    Sutherland–Hodgman untuk banyak poligon sekaligus.
+
+    ``verts`` (N, 2) berisi verteks semua poligon berurutan, ``counts``
+    jumlah verteks tiap poligon. Keempat tepi window diproses satu per satu
+    untuk seluruh verteks sekaligus (tanpa loop per poligon).
+
+    Mengembalikan ``(verts, counts, boundary)`` dengan format yang sama;
+    poligon yang habis terpotong punya count 0. ``boundary[i]`` True berarti
+    sisi dari verteks i ke verteks berikutnya (siklik) adalah sisi buatan di
+    tepi window, bukan bagian outline asli — outline tampil cukup menggambar
+    sisi yang boundary-nya False.
+    """
+    verts = np.asarray(verts, dtype=np.float64).reshape(-1, 2)
+    counts = np.asarray(counts, dtype=np.intp)
+    if boundary is None:
+        boundary = np.zeros(len(verts), dtype=bool)
+    planes = ((0, xmin, True), (0, xmax, False), (1, ymin, True), (1, ymax, False))
+    for axis, value, keep_greater in planes:
+        n = len(verts)
+        if n == 0:
+            break
+        p = verts
+        c = p[:, axis]
+        p_in = c >= value if keep_greater else c <= value
+        if p_in.all():
+            continue
+        owner = np.repeat(np.arange(len(counts)), counts)
+        first = np.cumsum(counts) - counts
+        prev = np.arange(n) - 1
+        live = counts > 0
+        prev[first[live]] = first[live] + counts[live] - 1
+        s_in = p_in[prev]
+        cross = s_in != p_in
+
+        # titik potong sisi s -> p dengan garis tepi
+        inter = np.empty((int(cross.sum()), 2))
+        sc, pc = verts[prev[cross]], p[cross]
+        t = (value - sc[:, axis]) / (pc[:, axis] - sc[:, axis])
+        inter[:] = sc + t[:, None] * (pc - sc)
+        inter[:, axis] = value
+
+        # tiap verteks p mengeluarkan: [] / [p] / [I] / [I, p]
+        emit_i = cross
+        emit_p = p_in
+        k = emit_i.astype(np.intp) + emit_p
+        pos = np.cumsum(k) - k
+        out = np.empty((int(k.sum()), 2))
+        out_b = np.empty(len(out), dtype=bool)
+
+        ipos = pos[emit_i]
+        out[ipos] = inter
+        # keluar window: sisi berikutnya menyusuri tepi; masuk: bagian sisi asli s -> p
+        out_b[ipos] = s_in[emit_i] | boundary[prev[emit_i]]
+        ppos = pos[emit_p] + emit_i[emit_p]
+        out[ppos] = p[emit_p]
+        out_b[ppos] = boundary[emit_p]
+
+        counts = np.bincount(owner, weights=k, minlength=len(counts)).astype(np.intp)
+        verts, boundary = out, out_b
+    return verts, counts, boundary
+
+
+def outline_segments(verts, counts, boundary):
+    """Sisi outline asli (boundary False) sebagai pasangan titik (M, 2, 2)."""
+    counts = np.asarray(counts, dtype=np.intp)
+    first = np.cumsum(counts) - counts
+    nxt = np.arange(len(verts)) + 1
+    live = counts > 0
+    nxt[(first + counts - 1)[live]] = first[live]
+    keep = ~boundary
+    return np.stack((verts[keep], verts[nxt[keep]]), axis=1)
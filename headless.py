@@ -0,0 +1,49 @@
+"""
+Konteks OpenGL offscreen (EGL pbuffer) untuk benchmark dan tes tanpa display.
+
+Import modul ini SEBELUM modul lain yang meng-import OpenGL, karena PyOpenGL
+memilih platform (GLX / EGL) saat pertama kali di-import. Dengan Mesa,
+gunakan ``EGL_PLATFORM=surfaceless`` dan ``LIBGL_ALWAYS_SOFTWARE=1`` agar
+berjalan di llvmpipe tanpa GPU maupun server X.
+"""
+import ctypes
+import os
+import sys
+
+if "OpenGL" not in sys.modules:
+    os.environ.setdefault("PYOPENGL_PLATFORM", "egl")
+    os.environ.setdefault("EGL_PLATFORM", "surfaceless")
+    os.environ.setdefault("LIBGL_ALWAYS_SOFTWARE", "1")
+
+from OpenGL import EGL  # noqa: E402
+
+
+def create_context(width, height, depth_bits=24):
+    """Buat & aktifkan konteks GL compatibility profile berukuran width x height."""
+    dpy = EGL.eglGetDisplay(EGL.EGL_DEFAULT_DISPLAY)
+    major, minor = EGL.EGLint(), EGL.EGLint()
+    if not EGL.eglInitialize(dpy, ctypes.pointer(major), ctypes.pointer(minor)):
+        raise RuntimeError("eglInitialize gagal")
+
+    attrs = [
+        EGL.EGL_SURFACE_TYPE, EGL.EGL_PBUFFER_BIT,
+        EGL.EGL_RED_SIZE, 8, EGL.EGL_GREEN_SIZE, 8,
+        EGL.EGL_BLUE_SIZE, 8, EGL.EGL_ALPHA_SIZE, 8,
+        EGL.EGL_DEPTH_SIZE, depth_bits,
+        EGL.EGL_RENDERABLE_TYPE, EGL.EGL_OPENGL_BIT,
+        EGL.EGL_NONE,
+    ]
+    cfg, n = EGL.EGLConfig(), EGL.EGLint()
+    ok = EGL.eglChooseConfig(
+        dpy, (EGL.EGLint * len(attrs))(*attrs), ctypes.pointer(cfg), 1, ctypes.pointer(n)
+    )
+    if not ok or n.value == 0:
+        raise RuntimeError("tidak ada EGLConfig yang cocok")
+
+    pb = [EGL.EGL_WIDTH, width, EGL.EGL_HEIGHT, height, EGL.EGL_NONE]
+    surf = EGL.eglCreatePbufferSurface(dpy, cfg, (EGL.EGLint * len(pb))(*pb))
+    EGL.eglBindAPI(EGL.EGL_OPENGL_API)
+    ctx = EGL.eglCreateContext(dpy, cfg, EGL.EGL_NO_CONTEXT, None)
+    if not EGL.eglMakeCurrent(dpy, surf, surf, ctx):
+        raise RuntimeError("eglMakeCurrent gagal")
+    return dpy, surf, ctx
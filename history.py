@@ -0,0 +1,117 @@
+"""
+Riwayat undo/redo berupa log perintah delta yang ringkas.
+
+Setiap perintah hanya menyimpan apa yang berubah (indeks objek plus nilai
+lama & baru, atau buffer yang dilepas store saat clear), bukan salinan scene,
+jadi memori riwayat tumbuh dengan jumlah edit, bukan dengan ukuran scene.
+Perintah berurutan dalam satu drag digabung lewat ``Command.merge`` sampai
+``History.close`` dipanggil. Bila total ``nbytes`` melewati ``budget``, entri
+tertua dibuang (tidak bisa di-undo lagi).
+"""
+from collections import deque
+
+ENTRY_NBYTES = 64               # perkiraan overhead satu entri (objek Python)
+
+
+class Command:
+    """
+    Satu edit. Saat dicatat edit-nya sudah terjadi; ``undo`` membatalkannya
+    dan ``redo`` menerapkannya lagi.
+    """
+
+    @property
+    def nbytes(self):
+        return ENTRY_NBYTES
+
+    def undo(self):
+        raise NotImplementedError
+
+    def redo(self):
+        raise NotImplementedError
+
+    def merge(self, other):
+        """Gabungkan ``other`` (edit berikutnya di drag yang sama) ke sini; True bila bisa."""
+        return False
+
+    def release(self):
+        """Entri dibuang dari riwayat: lepaskan data yang ditahannya."""
+
+
+class History:
+    def __init__(self, budget=64 << 20):
+        self.budget = budget                # byte, undo + redo
+        self.undo_stack: deque = deque()
+        self.redo_stack: list = []
+        self.nbytes = 0
+        self._sizes: dict = {}              # id(command) -> nbytes saat dicatat
+        self._open = False                  # entri teratas masih menerima merge
+
+    def __len__(self):
+        return len(self.undo_stack)
+
+    def _track(self, cmd):
+        size = cmd.nbytes
+        self.nbytes += size - self._sizes.get(id(cmd), 0)
+        self._sizes[id(cmd)] = size
+
+    def _forget(self, cmd, release=False):
+        self.nbytes -= self._sizes.pop(id(cmd), 0)
+        if release:
+            cmd.release()
+
+    def push(self, cmd):
+        """Catat edit yang baru saja dilakukan; riwayat redo dibuang."""
+        for old in self.redo_stack:
+            self._forget(old, release=True)
+        self.redo_stack.clear()
+        top = self.undo_stack[-1] if self.undo_stack else None
+        if self._open and top is not None and top.merge(cmd):
+            self._track(top)
+        else:
+            self.undo_stack.append(cmd)
+            self._track(cmd)
+        self._open = True
+        self._trim()
+
+    def close(self):
+        """Akhir satu drag / aksi: edit berikutnya menjadi entri baru."""
+        self._open = False
+
+    def undo(self):
+        """Batalkan edit terakhir; mengembalikan perintahnya (None bila kosong)."""
+        self._open = False
+        if not self.undo_stack:
+            return None
+        cmd = self.undo_stack.pop()
+        cmd.undo()
+        self.redo_stack.append(cmd)
+        self._track(cmd)
+        self._trim()
+        return cmd
+
+    def redo(self):
+        self._open = False
+        if not self.redo_stack:
+            return None
+        cmd = self.redo_stack.pop()
+        cmd.redo()
+        self.undo_stack.append(cmd)
+        self._track(cmd)
+        self._trim()
+        return cmd
+
+    def clear(self):
+        for cmd in (*self.undo_stack, *self.redo_stack):
+            cmd.release()
+        self.undo_stack.clear()
+        self.redo_stack.clear()
+        self._sizes.clear()
+        self.nbytes = 0
+        self._open = False
+
+    def _trim(self):
+        # entri undo tertua dulu, lalu redo terjauh
+        while self.nbytes > self.budget and self.undo_stack:
+            self._forget(self.undo_stack.popleft(), release=True)
+        while self.nbytes > self.budget and self.redo_stack:
+            self._forget(self.redo_stack.pop(0), release=True)
@@ -0,0 +1,190 @@
+"""
+Rekam / putar ulang stream event input aplikasi (lihat replay.py).
+
+Perilaku ``main()`` sepenuhnya digerakkan event pygame; dengan mencatat setiap
+batch event (hasil satu ``pygame.event.get()``) beserta waktunya, sesi edit
+bisa diputar ulang persis sama: batch yang sama menghasilkan penggabungan
+MOUSEMOTION yang sama. Posisi & tombol mouse diambil dari event (``MouseState``),
+bukan status OS, jadi ikut terekam.
+
+Format file ``.gkr`` (little-endian)::
+
+    MAGIC (8 byte) | versi u32 | panjang header u32 | header JSON (utf-8)
+    | batch: waktu ms u32, jumlah event u16, lalu event-eventnya
+
+Header: ``args`` (argumen main), ``width`` / ``height``, ``seed`` (RNG
+aplikasi), ``event_driven`` dan ``mouse`` (posisi awal). Tiap event diawali
+kode u8; hanya event yang dipakai aplikasi yang dicatat.
+"""
+import json
+import struct
+import time
+
+import pygame
+from pygame.locals import KEYDOWN, KEYUP, MOUSEBUTTONDOWN, MOUSEBUTTONUP, MOUSEMOTION, QUIT
+
+MAGIC = b"GKINPUT\0"
+VERSION = 1
+_PREFIX = struct.Struct("<8sII")
+_BATCH = struct.Struct("<IH")
+
+# kode event -> (tipe pygame, struct payload)
+_EVENTS = {
+    0: (QUIT, struct.Struct("<")),
+    1: (KEYDOWN, struct.Struct("<iH")),             # key, mod
+    2: (KEYUP, struct.Struct("<iH")),
+    3: (MOUSEBUTTONDOWN, struct.Struct("<hhB")),    # x, y, tombol
+    4: (MOUSEBUTTONUP, struct.Struct("<hhB")),
+    5: (MOUSEMOTION, struct.Struct("<hhhhB")),      # x, y, rel x, rel y, tombol (bit)
+}
+_CODES = {etype: (code, fmt) for code, (etype, fmt) in _EVENTS.items()}
+
+
+def _i16(v):
+    return max(-32768, min(32767, int(v)))
+
+
+class MouseState:
+    """Posisi & tombol mouse menurut event terakhir yang sudah diproses."""
+
+    def __init__(self, pos=(0, 0)):
+        self.pos = tuple(pos)
+        self.buttons = (False, False, False)
+
+    def update(self, event):
+        if event.type == MOUSEMOTION:
+            self.pos = tuple(event.pos)
+            self.buttons = tuple(bool(b) for b in event.buttons[:3])
+        elif event.type in (MOUSEBUTTONDOWN, MOUSEBUTTONUP):
+            self.pos = tuple(event.pos)
+            if 1 <= event.button <= 3:
+                buttons = list(self.buttons)
+                buttons[event.button - 1] = event.type == MOUSEBUTTONDOWN
+                self.buttons = tuple(buttons)
+
+
+def encode(event):
+    """Bytes satu event, atau None bila jenisnya tidak dicatat."""
+    entry = _CODES.get(event.type)
+    if entry is None:
+        return None
+    code, fmt = entry
+    if event.type in (KEYDOWN, KEYUP):
+        payload = fmt.pack(event.key, event.mod & 0xFFFF)
+    elif event.type in (MOUSEBUTTONDOWN, MOUSEBUTTONUP):
+        payload = fmt.pack(_i16(event.pos[0]), _i16(event.pos[1]), event.button)
+    elif event.type == MOUSEMOTION:
+        bits = sum(1 << k for k, b in enumerate(event.buttons[:3]) if b)
+        payload = fmt.pack(*map(_i16, (*event.pos, *event.rel)), bits)
+    else:
+        payload = b""
+    return bytes((code,)) + payload
+
+
+def decode(code, payload):
+    etype, fmt = _EVENTS[code]
+    v = fmt.unpack(payload)
+    if etype in (KEYDOWN, KEYUP):
+        return pygame.event.Event(etype, key=v[0], mod=v[1], unicode="")
+    if etype in (MOUSEBUTTONDOWN, MOUSEBUTTONUP):
+        return pygame.event.Event(etype, pos=v[:2], button=v[2])
+    if etype == MOUSEMOTION:
+        return pygame.event.Event(
+            etype, pos=v[:2], rel=v[2:4], buttons=tuple(bool(v[4] >> k & 1) for k in range(3))
+        )
+    return pygame.event.Event(etype)
+
+
+def read_header(f):
+    prefix = f.read(_PREFIX.size)
+    if len(prefix) < _PREFIX.size:
+        raise ValueError("bukan rekaman input")
+    magic, version, size = _PREFIX.unpack(prefix)
+    if magic != MAGIC:
+        raise ValueError("bukan rekaman input")
+    if version > VERSION:
+        raise ValueError(f"versi rekaman {version} belum didukung (maks {VERSION})")
+    return json.loads(f.read(size))
+
+
+class Recorder:
+    """Tulis batch event ke file ``.gkr``; ``header`` lihat docstring modul."""
+
+    def __init__(self, path, header):
+        self.f = open(path, "wb")
+        head = json.dumps(header).encode()
+        self.f.write(_PREFIX.pack(MAGIC, VERSION, len(head)) + head)
+        self.t0 = time.perf_counter()
+        self.batches = self.events = 0
+
+    def write(self, events):
+        data = [b for b in map(encode, events) if b is not None]
+        if not data:
+            return
+        ms = int((time.perf_counter() - self.t0) * 1000)
+        self.f.write(_BATCH.pack(min(ms, 0xFFFFFFFF), len(data)) + b"".join(data))
+        # per batch ke OS: proses yang mati / di-kill paling banyak memotong batch terakhir
+        self.f.flush()
+        self.batches += 1
+        self.events += len(data)
+
+    def close(self):
+        if self.f is not None:
+            self.f.close()
+            self.f = None
+
+
+class Player:
+    """
+    Sumber event dari file ``.gkr``: ``next_events()`` mengembalikan batch
+    berikutnya (QUIT setelah batch terakhir). Batch terakhir yang terpotong
+    (aplikasi mati saat merekam) dianggap akhir rekaman dan ditandai
+    ``truncated``. ``frame_done`` mencatat waktu tiap frame yang digambar.
+    """
+
+    def __init__(self, path):
+        self.f = open(path, "rb")
+        self.header = read_header(self.f)
+        self.batches = self.events = 0
+        self.recorded_ms = 0
+        self.truncated = False
+        self.frame_times = []
+
+    def next_events(self):
+        if self.f is None:
+            return [pygame.event.Event(QUIT)]
+        events = self._read_batch()
+        if events is None:
+            self.f.close()
+            self.f = None
+            return [pygame.event.Event(QUIT)]
+        self.batches += 1
+        self.events += len(events)
+        return events
+
+    def _read_batch(self):
+        """Event batch berikutnya; None di akhir file atau bila batch-nya terpotong."""
+        head = self.f.read(_BATCH.size)
+        if len(head) < _BATCH.size:
+            self.truncated = bool(head)
+            return None
+        ms, count = _BATCH.unpack(head)
+        events = []
+        for _ in range(count):
+            code = self.f.read(1)
+            if not code:
+                self.truncated = True
+                return None
+            entry = _EVENTS.get(code[0])
+            if entry is None:
+                raise ValueError(f"rekaman rusak: kode event {code[0]} tidak dikenal")
+            payload = self.f.read(entry[1].size)
+            if len(payload) < entry[1].size:
+                self.truncated = True
+                return None
+            events.append(decode(code[0], payload))
+        self.recorded_ms = ms
+        return events
+
+    def frame_done(self, seconds):
+        self.frame_times.append(seconds)
@@ -0,0 +1,292 @@
+"""
+Instanced rendering: ribuan salinan satu mesh (mis. kubus voxel / partikel)
+dengan translasi, rotasi (derajat x, y, z seperti glRotatef) dan warna per
+instance yang disimpan sebagai array NumPy.
+
+Dua jalur dengan hasil yang sama:
+
+* instanced: mesh diunggah sekali, data instance (9 float) di VBO sendiri
+  dengan ``glVertexAttribDivisor(1)``; satu glDrawElementsInstanced untuk
+  semua instance. Shader GLSL 1.20 meniru pipeline fixed-function yang
+  dipakai aplikasi (GL_LIGHT0 + GL_COLOR_MATERIAL ambient & diffuse).
+* batch fixed-function (konteks tanpa instancing / shader): verteks semua
+  instance ditransformasi di CPU (NumPy) ke satu VBO besar dan digambar
+  dengan satu glDrawElements.
+
+Hanya rentang instance yang berubah (``set`` / ``mark_dirty``) yang diunggah
+ulang lewat glBufferSubData, di kedua jalur.
+"""
+import ctypes
+
+import numpy as np
+from OpenGL.GL import *
+
+from mesh import GpuMesh
+from scene3d import rotation_matrices
+
+_f32 = np.float32
+_STRIDE = 9 * 4                 # translasi, rotasi, warna (float32)
+MAX_DIRTY_RANGES = 64           # glBufferSubData per draw; celah terkecil digabung
+
+_VERTEX_SHADER = """
+#version 120
+attribute vec3 i_offset;
+attribute vec3 i_rotation;      // derajat, urutan glRotatef x -> y -> z
+attribute vec3 i_color;
+uniform bool u_lighting;
+varying vec4 v_color;
+
+void main() {
+    vec3 r = radians(i_rotation);
+    vec3 c = cos(r);
+    vec3 s = sin(r);
+    // mat3 GLSL disusun per kolom
+    mat3 rx = mat3(1.0, 0.0, 0.0,  0.0, c.x, s.x,  0.0, -s.x, c.x);
+    mat3 ry = mat3(c.y, 0.0, -s.y,  0.0, 1.0, 0.0,  s.y, 0.0, c.y);
+    mat3 rz = mat3(c.z, s.z, 0.0,  -s.z, c.z, 0.0,  0.0, 0.0, 1.0);
+    mat3 rot = rx * ry * rz;
+    vec4 eye = gl_ModelViewMatrix * vec4(rot * gl_Vertex.xyz + i_offset, 1.0);
+    gl_Position = gl_ProjectionMatrix * eye;
+    if (u_lighting) {
+        vec3 n = normalize(gl_NormalMatrix * (rot * gl_Normal));
+        vec4 lp = gl_LightSource[0].position;
+        vec3 l = normalize(lp.w == 0.0 ? lp.xyz : lp.xyz - eye.xyz);
+        vec3 light = gl_LightModel.ambient.rgb + gl_LightSource[0].ambient.rgb
+            + max(dot(n, l), 0.0) * gl_LightSource[0].diffuse.rgb;
+        v_color = vec4(clamp(i_color * light, 0.0, 1.0), 1.0);
+    } else {
+        v_color = vec4(i_color, 1.0);
+    }
+}
+"""
+
+_FRAGMENT_SHADER = """
+#version 120
+varying vec4 v_color;
+
+void main() {
+    gl_FragColor = v_color;
+}
+"""
+
+
+def instancing_supported():
+    """Konteks GL aktif punya glDrawElementsInstanced + glVertexAttribDivisor."""
+    return bool(glDrawElementsInstanced) and bool(glVertexAttribDivisor) and bool(glCreateShader)
+
+
+class InstancedMesh:
+    """
+    ``mesh`` digambar sekali per instance. ``translation``, ``rotation`` dan
+    ``color`` adalah view (n, 3) ke satu array interleaved float32; setelah
+    menulis langsung ke array itu panggil ``mark_dirty``. ``instanced``:
+    True / False memaksa jalur, None = deteksi saat draw pertama.
+    """
+
+    def __init__(self, mesh, capacity=1024, instanced=None):
+        self.mesh = mesh
+        self.gpu = GpuMesh(mesh)
+        self.instanced = instanced
+        self.n = 0
+        self._alloc(capacity)
+        self._dirty: list = []
+        self._gl_capacity = 0           # kapasitas buffer GL (0 = belum ada)
+        self.vbo = None
+        self.ibo = None                 # hanya jalur batch
+        self.program = None
+        self.uploaded = 0               # instance yang diunggah pada draw terakhir
+
+    # ---------- data instance ----------
+    def _alloc(self, cap):
+        data = np.zeros((cap, 9), dtype=_f32)
+        if hasattr(self, "data"):
+            data[:self.n] = self.data[:self.n]
+        self.data = data
+        self.translation = data[:, 0:3]
+        self.rotation = data[:, 3:6]
+        self.color = data[:, 6:9]
+
+    def __len__(self):
+        return self.n
+
+    def add(self, translations, rotations=(0, 0, 0), colors=(0.8, 0.8, 0.8)):
+        """Tambah instance; mengembalikan indeksnya."""
+        translations = np.asarray(translations, dtype=_f32).reshape(-1, 3)
+        m = len(translations)
+        if self.n + m > len(self.data):
+            self._alloc(max(2 * len(self.data), self.n + m))
+        sl = slice(self.n, self.n + m)
+        self.translation[sl] = translations
+        self.rotation[sl] = rotations
+        self.color[sl] = colors
+        self.n += m
+        self.mark_dirty(sl.start, sl.stop)
+        return np.arange(sl.start, sl.stop)
+
+    def set(self, index, translation=None, rotation=None, color=None):
+        """Ubah instance ``index`` (int, slice, atau array indeks) dan tandai berubah."""
+        for arr, value in ((self.translation, translation), (self.rotation, rotation), (self.color, color)):
+            if value is not None:
+                arr[index] = value
+        if isinstance(index, slice):
+            start, stop, _ = index.indices(self.n)
+            self.mark_dirty(start, stop)
+            return
+        # indeks acak: satu rentang per deret indeks berurutan
+        idx = np.unique(np.asarray(index, dtype=np.intp) % max(self.n, 1))
+        cut = np.flatnonzero(np.diff(idx) > 1) + 1
+        for run in np.split(idx, cut) if len(idx) else ():
+            self.mark_dirty(int(run[0]), int(run[-1]) + 1)
+
+    def mark_dirty(self, start, stop):
+        """Instance [start, stop) berubah dan perlu diunggah ulang."""
+        if stop > start:
+            self._dirty.append((start, stop))
+
+    def clear(self):
+        self.n = 0
+        self._dirty.clear()
+
+    def _dirty_ranges(self):
+        """Rentang berubah yang sudah diurutkan & digabung."""
+        if not self._dirty:
+            return []
+        merged = []
+        for a, b in sorted(self._dirty):
+            if merged and a <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], b)
+            else:
+                merged.append([a, b])
+        if len(merged) > MAX_DIRTY_RANGES:
+            # gabungkan lewat celah terkecil sampai tersisa MAX_DIRTY_RANGES
+            gaps = np.array([merged[i + 1][0] - merged[i][1] for i in range(len(merged) - 1)])
+            keep = np.sort(np.argsort(gaps, kind="stable")[len(gaps) - MAX_DIRTY_RANGES + 1:])
+            starts = [merged[0][0]] + [merged[i + 1][0] for i in keep]
+            stops = [merged[i][1] for i in keep] + [merged[-1][1]]
+            merged = list(zip(starts, stops))
+        return [(a, min(b, self.n)) for a, b in merged if a < self.n]
+
+    # ---------- GL ----------
+    def _setup(self):
+        if self.instanced is None:
+            self.instanced = instancing_supported()
+        if self.instanced and self.program is None:
+            from OpenGL.GL import shaders   # diimpor saat shader pertama dikompilasi (startup)
+
+            try:
+                self.program = shaders.compileProgram(
+                    shaders.compileShader(_VERTEX_SHADER, GL_VERTEX_SHADER),
+                    shaders.compileShader(_FRAGMENT_SHADER, GL_FRAGMENT_SHADER),
+                    validate=False,
+                )
+            except (RuntimeError, GLError):
+                self.instanced = False
+            else:
+                self.attrs = [glGetAttribLocation(self.program, name) for name in ("i_offset", "i_rotation", "i_color")]
+                self.u_lighting = glGetUniformLocation(self.program, "u_lighting")
+
+    def _upload(self):
+        """Unggah rentang berubah; buffer dibuat ulang bila kapasitas berubah."""
+        cap = len(self.data)
+        if self.vbo is None or self._gl_capacity != cap:
+            if self.vbo is None:
+                self.vbo = glGenBuffers(1)
+            per = 1 if self.instanced else self.mesh.n_vertices
+            glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+            glBufferData(GL_ARRAY_BUFFER, cap * per * _STRIDE, None, GL_DYNAMIC_DRAW)
+            glBindBuffer(GL_ARRAY_BUFFER, 0)
+            if not self.instanced:
+                self._upload_batch_index(cap)
+            self._gl_capacity = cap
+            self._dirty = [(0, self.n)]
+        ranges = self._dirty_ranges()
+        self._dirty.clear()
+        self.uploaded = sum(b - a for a, b in ranges)
+        if not ranges:
+            return
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        for a, b in ranges:
+            if self.instanced:
+                chunk = np.ascontiguousarray(self.data[a:b])
+                glBufferSubData(GL_ARRAY_BUFFER, a * _STRIDE, chunk.nbytes, chunk)
+            else:
+                chunk = self._batch_vertices(a, b)
+                glBufferSubData(GL_ARRAY_BUFFER, a * self.mesh.n_vertices * _STRIDE, chunk.nbytes, chunk)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+    def _batch_vertices(self, a, b):
+        """Verteks dunia instance [a, b): posisi, normal, warna (interleaved float32)."""
+        m = self.mesh
+        rot = rotation_matrices(self.rotation[a:b]).astype(_f32)
+        pos = np.einsum("nij,vj->nvi", rot, m.vertices) + self.translation[a:b, None, :]
+        nrm = np.einsum("nij,vj->nvi", rot, m.normals)
+        col = np.broadcast_to(self.color[a:b, None, :], pos.shape)
+        return np.ascontiguousarray(np.concatenate((pos, nrm, col), axis=2), dtype=_f32)
+
+    def _upload_batch_index(self, cap):
+        nv = self.mesh.n_vertices
+        index = (self.mesh.faces[None, :, :].astype(np.uint32)
+                 + (np.arange(cap, dtype=np.uint32) * nv)[:, None, None])
+        if self.ibo is None:
+            self.ibo = glGenBuffers(1)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.ibo)
+        glBufferData(GL_ELEMENT_ARRAY_BUFFER, index.nbytes, np.ascontiguousarray(index), GL_STATIC_DRAW)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+
+    def draw(self):
+        if not self.n:
+            return
+        self._setup()
+        self._upload()
+        if self.instanced:
+            self._draw_instanced()
+        else:
+            self._draw_batch()
+
+    def _draw_instanced(self):
+        glUseProgram(self.program)
+        glUniform1i(self.u_lighting, int(glIsEnabled(GL_LIGHTING)))
+        self.gpu.bind()
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        for k, loc in enumerate(self.attrs):
+            glEnableVertexAttribArray(loc)
+            glVertexAttribPointer(loc, 3, GL_FLOAT, GL_FALSE, _STRIDE, ctypes.c_void_p(12 * k))
+            glVertexAttribDivisor(loc, 1)
+        glDrawElementsInstanced(GL_TRIANGLES, self.gpu.count, self.gpu.index_type, None, self.n)
+        for loc in self.attrs:
+            glVertexAttribDivisor(loc, 0)
+            glDisableVertexAttribArray(loc)
+        self.gpu.unbind()
+        glUseProgram(0)
+
+    def _draw_batch(self):
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.ibo)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_NORMAL_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glVertexPointer(3, GL_FLOAT, _STRIDE, None)
+        glNormalPointer(GL_FLOAT, _STRIDE, ctypes.c_void_p(12))
+        glColorPointer(3, GL_FLOAT, _STRIDE, ctypes.c_void_p(24))
+        glDrawElements(GL_TRIANGLES, self.n * self.mesh.n_faces * 3, GL_UNSIGNED_INT, None)
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_NORMAL_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+    def release(self):
+        """Hapus buffer & program milik konteks GL yang masih aktif."""
+        self.gpu.release()
+        bufs = [b for b in (self.vbo, self.ibo) if b is not None]
+        if bufs:
+            glDeleteBuffers(len(bufs), bufs)
+        if self.program is not None:
+            glDeleteProgram(self.program)
+        self.invalidate_gl()
+
+    def invalidate_gl(self):
+        """Konteks GL dibuat ulang: buffer & shader dibuat ulang saat draw."""
+        self.gpu.invalidate_gl()
+        self.vbo = self.ibo = self.program = None
+        self._gl_capacity = 0
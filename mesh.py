@@ -0,0 +1,531 @@
+"""
+Mesh terindeks generik: pemuat OBJ/PLY, normal per verteks, dan buffer GL.
+
+File dibaca per potongan (``CHUNK_BYTES``) dan setiap potongan diurai
+sekaligus dengan NumPy, jadi model ratusan ribu segitiga tidak pernah
+disimpan sebagai objek Python per verteks. Poligon (quad, n-gon) dipecah
+menjadi kipas segitiga secara tervektorisasi. Hasilnya ``Mesh``: verteks
+float32 (N, 3), indeks segitiga uint32 (M, 3), normal per verteks dan warna
+per verteks opsional, yang diunggah ``GpuMesh`` ke VBO + IBO dan digambar
+dengan satu glDrawElements.
+"""
+import ctypes
+import itertools
+import os
+
+import numpy as np
+from OpenGL.GL import *
+
+CHUNK_BYTES = 1 << 22           # ukuran baca per potongan file teks (~4 MB)
+
+_f32 = np.float32
+
+
+class Mesh:
+    """
+    Mesh segitiga terindeks. ``normals`` dihitung dari geometri bila tidak
+    diberikan; ``colors`` (N, 3) 0..1 atau None (pakai warna model).
+    """
+
+    def __init__(self, vertices, faces, colors=None, normals=None):
+        self.vertices = np.ascontiguousarray(vertices, dtype=_f32).reshape(-1, 3)
+        self.faces = np.ascontiguousarray(faces, dtype=np.uint32).reshape(-1, 3)
+        self.colors = None if colors is None else np.ascontiguousarray(colors, dtype=_f32)
+        if normals is None:
+            normals = vertex_normals(self.vertices, self.faces)
+        self.normals = np.ascontiguousarray(normals, dtype=_f32)
+
+    @property
+    def n_vertices(self):
+        return len(self.vertices)
+
+    @property
+    def n_faces(self):
+        return len(self.faces)
+
+    def bounds(self):
+        """Kotak pembatas (min (3,), max (3,))."""
+        if not len(self.vertices):
+            return np.zeros(3, _f32), np.zeros(3, _f32)
+        return self.vertices.min(axis=0), self.vertices.max(axis=0)
+
+    def normalized(self, size=2.0):
+        """
+        Salinan yang dipusatkan di origin dan diskalakan agar sisi terpanjang
+        kotak pembatasnya ``size`` (kubus bawaan: 2). Normal tidak berubah.
+        """
+        lo, hi = self.bounds()
+        extent = float((hi - lo).max())
+        scale = size / extent if extent > 0 else 1.0
+        return Mesh((self.vertices - (lo + hi) / 2) * scale, self.faces, self.colors, self.normals)
+
+
+def vertex_normals(vertices, faces):
+    """
+    Normal per verteks: jumlah normal sisi (hasil silang, jadi berbobot luas)
+    dari semua segitiga yang memakai verteks itu, lalu dinormalkan.
+    """
+    vertices = np.asarray(vertices, dtype=np.float64)
+    faces = np.asarray(faces, dtype=np.intp).reshape(-1, 3)
+    n = len(vertices)
+    if not len(faces):
+        return np.zeros((n, 3), dtype=_f32)
+    v0, v1, v2 = vertices[faces[:, 0]], vertices[faces[:, 1]], vertices[faces[:, 2]]
+    fn = np.cross(v1 - v0, v2 - v0)
+    idx = faces.ravel()
+    out = np.empty((n, 3))
+    for k in range(3):
+        # bincount jauh lebih cepat dari np.add.at untuk akumulasi berindeks
+        out[:, k] = np.bincount(idx, weights=np.repeat(fn[:, k], 3), minlength=n)
+    length = np.linalg.norm(out, axis=1, keepdims=True)
+    np.divide(out, length, out=out, where=length > 0)
+    return out.astype(_f32)
+
+
+def fan_triangulate(flat, counts):
+    """
+    Poligon packed (indeks ``flat`` + ``counts`` per poligon) menjadi
+    segitiga kipas (M, 3): (v0, v_i, v_i+1) untuk i = 1..k-2.
+    Poligon dengan kurang dari 3 verteks dibuang.
+    """
+    flat = np.asarray(flat)
+    counts = np.asarray(counts, dtype=np.intp)
+    if len(counts) and (counts == 3).all():
+        return flat.reshape(-1, 3)
+    first = np.cumsum(counts) - counts
+    ntri = np.maximum(counts - 2, 0)
+    owner = np.repeat(np.arange(len(counts)), ntri)
+    k = np.arange(int(ntri.sum())) - np.repeat(np.cumsum(ntri) - ntri, ntri) + 1
+    base = first[owner]
+    return np.column_stack((flat[base], flat[base + k], flat[base + k + 1]))
+
+
+def box_mesh(vertices, quads, colors):
+    """
+    Mesh sisi datar dari poligon berwarna per sisi (mis. kubus): verteks
+    tiap sisi tidak dibagi supaya normal dan warnanya tetap per sisi. Urutan
+    verteks sisi yang menghadap ke dalam dibalik (verteks pertama tetap, jadi
+    diagonal pemecahannya sama) sehingga semua normal menghadap keluar.
+    """
+    vertices = np.asarray(vertices, dtype=np.float64)
+    quads = np.asarray(quads, dtype=np.intp)
+    k = quads.shape[1]
+    pts = vertices[quads]                                         # (F, k, 3)
+    fn = np.cross(pts[:, 1] - pts[:, 0], pts[:, 2] - pts[:, 0])
+    inward = np.einsum("ij,ij->i", fn, pts.mean(axis=1) - vertices.mean(axis=0)) < 0
+    pts[inward, 1:] = pts[inward, :0:-1]
+    flat = np.arange(len(quads) * k)
+    faces = fan_triangulate(flat, np.full(len(quads), k))
+    cols = np.repeat(np.asarray(colors, dtype=np.float64), k, axis=0)
+    return Mesh(pts.reshape(-1, 3), faces, cols)
+
+
+def decimate(mesh, cells):
+    """
+    LOD kasar dengan vertex clustering: kotak pembatas dibagi grid ``cells``
+    sel pada sisi terpanjangnya, verteks satu sel digabung (rata-rata posisi &
+    warna), segitiga yang runtuh atau kembar dibuang. Normal dihitung ulang.
+    """
+    v = mesh.vertices.astype(np.float64)
+    if not len(v) or not len(mesh.faces):
+        return mesh
+    lo, hi = v.min(axis=0), v.max(axis=0)
+    size = float((hi - lo).max()) / cells or 1.0
+    cell = np.floor((v - lo) / size).astype(np.int64)
+    dims = cell.max(axis=0) + 1
+    key = (cell[:, 0] * dims[1] + cell[:, 1]) * dims[2] + cell[:, 2]
+    _, inv = np.unique(key, return_inverse=True)
+    inv = inv.ravel()
+    count = np.bincount(inv)
+
+    def mean(cols):
+        return np.column_stack([np.bincount(inv, weights=cols[:, k]) / count for k in range(cols.shape[1])])
+
+    f = inv[mesh.faces.astype(np.intp)]
+    keep = (f[:, 0] != f[:, 1]) & (f[:, 1] != f[:, 2]) & (f[:, 0] != f[:, 2])
+    f = f[keep]
+    _, first = np.unique(np.sort(f, axis=1), axis=0, return_index=True)
+    colors = None if mesh.colors is None else mean(mesh.colors.astype(np.float64))
+    return Mesh(mean(v), f[np.sort(first)], colors)
+
+
+# ---------------------------------------------------------------- OBJ
+def _rows(text, n, min_cols):
+    """
+    ``n`` baris angka (str/bytes) -> array (n, kolom); bila jumlah kolom
+    tidak seragam tiap baris dipotong ke ``min_cols``.
+    """
+    vals = np.array(text.split(), dtype=np.float64)
+    cols = len(vals) // n if n else 0
+    if cols >= min_cols and cols * n == len(vals):
+        return vals.reshape(n, cols)
+    return np.array([ln.split()[:min_cols] for ln in text.splitlines() if ln.strip()], dtype=np.float64)
+
+
+def _select_lines(b, starts, lengths, keep):
+    """
+    Byte baris ``keep`` (mask per baris) digabung, kata kunci awalnya
+    ("v"/"f") dijadikan spasi -> (byte uint8, awal tiap baris terpilih).
+    Komentar akhir baris ("# ...") ikut dijadikan spasi.
+    """
+    out = b[np.repeat(keep, lengths)]
+    lens = lengths[keep]
+    first = np.cumsum(lens) - lens
+    out[first] = 32
+    hashes = out == 35
+    if hashes.any():
+        # byte di / setelah "#" pertama pada barisnya (jumlah "#" kumulatif per baris > 0)
+        seen = np.cumsum(hashes)
+        seen -= np.repeat(seen[first] - hashes[first], lens)
+        out[(seen > 0) & (out != 10)] = 32
+    return out, first
+
+
+def _face_indices(fb, first):
+    """
+    Baris sisi (byte tanpa "f") -> (indeks 1-based/negatif, jumlah per baris).
+    Akhiran "/t/n" dibuang dengan mengganti "/" menjadi spasi lalu mengambil
+    tiap token ke-m, selama semua referensi berformat sama seperti yang pertama.
+    """
+    tok = fb > 32
+    start = tok.copy()
+    start[1:] &= ~tok[:-1]
+    counts = np.add.reduceat(start, first, dtype=np.intp)
+    total = int(counts.sum())
+    text = fb.tobytes()
+    if b"/" not in text:
+        vals = np.fromstring(text, dtype=np.int64, sep=" ")
+    else:
+        ref = text.split(None, 1)[0]
+        m = len(ref.split(b"/")) - ref.count(b"//")
+        vals = np.fromstring(text.replace(b"/", b" "), dtype=np.int64, sep=" ")
+        if len(vals) == m * total:
+            vals = vals[::m]
+        else:
+            # format referensi campuran: ambil bagian sebelum "/" per token
+            vals = np.array([t.split(b"/", 1)[0] for t in text.split()], dtype=np.int64)
+    if len(vals) != total:
+        raise ValueError("baris f OBJ tidak valid")
+    return vals, counts
+
+
+def _obj_chunk(buf, n_before):
+    """
+    Satu potongan OBJ (baris utuh) -> (baris verteks (n, kolom), sisi (M, 3)).
+    Baris ``v``/``f`` dipilih per baris dengan NumPy; ``n_before`` = jumlah
+    verteks potongan sebelumnya, untuk indeks negatif (relatif).
+    """
+    b = np.frombuffer(buf, dtype=np.uint8)
+    ends = np.flatnonzero(b == 10) + 1
+    starts = np.concatenate(([0], ends[:-1]))
+    lengths = ends - starts
+    head = b[starts]
+    sep = b[np.minimum(starts + 1, len(b) - 1)]
+    sep = (sep == 32) | (sep == 9)
+    is_v = (head == ord("v")) & sep
+    is_f = (head == ord("f")) & sep
+
+    rows = np.empty((0, 3))
+    if is_v.any():
+        vb, _ = _select_lines(b, starts, lengths, is_v)
+        rows = _rows(vb.tobytes(), int(is_v.sum()), 3)
+
+    faces = np.empty((0, 3), dtype=np.int64)
+    if is_f.any():
+        vals, counts = _face_indices(*_select_lines(b, starts, lengths, is_f))
+        if (vals < 0).any():
+            seen = n_before + np.cumsum(is_v)[is_f]             # verteks sebelum tiap baris f
+            vals = np.where(vals < 0, np.repeat(seen, counts) + vals, vals - 1)
+        else:
+            vals -= 1
+        faces = fan_triangulate(vals, counts)
+    return rows, faces
+
+
+def load_obj(path, chunk_bytes=CHUNK_BYTES):
+    """
+    Wavefront OBJ: baris ``v x y z [r g b]`` dan ``f i j k ...`` (format
+    ``i/t/n`` dan indeks negatif didukung). Baris lain diabaikan.
+    """
+    verts, cols, faces = [], [], []
+    n = 0
+    with open(path, "rb") as f:
+        rest = b""
+        while True:
+            block = f.read(chunk_bytes)
+            if block:
+                data = rest + block
+                cut = data.rfind(b"\n") + 1
+                data, rest = data[:cut], data[cut:]
+            else:
+                data, rest = (rest + b"\n" if rest.strip() else b""), b""
+            if data:
+                rows, tri = _obj_chunk(data, n)
+                faces.append(tri)
+                if len(rows):
+                    verts.append(rows[:, :3])
+                    if rows.shape[1] >= 6:
+                        cols.append(rows[:, 3:6])
+                    n += len(rows)
+            if not block:
+                break
+    vertices = np.concatenate(verts) if verts else np.empty((0, 3))
+    faces = np.concatenate(faces) if faces else np.empty((0, 3), dtype=np.int64)
+    colors = np.concatenate(cols) if cols and sum(map(len, cols)) == n else None
+    return Mesh(vertices, _checked(faces, n), colors)
+
+
+# ---------------------------------------------------------------- PLY
+_PLY_TYPES = {
+    "char": "i1", "int8": "i1", "uchar": "u1", "uint8": "u1",
+    "short": "i2", "int16": "i2", "ushort": "u2", "uint16": "u2",
+    "int": "i4", "int32": "i4", "uint": "u4", "uint32": "u4",
+    "float": "f4", "float32": "f4", "double": "f8", "float64": "f8",
+}
+
+
+def _ply_header(f):
+    """(format, [(nama elemen, jumlah, [(nama, tipe | (tipe jumlah, tipe item))])])."""
+    if f.readline().strip() != b"ply":
+        raise ValueError("bukan file PLY")
+    fmt, elements = None, []
+    while True:
+        line = f.readline()
+        if not line:
+            raise ValueError("header PLY tidak diakhiri end_header")
+        tok = line.decode("ascii", "replace").split()
+        if not tok or tok[0] in ("comment", "obj_info"):
+            continue
+        if tok[0] == "end_header":
+            return fmt, elements
+        if tok[0] == "format":
+            fmt = tok[1]
+        elif tok[0] == "element":
+            elements.append((tok[1], int(tok[2]), []))
+        elif tok[0] == "property":
+            if tok[1] == "list":
+                elements[-1][2].append((tok[4], (_PLY_TYPES[tok[2]], _PLY_TYPES[tok[3]])))
+            else:
+                elements[-1][2].append((tok[2], _PLY_TYPES[tok[1]]))
+
+
+def _ply_binary(buf, offset, count, props, order):
+    """Satu elemen PLY biner -> (dict kolom, offset berikutnya)."""
+    lists = [name for name, t in props if isinstance(t, tuple)]
+    if not lists:
+        dt = np.dtype([(name, order + t) for name, t in props])
+        arr = np.frombuffer(buf, dt, count, offset)
+        return {name: arr[name] for name, _ in props}, offset + count * dt.itemsize
+    if len(lists) == 1 and count:
+        # jalur cepat: semua list sepanjang list record pertama (mesh segitiga /
+        # quad murni) -> satu dtype terstruktur untuk seluruh elemen
+        fields, head = [], 0
+        for name, t in props:
+            if name == lists[0]:
+                k = int(np.frombuffer(buf, order + t[0], 1, offset + head)[0])
+                fields += [(name + ".n", order + t[0]), (name, order + t[1], (k,))]
+                break
+            fields.append((name, order + t))
+            head += np.dtype(order + t).itemsize
+        fields += [(name, order + t) for name, t in props[len(fields) - 1:] if name != lists[0]]
+        dt = np.dtype(fields)
+        if offset + count * dt.itemsize <= len(buf):
+            arr = np.frombuffer(buf, dt, count, offset)
+            if (arr[lists[0] + ".n"] == k).all():
+                out = {name: arr[name] for name, t in props if not isinstance(t, tuple)}
+                out[lists[0]] = (arr[lists[0]].reshape(-1), np.full(count, k))
+                return out, offset + count * dt.itemsize
+    # jalur umum: panjang list berbeda-beda, telusuri per record
+    out = {name: [] for name, _ in props}
+    for _ in range(count):
+        for name, t in props:
+            if isinstance(t, tuple):
+                ct, it = np.dtype(order + t[0]), np.dtype(order + t[1])
+                k = int(np.frombuffer(buf, ct, 1, offset)[0])
+                offset += ct.itemsize
+                out[name].append(np.frombuffer(buf, it, k, offset))
+                offset += k * it.itemsize
+            else:
+                dt1 = np.dtype(order + t)
+                out[name].append(np.frombuffer(buf, dt1, 1, offset)[0])
+                offset += dt1.itemsize
+    return _gather(out, props), offset
+
+
+def _gather(out, props):
+    """Kolom per record (list Python) -> array; properti list -> (flat, counts)."""
+    res = {}
+    for name, t in props:
+        items = out[name]
+        if isinstance(t, tuple):
+            res[name] = (
+                np.concatenate(items).astype(np.int64) if items else np.empty(0, dtype=np.int64),
+                np.array([len(x) for x in items], dtype=np.intp),
+            )
+        else:
+            res[name] = np.array(items)
+    return res
+
+
+def _ply_ascii(f, count, props):
+    """Satu elemen PLY ASCII (``count`` baris berikutnya) -> dict kolom."""
+    lines = list(itertools.islice(f, count))
+    lists = [p for p in props if isinstance(p[1], tuple)]
+    if not lists:
+        rows = _rows(b"".join(lines), count, len(props)) if count else np.empty((0, len(props)))
+        return {name: rows[:, i] for i, (name, _) in enumerate(props)}
+    if len(props) == 1 and count and props[0][1][1][0] in "iu":
+        # hanya satu list indeks per baris: cek panjang seragam secara tervektorisasi
+        flat = np.fromstring(b"".join(lines).decode("ascii"), dtype=np.int64, sep=" ")
+        k = int(flat[0]) if len(flat) else 0
+        if k > 0 and len(flat) == count * (k + 1) and (flat[::k + 1] == k).all():
+            return {props[0][0]: (flat.reshape(count, k + 1)[:, 1:].ravel(), np.full(count, k))}
+    out = {name: [] for name, _ in props}
+    for ln in lines:
+        tok = ln.split()
+        pos = 0
+        for name, t in props:
+            if isinstance(t, tuple):
+                k = int(tok[pos])
+                out[name].append(np.array(tok[pos + 1:pos + 1 + k], dtype=np.int64))
+                pos += k + 1
+            else:
+                out[name].append(float(tok[pos]))
+                pos += 1
+    return _gather(out, props)
+
+
+def load_ply(path):
+    """
+    Stanford PLY (ascii, binary_little_endian, binary_big_endian): elemen
+    ``vertex`` (x, y, z, opsional red/green/blue) dan ``face``
+    (``vertex_indices`` / ``vertex_index``). Elemen lain dilewati.
+    """
+    data = {}
+    with open(path, "rb") as f:
+        fmt, elements = _ply_header(f)
+        if fmt == "ascii":
+            for name, count, props in elements:
+                data[name] = _ply_ascii(f, count, props)
+        elif fmt in ("binary_little_endian", "binary_big_endian"):
+            order = "<" if fmt == "binary_little_endian" else ">"
+            buf = f.read()
+            offset = 0
+            for name, count, props in elements:
+                data[name], offset = _ply_binary(buf, offset, count, props, order)
+        else:
+            raise ValueError(f"format PLY tidak dikenal: {fmt}")
+
+    vert = data.get("vertex")
+    if vert is None:
+        raise ValueError("PLY tanpa elemen vertex")
+    vertices = np.column_stack([vert["x"], vert["y"], vert["z"]])
+    colors = None
+    if all(c in vert for c in ("red", "green", "blue")):
+        colors = np.column_stack([vert["red"], vert["green"], vert["blue"]]).astype(np.float64)
+        if dict(_vertex_props(elements))["red"][0] in "iu":
+            colors /= 255.0
+    faces = np.empty((0, 3), dtype=np.int64)
+    face = data.get("face")
+    if face is not None:
+        key = "vertex_indices" if "vertex_indices" in face else "vertex_index"
+        flat, counts = face[key]
+        faces = fan_triangulate(flat.astype(np.int64), counts)
+    return Mesh(vertices, _checked(faces, len(vertices)), colors)
+
+
+def _vertex_props(elements):
+    return next(props for name, _, props in elements if name == "vertex")
+
+
+def _checked(faces, n):
+    if len(faces) and (faces.min() < 0 or faces.max() >= n):
+        raise ValueError("indeks sisi di luar jangkauan verteks")
+    return faces
+
+
+def load_mesh(path):
+    """Muat .obj / .ply sesuai ekstensinya."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".obj":
+        return load_obj(path)
+    if ext == ".ply":
+        return load_ply(path)
+    raise ValueError(f"format mesh tidak didukung: {ext}")
+
+
+# ---------------------------------------------------------------- GL
+class GpuMesh:
+    """
+    Mesh di GPU: satu VBO interleaved (posisi, normal, warna opsional) dan
+    satu IBO (uint16 bila verteks <= 65536, selain itu uint32). Diunggah
+    saat draw pertama dan setelah ``invalidate_gl``.
+    """
+
+    def __init__(self, mesh):
+        self.mesh = mesh
+        self.vbo = None
+        self.ibo = None
+        self.index_type = GL_UNSIGNED_INT
+        self.uploads = 0
+
+    def _upload(self):
+        m = self.mesh
+        cols = [m.vertices, m.normals] + ([m.colors] if m.colors is not None else [])
+        data = np.ascontiguousarray(np.column_stack(cols), dtype=_f32)
+        if m.n_vertices <= 1 << 16:
+            index, self.index_type = m.faces.astype(np.uint16), GL_UNSIGNED_SHORT
+        else:
+            index, self.index_type = m.faces, GL_UNSIGNED_INT
+        self.vbo, self.ibo = glGenBuffers(2)
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        glBufferData(GL_ARRAY_BUFFER, data.nbytes, data, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.ibo)
+        glBufferData(GL_ELEMENT_ARRAY_BUFFER, index.nbytes, np.ascontiguousarray(index), GL_STATIC_DRAW)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+        self.uploads += 1
+
+    @property
+    def count(self):
+        """Jumlah indeks (3 per segitiga) untuk glDrawElements."""
+        return self.mesh.n_faces * 3
+
+    def bind(self):
+        """Pasang VBO/IBO dan pointer posisi, normal (dan warna) mesh ini."""
+        if self.vbo is None:
+            self._upload()
+        has_color = self.mesh.colors is not None
+        stride = (9 if has_color else 6) * 4
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.ibo)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_NORMAL_ARRAY)
+        glVertexPointer(3, GL_FLOAT, stride, None)
+        glNormalPointer(GL_FLOAT, stride, ctypes.c_void_p(12))
+        if has_color:
+            glEnableClientState(GL_COLOR_ARRAY)
+            glColorPointer(3, GL_FLOAT, stride, ctypes.c_void_p(24))
+
+    def unbind(self):
+        if self.mesh.colors is not None:
+            glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_NORMAL_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+    def draw(self):
+        self.bind()
+        glDrawElements(GL_TRIANGLES, self.count, self.index_type, None)
+        self.unbind()
+
+    def release(self):
+        """Hapus buffer milik konteks GL yang masih aktif."""
+        if self.vbo is not None:
+            glDeleteBuffers(2, [self.vbo, self.ibo])
+            self.vbo = self.ibo = None
+
+    def invalidate_gl(self):
+        """Konteks GL dibuat ulang: id buffer lama tidak berlaku, unggah ulang saat draw."""
+        self.vbo = self.ibo = None
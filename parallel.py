@@ -0,0 +1,59 @@
+"""
+Eksekusi paralel opsional untuk kernel NumPy batch (kliping, tesselasi).
+
+Pekerjaan dipecah menjadi potongan objek berurutan yang dikerjakan thread
+pool. Loop internal NumPy melepas GIL, jadi potongan berjalan bersamaan di
+beberapa core tanpa menyalin array: semua thread memakai buffer scene yang
+sama. Setiap potongan hanya menulis baris objeknya sendiri dan hasilnya
+dikembalikan menurut urutan potongan, jadi keluarannya identik dengan jalur
+serial.
+
+Default serial (1 worker); atur lewat ``GRAFKOM_WORKERS`` (0 = semua core)
+atau ``set_workers``.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+MIN_CHUNK = 50_000          # objek per potongan; di bawah ini overhead thread dominan
+
+_workers = 1
+_pool = None
+
+
+def workers():
+    return _workers
+
+
+def set_workers(n):
+    """Jumlah thread; 1 = serial, 0 / None = jumlah core."""
+    global _workers, _pool
+    n = max(1, int(n or 0) or os.cpu_count() or 1)
+    if n == _workers:
+        return
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
+    _workers = n
+
+
+def chunks(total, min_chunk=MIN_CHUNK):
+    """Batas potongan ``[(a, b), ...]`` untuk ``total`` objek; satu potongan bila serial / kecil."""
+    k = max(1, min(_workers, total // max(1, min_chunk)))
+    edges = np.linspace(0, total, k + 1).astype(np.intp).tolist()
+    return list(zip(edges[:-1], edges[1:]))
+
+
+def map_chunks(fn, total, min_chunk=MIN_CHUNK):
+    """``fn(a, b)`` untuk setiap potongan; daftar hasil urut sesuai potongan."""
+    global _pool
+    parts = chunks(total, min_chunk)
+    if len(parts) == 1:
+        return [fn(*parts[0])]
+    if _pool is None:
+        _pool = ThreadPoolExecutor(_workers, thread_name_prefix="grafkom")
+    return list(_pool.map(lambda ab: fn(*ab), parts))
+
+
+set_workers(os.environ.get("GRAFKOM_WORKERS", 1))
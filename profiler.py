@@ -0,0 +1,207 @@
+"""
+Profiler frame ringan untuk loop utama.
+
+Loop memanggil ``begin_frame`` lalu ``lap(nama)`` di setiap batas fase; waktu
+sejak lap sebelumnya masuk ke fase itu. Fungsi panas bisa dibungkus
+``@profiler.timed(nama)`` (waktu bersarang, mis. kliping di dalam event).
+Selama profiler mati setiap panggilan hanya mengecek ``enabled`` lalu kembali,
+dan penghitung panggilan GL dilepas sepenuhnya, jadi instrumentasi ini boleh
+tetap terpasang.
+
+Statistik min / rata-rata / p99 dihitung dari ``history`` frame terakhir.
+Trace log (opsional) berisi satu baris JSON per frame.
+"""
+import functools
+import gc
+import json
+import sys
+import time
+
+import numpy as np
+
+_now = time.perf_counter
+
+
+class FrameProfiler:
+    def __init__(self, history=240):
+        self.history = history
+        self.hud = False
+        self.enabled = False
+        self.trace_file = None
+        self.frame = 0
+        self.phases: dict = {}     # fase -> ms frame ini
+        self.counts: dict = {}     # penghitung frame ini
+        self.samples: dict = {}    # fase -> ring buffer ms (history,)
+        self.filled = 0
+        self.starts = np.zeros(history)   # waktu mulai frame, untuk fps
+        self.gl_calls = GLCallCounter()
+        self._t = self._t0 = 0.0
+        self._blocks = 0
+        self._gc = 0
+
+    # ---------- on / off ----------
+    def _update_enabled(self):
+        enabled = self.hud or self.trace_file is not None
+        if enabled == self.enabled:
+            return
+        self.enabled = enabled
+        if enabled:
+            self.gl_calls.install()
+            gc.callbacks.append(self._on_gc)
+        else:
+            self.gl_calls.uninstall()
+            gc.callbacks.remove(self._on_gc)
+
+    def toggle_hud(self):
+        self.hud = not self.hud
+        self._update_enabled()
+
+    def start_trace(self, path):
+        self.stop_trace()
+        self.trace_file = open(path, "w")
+        self._update_enabled()
+
+    def stop_trace(self):
+        if self.trace_file is not None:
+            self.trace_file.close()
+            self.trace_file = None
+            self._update_enabled()
+
+    def _on_gc(self, phase, info):
+        if phase == "start":
+            self._gc += 1
+
+    # ---------- instrumentasi ----------
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self.phases = {}
+        self.counts = {}
+        self._gc = 0
+        self._blocks = sys.getallocatedblocks()
+        self._t = self._t0 = _now()
+
+    def lap(self, name):
+        """Waktu sejak lap/begin_frame sebelumnya dicatat sebagai fase ``name``."""
+        if not self.enabled:
+            return
+        now = _now()
+        self.phases[name] = self.phases.get(name, 0.0) + (now - self._t) * 1e3
+        self._t = now
+
+    def add(self, name, ms):
+        self.phases[name] = self.phases.get(name, 0.0) + ms
+
+    def timed(self, name):
+        """Decorator: waktu fungsi masuk ke fase ``name`` (bersarang)."""
+        def deco(fn):
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return fn(*args, **kwargs)
+                t0 = _now()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    self.add(name, (_now() - t0) * 1e3)
+            return wrapper
+        return deco
+
+    def end_frame(self, **counts):
+        if not self.enabled:
+            return
+        self.phases["frame"] = (_now() - self._t0) * 1e3
+        self.counts.update(counts)
+        self.counts["gl_calls"] = self.gl_calls.take()
+        self.counts["alloc_blocks"] = sys.getallocatedblocks() - self._blocks
+        self.counts["gc"] = self._gc
+
+        slot = self.frame % self.history
+        self.starts[slot] = self._t0
+        for name, ms in self.phases.items():
+            ring = self.samples.get(name)
+            if ring is None:
+                ring = self.samples[name] = np.full(self.history, np.nan)
+            ring[slot] = ms
+        for name, ring in self.samples.items():
+            if name not in self.phases:
+                ring[slot] = 0.0
+        self.filled = min(self.filled + 1, self.history)
+        self.frame += 1
+
+        if self.trace_file is not None:
+            self.trace_file.write(json.dumps({
+                "frame": self.frame, "t": self._t0,
+                "ms": {k: round(v, 4) for k, v in self.phases.items()},
+                "counts": self.counts,
+            }) + "\n")
+
+    # ---------- laporan ----------
+    def stats(self, name):
+        """(min, rata-rata, p99) ms fase ``name`` atas history terakhir."""
+        ring = self.samples.get(name)
+        if ring is None or not self.filled:
+            return None
+        vals = ring[~np.isnan(ring)]
+        return float(vals.min()), float(vals.mean()), float(np.percentile(vals, 99))
+
+    def fps(self):
+        if self.filled < 2:
+            return 0.0
+        starts = self.starts[:self.filled]
+        return (self.filled - 1) / (starts.max() - starts.min())
+
+    def report_lines(self):
+        lines = [f"{'fase':10s} {'min':>7s} {'avg':>7s} {'p99':>7s}  ms   {self.fps():.0f} fps"]
+        for name in self.samples:
+            st = self.stats(name)
+            if st is not None:
+                lines.append(f"{name:10s} {st[0]:7.2f} {st[1]:7.2f} {st[2]:7.2f}")
+        lines.append("  ".join(f"{k} {v}" for k, v in self.counts.items()))
+        return lines
+
+
+class GLCallCounter:
+    """
+    Menghitung panggilan gl*/glu* dengan mengganti nama-nama itu di modul
+    yang didaftarkan (``watch``). Fungsi asli dikembalikan saat uninstall.
+    """
+
+    def __init__(self):
+        self.modules = []
+        self.calls = 0
+        self._saved = []
+
+    def watch(self, *modules):
+        """Daftarkan modul; modul yang diimpor belakangan langsung dihitung bila sudah terpasang."""
+        new = [mod for mod in modules if mod not in self.modules]
+        self.modules.extend(new)
+        if self._saved:
+            self._patch(new)
+
+    def install(self):
+        if self._saved:
+            return
+        self._patch(self.modules)
+
+    def _patch(self, modules):
+        for mod in modules:
+            for name, fn in list(vars(mod).items()):
+                if name.startswith("gl") and callable(fn):
+                    self._saved.append((mod, name, fn))
+                    setattr(mod, name, self._wrap(fn))
+
+    def uninstall(self):
+        for mod, name, fn in self._saved:
+            setattr(mod, name, fn)
+        self._saved = []
+
+    def _wrap(self, fn):
+        def counted(*args, **kwargs):
+            self.calls += 1
+            return fn(*args, **kwargs)
+        return counted
+
+    def take(self):
+        n, self.calls = self.calls, 0
+        return n
@@ -0,0 +1,224 @@
+"""
+Rasterizer software (NumPy murni) untuk render tanpa display / OpenGL.
+
+Primitif yang dipakai frame 2D (titik persegi, garis tebal, loop outline)
+dirasterisasi sekaligus per batch: setiap segmen dipecah menjadi fragmen per
+kolom/baris sumbu mayornya (seperti rasterisasi garis non-antialias GL) lalu
+dilebarkan ke sumbu minor sesuai ketebalan. Urutan tumpukan memakai buffer
+"depth" bilangan bulat: fragmen dengan ``order`` lebih besar menang, dan pada
+order sama panggilan belakangan menang (setara GL_LEQUAL di renderer.py).
+
+Framebuffer disimpan dengan baris 0 di bawah, sama seperti glReadPixels;
+``image()`` membaliknya (baris 0 di atas) untuk disimpan sebagai gambar.
+"""
+import struct
+import zlib
+
+import numpy as np
+
+CHUNK_SEGMENTS = 1 << 18    # batas segmen per batch supaya memori fragmen terbatas
+
+
+def to_rgba8(colors):
+    """Warna float 0..1 (n, 3) / (n, 4) ke uint8 RGBA (n, 4)."""
+    colors = np.atleast_2d(np.asarray(colors, dtype=np.float64))
+    out = np.full((len(colors), 4), 255, dtype=np.uint8)
+    out[:, :colors.shape[1]] = np.round(np.clip(colors, 0.0, 1.0) * 255)
+    return out
+
+
+def loop_segments(verts, counts):
+    """Sisi loop tertutup (LINE_LOOP) format packed: (awal, akhir, pemilik)."""
+    counts = np.asarray(counts, dtype=np.intp)
+    first = np.cumsum(counts) - counts
+    nxt = np.arange(len(verts)) + 1
+    live = counts > 0
+    nxt[(first + counts - 1)[live]] = first[live]
+    return verts, verts[nxt], np.repeat(np.arange(len(counts)), counts)
+
+
+class SoftwareRasterizer:
+    """
+    Framebuffer RGBA ``height`` x ``width`` dengan proyeksi ortografis
+    ``world`` = (left, right, bottom, top), sama seperti gluOrtho2D.
+    """
+
+    def __init__(self, width, height, world=(-10.0, 10.0, -10.0, 10.0)):
+        self.width = width
+        self.height = height
+        self.world = world
+        self.pixels = np.zeros((height, width, 4), dtype=np.uint8)
+        self.order = np.full(height * width, -1, dtype=np.int32)
+        self.scissor = None
+
+    def clear(self, rgba):
+        self.pixels[:] = to_rgba8([rgba])[0]
+        self.order[:] = -1
+
+    def set_scissor(self, rect):
+        """Kotak scissor (x, y, w, h) piksel, y dari bawah; None = mati."""
+        self.scissor = rect
+
+    def to_window(self, xy):
+        """
+        Koordinat dunia (n, 2) ke koordinat window piksel (y dari bawah), lewat
+        proyeksi ortografis lalu viewport dalam float32 seperti GL, supaya
+        titik yang jatuh tepat di batas piksel dibulatkan sama.
+        """
+        left, right, bottom, top = self.world
+        xy = np.asarray(xy, dtype=np.float32).reshape(-1, 2)
+        out = []
+        axes = ((xy[:, 0], left, right, self.width), (xy[:, 1], bottom, top, self.height))
+        for v, lo, hi, size in axes:
+            ndc = v * np.float32(2 / (hi - lo)) + np.float32(-(hi + lo) / (hi - lo))
+            half = np.float32(size / 2)
+            out.append((ndc * half + half).astype(np.float64))
+        return out
+
+    # ---------- primitif (koordinat dunia) ----------
+    def points(self, xy, colors, size=5.0, order=0):
+        """Titik persegi ``size`` piksel (glPointSize non-antialias)."""
+        x, y = self.to_window(xy)
+        n = len(x)
+        if not n:
+            return
+        xmin, ymin, xmax, ymax = self._bounds()
+        s = max(1, int(size + 0.5))
+        k = np.arange(s, dtype=np.int32)
+        px = np.ceil(x - s / 2 - 0.5).astype(np.int32)[:, None] + k
+        py = np.ceil(y - s / 2 - 0.5).astype(np.int32)[:, None] + k
+        ok = ((px >= xmin) & (px < xmax))[:, None, :] & ((py >= ymin) & (py < ymax))[:, :, None]
+        pix = py[:, :, None] * self.width + px[:, None, :]
+        owner = np.broadcast_to(np.arange(n)[:, None, None], pix.shape)
+        self._write(pix[ok], owner[ok], self._colors(colors, n), self._orders(order, n))
+
+    def segments(self, p0, p1, colors, widths=1.0, order=0):
+        """Garis p0[i] -> p1[i] (GL_LINES) dengan ketebalan piksel ``widths``."""
+        x0, y0 = self.to_window(p0)
+        x1, y1 = self.to_window(p1)
+        n = len(x0)
+        if not n:
+            return
+        colors = self._colors(colors, n)
+        widths = np.maximum(np.floor(np.broadcast_to(widths, (n,)) + 0.5), 1).astype(np.int64)
+        orders = self._orders(order, n)
+        bounds = self._bounds()
+        for a in range(0, n, CHUNK_SEGMENTS):
+            sl = slice(a, a + CHUNK_SEGMENTS)
+            pix, seg = _line_fragments(
+                x0[sl], y0[sl], x1[sl], y1[sl], widths[sl], bounds, self.width
+            )
+            self._write(pix, seg, colors[sl], orders[sl])
+
+    def loops(self, verts, counts, colors, widths=1.0, order=0):
+        """Outline tertutup (GL_LINE_LOOP) format packed ``(verts, counts)``."""
+        a, b, owner = loop_segments(np.asarray(verts, dtype=np.float64), counts)
+        n = len(counts)
+        self.segments(
+            a, b, self._colors(colors, n)[owner], np.broadcast_to(widths, (n,))[owner],
+            self._orders(order, n)[owner],
+        )
+
+    # ---------- framebuffer ----------
+    def _bounds(self):
+        """Area yang boleh ditulis (xmin, ymin, xmax, ymax), setengah terbuka."""
+        if self.scissor is None:
+            return 0, 0, self.width, self.height
+        sx, sy, sw, sh = self.scissor
+        return (
+            max(sx, 0), max(sy, 0),
+            min(sx + sw, self.width), min(sy + sh, self.height),
+        )
+
+    def _colors(self, colors, n):
+        """Warna per primitif sebagai RGBA8 yang dikemas ke uint32 (idempoten)."""
+        packed = np.asarray(colors)
+        if packed.dtype != np.uint32:
+            packed = to_rgba8(colors).view(np.uint32).ravel()
+        return np.broadcast_to(packed, (n,)) if len(packed) == 1 else packed
+
+    def _orders(self, order, n):
+        return np.broadcast_to(np.asarray(order, dtype=np.int32), (n,))
+
+    def _write(self, pix, owner, colors, orders):
+        key = orders[owner]
+        # fragmen dengan order terbesar per piksel; order sama = yang ini menimpa
+        np.maximum.at(self.order, pix, key)
+        win = self.order[pix] == key
+        self.pixels.view(np.uint32).reshape(-1)[pix[win]] = colors[owner[win]]
+
+    def image(self):
+        """Salinan framebuffer (tinggi, lebar, 4) uint8 dengan baris 0 di atas."""
+        return self.pixels[::-1].copy()
+
+
+def _line_fragments(x0, y0, x1, y1, widths, bounds, stride):
+    """
+    Fragmen garis non-antialias sebagai (indeks piksel, indeks segmen): satu
+    sampel per pusat piksel sepanjang sumbu mayor (pusat di [min, max) kedua
+    ujung), lalu ``widths`` piksel berurutan di sumbu minor.
+    Hanya piksel di dalam ``bounds`` yang dihasilkan. Segmen dikelompokkan
+    per (sumbu mayor, ketebalan) supaya tiap kelompok cukup memakai skalar.
+    """
+    xmin, ymin, xmax, ymax = bounds
+    xmajor = np.abs(x1 - x0) >= np.abs(y1 - y0)
+    pix, owner = [], []
+    for is_x in (True, False):
+        if is_x:
+            a0, a1, b0, b1 = x0, x1, y0, y1
+            lo, hi, lo_minor, hi_minor = xmin, xmax, ymin, ymax
+            major_step, minor_step = 1, stride
+        else:
+            a0, a1, b0, b1 = y0, y1, x0, x1
+            lo, hi, lo_minor, hi_minor = ymin, ymax, xmin, xmax
+            major_step, minor_step = stride, 1
+        for w in np.unique(widths[xmajor == is_x]).tolist():
+            sel = np.flatnonzero((xmajor == is_x) & (widths == w))
+            sa0, sa1 = a0[sel], a1[sel]
+            first = np.clip(np.ceil(np.minimum(sa0, sa1) - 0.5), lo, hi).astype(np.int32)
+            last = np.clip(np.ceil(np.maximum(sa0, sa1) - 0.5), lo, hi).astype(np.int32)
+            n = np.maximum(last - first, 0)
+            keep = n > 0
+            if not keep.any():
+                continue
+            sel, first, n, sa0 = sel[keep], first[keep], n[keep], sa0[keep]
+            slope = (b1[sel] - b0[sel]) / (a1[sel] - sa0)
+            # baris/kolom minor pertama: pusat piksel pertama >= b(sampel) - w/2
+            c0 = b0[sel] + (0.5 - sa0) * slope - w / 2 - 0.5
+
+            k = np.repeat(np.arange(len(sel), dtype=np.int32), n)
+            skip = (first - (np.cumsum(n) - n)).astype(np.int32)
+            major = np.arange(int(n.sum()), dtype=np.int32) + np.repeat(skip, n)
+            start = np.ceil(c0[k] + major * slope[k]).astype(np.int32)
+            base = major * major_step + start * minor_step
+            own = sel[k]
+            for j in range(w):
+                ok = (start >= lo_minor - j) & (start < hi_minor - j)
+                if ok.all():
+                    pix.append(base + j * minor_step)
+                    owner.append(own)
+                else:
+                    pix.append(base[ok] + j * minor_step)
+                    owner.append(own[ok])
+    if not pix:
+        return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.intp)
+    return np.concatenate(pix), np.concatenate(owner)
+
+
+def write_png(path, rgba, level=6):
+    """Simpan gambar RGBA (tinggi, lebar, 4) uint8, baris 0 di atas, sebagai PNG (kompresi zlib ``level``)."""
+    h, w = rgba.shape[:2]
+    raw = np.zeros((h, w * 4 + 1), dtype=np.uint8)     # byte filter 0 per baris
+    raw[:, 1:] = np.ascontiguousarray(rgba, dtype=np.uint8).reshape(h, -1)
+
+    def chunk(tag, data):
+        return (
+            struct.pack(">I", len(data)) + tag + data
+            + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+        )
+
+    with open(path, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        f.write(chunk(b"IHDR", struct.pack(">IIBBBBB", w, h, 8, 6, 0, 0, 0)))
+        f.write(chunk(b"IDAT", zlib.compress(raw.tobytes(), level)))
+        f.write(chunk(b"IEND", b""))
@@ -0,0 +1,54 @@
+"""
+Status render per mode tampilan (2D / 3D) yang disiapkan sekali.
+
+Dulu F1 memanggil init() lagi (jendela & konteks GL dibuat ulang, semua VBO,
+tekstur teks dan FBO tangkapan ikut hilang) dan F2 menyusun proyeksi serta
+lampu dari awal. Sekarang setiap mode adalah ``RenderMode``: matriks
+proyeksinya dihitung sekali dengan NumPy, parameter yang tersimpan di
+konteks GL (mis. posisi & warna lampu) diset saat mode pertama kali aktif,
+dan ``activate`` hanya memuat matriks serta menyalakan / mematikan
+kapabilitas yang berbeda dari mode sebelumnya — beberapa panggilan GL.
+"""
+import numpy as np
+from OpenGL.GL import *
+
+
+class RenderMode:
+    """
+    ``projection``: matriks (4, 4) konvensi vektor kolom (scene3d.perspective /
+    camera2d.ortho); ``enable``: kapabilitas glEnable selama mode aktif; ``setup()``:
+    status GL sekali per konteks, dipanggil dengan modelview identitas.
+    """
+
+    def __init__(self, name, projection, enable=(), setup=None):
+        self.name = name
+        # glLoadMatrixd membaca kolom demi kolom
+        self.projection = np.ascontiguousarray(np.asarray(projection, dtype=np.float64).T)
+        self.enable = frozenset(enable)
+        self.setup = setup
+        self.ready = False
+        self.activations = 0
+
+    def activate(self, previous=None):
+        """
+        Jadikan mode ini aktif. ``previous``: mode yang sedang aktif (None =
+        status GL bawaan, semua kapabilitas mati).
+        """
+        glMatrixMode(GL_PROJECTION)
+        glLoadMatrixd(self.projection)
+        glMatrixMode(GL_MODELVIEW)
+        glLoadIdentity()
+        if not self.ready:
+            if self.setup is not None:
+                self.setup()
+            self.ready = True
+        active = previous.enable if previous is not None else frozenset()
+        for cap in active - self.enable:
+            glDisable(cap)
+        for cap in self.enable - active:
+            glEnable(cap)
+        self.activations += 1
+
+    def invalidate_gl(self):
+        """Konteks GL dibuat ulang: ``setup`` dijalankan lagi saat aktif berikutnya."""
+        self.ready = False
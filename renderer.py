@@ -0,0 +1,478 @@
+"""
+Renderer 2D retained-mode berbasis VBO.
+
+Geometri setiap objek dihitung sekali ke clip space lalu dikelompokkan per
+(primitif, warna, ketebalan). Setiap kelompok punya satu VBO dan digambar
+dengan satu panggilan glDrawArrays / glMultiDrawArrays. Rentang verteks
+setiap anggota di VBO kelompoknya tetap: objek yang berubah dengan jumlah
+verteks sama (mis. digeser) ditulis di tempat lewat glBufferSubData, objek
+baru ditambahkan di ujung VBO; kelompok hanya dikemas ulang bila ada anggota
+yang keluar, jumlah verteksnya berubah, atau sebagian besar anggotanya
+berubah sekaligus.
+
+Supaya hasilnya identik piksel-per-piksel dengan ``Object2D.draw``, matriks
+glTranslatef · glRotatef · glScalef dan perkalian projection × modelview
+ditiru dalam float32 dengan urutan operasi yang sama seperti Mesa. Urutan
+tumpukan objek dijaga lewat depth: objek yang dibuat belakangan mendapat
+depth lebih kecil (GL_LEQUAL), jadi urutan gambar antar kelompok tidak
+berpengaruh.
+
+Kamera 2D (camera2d.py) tidak mengubah verteks tersimpan: ``draw(view=...)``
+memasang matriks pan / zoom di atas clip space, dan ``visible`` (hasil
+culling) membatasi gambar ke objek yang terlihat lewat glMultiDrawArrays
+dengan rentang verteks per objek.
+"""
+import math
+
+import numpy as np
+from OpenGL.GL import *
+
+from clipping import outline_segments
+from tessellation import ellipse_outline
+
+_f32 = np.float32
+_NO_TRANSFORM = (0.0, 0.0, 0.0, 1.0, 1.0)
+_VERTEX_NBYTES = 3 * 4
+# lebih dari 1/PATCH_RATIO anggota berubah: kemas ulang (satu upload) lebih
+# murah daripada satu glBufferSubData per anggota
+PATCH_RATIO = 16
+
+
+def local_geometry(obj, px_per_unit):
+    """
+    ``(mode, verteks lokal (N, 2), (tx, ty, rot, sx, sy))`` untuk satu objek,
+    mengikuti persis urutan glTranslatef/glRotatef/glScalef di
+    ``Object2D.draw``. None jika tidak ada yang digambar.
+    """
+    pts = obj.points
+    if not pts:
+        return None
+    clipped = obj.clipped_outline()
+    if clipped is not None:
+        verts, boundary = clipped
+        segs = outline_segments(verts, [len(verts)], boundary)
+        return GL_LINES, segs.reshape(-1, 2), _NO_TRANSFORM
+    t = obj.translation
+    if obj.obj_type == "line":
+        if len(pts) < 2:
+            return None
+        return GL_LINES, [(p.x, p.y) for p in pts], _NO_TRANSFORM
+
+    if obj.obj_type == "point":
+        return GL_POINTS, [(pts[0].x, pts[0].y)], (t[0], t[1], obj.rotation, *obj.scale)
+
+    if obj.obj_type == "square":
+        if len(pts) < 2:
+            return None
+        p1, p2 = pts
+        cx, cy = (p1.x + p2.x) / 2.0, (p1.y + p2.y) / 2.0
+        hw, hh = abs(p2.x - p1.x) / 2.0, abs(p2.y - p1.y) / 2.0
+        local = [(-hw, -hh), (hw, -hh), (hw, hh), (-hw, hh)]
+        return GL_LINE_LOOP, local, (cx + t[0], cy + t[1], obj.rotation, *obj.scale)
+
+    if obj.obj_type == "ellipse":
+        if len(pts) < 2:
+            return None
+        center, radius = pts
+        local = ellipse_outline(obj, px_per_unit)
+        return (
+            GL_LINE_LOOP,
+            local,
+            (center.x + t[0], center.y + t[1], obj.rotation, *obj.scale),
+        )
+
+    return None
+
+
+# ---------- tiruan matriks fixed-function (float32) ----------
+def _matmul(a, b):
+    acc = a[:, :, 0, None] * b[:, None, 0, :]
+    for k in range(1, 4):
+        acc = acc + a[:, :, k, None] * b[:, None, k, :]
+    return acc
+
+
+def object_mvps(projection, modelview, params):
+    """
+    Matriks projection × modelview × T · R · S untuk banyak objek sekaligus.
+    ``projection``/``modelview`` (4, 4) row-major float32, ``params`` (n, 5).
+    """
+    params = np.asarray(params, dtype=np.float64).reshape(-1, 5)
+    n = len(params)
+    tx, ty, rot, sx, sy = params.astype(_f32).T
+
+    m = np.broadcast_to(modelview.astype(_f32), (n, 4, 4)).copy()
+    m[:, :, 3] = (
+        m[:, :, 0] * tx[:, None] + m[:, :, 1] * ty[:, None]
+        + m[:, :, 2] * _f32(0) + m[:, :, 3]
+    )
+
+    # sinf/cosf Mesa dibulatkan benar; sin float32 NumPy bisa meleset 1 ulp
+    ang = (rot.astype(np.float64) * math.pi / 180.0).astype(_f32).astype(np.float64)
+    s, c = np.sin(ang).astype(_f32), np.cos(ang).astype(_f32)
+    r = np.zeros((n, 4, 4), dtype=_f32)
+    r[:, 0, 0] = c
+    r[:, 1, 1] = c
+    r[:, 1, 0] = s
+    r[:, 0, 1] = -s
+    r[:, 2, 2] = 1
+    r[:, 3, 3] = 1
+    m = _matmul(m, r)
+
+    m[:, :, 0] *= sx[:, None]
+    m[:, :, 1] *= sy[:, None]
+    return _matmul(np.broadcast_to(projection.astype(_f32), (n, 4, 4)), m)
+
+
+def transform_vertices(mvps, owner, local):
+    """Clip-space x, y untuk verteks lokal (z = 0, w = 1) milik objek ``owner``."""
+    lx = local[:, 0].astype(_f32)
+    ly = local[:, 1].astype(_f32)
+    out = np.empty((len(local), 2), dtype=_f32)
+    for row in range(2):
+        m = mvps[owner, row]
+        t = lx * m[:, 0]
+        t = ly * m[:, 1] + t
+        t = _f32(0) * m[:, 2] + t
+        out[:, row] = _f32(1) * m[:, 3] + t
+    return out
+
+
+class _Group:
+    def __init__(self, gid, key):
+        self.id = gid
+        self.key = key
+        self.members: dict = {}   # indeks objek -> None, urutan sisip = urutan di VBO
+        self.vbo = None
+        self.capacity = 0         # verteks yang dialokasikan di VBO
+        self.count = 0
+        self.firsts = None
+        self.counts = None
+        self.patched: dict = {}   # anggota berubah, jumlah verteks sama (tulis di tempat)
+        self.appended: list = []  # anggota baru sejak upload terakhir (di ujung members)
+
+
+class SceneRenderer2D:
+    """
+    Menggambar ``objects`` (urutan objek scene, mis. objects_2d). Objek
+    dikenali lewat indeksnya di urutan itu, yang sekaligus urutan tumpukannya.
+    """
+
+    def __init__(self, objects, px_per_unit=(40.0, 30.0), matrices=None):
+        self.objects = objects
+        # skala dunia -> piksel, dipakai memilih jumlah segmen elips
+        self.px_per_unit = px_per_unit
+        # (projection, modelview) (4, 4) clip space verteks tersimpan;
+        # None = matriks GL yang aktif saat draw
+        self.matrices = matrices
+        self.groups: dict = {}
+        self.clear()
+
+    def clear(self):
+        self.release()
+        self.meshes: dict = {}    # indeks -> (key, verteks clip space float32 (N, 3))
+        self.groups: dict = {}    # key -> _Group
+        self.dirty_objects: set = set()
+        self.dirty_groups: set = set()     # kelompok yang harus dikemas ulang
+        self.patched_groups: set = set()   # kelompok dengan anggota berubah / baru
+        self._z_step = None
+        self._matrices = None
+        self._next_gid = 0
+        self._by_id: dict = {}    # id kelompok -> _Group
+        # per indeks objek: kelompok (-1 = tidak digambar), rentang verteksnya
+        # di VBO kelompok, dan skala tesselasi elips saat dibangun (0 = bukan elips)
+        self.slot_group = np.full(0, -1, dtype=np.int32)
+        self.slot_first = np.zeros(0, dtype=np.int32)
+        self.slot_count = np.zeros(0, dtype=np.int32)
+        self.detail = np.zeros(0, dtype=np.float64)
+        self._stale_detail = False
+        self.submitted = 0        # objek yang dikirim ke GL pada draw terakhir
+
+    # ---------- sinkronisasi scene ----------
+    def add(self, obj):
+        self.dirty_objects.add(obj.index)
+
+    def invalidate(self, obj):
+        self.dirty_objects.add(obj.index)
+
+    def invalidate_indices(self, indices):
+        self.dirty_objects.update(np.asarray(indices).tolist())
+
+    def invalidate_all(self):
+        self.dirty_objects.update(range(len(self.objects)))
+
+    def set_px_per_unit(self, px_per_unit):
+        """
+        Ganti skala tesselasi (zoom kamera). Elips dibangun ulang saat
+        berikutnya terlihat, bukan semuanya sekaligus.
+        """
+        if tuple(px_per_unit) != tuple(self.px_per_unit):
+            self.px_per_unit = tuple(px_per_unit)
+            self._stale_detail = True
+
+    def _reserve(self, n):
+        cap = len(self.slot_group)
+        if n <= cap:
+            return
+        cap = max(n, 2 * cap, 1024)
+        grow = cap - len(self.slot_group)
+        self.slot_group = np.concatenate((self.slot_group, np.full(grow, -1, dtype=np.int32)))
+        self.slot_first = np.concatenate((self.slot_first, np.zeros(grow, dtype=np.int32)))
+        self.slot_count = np.concatenate((self.slot_count, np.zeros(grow, dtype=np.int32)))
+        self.detail = np.concatenate((self.detail, np.zeros(grow)))
+
+    def _refresh_detail(self, visible):
+        # elips yang ditesselasi dengan skala lama dan (akan) terlihat
+        cur = self.px_per_unit[0]
+        if visible is None:
+            stale = np.flatnonzero((self.detail != 0) & (self.detail != cur))
+            self._stale_detail = False
+        else:
+            d = self.detail[visible]
+            stale = visible[(d != 0) & (d != cur)]
+        self.dirty_objects.update(stale.tolist())
+
+    def _detach(self, i):
+        old = self.meshes.pop(i, None)
+        if old is not None:
+            del self.groups[old[0]].members[i]
+            self.dirty_groups.add(old[0])
+            self.slot_group[i] = -1
+
+    def _z(self, i):
+        # depth = (z + 1) / 2; objek belakangan lebih dekat, dibatasi di (-1, 1)
+        return max(1.0 - (i + 1) * self._z_step, -1.0 + self._z_step)
+
+    def sync(self):
+        objs, modes, locals_, params = [], [], [], []
+        total = len(self.objects)
+        self._reserve(total)
+        for i in self.dirty_objects:
+            if i >= total:
+                self._detach(i)
+                continue
+            obj = self.objects[i]
+            res = local_geometry(obj, self.px_per_unit)
+            if res is None:
+                self._detach(i)
+                continue
+            objs.append(obj)
+            modes.append(res[0])
+            locals_.append(np.asarray(res[1], dtype=np.float64))
+            params.append(res[2])
+        self.dirty_objects.clear()
+
+        if objs:
+            counts = [len(a) for a in locals_]
+            projection, modelview = self._matrices
+            mvps = object_mvps(projection, modelview, params)
+            owner = np.repeat(np.arange(len(objs)), counts)
+            xy = transform_vertices(mvps, owner, np.concatenate(locals_))
+            start = 0
+            for obj, mode, n in zip(objs, modes, counts):
+                verts = np.empty((n, 3), dtype=_f32)
+                verts[:, :2] = xy[start:start + n]
+                verts[:, 2] = self._z(obj.index)
+                start += n
+                key = (mode, tuple(obj.color), float(obj.thickness))
+                i = obj.index
+                old = self.meshes.get(i)
+                if old is not None and old[0] == key and len(old[1]) == n:
+                    # rentangnya di VBO tetap, cukup ditulis ulang
+                    self.groups[key].patched[i] = None
+                else:
+                    self._detach(i)
+                    group = self.groups.get(key)
+                    if group is None:
+                        group = self.groups[key] = self._by_id[self._next_gid] = _Group(self._next_gid, key)
+                        self._next_gid += 1
+                    group.members[i] = None
+                    group.appended.append(i)
+                self.meshes[i] = (key, verts)
+                self.patched_groups.add(key)
+                self.detail[i] = self.px_per_unit[0] if obj.obj_type == "ellipse" else 0.0
+
+        for key in self.dirty_groups | self.patched_groups:
+            group = self.groups.get(key)
+            if group is None:
+                continue
+            if not group.members:
+                if group.vbo is not None:
+                    glDeleteBuffers(1, [group.vbo])
+                del self.groups[key]
+                del self._by_id[group.id]
+                continue
+            if (
+                key in self.dirty_groups
+                or group.vbo is None
+                or PATCH_RATIO * len(group.patched) > len(group.members)
+                or not self._patch(group)
+            ):
+                self._repack(group)
+            group.patched.clear()
+            group.appended.clear()
+        self.dirty_groups.clear()
+        self.patched_groups.clear()
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+    def _patch(self, group):
+        """
+        Tulis anggota yang berubah di rentangnya sendiri dan anggota baru di
+        ujung VBO. False bila VBO tidak cukup untuk anggota baru; pemanggil
+        lalu mengemas ulang.
+        """
+        glBindBuffer(GL_ARRAY_BUFFER, group.vbo)
+        if group.appended:
+            arrays = [self.meshes[i][1] for i in group.appended]
+            counts = np.array([len(a) for a in arrays], dtype=np.int32)
+            total = int(counts.sum())
+            if group.count + total > group.capacity:
+                return False
+            data = np.ascontiguousarray(np.concatenate(arrays))
+            glBufferSubData(GL_ARRAY_BUFFER, group.count * _VERTEX_NBYTES, data.nbytes, data)
+            firsts = group.count + np.cumsum(counts) - counts
+            group.counts = np.concatenate((group.counts, counts))
+            group.firsts = np.concatenate((group.firsts, firsts)).astype(np.int32)
+            group.count += total
+            members = np.array(group.appended, dtype=np.intp)
+            self.slot_group[members] = group.id
+            self.slot_first[members] = firsts
+            self.slot_count[members] = counts
+        for i in group.patched:
+            verts = self.meshes[i][1]
+            glBufferSubData(GL_ARRAY_BUFFER, int(self.slot_first[i]) * _VERTEX_NBYTES, verts.nbytes, verts)
+        return True
+
+    def _repack(self, group):
+        """Upload ulang seluruh kelompok, anggota dirapatkan sesuai urutan members."""
+        arrays = [self.meshes[o][1] for o in group.members]
+        data = np.ascontiguousarray(np.concatenate(arrays))
+        n = len(data)
+        if group.vbo is None:
+            group.vbo = glGenBuffers(1)
+            group.capacity = 0
+        glBindBuffer(GL_ARRAY_BUFFER, group.vbo)
+        if n > group.capacity or 4 * n < group.capacity:
+            # tumbuh dua kali lipat supaya objek baru bisa ditambahkan di ujung
+            group.capacity = max(n, 2 * group.capacity) if n > group.capacity else n
+            glBufferData(GL_ARRAY_BUFFER, group.capacity * _VERTEX_NBYTES, None, GL_DYNAMIC_DRAW)
+        glBufferSubData(GL_ARRAY_BUFFER, 0, data.nbytes, data)
+        group.count = n
+        group.counts = np.array([len(a) for a in arrays], dtype=np.int32)
+        group.firsts = np.concatenate(
+            ([0], np.cumsum(group.counts)[:-1])
+        ).astype(np.int32)
+        members = np.fromiter(group.members, dtype=np.intp, count=len(group.members))
+        self.slot_group[members] = group.id
+        self.slot_first[members] = group.firsts
+        self.slot_count[members] = group.counts
+
+    # ---------- GL ----------
+    def release(self):
+        """Hapus VBO milik konteks GL yang masih aktif."""
+        for group in self.groups.values():
+            if group.vbo is not None:
+                glDeleteBuffers(1, [group.vbo])
+                group.vbo = None
+
+    def invalidate_gl(self):
+        """Konteks GL dibuat ulang: lupakan id VBO lama & upload semuanya lagi."""
+        for group in self.groups.values():
+            group.vbo = None
+        self.dirty_groups.update(self.groups)
+        self._z_step = None
+        self._matrices = None
+        self.invalidate_all()
+
+    def _check_matrices(self):
+        # verteks disimpan di clip space, jadi perubahan matriks = bangun ulang
+        if self.matrices is not None:
+            projection, modelview = (np.asarray(m, dtype=_f32) for m in self.matrices)
+        else:
+            projection = np.array(glGetFloatv(GL_PROJECTION_MATRIX), dtype=_f32).reshape(4, 4).T
+            modelview = np.array(glGetFloatv(GL_MODELVIEW_MATRIX), dtype=_f32).reshape(4, 4).T
+        if (
+            self._matrices is None
+            or not np.array_equal(self._matrices[0], projection)
+            or not np.array_equal(self._matrices[1], modelview)
+        ):
+            self._matrices = (projection, modelview)
+            self.invalidate_all()
+
+    def draw(self, view=None, visible=None):
+        """
+        ``view``: matriks (4, 4) yang dipasang di atas clip space tersimpan
+        (kamera 2D); None = identitas. ``visible``: indeks objek hasil
+        culling; None = semua. Bila lebih dari separuh objek terlihat,
+        kelompok tetap digambar utuh (satu panggilan per kelompok).
+        """
+        if self._z_step is None:
+            bits = glGetIntegerv(GL_DEPTH_BITS) or 16
+            self._z_step = 4.0 / (1 << int(bits))
+        self._check_matrices()
+        self._reserve(len(self.objects))
+        if visible is not None:
+            visible = np.asarray(visible, dtype=np.intp)
+            visible = visible[visible < len(self.slot_group)]
+        if self._stale_detail:
+            self._refresh_detail(visible)
+        if self.dirty_objects or self.dirty_groups:
+            self.sync()
+        if not self.groups:
+            self.submitted = 0
+            return
+
+        glMatrixMode(GL_PROJECTION)
+        glPushMatrix()
+        if view is None:
+            glLoadIdentity()
+        else:
+            glLoadTransposeMatrixd(np.asarray(view, dtype=np.float64))
+        glMatrixMode(GL_MODELVIEW)
+        glPushMatrix()
+        glLoadIdentity()
+        glEnable(GL_DEPTH_TEST)
+        glDepthFunc(GL_LEQUAL)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        if visible is not None and 2 * len(visible) < len(self.meshes):
+            self._draw_visible(visible)
+        else:
+            for (mode, color, thickness), group in self.groups.items():
+                glColor3fv(color)
+                glLineWidth(thickness)
+                glBindBuffer(GL_ARRAY_BUFFER, group.vbo)
+                glVertexPointer(3, GL_FLOAT, 0, None)
+                if mode == GL_LINE_LOOP:
+                    glMultiDrawArrays(mode, group.firsts, group.counts, len(group.counts))
+                else:
+                    glDrawArrays(mode, 0, group.count)
+            self.submitted = len(self.meshes)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glDepthFunc(GL_LESS)
+        glDisable(GL_DEPTH_TEST)
+        glPopMatrix()
+        glMatrixMode(GL_PROJECTION)
+        glPopMatrix()
+        glMatrixMode(GL_MODELVIEW)
+
+    def _draw_visible(self, visible):
+        # objek terlihat dikelompokkan per kelompok VBO, rentang verteksnya
+        # digambar dengan satu glMultiDrawArrays per kelompok
+        gid = self.slot_group[visible]
+        keep = gid >= 0
+        visible, gid = visible[keep], gid[keep]
+        order = np.argsort(gid, kind="stable")
+        visible, gid = visible[order], gid[order]
+        firsts = self.slot_first[visible]
+        counts = self.slot_count[visible]
+        starts = np.flatnonzero(np.diff(gid, prepend=-1)).tolist()
+        for a, b in zip(starts, starts[1:] + [len(gid)]):
+            group = self._by_id[int(gid[a])]
+            mode, color, thickness = group.key
+            glColor3fv(color)
+            glLineWidth(thickness)
+            glBindBuffer(GL_ARRAY_BUFFER, group.vbo)
+            glVertexPointer(3, GL_FLOAT, 0, None)
+            glMultiDrawArrays(mode, firsts[a:b], counts[a:b], b - a)
+        self.submitted = len(visible)
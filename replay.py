@@ -0,0 +1,126 @@
+"""
+Putar ulang rekaman input (lihat input_log.py) secepatnya tanpa display:
+driver video SDL dummy dengan konteks GL software (headless.py, EGL / Mesa
+llvmpipe). Melaporkan persentil latensi per frame dan checksum scene akhir,
+jadi sesi edit berat bisa dipakai sebagai tes regresi performa.
+
+    GRAFKOM_RECORD=sesi.gkr python TubesGrafkom.py     # rekam; tutup jendela untuk selesai
+    python replay.py sesi.gkr --json hasil.json
+    python replay.py sesi.gkr --check hasil.json       # exit 1 bila checksum berbeda
+    python replay.py sesi.gkr --capture frames/        # simpan setiap frame (capture.py)
+
+Rekaman hanya memuat event; scene awal berasal dari argumen yang sama
+(``args`` di header), jadi file scene / model yang dipakai saat merekam harus
+masih ada dan tidak berubah. Ctrl+S / Ctrl+O di dalam sesi ikut dijalankan.
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import headless  # noqa: E402  (harus sebelum OpenGL)
+
+import numpy as np  # noqa: E402
+
+import scene_file  # noqa: E402
+from input_log import Player  # noqa: E402
+
+
+def _digest(*arrays):
+    h = hashlib.sha256()
+    for a in arrays:
+        h.update(np.ascontiguousarray(a).tobytes())
+    return h.hexdigest()[:16]
+
+
+def checksums(app):
+    """Digest isi scene aplikasi: objek 2D, hasil kliping, window, scene 3D."""
+    # scene 3D dibangun saat pertama dipakai; sesi tanpa F2 tetap punya kubus bawaan
+    st, s3 = app.scene, app.setup_3d()
+    n = st.n
+    lines = np.flatnonzero((st.types[:n] == app.TYPE_CODES["line"]) & st.visible[:n] & st.alive[:n])
+    off = st.offset[lines]
+    clipped = sorted(st.clipped.items())
+    return {
+        "2d": _digest(*(getattr(st, name)[:st.nv if name == "orig" else n] for name in scene_file.COLUMNS),
+                      st.alive[:n]),
+        "clip": _digest(st.visible[:n], st.color[:n], st.disp[off], st.disp[off + 1],
+                        np.array([i for i, _ in clipped], dtype=np.int64),
+                        *(v for _, (v, _) in clipped), *(b for _, (_, b) in clipped)),
+        "window": _digest(np.asarray(app.window_state() or [], dtype=np.float64)),
+        "3d": _digest(*(getattr(s3, name)[:s3.n] for name in ("model", "translation", "rotation", "scale", "color"))),
+    }
+
+
+def replay(path, capture=None):
+    """
+    Jalankan main() dengan event dari ``path``; mengembalikan laporan (dict).
+    ``capture``: direktori PNG / file .rgba untuk setiap frame yang digambar.
+    """
+    player = Player(path)
+    head = player.header
+    headless.create_context(head["width"], head["height"])
+    import TubesGrafkom as app
+
+    if (app.WIDTH, app.HEIGHT) != (head["width"], head["height"]):
+        raise ValueError(f"{path}: direkam pada {head['width']}x{head['height']}, aplikasi {app.WIDTH}x{app.HEIGHT}")
+    app.external_gl = True
+    app.input_player = player
+    if capture:
+        app.frame_capture().start(capture)
+    app.main(*head["args"])
+
+    t = np.array(player.frame_times) * 1e3
+    return {
+        "frames": len(t),
+        "events": player.events,
+        "truncated": player.truncated,
+        "recorded_s": player.recorded_ms / 1e3,
+        "replay_s": float(t.sum()) / 1e3,
+        "latency_ms": {
+            "mean": float(t.mean()) if len(t) else 0.0,
+            **{f"p{q}": float(np.percentile(t, q)) if len(t) else 0.0 for q in (50, 90, 99)},
+            "max": float(t.max()) if len(t) else 0.0,
+        },
+        "checksums": checksums(app),
+        "captured": app.capture.frames if app.capture is not None else 0,
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Putar ulang rekaman input tanpa display.")
+    ap.add_argument("recording", help="file .gkr (GRAFKOM_RECORD)")
+    ap.add_argument("--json", metavar="PATH", help="tulis laporan sebagai JSON")
+    ap.add_argument("--check", metavar="PATH", help="bandingkan checksum dengan laporan JSON sebelumnya")
+    ap.add_argument("--capture", metavar="PATH", help="tangkap setiap frame ke direktori PNG / file .rgba")
+    args = ap.parse_args()
+
+    try:
+        report = replay(args.recording, args.capture)
+    except (OSError, ValueError) as e:
+        sys.exit(f"replay: {e}")
+    lat = report["latency_ms"]
+    print(f"rekaman  : {report['events']} event, {report['recorded_s']:.1f} s saat direkam"
+          + ("  (batch terakhir terpotong, diabaikan)" if report["truncated"] else ""))
+    print(f"replay   : {report['frames']} frame dalam {report['replay_s']:.2f} s")
+    print(f"latensi  : rata2 {lat['mean']:.2f} ms   p50 {lat['p50']:.2f}   p90 {lat['p90']:.2f}"
+          f"   p99 {lat['p99']:.2f}   maks {lat['max']:.2f} ms")
+    print("checksum : " + "  ".join(f"{k} {v}" for k, v in report["checksums"].items()))
+    if args.capture:
+        print(f"tangkapan: {report['captured']} frame -> {args.capture}")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.check:
+        with open(args.check) as f:
+            expected = json.load(f)["checksums"]
+        diff = [k for k in expected if report["checksums"].get(k) != expected[k]]
+        print(f"cocok    : {'ya' if not diff else 'TIDAK (' + ', '.join(diff) + ')'}")
+        sys.exit(1 if diff else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+"""
+Scene 3D berbentuk kolom (NumPy) dengan frustum culling dan level-of-detail.
+
+Seperti SceneStore untuk 2D: transformasi semua objek (translasi, rotasi
+derajat per sumbu, skala seragam, warna) disimpan sebagai array, sedangkan
+``Model3D`` di aplikasi hanyalah view (scene, indeks). Tiap objek memakai
+satu ``LodMesh`` (mesh + versi sederhananya, dibagi antar objek) dengan bola
+pembatas lokal. Setiap frame bola dunia semua objek dihitung sekaligus, diuji
+terhadap 6 bidang frustum dari matriks gluPerspective x gluLookAt yang sama,
+dan LOD dipilih dari radius proyeksinya dalam piksel. Hanya objek yang lolos
+yang dikirim ke GL.
+"""
+import numpy as np
+from OpenGL.GL import *
+
+from mesh import GpuMesh, decimate
+
+LOD_CELLS = (32, 10)            # grid vertex clustering untuk LOD 1, 2
+LOD_PIXELS = (96.0, 24.0)       # radius proyeksi (px) minimum untuk LOD 0, 1
+
+
+class LodMesh:
+    """
+    Mesh dengan versi sederhana yang dihitung sekali saat dibuat. Level yang
+    tidak mengurangi sisi minimal setengahnya tidak dipakai (mis. kubus).
+    """
+
+    def __init__(self, mesh, cells=LOD_CELLS):
+        levels = [mesh]
+        for c in cells:
+            m = decimate(mesh, c)
+            if 0 < m.n_faces <= levels[-1].n_faces // 2:
+                levels.append(m)
+        self.levels = levels
+        self.gpu = [GpuMesh(m) for m in levels]
+        lo, hi = mesh.bounds()
+        self.center = (lo.astype(np.float64) + hi) / 2
+        self.radius = float(np.linalg.norm(mesh.vertices - self.center, axis=1).max()) if mesh.n_vertices else 0.0
+
+    @property
+    def mesh(self):
+        return self.levels[0]
+
+    def invalidate_gl(self):
+        for g in self.gpu:
+            g.invalidate_gl()
+
+
+# ---------- matriks kamera (sama dengan GLU) ----------
+def perspective(fovy, aspect, near, far):
+    """Matriks gluPerspective (4, 4), konvensi vektor kolom."""
+    f = 1.0 / np.tan(np.radians(fovy) / 2)
+    return np.array([
+        [f / aspect, 0, 0, 0],
+        [0, f, 0, 0],
+        [0, 0, (far + near) / (near - far), 2 * far * near / (near - far)],
+        [0, 0, -1, 0],
+    ])
+
+
+def look_at(eye, target, up):
+    """Matriks gluLookAt (4, 4)."""
+    eye = np.asarray(eye, dtype=np.float64)
+    f = np.asarray(target, dtype=np.float64) - eye
+    f /= np.linalg.norm(f)
+    s = np.cross(f, up)
+    s /= np.linalg.norm(s)
+    u = np.cross(s, f)
+    m = np.eye(4)
+    m[0, :3], m[1, :3], m[2, :3] = s, u, -f
+    m[:3, 3] = -m[:3, :3] @ eye
+    return m
+
+
+def frustum_planes(clip):
+    """
+    6 bidang (a, b, c, d) frustum dari matriks proyeksi x view (Gribb &
+    Hartmann), dinormalkan: titik p di dalam bila a*x + b*y + c*z + d >= 0.
+    """
+    r = np.asarray(clip, dtype=np.float64)
+    planes = np.array([r[3] + r[0], r[3] - r[0], r[3] + r[1], r[3] - r[1], r[3] + r[2], r[3] - r[2]])
+    return planes / np.linalg.norm(planes[:, :3], axis=1, keepdims=True)
+
+
+def rotation_matrices(deg):
+    """
+    Matriks rotasi (n, 3, 3) untuk glRotatef x, lalu y, lalu z (sudut derajat
+    (n, 3)): verteks lokal p menjadi Rx @ Ry @ Rz @ p.
+    """
+    a = np.radians(np.asarray(deg, dtype=np.float64).reshape(-1, 3))
+    c, s = np.cos(a), np.sin(a)
+    n = len(a)
+    one, zero = np.ones(n), np.zeros(n)
+    rx = np.stack([one, zero, zero, zero, c[:, 0], -s[:, 0], zero, s[:, 0], c[:, 0]], 1).reshape(n, 3, 3)
+    ry = np.stack([c[:, 1], zero, s[:, 1], zero, one, zero, -s[:, 1], zero, c[:, 1]], 1).reshape(n, 3, 3)
+    rz = np.stack([c[:, 2], -s[:, 2], zero, s[:, 2], c[:, 2], zero, zero, zero, one], 1).reshape(n, 3, 3)
+    return rx @ ry @ rz
+
+
+class Scene3D:
+    def __init__(self, capacity=16):
+        self.lods: list = []            # LodMesh unik, diacu lewat kolom ``model``
+        self._lod_ids: dict = {}
+        self._alloc(capacity)
+        self.n = 0
+        self.stats = {"drawn": 0, "culled": 0, "triangles": 0}
+
+    def _alloc(self, cap):
+        old = getattr(self, "model", None)
+        n = self.n if old is not None else 0
+
+        def grow(name, shape, dtype, fill=0):
+            arr = np.full((cap, *shape), fill, dtype=dtype)
+            if old is not None:
+                arr[:n] = getattr(self, name)[:n]
+            setattr(self, name, arr)
+
+        grow("model", (), np.int32)
+        grow("translation", (3,), np.float64)
+        grow("rotation", (3,), np.float64)
+        grow("scale", (), np.float64, 1.0)
+        grow("color", (3,), np.float32)
+        grow("lod", (), np.int8)              # level yang dipakai frame terakhir
+        grow("drawn", (), bool)               # lolos culling di frame terakhir
+
+    def __len__(self):
+        return self.n
+
+    def model_id(self, lod):
+        key = id(lod)
+        if key not in self._lod_ids:
+            self._lod_ids[key] = len(self.lods)
+            self.lods.append(lod)
+        return self._lod_ids[key]
+
+    def add(self, lod, translation=(0, 0, 0), rotation=(0, 0, 0), scale=1.0, color=(0.8, 0.8, 0.8)):
+        return int(self.add_many(lod, [translation], [rotation], scale, color)[0])
+
+    def add_many(self, lod, translations, rotations=(0, 0, 0), scale=1.0, colors=(0.8, 0.8, 0.8)):
+        """Tambah banyak objek dengan LodMesh yang sama. Mengembalikan indeksnya."""
+        translations = np.asarray(translations, dtype=np.float64).reshape(-1, 3)
+        m = len(translations)
+        if self.n + m > len(self.model):
+            self._alloc(max(2 * len(self.model), self.n + m))
+        idx = np.arange(self.n, self.n + m)
+        self.model[idx] = self.model_id(lod)
+        self.translation[idx] = translations
+        self.rotation[idx] = rotations
+        self.scale[idx] = scale
+        self.color[idx] = colors
+        self.lod[idx] = 0
+        self.drawn[idx] = False
+        self.n += m
+        return idx
+
+    def clear(self):
+        self.n = 0
+
+    def invalidate_gl(self):
+        """Konteks GL dibuat ulang: semua buffer mesh diunggah ulang saat digambar."""
+        for lod in self.lods:
+            lod.invalidate_gl()
+
+    # ---------- culling & LOD ----------
+    def world_spheres(self):
+        """Pusat (n, 3) dan radius (n,) bola pembatas dunia semua objek."""
+        n = self.n
+        centers = np.array([lod.center for lod in self.lods]).reshape(-1, 3)[self.model[:n]]
+        radii = np.array([lod.radius for lod in self.lods])[self.model[:n]] if n else np.zeros(0)
+        scale = self.scale[:n]
+        rot = rotation_matrices(self.rotation[:n])
+        world = self.translation[:n] + np.einsum("nij,nj->ni", rot, centers * scale[:, None])
+        return world, radii * np.abs(scale)
+
+    def visibility(self, eye, clip, fovy, viewport_h):
+        """
+        (lolos culling (n,), level LOD (n,)) untuk kamera di ``eye`` dengan
+        matriks proyeksi x view ``clip``. Bola yang seluruhnya di luar salah
+        satu bidang frustum dibuang; LOD dari radius proyeksi dalam piksel.
+        """
+        centers, radii = self.world_spheres()
+        planes = frustum_planes(clip)
+        dist = centers @ planes[:, :3].T + planes[:, 3]
+        visible = (dist >= -radii[:, None]).all(axis=1)
+
+        depth = np.linalg.norm(centers - np.asarray(eye, dtype=np.float64), axis=1)
+        px = np.full(self.n, np.inf)
+        far = depth > radii
+        px[far] = radii[far] / (depth[far] * np.tan(np.radians(fovy) / 2)) * (viewport_h / 2)
+        level = np.zeros(self.n, dtype=np.int8)
+        for thr in LOD_PIXELS:
+            level += px < thr
+        n_levels = np.array([len(lod.levels) for lod in self.lods], dtype=np.int8)
+        return visible, np.minimum(level, n_levels[self.model[:self.n]] - 1)
+
+    # ---------- gambar ----------
+    def draw_object(self, i, level=0):
+        lod = self.lods[self.model[i]]
+        glPushMatrix()
+        glTranslatef(*self.translation[i])
+        glRotatef(self.rotation[i, 0], 1, 0, 0)
+        glRotatef(self.rotation[i, 1], 0, 1, 0)
+        glRotatef(self.rotation[i, 2], 0, 0, 1)
+        if self.scale[i] != 1.0:
+            glScalef(self.scale[i], self.scale[i], self.scale[i])
+        if lod.levels[level].colors is None:
+            glColor3f(*self.color[i])
+        lod.gpu[level].draw()
+        glPopMatrix()
+
+    def draw(self, eye, target, up, fovy, aspect, near, far, viewport_h):
+        """
+        Gambar objek yang lolos frustum culling dengan LOD-nya; kamera sama
+        dengan gluPerspective(fovy, aspect, near, far) x gluLookAt(eye,
+        target, up). Mengembalikan (dan menyimpan di ``stats``) jumlah objek
+        tergambar / terbuang dan segitiga yang dikirim.
+        """
+        n = self.n
+        if not n:
+            self.stats = {"drawn": 0, "culled": 0, "triangles": 0}
+            return self.stats
+        clip = perspective(fovy, aspect, near, far) @ look_at(eye, target, up)
+        visible, level = self.visibility(eye, clip, fovy, viewport_h)
+        self.drawn[:n] = visible
+        self.lod[:n] = level
+        tris = 0
+        for i in np.flatnonzero(visible).tolist():
+            k = int(level[i])
+            self.draw_object(i, k)
+            tris += self.lods[self.model[i]].levels[k].n_faces
+        drawn = int(visible.sum())
+        self.stats = {"drawn": drawn, "culled": n - drawn, "triangles": tris}
+        return self.stats
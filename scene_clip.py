@@ -0,0 +1,98 @@
+"""
+Kliping isi SceneStore terhadap window, tanpa pygame / OpenGL.
+
+Dipakai ``clip_objects`` di aplikasi (store = scene, per potongan lewat
+parallel.py) dan pipeline headless ``clip_stream.py`` (store = satu potongan
+input). Setiap fungsi hanya menulis baris objek yang diberikan.
+"""
+import numpy as np
+
+from clipping import (
+    CROSSING,
+    FULLY_INSIDE,
+    OUTSIDE,
+    classify_bboxes,
+    clip_polygons,
+    cohen_sutherland_clip_batch,
+)
+from scene_store import TYPE_CODES
+from tessellation import shape_outlines
+
+INSIDE_COLOR = (0, 1, 0)        # warna objek yang seluruhnya di dalam window
+
+
+def pack(store):
+    """
+    Indeks garis / bentuk lain yang belum dihapus beserta geometri asli yang
+    dipakai kliping: segmen & bbox garis, bbox dunia bentuk.
+    """
+    n = store.n
+    is_line = store.types[:n] == TYPE_CODES["line"]
+    alive = store.alive[:n]                 # objek terhapus tidak ikut diklip
+    lines = np.flatnonzero(is_line & alive)
+    shapes = np.flatnonzero(~is_line & alive)       # point, square, ellipse, polygon
+    off = store.offset[lines]
+    seg = np.column_stack((store.orig[off], store.orig[off + 1]))
+    line_bbox = (
+        np.minimum(seg[:, 0], seg[:, 2]), np.minimum(seg[:, 1], seg[:, 3]),
+        np.maximum(seg[:, 0], seg[:, 2]), np.maximum(seg[:, 1], seg[:, 3]),
+    )
+    bbox = store.world_bboxes(shapes) if len(shapes) else None
+    return dict(lines=lines, shapes=shapes, seg=seg, line_bbox=line_bbox, bbox=bbox)
+
+
+def clip_lines(store, pack, sel, bounds):
+    """
+    Cohen–Sutherland untuk garis pack["lines"][sel]: titik tampil, visible dan
+    warna ditulis ke store. Mengembalikan klasifikasi bbox-nya.
+    """
+    green = np.array(INSIDE_COLOR, dtype=np.float32)
+    lines = pack["lines"][sel]
+    seg = pack["seg"][sel]
+    visible, x0, y0, x1, y1 = cohen_sutherland_clip_batch(
+        seg[:, 0], seg[:, 1], seg[:, 2], seg[:, 3], *bounds
+    )
+    cls = classify_bboxes(*(a[sel] for a in pack["line_bbox"]), *bounds)
+    off = store.offset[lines[visible]]
+    store.disp[off] = np.column_stack((x0, y0))[visible]
+    store.disp[off + 1] = np.column_stack((x1, y1))[visible]
+    store.visible[lines] = visible
+    store.color[lines] = np.where(
+        (cls == FULLY_INSIDE)[:, None], green, store.orig_color[lines]
+    )
+    return cls
+
+
+def clip_shapes(store, pack, sel, bounds, px_per_unit):
+    """
+    Bentuk non-garis pack["shapes"][sel], diklasifikasi dari bbox dunianya;
+    visible & warna ditulis ke store. Yang memotong tepi window diklip secara
+    geometris (Sutherland–Hodgman batch). Mengembalikan ``(cls, idx, clipped)``:
+    ``idx`` bentuk yang memotong tepi, ``clipped`` daftar ``(i, (verts,
+    boundary))`` untuk ``store.clipped`` (tidak ditulis di sini supaya aman
+    dipanggil dari beberapa thread).
+    """
+    green = np.array(INSIDE_COLOR, dtype=np.float32)
+    shapes = pack["shapes"][sel]
+    cls = classify_bboxes(*(a[sel] for a in pack["bbox"]), *bounds)
+    visible = cls != OUTSIDE
+    store.color[shapes] = np.where(
+        (cls == FULLY_INSIDE)[:, None], green, store.orig_color[shapes]
+    )
+    crossing = np.flatnonzero(cls == CROSSING)
+    idx = shapes[crossing]
+    clipped = []
+    if len(crossing):
+        verts, counts = shape_outlines(store, idx, px_per_unit)
+        verts, counts, boundary = clip_polygons(verts, counts, *bounds)
+        owner = np.repeat(np.arange(len(idx)), counts)
+        # tanpa satu pun sisi asli di dalam window = tidak ada yang digambar
+        drawn = np.bincount(owner, weights=~boundary, minlength=len(idx)) > 0
+        visible[crossing] = drawn
+        ends = np.cumsum(counts)
+        clipped = [
+            (i, (verts[a:b], boundary[a:b]))
+            for i, a, b in zip(idx[drawn].tolist(), (ends - counts)[drawn].tolist(), ends[drawn].tolist())
+        ]
+    store.visible[shapes] = visible
+    return cls, idx, clipped
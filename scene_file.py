@@ -0,0 +1,380 @@
+"""
+Simpan / buka scene 2D: format biner ``.gks`` (dibuka lewat ``numpy.memmap``)
+dan JSON / JSONL untuk pertukaran data. ``iter_chunks`` membaca keduanya per
+potongan untuk pipeline yang memorinya dibatasi (clip_stream.py).
+
+Tata letak file ``.gks`` (little-endian)::
+
+    MAGIC (8 byte) | versi u32 | panjang header u32 | header JSON (utf-8)
+    | data: satu blok per kolom, tiap blok rata 64 byte
+
+Header JSON: ``n`` (objek), ``nv`` (verteks), ``window`` (window kliping
+``[[x1, y1], [x2, y2]]`` atau null), ``types`` (jumlah objek per tipe) dan
+``columns``: nama -> ``{"dtype", "shape", "offset"}`` dengan offset relatif
+terhadap awal data. Kolomnya sama dengan kolom ``SceneStore``: tipe, jumlah &
+offset verteks, koordinat asli (nv, 2) berurutan sesuai scene, warna,
+ketebalan, translasi, rotasi dan skala. Koordinat sengaja tidak dipecah per
+tipe supaya bloknya bisa langsung menjadi ``SceneStore.orig`` tanpa disalin.
+
+``load`` memetakan setiap blok dengan mode copy-on-write: membuka file jutaan
+objek hampir instan, hanya halaman yang disentuh yang dibaca dari disk (saat
+dibuka hanya kolom indeks: tipe, jumlah & offset, untuk diperiksa), dan
+perubahan scene tidak pernah menulis ke file. Objek yang dihapus (tombstone
+undo) tidak ikut disimpan.
+"""
+import json
+import os
+import struct
+import sys
+
+import numpy as np
+
+from scene_store import TYPE_CODES, TYPE_NAMES
+
+MAGIC = b"GKSCENE\0"
+VERSION = 1
+ALIGN = 64
+_PREFIX = struct.Struct("<8sII")
+
+# kolom yang disimpan -> dtype di file
+COLUMNS = {
+    "types": "<u1",
+    "count": "<i4",
+    "offset": "<i8",
+    "orig": "<f8",
+    "orig_color": "<f4",
+    "thickness": "<f4",
+    "translation": "<f8",
+    "rotation": "<f8",
+    "scale": "<f8",
+}
+
+# jumlah titik yang sah per tipe: (minimum, maksimum; None = tanpa batas)
+POINT_COUNTS = {
+    "point": (1, None),
+    "line": (2, 2),
+    "square": (2, 2),
+    "ellipse": (2, 2),     # pusat, radius
+    "polygon": (3, None),
+}
+_MIN_POINTS = np.array([POINT_COUNTS[t][0] for t in TYPE_NAMES])
+_MAX_POINTS = np.array([POINT_COUNTS[t][1] or np.iinfo(np.int64).max for t in TYPE_NAMES])
+
+
+def _check_counts(types, count, position):
+    """ValueError untuk objek pertama yang jumlah titiknya tidak sah bagi tipenya."""
+    bad = np.flatnonzero((count < _MIN_POINTS[types]) | (count > _MAX_POINTS[types]))
+    if not len(bad):
+        return
+    k = int(bad[0])
+    name = TYPE_NAMES[types[k]]
+    lo, hi = POINT_COUNTS[name]
+    need = lo if lo == hi else f"minimal {lo}"
+    raise ValueError(f"{position(k)}: {name} harus punya {need} titik, bukan {int(count[k])}")
+
+
+def _check_index(cols, n, nv, where, first=0):
+    """
+    Kolom indeks (tipe, jumlah & offset verteks) file ``.gks``: tipe harus
+    dikenal dan titik setiap objek berada di dalam ``nv`` verteks ``orig``;
+    ValueError bila tidak, supaya file rusak gagal saat dibuka, bukan saat
+    digambar.
+    ``first`` = indeks objek pertama ``cols`` di file (untuk pesan galat).
+    """
+    types, count, offset = cols["types"], cols["count"], cols["offset"]
+    if not len(types) == len(count) == len(offset) == n:
+        raise ValueError(f"{where}: panjang kolom tidak cocok dengan n={n}")
+    bad = np.flatnonzero(types >= len(TYPE_NAMES))
+    if len(bad):
+        k = bad[0]
+        raise ValueError(f"{where}: objek ke-{first + k}: kode tipe {types[k]} tidak dikenal")
+    bad = np.flatnonzero((offset < 0) | (offset + count > nv))
+    if len(bad):
+        k = bad[0]
+        raise ValueError(f"{where}: objek ke-{first + k}: verteks di luar kolom orig")
+    _check_counts(types, count, lambda k: f"{where}: objek ke-{first + k}")
+
+
+def _align(pos):
+    return -(-pos // ALIGN) * ALIGN
+
+
+def _columns(store):
+    """Kolom yang disimpan, hanya objek yang belum dihapus (view bila tidak ada yang dihapus)."""
+    n, nv = store.n, store.nv
+    if store.alive[:n].all():
+        cols = {name: getattr(store, name)[:nv if name == "orig" else n] for name in COLUMNS}
+        return cols, n, nv
+    idx = np.flatnonzero(store.alive[:n])
+    rows, _ = store.vertex_rows(idx)
+    cols = {name: getattr(store, name)[idx] for name in COLUMNS if name != "orig"}
+    cols["orig"] = store.orig[rows]
+    cols["offset"] = np.cumsum(cols["count"], dtype=np.int64) - cols["count"]
+    return cols, len(idx), len(rows)
+
+
+def _window(window):
+    return None if window is None else [[float(x), float(y)] for x, y in window]
+
+
+def _read_window(window, where):
+    """Window dari header file -> ((x1, y1), (x2, y2)) atau None; ValueError bila bentuknya salah."""
+    if window is None:
+        return None
+    try:
+        (x1, y1), (x2, y2) = window
+        return (float(x1), float(y1)), (float(x2), float(y2))
+    except (TypeError, ValueError):
+        raise ValueError(f"{where}: window harus [[x1, y1], [x2, y2]]") from None
+
+
+def save(path, store, window=None):
+    """
+    Tulis scene ke file ``.gks``. ``window`` = ((x1, y1), (x2, y2)) atau None.
+    File ditulis ke nama sementara lalu diganti sekaligus, jadi file yang
+    sedang di-memmap (scene hasil ``load``) aman ditimpa.
+    """
+    cols, n, nv = _columns(store)
+    table, pos = {}, 0
+    for name, dtype in COLUMNS.items():
+        arr = cols[name]
+        table[name] = {"dtype": dtype, "shape": list(arr.shape), "offset": pos}
+        pos = _align(pos + arr.size * np.dtype(dtype).itemsize)
+    types = np.bincount(cols["types"], minlength=len(TYPE_NAMES))
+    header = json.dumps({
+        "n": n,
+        "nv": nv,
+        "window": _window(window),
+        "types": {name: int(k) for name, k in zip(TYPE_NAMES, types)},
+        "columns": table,
+    }).encode()
+    base = _align(_PREFIX.size + len(header))
+
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(_PREFIX.pack(MAGIC, VERSION, len(header)))
+        f.write(header)
+        for name, dtype in COLUMNS.items():
+            f.seek(base + table[name]["offset"])
+            np.ascontiguousarray(cols[name], dtype=dtype).tofile(f)
+        f.truncate(base + pos)
+    os.replace(tmp, path)
+
+
+def read_header(path):
+    """Header file ``.gks`` dan posisi awal data; ValueError bila bukan file scene."""
+    with open(path, "rb") as f:
+        prefix = f.read(_PREFIX.size)
+        if len(prefix) < _PREFIX.size:
+            raise ValueError(f"{path}: bukan file scene")
+        magic, version, size = _PREFIX.unpack(prefix)
+        if magic != MAGIC:
+            raise ValueError(f"{path}: bukan file scene")
+        if version > VERSION:
+            raise ValueError(f"{path}: versi format {version} belum didukung (maks {VERSION})")
+        header = json.loads(f.read(size))
+    if not isinstance(header, dict) or not isinstance(header.get("columns"), dict):
+        raise ValueError(f"{path}: header scene rusak")
+    return header, _align(_PREFIX.size + size)
+
+
+def _column_specs(header, path):
+    """Tabel kolom header ``.gks``; ValueError bila ada kolom yang tidak ada."""
+    columns = header["columns"]
+    missing = set(COLUMNS) - set(columns)
+    if missing:
+        raise ValueError(f"{path}: kolom {', '.join(sorted(missing))} tidak ada")
+    return columns
+
+
+def _block(path, base, spec, mmap):
+    shape = tuple(spec["shape"])
+    offset = base + spec["offset"]
+    if mmap and 0 not in shape:
+        # view ndarray biasa; pemetaannya tetap hidup lewat .base
+        arr = np.memmap(path, dtype=spec["dtype"], mode="c", offset=offset, shape=shape).view(np.ndarray)
+    else:
+        arr = np.fromfile(path, dtype=spec["dtype"], count=int(np.prod(shape)), offset=offset).reshape(shape)
+    native = np.dtype(spec["dtype"]).newbyteorder("=")
+    return arr if arr.dtype == native else arr.astype(native)
+
+
+def load(path, store, mmap=True):
+    """
+    Isi ``store`` (harus kosong) dari file ``.gks``; mengembalikan window
+    kliping ((x1, y1), (x2, y2)) atau None. ``mmap=False`` membaca semuanya
+    ke memori.
+    """
+    header, base = read_header(path)
+    columns = _column_specs(header, path)
+    window = _read_window(header.get("window"), path)
+    try:
+        cols = {name: _block(path, base, columns[name], mmap) for name in COLUMNS}
+        # geometri & warna tampil: pemetaan kedua atas blok yang sama (copy-on-write terpisah)
+        for name, source in (("disp", "orig"), ("color", "orig_color")):
+            cols[name] = _block(path, base, columns[source], mmap) if mmap else cols[source].copy()
+        n, nv = int(header["n"]), int(header["nv"])
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"{path}: header scene rusak ({e!r})") from None
+    _check_index(cols, n, nv, path)
+    store.adopt(n, nv, cols)
+    return window
+
+
+def _object_dicts(cols, n):
+    """Objek sebagai dict JSON (format export_json), berurutan."""
+    pts = cols["orig"].tolist()
+    lists = {name: cols[name].tolist() for name in COLUMNS if name != "orig"}
+    for i in range(n):
+        start = lists["offset"][i]
+        yield {
+            "type": TYPE_NAMES[lists["types"][i]],
+            "points": pts[start:start + lists["count"][i]],
+            "color": lists["orig_color"][i],
+            "thickness": lists["thickness"][i],
+            "translation": lists["translation"][i],
+            "rotation": lists["rotation"][i],
+            "scale": lists["scale"][i],
+        }
+
+
+def _header(window):
+    return {"format": "grafkom-scene", "version": VERSION, "window": _window(window)}
+
+
+def export_json(path, store, window=None):
+    """Tulis scene sebagai JSON (satu entri per objek) untuk pertukaran data."""
+    cols, n, _ = _columns(store)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({**_header(window), "objects": list(_object_dicts(cols, n))}, f)
+
+
+def export_jsonl(path, store, window=None):
+    """Seperti export_json, tetapi satu baris header lalu satu baris per objek (bisa di-stream)."""
+    cols, n, _ = _columns(store)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(json.dumps(_header(window)) + "\n")
+        for obj in _object_dicts(cols, n):
+            f.write(json.dumps(obj) + "\n")
+
+
+def _object_columns(objects, where, lines=None):
+    """
+    Kolom store dari daftar dict objek JSON. Field yang hilang, salah tipe /
+    bentuk, atau jumlah titik yang tidak cocok dengan tipenya menjadi
+    ValueError (dengan posisi objeknya), bukan KeyError / TypeError.
+    ``lines`` = nomor baris tiap objek di file JSONL.
+    """
+    def position(k):
+        return f"{where}:{lines[k]}" if lines is not None else f"{where}: objek ke-{k}"
+
+    if not isinstance(objects, list):
+        raise ValueError(f"{where}: objects harus berupa list")
+    for k, o in enumerate(objects):
+        if not isinstance(o, dict) or "type" not in o or "points" not in o:
+            raise ValueError(f"{position(k)}: objek tidak punya field type / points")
+        if not isinstance(o["type"], str) or o["type"] not in TYPE_CODES:
+            raise ValueError(f"{position(k)}: tipe objek {o['type']!r} tidak dikenal")
+        if not isinstance(o["points"], list):
+            raise ValueError(f"{position(k)}: points harus berupa list")
+    n = len(objects)
+    types = np.array([TYPE_CODES[o["type"]] for o in objects], dtype=np.uint8)
+    count = np.array([len(o["points"]) for o in objects], dtype=np.int32)
+    _check_counts(types, count, position)
+
+    def column(name, default, dtype, shape=()):
+        return np.array([o.get(name, default) for o in objects], dtype=dtype).reshape(n, *shape)
+
+    try:
+        orig = np.array([p for o in objects for p in o["points"]], dtype=np.float64)
+        return {
+            "types": types,
+            "count": count,
+            "offset": np.cumsum(count, dtype=np.int64) - count,
+            "orig": orig.reshape(int(count.sum()), 2),
+            "orig_color": column("color", (1, 1, 1), np.float32, (3,)),
+            "thickness": column("thickness", 1.0, np.float32),
+            "translation": column("translation", (0, 0), np.float64, (2,)),
+            "rotation": column("rotation", 0.0, np.float64),
+            "scale": column("scale", (1, 1), np.float64, (2,)),
+        }
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"{where}: field objek tidak valid ({e})") from None
+
+
+def import_json(path, store):
+    """Isi ``store`` (harus kosong) dari JSON ``export_json``; mengembalikan window kliping."""
+    with open(path, encoding="utf-8") as f:
+        doc = json.load(f)
+    if not isinstance(doc, dict) or doc.get("format") != "grafkom-scene":
+        raise ValueError(f"{path}: bukan scene JSON")
+    cols = _object_columns(doc.get("objects"), path)
+    window = _read_window(doc.get("window"), path)
+    store.adopt(len(cols["types"]), len(cols["orig"]), cols)
+    return window
+
+
+def iter_chunks(path, size):
+    """
+    Baca scene per potongan ``size`` objek tanpa memuat seluruh file: ``.gks``
+    per rentang baris kolom, selain itu JSONL (``export_jsonl``) baris demi
+    baris; ``"-"`` = stdin. Menghasilkan ``(window, n, nv, kolom)`` dengan
+    kolom seperti ``SceneStore.adopt``; window dari header file (atau None).
+    """
+    if path.endswith(".gks"):
+        yield from _gks_chunks(path, size)
+        return
+    f = sys.stdin if path == "-" else open(path, encoding="utf-8")
+    try:
+        window, batch, lines = None, [], []
+        for k, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            obj = json.loads(line)
+            if not isinstance(obj, dict):
+                raise ValueError(f"{path}:{k}: baris bukan objek JSON")
+            if "type" not in obj:
+                # baris header (format / window) boleh muncul sebelum objek
+                if obj.get("window") is not None:
+                    window = _read_window(obj["window"], f"{path}:{k}")
+                continue
+            batch.append(obj)
+            lines.append(k)
+            if len(batch) == size:
+                cols = _object_columns(batch, path, lines)
+                yield window, len(batch), len(cols["orig"]), cols
+                batch, lines = [], []
+        if batch:
+            cols = _object_columns(batch, path, lines)
+            yield window, len(batch), len(cols["orig"]), cols
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+def _gks_chunks(path, size):
+    header, base = read_header(path)
+    window = _read_window(header.get("window"), path)
+    columns = _column_specs(header, path)
+    try:
+        n, nv = int(header["n"]), int(header["nv"])
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"{path}: header scene rusak ({e!r})") from None
+
+    def rows(f, spec, a, b):
+        dtype = np.dtype(spec["dtype"])
+        width = int(np.prod(spec["shape"][1:], dtype=np.int64))
+        f.seek(base + spec["offset"] + a * width * dtype.itemsize)
+        arr = np.fromfile(f, dtype=dtype, count=(b - a) * width)
+        return arr.reshape(b - a, *spec["shape"][1:]).astype(dtype.newbyteorder("="), copy=False)
+
+    with open(path, "rb") as f:
+        for a in range(0, n, size):
+            b = min(a + size, n)
+            cols = {name: rows(f, columns[name], a, b) for name in COLUMNS if name != "orig"}
+            _check_index(cols, b - a, nv, path, first=a)
+            lo = int(cols["offset"].min())
+            hi = int((cols["offset"] + cols["count"]).max())
+            cols["orig"] = rows(f, columns["orig"], lo, hi)
+            cols["offset"] = cols["offset"] - lo
+            yield window, b - a, hi - lo, cols
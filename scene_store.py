@@ -0,0 +1,529 @@
+"""
+Penyimpanan scene 2D berbentuk kolom (NumPy).
+
+Semua koordinat objek disimpan berurutan di satu buffer (N, 2) dengan offset &
+jumlah titik per objek; atribut lain (tipe, warna, ketebalan, transformasi,
+status tampil) juga berupa array. ``Object2D`` hanyalah view (indeks) ke store
+ini, dan objek maupun titik-titiknya (``PointList`` / ``PointView``) dibuat
+saat dibaca saja, jadi menambah atau mengklip objek tidak membuat objek Python
+per objek ataupun per verteks.
+
+Ada dua buffer koordinat dengan tata letak yang sama:
+``orig`` (geometri asli) dan ``disp`` (geometri tampil, misalnya hasil kliping).
+
+Transformasi tiap objek (translasi, rotasi, skala) juga di-cache sebagai
+matriks affine 3x3 titik asli ➜ dunia, inversnya, dan bbox dunianya. Cache
+baris yang ditandai ``invalidate_transform`` dihitung ulang sekaligus
+(NumPy) saat pertama kali dibaca lagi.
+"""
+import numpy as np
+
+from clipping import segment_bboxes
+
+TYPE_NAMES = ("point", "line", "square", "ellipse", "polygon")
+TYPE_CODES = {name: i for i, name in enumerate(TYPE_NAMES)}
+
+# kolom per objek: nama -> (bentuk per baris, dtype, nilai awal)
+_OBJECT_COLUMNS = {
+    "offset": ((), np.int64, 0),
+    "count": ((), np.int32, 0),
+    "types": ((), np.uint8, 0),
+    "alive": ((), bool, True),                  # False = dihapus (bisa di-undo)
+    "visible": ((), bool, True),
+    "color": ((3,), np.float32, 0),
+    "orig_color": ((3,), np.float32, 0),
+    "thickness": ((), np.float32, 0),
+    "translation": ((2,), np.float64, 0),
+    "rotation": ((), np.float64, 0),
+    "scale": ((2,), np.float64, 1.0),
+    "affine": ((3, 3), np.float64, 0),          # titik asli ➜ dunia
+    "affine_inv": ((3, 3), np.float64, 0),      # dunia ➜ titik asli
+    "world_bbox": ((4,), np.float64, 0),        # xmin, ymin, xmax, ymax
+    "xform_dirty": ((), bool, True),            # cache di atas basi
+}
+
+
+class PointView:
+    """Satu titik di buffer store; antarmuka sama dengan Point2D (x, y)."""
+
+    __slots__ = ("_store", "_disp", "_row")
+
+    def __init__(self, store, disp, row):
+        self._store = store
+        self._disp = disp
+        self._row = row
+
+    # buffer diambil ulang setiap akses karena store bisa realokasi saat tumbuh
+    @property
+    def x(self):
+        st = self._store
+        return float((st.disp if self._disp else st.orig)[self._row, 0])
+
+    @x.setter
+    def x(self, value):
+        st = self._store
+        (st.disp if self._disp else st.orig)[self._row, 0] = value
+
+    @property
+    def y(self):
+        st = self._store
+        return float((st.disp if self._disp else st.orig)[self._row, 1])
+
+    @y.setter
+    def y(self, value):
+        st = self._store
+        (st.disp if self._disp else st.orig)[self._row, 1] = value
+
+
+class PointList:
+    """View list titik milik satu objek (orig atau disp)."""
+
+    __slots__ = ("_store", "_disp", "_start", "_count")
+
+    def __init__(self, store, disp, start, count):
+        self._store = store
+        self._disp = disp
+        self._start = start
+        self._count = count
+
+    def __len__(self):
+        return self._count
+
+    def __bool__(self):
+        return self._count > 0
+
+    def _row(self, k):
+        if k < 0:
+            k += self._count
+        if not 0 <= k < self._count:
+            raise IndexError("indeks titik di luar jangkauan")
+        return self._start + k
+
+    def __getitem__(self, k):
+        return PointView(self._store, self._disp, self._row(k))
+
+    def __setitem__(self, k, p):
+        buf = self._store.disp if self._disp else self._store.orig
+        buf[self._row(k)] = (p.x, p.y)
+
+    def __iter__(self):
+        for k in range(self._count):
+            yield PointView(self._store, self._disp, self._start + k)
+
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    def __radd__(self, other):
+        return list(other) + list(self)
+
+    def array(self):
+        """View NumPy (N, 2) atas koordinatnya (bukan salinan)."""
+        buf = self._store.disp if self._disp else self._store.orig
+        return buf[self._start:self._start + self._count]
+
+
+class ObjectList:
+    """
+    Urutan objek scene sebagai view yang dibuat saat diakses, jadi scene
+    tidak menyimpan satu objek Python per objek. View dengan indeks sama
+    dianggap sama (``==`` / hash), sehingga aman dipakai sebagai kunci dict.
+    """
+
+    __slots__ = ("_store",)
+
+    def __init__(self, store):
+        self._store = store
+
+    def __len__(self):
+        return self._store.n
+
+    def __bool__(self):
+        return self._store.n > 0
+
+    def __getitem__(self, i):
+        n = self._store.n
+        if isinstance(i, slice):
+            return [self[k] for k in range(*i.indices(n))]
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("indeks objek di luar jangkauan")
+        return self._store.view_factory(self._store, i)
+
+    def __iter__(self):
+        store = self._store
+        make = store.view_factory
+        for i in range(store.n):
+            yield make(store, i)
+
+    def __reversed__(self):
+        store = self._store
+        make = store.view_factory
+        for i in range(store.n - 1, -1, -1):
+            yield make(store, i)
+
+    def clear(self):
+        self._store.clear()
+
+
+class SceneStore:
+    def __init__(self, capacity=1024, vertex_capacity=4096, view_factory=None):
+        # view_factory(store, i) membuat view (Object2D) untuk baris ke-i
+        self.view_factory = view_factory
+        self.objects = ObjectList(self)
+        self.tess_cache: dict = {}   # indeks -> cache tesselasi elips
+        # indeks -> (verts dunia, flag sisi tepi window) bentuk yang terpotong
+        self.clipped: dict = {}
+        self._capacity = (capacity, vertex_capacity)
+        self._alloc_objects(capacity)
+        self._alloc_vertices(vertex_capacity)
+        self.n = 0
+        self.nv = 0
+
+    # ---------- alokasi ----------
+    def _alloc_objects(self, cap):
+        old = getattr(self, "types", None)
+        n = self.n if old is not None else 0
+
+        for name, (shape, dtype, fill) in _OBJECT_COLUMNS.items():
+            arr = np.full((cap, *shape), fill, dtype=dtype)
+            if old is not None:
+                arr[:n] = getattr(self, name)[:n]
+            setattr(self, name, arr)
+
+    def _alloc_vertices(self, cap):
+        nv = getattr(self, "nv", 0)
+        for name in ("orig", "disp"):
+            arr = np.zeros((cap, 2), dtype=np.float64)
+            old = getattr(self, name, None)
+            if old is not None:
+                arr[:nv] = old[:nv]
+            setattr(self, name, arr)
+
+    def clear(self):
+        """Kosongkan scene; kapasitas buffer dipertahankan."""
+        self.tess_cache.clear()
+        self.clipped.clear()
+        self.n = 0
+        self.nv = 0
+        self.scale[:] = 1.0
+        self.translation[:] = 0.0
+        self.rotation[:] = 0.0
+
+    def __len__(self):
+        return self.n
+
+    # ---------- objek ----------
+    def add(self, obj_type, coords, color, thickness):
+        coords = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+        k = len(coords)
+        if self.n == len(self.types):
+            self._alloc_objects(2 * len(self.types))
+        if self.nv + k > len(self.orig):
+            self._alloc_vertices(max(2 * len(self.orig), self.nv + k))
+
+        i, v = self.n, self.nv
+        self.offset[i] = v
+        self.count[i] = k
+        self.types[i] = TYPE_CODES[obj_type]
+        self.alive[i] = True
+        self.visible[i] = True
+        self.color[i] = color
+        self.orig_color[i] = color
+        self.thickness[i] = thickness
+        self.translation[i] = 0.0
+        self.rotation[i] = 0.0
+        self.scale[i] = 1.0
+        self.xform_dirty[i] = True
+        self.orig[v:v + k] = coords
+        self.disp[v:v + k] = coords
+        self.n += 1
+        self.nv += k
+        return i
+
+    def add_many(self, obj_type, coords, colors, thickness=1.0):
+        """
+        Tambah banyak objek bertipe sama sekaligus. ``coords`` (m, k, 2);
+        ``colors`` (3,) atau (m, 3). Mengembalikan indeks objek baru.
+        """
+        coords = np.asarray(coords, dtype=np.float64)
+        m, k = coords.shape[:2]
+        if self.n + m > len(self.types):
+            self._alloc_objects(max(2 * len(self.types), self.n + m))
+        if self.nv + m * k > len(self.orig):
+            self._alloc_vertices(max(2 * len(self.orig), self.nv + m * k))
+
+        idx = np.arange(self.n, self.n + m)
+        v0 = self.nv
+        self.offset[idx] = v0 + k * np.arange(m)
+        self.count[idx] = k
+        self.types[idx] = TYPE_CODES[obj_type]
+        self.alive[idx] = True
+        self.visible[idx] = True
+        self.color[idx] = colors
+        self.orig_color[idx] = colors
+        self.thickness[idx] = thickness
+        self.translation[idx] = 0.0
+        self.rotation[idx] = 0.0
+        self.scale[idx] = 1.0
+        self.xform_dirty[idx] = True
+        self.orig[v0:v0 + m * k] = coords.reshape(-1, 2)
+        self.disp[v0:v0 + m * k] = coords.reshape(-1, 2)
+        self.n += m
+        self.nv += m * k
+        return idx
+
+    def points(self, i):
+        if not self.visible[i]:
+            return []
+        return PointList(self, True, int(self.offset[i]), int(self.count[i]))
+
+    def original_points(self, i):
+        return PointList(self, False, int(self.offset[i]), int(self.count[i]))
+
+    def set_points(self, i, pts):
+        """
+        Ganti titik tampil: kosong = objek disembunyikan (hasil kliping),
+        selain itu jumlah titiknya harus sama dengan geometri asli.
+        """
+        if not pts:
+            self.visible[i] = False
+            return
+        start, k = int(self.offset[i]), int(self.count[i])
+        if len(pts) != k:
+            raise ValueError(f"objek {i} punya {k} titik, bukan {len(pts)}")
+        if isinstance(pts, PointList):
+            self.disp[start:start + k] = pts.array()
+        else:
+            self.disp[start:start + k] = [(p.x, p.y) for p in pts]
+        self.visible[i] = True
+
+    def reset_display(self):
+        """Geometri tampil = geometri asli, semua yang belum dihapus tampil, warna asli."""
+        self.clipped.clear()
+        self.disp[:self.nv] = self.orig[:self.nv]
+        self.visible[:self.n] = self.alive[:self.n]
+        self.color[:self.n] = self.orig_color[:self.n]
+
+    # ---------- undo (lihat history.py) ----------
+    def truncate(self, n):
+        """Buang objek [n, self.n) dari akhir scene."""
+        if not 0 <= n <= self.n:
+            raise ValueError(f"tidak bisa memotong {self.n} objek menjadi {n}")
+        for cache in (self.tess_cache, self.clipped):
+            for i in [i for i in cache if i >= n]:
+                del cache[i]
+        self.n = n
+        self.nv = int(self.offset[n - 1] + self.count[n - 1]) if n else 0
+
+    def copy_row(self, i):
+        """Salinan semua kolom & titik objek i, untuk dipasang lagi dengan ``restore_row``."""
+        start, k = int(self.offset[i]), int(self.count[i])
+        row = {name: getattr(self, name)[i].copy() for name in _OBJECT_COLUMNS}
+        row["orig"] = self.orig[start:start + k].copy()
+        row["disp"] = self.disp[start:start + k].copy()
+        return row
+
+    def restore_row(self, i, row):
+        """
+        Pasang kembali salinan ``copy_row`` sebagai objek terakhir (i harus
+        sama dengan ``self.n``). Tidak bergantung pada isi buffer lama, yang
+        bisa sudah ditimpa atau dilepas ``detach``.
+        """
+        if i != self.n:
+            raise ValueError(f"objek {i} hanya bisa dikembalikan di akhir scene ({self.n} objek)")
+        k = len(row["orig"])
+        if self.n == len(self.types):
+            self._alloc_objects(2 * len(self.types))
+        if self.nv + k > len(self.orig):
+            self._alloc_vertices(max(2 * len(self.orig), self.nv + k))
+        for name in _OBJECT_COLUMNS:
+            getattr(self, name)[i] = row[name]
+        v = self.nv
+        self.offset[i] = v
+        self.xform_dirty[i] = True
+        self.orig[v:v + k] = row["orig"]
+        self.disp[v:v + k] = row["disp"]
+        self.n += 1
+        self.nv += k
+
+    def detach(self):
+        """
+        Lepaskan seluruh isi scene (buffer itu sendiri, bukan salinan) lalu
+        kosongkan store dengan buffer baru berkapasitas awal. ``attach``
+        memasang kembali hasilnya, jadi "clear" bisa di-undo tanpa menyalin.
+        """
+        state = {name: getattr(self, name) for name in (*_OBJECT_COLUMNS, "orig", "disp")}
+        state.update(n=self.n, nv=self.nv, tess_cache=self.tess_cache, clipped=self.clipped)
+        self.tess_cache, self.clipped = {}, {}
+        self.n = self.nv = 0
+        self._alloc_objects(self._capacity[0])
+        self._alloc_vertices(self._capacity[1])
+        return state
+
+    def attach(self, state):
+        """Pasang kembali isi hasil ``detach``; store harus kosong."""
+        if self.n:
+            raise ValueError("attach hanya untuk store kosong")
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    @staticmethod
+    def state_nbytes(state):
+        return sum(v.nbytes for v in state.values() if isinstance(v, np.ndarray))
+
+    def adopt(self, n, nv, columns):
+        """
+        Jadikan array dari luar (mis. np.memmap file scene, lihat scene_file.py)
+        isi store tanpa disalin. ``columns`` wajib memuat ``orig`` (nv, 2);
+        kolom lain yang tidak ada dibuat dengan nilai awalnya, ``color`` dari
+        ``orig_color`` dan ``disp`` dari ``orig``. Store harus kosong.
+        """
+        if self.n:
+            raise ValueError("adopt hanya untuk store kosong")
+        if not n:
+            return
+        for name, (shape, dtype, fill) in _OBJECT_COLUMNS.items():
+            arr = columns.get(name)
+            if arr is None and name == "color" and "orig_color" in columns:
+                arr = columns["orig_color"].copy()
+            elif arr is None:
+                # np.zeros: halaman baru dialokasikan OS saat pertama disentuh
+                arr = np.full((n, *shape), fill, dtype=dtype) if fill else np.zeros((n, *shape), dtype=dtype)
+            elif arr.shape != (n, *shape):
+                raise ValueError(f"kolom {name}: bentuk {arr.shape}, seharusnya {(n, *shape)}")
+            setattr(self, name, arr)
+        orig = columns["orig"]
+        if orig.shape != (nv, 2):
+            raise ValueError(f"kolom orig: bentuk {orig.shape}, seharusnya {(nv, 2)}")
+        self.orig = orig
+        self.disp = columns["disp"] if "disp" in columns else orig.copy()
+        self.tess_cache, self.clipped = {}, {}
+        self.n, self.nv = n, nv
+
+    # ---------- transformasi ----------
+    def invalidate_transform(self, idx):
+        """Transformasi atau titik asli objek idx berubah: cache-nya dihitung ulang saat dibaca."""
+        self.xform_dirty[idx] = True
+
+    def _fresh(self, idx):
+        idx = np.asarray(idx, dtype=np.intp)
+        stale = idx[self.xform_dirty[idx]]
+        if stale.size:
+            self.update_transforms(np.unique(stale))
+        return idx
+
+    def matrices(self, idx):
+        """Matriks affine (m, 3, 3) titik asli ➜ dunia objek idx."""
+        return self.affine[self._fresh(idx)]
+
+    def inverse_matrices(self, idx):
+        """Matriks (m, 3, 3) dunia ➜ titik asli objek idx (NaN bila skala 0)."""
+        return self.affine_inv[self._fresh(idx)]
+
+    def world_bboxes(self, idx):
+        """Bbox dunia objek idx sebagai (xmin, ymin, xmax, ymax), masing-masing (m,)."""
+        return tuple(self.world_bbox[self._fresh(idx)].T)
+
+    def to_world(self, pts, idx, owner=None):
+        """
+        Titik (N, 2) berkoordinat asli ke koordinat dunia. Titik ke-j milik
+        objek ``idx[owner[j]]``; tanpa ``owner`` satu titik per objek idx.
+        """
+        return _apply(self.matrices(idx), pts, owner)
+
+    def to_local(self, pts, idx, owner=None):
+        """Kebalikan ``to_world``: titik dunia ke koordinat asli objeknya."""
+        return _apply(self.inverse_matrices(idx), pts, owner)
+
+    def vertex_rows(self, idx):
+        """Baris buffer verteks milik objek idx dan posisi pemiliknya di idx."""
+        counts = self.count[idx].astype(np.intp)
+        first = np.cumsum(counts) - counts
+        rows = np.repeat(self.offset[idx] - first, counts) + np.arange(counts.sum())
+        return rows, np.repeat(np.arange(len(idx)), counts)
+
+    def update_transforms(self, idx):
+        """
+        Hitung ulang matriks, invers dan bbox dunia objek idx sekaligus.
+        Urutannya sama dengan glTranslatef · glRotatef · glScalef di
+        Object2D.draw: kotak diputar/diskalakan terhadap pusatnya, elips
+        terhadap titik pusat (titik pertama; titik kedua = jari-jari),
+        titik & polygon terhadap titik asal. Garis tidak memakai
+        transformasi (titiknya diubah langsung), jadi matriksnya identitas.
+        """
+        idx = np.asarray(idx, dtype=np.intp)
+        m = len(idx)
+        types = self.types[idx]
+        off = self.offset[idx]
+        p0 = self.orig[off]
+        p1 = self.orig[off + np.minimum(self.count[idx] - 1, 1)]
+        square = types == TYPE_CODES["square"]
+        ellipse = types == TYPE_CODES["ellipse"]
+        line = types == TYPE_CODES["line"]
+
+        pivot = np.zeros((m, 2))
+        pivot[square] = (p0[square] + p1[square]) / 2.0
+        pivot[ellipse] = p0[ellipse]
+        ang = np.radians(self.rotation[idx])
+        ang[line] = 0.0
+        sx, sy = self.scale[idx].T.copy()
+        sx[line] = sy[line] = 1.0
+        shift = self.translation[idx].copy()
+        shift[line] = 0.0
+        c, s = np.cos(ang), np.sin(ang)
+
+        # p ➜ translasi + pivot + R · S · (p - pivot)
+        a = np.zeros((m, 3, 3))
+        a[:, 0, 0], a[:, 0, 1] = c * sx, -s * sy
+        a[:, 1, 0], a[:, 1, 1] = s * sx, c * sy
+        a[:, :2, 2] = shift + pivot - np.einsum("nij,nj->ni", a[:, :2, :2], pivot)
+        a[:, 2, 2] = 1.0
+        inv = np.zeros((m, 3, 3))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            inv[:, 0, 0], inv[:, 0, 1] = c / sx, s / sx
+            inv[:, 1, 0], inv[:, 1, 1] = -s / sy, c / sy
+            inv[:, :2, 2] = -np.einsum("nij,nj->ni", inv[:, :2, :2], a[:, :2, 2])
+        inv[:, 2, 2] = 1.0
+        self.affine[idx] = a
+        self.affine_inv[idx] = inv
+
+        # bbox dunia: kotak & elips analitik, titik eksak, sisanya dari verteksnya
+        center = shift + pivot
+        ac, as_ = np.abs(c), np.abs(s)
+        ext = np.zeros((m, 2))
+        hw = np.abs(p1[square, 0] - p0[square, 0]) / 2.0 * np.abs(sx[square])
+        hh = np.abs(p1[square, 1] - p0[square, 1]) / 2.0 * np.abs(sy[square])
+        ext[square, 0] = ac[square] * hw + as_[square] * hh
+        ext[square, 1] = as_[square] * hw + ac[square] * hh
+        ra = p1[ellipse, 0] * sx[ellipse]
+        rb = p1[ellipse, 1] * sy[ellipse]
+        ext[ellipse, 0] = np.hypot(ra * ac[ellipse], rb * as_[ellipse])
+        ext[ellipse, 1] = np.hypot(ra * as_[ellipse], rb * ac[ellipse])
+        point = types == TYPE_CODES["point"]
+        center[point] = _apply(a[point], p0[point])
+        box = np.column_stack((center - ext, center + ext))
+
+        rest = np.flatnonzero(~(square | ellipse | point) & (self.count[idx] > 0))
+        if len(rest):
+            rows, owner = self.vertex_rows(idx[rest])
+            w = _apply(a[rest], self.orig[rows], owner)
+            box[rest] = np.column_stack(segment_bboxes(w, self.count[idx[rest]]))
+        self.world_bbox[idx] = box
+        self.xform_dirty[idx] = False
+
+    # ---------- statistik ----------
+    def nbytes(self):
+        cols = sum(getattr(self, c).nbytes for c in _OBJECT_COLUMNS)
+        return cols + self.orig.nbytes + self.disp.nbytes
+
+
+def _apply(a, pts, owner=None):
+    """Matriks affine (m, 3, 3) dikenakan ke titik (N, 2) milik baris owner."""
+    pts = np.asarray(pts, dtype=np.float64).reshape(-1, 2)
+    rows = a.reshape(-1, 9)[:, :6] if owner is None else a.reshape(-1, 9)[owner, :6]
+    x, y = pts[:, 0], pts[:, 1]
+    return np.column_stack((
+        rows[:, 0] * x + rows[:, 1] * y + rows[:, 2],
+        rows[:, 3] * x + rows[:, 4] * y + rows[:, 5],
+    ))
@@ -0,0 +1,207 @@
+"""
+Indeks spasial grid seragam untuk hit-testing objek 2D.
+
+Grid hanya menyimpan kandidat berdasarkan bbox; tes presisi (jarak ke garis,
+toleransi titik, dll.) tetap dilakukan oleh pemanggil. Urutan tumpukan dijaga
+lewat nomor urut yang naik setiap kali objek dimasukkan, sehingga kandidat bisa
+dikembalikan dari yang paling atas.
+"""
+import gc
+import math
+
+import numpy as np
+
+ENTRY_NBYTES = 1024             # perkiraan memori Python per objek terindeks
+
+
+class SpatialGrid:
+    def __init__(self, cell_size: float = 1.0, max_cells: int = 256):
+        self.cell_size = cell_size
+        # objek yang menutupi lebih dari max_cells sel disimpan terpisah
+        # supaya insert/update tetap murah
+        self.max_cells = max_cells
+        self.clear()
+
+    def clear(self):
+        self.cells: dict = {}
+        self.large: set = set()
+        self.entries: dict = {}   # key -> bbox (sel-nya dihitung ulang dari bbox)
+        self.order: dict = {}     # key -> nomor urut tumpukan
+        self._next_order = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def _cells(self, key, bbox):
+        """Sel yang ditempati key (kosong untuk bbox None / objek besar)."""
+        if bbox is None or key in self.large:
+            return ()
+        i0, j0, i1, j1 = self._cell_range(bbox)
+        return [(i, j) for i in range(i0, i1 + 1) for j in range(j0, j1 + 1)]
+
+    def _cell_range(self, bbox):
+        xmin, ymin, xmax, ymax = bbox
+        cs = self.cell_size
+        return (
+            math.floor(xmin / cs), math.floor(ymin / cs),
+            math.floor(xmax / cs), math.floor(ymax / cs),
+        )
+
+    def insert(self, key, bbox, order=None):
+        """
+        Masukkan objek baru di posisi paling atas, atau di nomor urut
+        ``order`` lamanya (objek yang dihapus lalu di-undo).
+        """
+        if order is None:
+            order = self._next_order
+            self._next_order += 1
+        self.order[key] = order
+        self._place(key, bbox)
+
+    def insert_many(self, keys, bboxes):
+        """
+        ``insert`` untuk banyak objek baru sekaligus, ditumpuk sesuai urutan
+        ``keys``. ``bboxes`` (m, 4); sel tiap objek dihitung dengan NumPy dan
+        bucket diisi per sel, bukan per objek.
+        """
+        keys = list(keys)
+        m = len(keys)
+        if not m:
+            return
+        bboxes = np.asarray(bboxes, dtype=np.float64).reshape(m, 4)
+        lo = np.floor(bboxes[:, :2] / self.cell_size).astype(np.int64)
+        span = np.floor(bboxes[:, 2:] / self.cell_size).astype(np.int64) - lo + 1
+        ncells = span[:, 0] * span[:, 1]
+        large = ncells > self.max_cells
+        ncells[large] = 0
+
+        # jutaan tuple baru memicu koleksi GC generasi tua berulang kali
+        enabled = gc.isenabled()
+        gc.disable()
+        try:
+            first = self._next_order
+            self._next_order += m
+            self.order.update(zip(keys, range(first, first + m)))
+            self.entries.update(zip(keys, map(tuple, bboxes.tolist())))
+            self.large.update(keys[i] for i in np.flatnonzero(large).tolist())
+
+            # pasangan (objek, sel), dikelompokkan per sel
+            owner = np.repeat(np.arange(m), ncells)
+            k = np.arange(len(owner)) - np.repeat(np.cumsum(ncells) - ncells, ncells)
+            w = span[owner, 1]
+            ci = lo[owner, 0] + k // w
+            cj = lo[owner, 1] + k % w
+            if not len(owner):
+                return
+            cell = (ci - ci.min()) * (cj.max() - cj.min() + 1) + (cj - cj.min())
+            by_cell = np.argsort(cell, kind="stable")
+            ci, cj, cell, owner = ci[by_cell], cj[by_cell], cell[by_cell], owner[by_cell]
+            starts = np.flatnonzero(np.diff(cell, prepend=cell[0] - 1))
+            stops = np.append(starts[1:], len(owner)).tolist()
+            table = np.empty(m, dtype=object)
+            table[:] = keys
+            ordered = table[owner]
+            cells = self.cells
+            for a, b, c in zip(starts.tolist(), stops, zip(ci[starts].tolist(), cj[starts].tolist())):
+                bucket = dict.fromkeys(ordered[a:b].tolist())
+                if c in cells:
+                    cells[c].update(bucket)
+                else:
+                    cells[c] = bucket
+        finally:
+            if enabled:
+                gc.enable()
+
+    def update(self, key, bbox):
+        """Perbarui bbox tanpa mengubah urutan tumpukan."""
+        if key not in self.order:
+            self.insert(key, bbox)
+            return
+        self._unplace(key)
+        self._place(key, bbox)
+
+    def remove(self, key):
+        if key in self.order:
+            self._unplace(key)
+            del self.order[key]
+
+    def _place(self, key, bbox):
+        self.entries[key] = bbox
+        if bbox is None:
+            return
+        i0, j0, i1, j1 = self._cell_range(bbox)
+        if (i1 - i0 + 1) * (j1 - j0 + 1) > self.max_cells:
+            self.large.add(key)
+            return
+        # bucket berupa dict (urutan tidak penting, query mengurutkan lewat
+        # ``order``) supaya update objek di sel padat tidak O(isi sel)
+        for c in self._cells(key, bbox):
+            self.cells.setdefault(c, {})[key] = None
+
+    def _unplace(self, key):
+        cells = self._cells(key, self.entries.pop(key, None))
+        self.large.discard(key)
+        for c in cells:
+            bucket = self.cells[c]
+            del bucket[key]
+            if not bucket:
+                del self.cells[c]
+
+    def detach(self):
+        """Lepaskan seluruh isi indeks (tanpa menyalin) dan kosongkan; lihat ``attach``."""
+        state = (self.cells, self.large, self.entries, self.order, self._next_order)
+        self.clear()
+        return state
+
+    @staticmethod
+    def state_nbytes(state):
+        """Perkiraan memori isi hasil ``detach``."""
+        return ENTRY_NBYTES * len(state[2])
+
+    def attach(self, state):
+        """Pasang kembali isi hasil ``detach`` (indeks harus kosong)."""
+        if self.entries:
+            raise ValueError("attach hanya untuk indeks kosong")
+        self.cells, self.large, self.entries, self.order, self._next_order = state
+
+    def query_point(self, x, y):
+        """Kandidat yang bbox-nya memuat (x, y), urut dari paling atas."""
+        cs = self.cell_size
+        bucket = self.cells.get((math.floor(x / cs), math.floor(y / cs)), ())
+        hits = [
+            k for k in (*bucket, *self.large)
+            if _bbox_contains(self.entries[k], x, y)
+        ]
+        hits.sort(key=self.order.__getitem__, reverse=True)
+        return hits
+
+    def query_rect(self, xmin, ymin, xmax, ymax, limit=None):
+        """
+        Kandidat yang selnya menyentuh kotak (tanpa urutan, tanpa tes bbox
+        presisi; cukup untuk culling). Bila ``limit`` diberikan dan jumlah
+        kandidat melebihinya, berhenti dan mengembalikan None: sebagian besar
+        objek terlihat, pemanggil lebih murah menggambar semuanya.
+        Biaya sebanding dengan min(sel di kotak, sel terisi) + kandidat.
+        """
+        i0, j0, i1, j1 = self._cell_range((xmin, ymin, xmax, ymax))
+        cells = self.cells
+        if (i1 - i0 + 1) * (j1 - j0 + 1) <= len(cells):
+            buckets = [b for b in (
+                cells.get((i, j)) for i in range(i0, i1 + 1) for j in range(j0, j1 + 1)
+            ) if b]
+        else:
+            buckets = [b for (i, j), b in cells.items() if i0 <= i <= i1 and j0 <= j <= j1]
+        hits = dict.fromkeys(self.large)
+        for b in buckets:
+            hits.update(b)
+            if limit is not None and len(hits) > limit:
+                return None
+        return hits.keys()
+
+
+def _bbox_contains(bbox, x, y):
+    xmin, ymin, xmax, ymax = bbox
+    return xmin <= x <= xmax and ymin <= y <= ymax
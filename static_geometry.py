@@ -0,0 +1,117 @@
+"""
+Geometri statis (grid 2D, lantai grid 3D) yang disimpan di VBO.
+
+Verteks dibangun sekali dengan NumPy lalu di-upload; setiap frame cukup satu
+glDrawArrays per objek. Geometri dibangun ulang hanya bila kuncinya (mis.
+luas & jarak grid) berubah, atau setelah konteks GL dibuat ulang
+(``invalidate_gl``), jadi grid yang rapat pun tetap murah.
+"""
+import ctypes
+import math
+
+import numpy as np
+from OpenGL.GL import *
+
+_f32 = np.float32
+
+
+def grid_lines(extent, spacing):
+    """
+    Garis grid persegi [-extent, extent]² berjarak ``spacing`` sebagai pasangan
+    verteks GL_LINES (N, 2): tiap nilai menghasilkan satu garis vertikal dan
+    satu horizontal, seperti loop lama di draw_grid.
+    """
+    n = int(round(2 * extent / spacing))
+    k = np.linspace(-extent, extent, n + 1)
+    lo, hi = np.full_like(k, -extent), np.full_like(k, extent)
+    verts = np.stack((
+        np.column_stack((k, lo)), np.column_stack((k, hi)),
+        np.column_stack((lo, k)), np.column_stack((hi, k)),
+    ), axis=1)
+    return verts.reshape(-1, 2)
+
+
+def grid_rect(xmin, ymin, xmax, ymax, spacing):
+    """
+    Grid berjarak ``spacing`` yang menutupi kotak (batasnya dibulatkan keluar
+    ke kelipatan ``spacing``) sebagai pasangan verteks GL_LINES (N, 2): garis
+    vertikal lalu horizontal. Untuk kotak [-extent, extent]² garisnya sama
+    dengan ``grid_lines``.
+    """
+    xs = np.arange(math.floor(xmin / spacing), math.ceil(xmax / spacing) + 1) * spacing
+    ys = np.arange(math.floor(ymin / spacing), math.ceil(ymax / spacing) + 1) * spacing
+    vertical = np.stack((
+        np.column_stack((xs, np.full_like(xs, ys[0]))), np.column_stack((xs, np.full_like(xs, ys[-1]))),
+    ), axis=1)
+    horizontal = np.stack((
+        np.column_stack((np.full_like(ys, xs[0]), ys)), np.column_stack((np.full_like(ys, xs[-1]), ys)),
+    ), axis=1)
+    return np.concatenate((vertical, horizontal)).reshape(-1, 2)
+
+
+def floor_grid(extent, spacing, y=0.0):
+    """Grid lantai di bidang y (N, 3): garis sejajar sumbu z dan sumbu x."""
+    xz = grid_lines(extent, spacing)
+    return np.column_stack((xz[:, 0], np.full(len(xz), y), xz[:, 1]))
+
+
+class StaticGeometry:
+    """
+    Satu VBO berisi posisi (2D/3D) dan warna per verteks opsional.
+    ``build(*key)`` mengembalikan ``verts`` atau ``(verts, colors)`` dan baru
+    dipanggil lagi bila ``key`` pada draw() berbeda dari sebelumnya.
+    """
+
+    def __init__(self, mode, build):
+        self.mode = mode
+        self.build = build
+        self.key = None
+        self.vbo = None
+        self.count = 0
+        self.dims = 0
+        self.has_color = False
+        self.builds = 0
+
+    def _upload(self, key):
+        res = self.build(*key)
+        verts, colors = res if isinstance(res, tuple) else (res, None)
+        self.dims = verts.shape[1]
+        self.has_color = colors is not None
+        cols = [verts] if colors is None else [verts, colors]
+        data = np.ascontiguousarray(np.column_stack(cols), dtype=_f32)
+        if self.vbo is None:
+            self.vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        glBufferData(GL_ARRAY_BUFFER, data.nbytes, data, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        self.count = len(data)
+        self.key = key
+        self.builds += 1
+
+    def draw(self, *key):
+        if self.vbo is None or key != self.key:
+            self._upload(key)
+        stride = (self.dims + 3 * self.has_color) * 4
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glVertexPointer(self.dims, GL_FLOAT, stride, None)
+        if self.has_color:
+            glEnableClientState(GL_COLOR_ARRAY)
+            glColorPointer(3, GL_FLOAT, stride, ctypes.c_void_p(self.dims * 4))
+        glDrawArrays(self.mode, 0, self.count)
+        if self.has_color:
+            glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+    def release(self):
+        """Hapus VBO milik konteks GL yang masih aktif."""
+        if self.vbo is not None:
+            glDeleteBuffers(1, [self.vbo])
+            self.vbo = None
+
+    def invalidate_gl(self):
+        """Konteks GL dibuat ulang: id VBO lama tidak berlaku, bangun ulang saat draw."""
+        self.vbo = None
+        self.key = None
+
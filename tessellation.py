@@ -0,0 +1,132 @@
+"""
+Tesselasi elips adaptif.
+
+Tabel cos/sin lingkaran satuan dihitung sekali per jumlah segmen lalu dipakai
+bersama oleh semua elips. Jumlah segmen dipilih dari radius di layar (piksel)
+sehingga galat tali busur tidak melebihi TOLERANCE_PX: elips kecil murah,
+elips besar tetap halus.
+"""
+import math
+
+import numpy as np
+
+from scene_store import TYPE_CODES
+
+MIN_SEGMENTS = 8
+MAX_SEGMENTS = 512
+SEGMENT_STEP = 8          # dibulatkan ke kelipatan ini supaya jumlah tabel terbatas
+TOLERANCE_PX = 0.25
+
+_tables: dict = {}
+
+
+def unit_circle(n):
+    """(cos, sin) untuk sudut 2πi/n, i = 0..n-1; di-cache per n."""
+    table = _tables.get(n)
+    if table is None:
+        ang = 2 * np.pi * np.arange(n) / n
+        table = (np.cos(ang), np.sin(ang))
+        for a in table:
+            a.flags.writeable = False
+        _tables[n] = table
+    return table
+
+
+def segments_for(radius_px, tol=TOLERANCE_PX):
+    """Jumlah segmen minimum agar galat tali busur <= tol piksel."""
+    if radius_px <= tol:
+        return MIN_SEGMENTS
+    n = math.ceil(math.pi / math.acos(1.0 - tol / radius_px))
+    n = -(-n // SEGMENT_STEP) * SEGMENT_STEP
+    return max(MIN_SEGMENTS, min(MAX_SEGMENTS, n))
+
+
+def screen_radius(rx, ry, sx, sy, px_per_unit):
+    """Radius terbesar elips di layar, dalam piksel."""
+    return max(abs(rx * sx) * px_per_unit[0], abs(ry * sy) * px_per_unit[1])
+
+
+def ellipse_vertices(rx, ry, n):
+    cos, sin = unit_circle(n)
+    return np.column_stack((rx * cos, ry * sin))
+
+
+def ellipse_outline(obj, px_per_unit):
+    """
+    Verteks lokal (N, 2) untuk objek elips ``obj`` (points = [pusat, radius]).
+    Hasilnya disimpan di ``obj.tessellation`` dan dipakai ulang sampai radius
+    atau skala (yang menentukan jumlah segmen) berubah.
+    """
+    radius = obj.points[1]
+    rx, ry = radius.x, radius.y
+    sx, sy = (float(v) for v in obj.scale)
+    n = segments_for(screen_radius(rx, ry, sx, sy, px_per_unit))
+    key = (rx, ry, n)
+    cached = obj.tessellation
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    verts = ellipse_vertices(rx, ry, n)
+    obj.tessellation = (key, verts)
+    return verts
+
+
+def segments_for_many(radius_px, tol=TOLERANCE_PX):
+    """``segments_for`` untuk array radius sekaligus (hasil identik)."""
+    r = np.asarray(radius_px, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        n = np.ceil(np.pi / np.arccos(1.0 - tol / np.where(r > tol, r, 1.0)))
+    n = -(-n // SEGMENT_STEP) * SEGMENT_STEP
+    n = np.clip(n, MIN_SEGMENTS, MAX_SEGMENTS)
+    return np.where(r > tol, n, MIN_SEGMENTS).astype(np.intp)
+
+
+def shape_outlines(store, idx, px_per_unit):
+    """
+    Outline dunia bentuk ``idx`` di SceneStore (kotak, elips tersesselasi,
+    polygon) dalam format packed ``(verts (N, 2), counts)``. Jumlah segmen
+    elips sama dengan ``ellipse_outline``, jadi hasil klipingnya sama dengan
+    yang digambar. Titik tidak punya outline.
+    """
+    types = store.types[idx]
+    p0 = store.orig[store.offset[idx]]
+    p1 = store.orig[store.offset[idx] + np.minimum(store.count[idx] - 1, 1)]
+    scale = store.scale[idx]
+    counts = store.count[idx].astype(np.intp)       # polygon: verteksnya sendiri
+    square = types == TYPE_CODES["square"]
+    ellipse = types == TYPE_CODES["ellipse"]
+    counts[square] = 4
+    segs = segments_for_many(np.maximum(
+        np.abs(p1[ellipse, 0] * scale[ellipse, 0]) * px_per_unit[0],
+        np.abs(p1[ellipse, 1] * scale[ellipse, 1]) * px_per_unit[1],
+    ))
+    counts[ellipse] = segs
+    first = np.cumsum(counts) - counts
+    owner = np.repeat(np.arange(len(idx)), counts)
+    # outline dalam koordinat titik asli, lalu matriks affine (cache) ke dunia
+    local = np.empty((int(counts.sum()), 2))
+
+    k = np.flatnonzero(square)
+    if len(k):
+        cx, cy = ((p0[k] + p1[k]) / 2.0).T
+        hw = np.abs(p1[k, 0] - p0[k, 0]) / 2.0
+        hh = np.abs(p1[k, 1] - p0[k, 1]) / 2.0
+        corners = np.stack((
+            np.column_stack((cx - hw, cy - hh)), np.column_stack((cx + hw, cy - hh)),
+            np.column_stack((cx + hw, cy + hh)), np.column_stack((cx - hw, cy + hh)),
+        ), axis=1)
+        local[(first[k, None] + np.arange(4)).ravel()] = corners.reshape(-1, 2)
+
+    k = np.flatnonzero(ellipse)
+    for n in np.unique(segs):
+        grp = k[segs == n]
+        cos, sin = unit_circle(int(n))
+        rows = (first[grp, None] + np.arange(n)).ravel()
+        local[rows, 0] = (p0[grp, 0, None] + p1[grp, 0, None] * cos).ravel()
+        local[rows, 1] = (p0[grp, 1, None] + p1[grp, 1, None] * sin).ravel()
+
+    k = np.flatnonzero(types == TYPE_CODES["polygon"])
+    if len(k):
+        rows, _ = store.vertex_rows(idx[k])
+        c = counts[k]
+        local[np.repeat(first[k] - (np.cumsum(c) - c), c) + np.arange(c.sum())] = store.orig[rows]
+    return store.to_world(local, idx, owner), counts
@@ -0,0 +1,17 @@
+"""Fixture bersama: modul di akar repo bisa di-import, aplikasi dengan scene kosong."""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+
+@pytest.fixture
+def app():
+    """Modul aplikasi (TubesGrafkom) dengan scene & riwayat kosong; tanpa konteks GL."""
+    import TubesGrafkom as app
+    app.clear_objects()
+    app.window_clipping.clear()
+    yield app
+    app.clear_objects()
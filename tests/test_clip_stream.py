@@ -0,0 +1,70 @@
+import io
+import json
+
+import pytest
+
+import clip_stream
+
+WINDOW = {"format": "grafkom-scene", "window": [[0, 0], [4, 4]]}
+
+
+def write_jsonl(path, objects):
+    path.write_text("\n".join(json.dumps(o) for o in [WINDOW, *objects]) + "\n")
+    return str(path)
+
+
+def clip(path, **kw):
+    out = io.StringIO()
+    clip_stream.run(path, out, **kw)
+    return [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+def test_records(tmp_path):
+    path = write_jsonl(tmp_path / "s.jsonl", [
+        {"type": "line", "points": [[-2, 1], [2, 1]], "thickness": 3.0},
+        {"type": "square", "points": [[1, 1], [2, 2]], "thickness": 2.0},
+        {"type": "square", "points": [[3, 3], [5, 5]]},
+        {"type": "point", "points": [[9, 9]]},
+    ])
+    line, inside, crossing, outside = clip(path)
+    assert line["class"] == "crossing" and line["points"] == [[0, 1], [2, 1]]
+    assert inside["class"] == "inside" and inside["points"] == [[1, 1], [2, 2]]
+    assert inside["translation"] == [0, 0] and inside["scale"] == [1, 1]
+    assert crossing["class"] == "crossing" and "outline" in crossing
+    assert [r["thickness"] for r in (line, inside, crossing)] == [3.0, 2.0, 1.0]
+    assert outside == {"i": 3, "type": "point", "class": "outside", "visible": False,
+                       "color": [1, 1, 1]}
+
+
+def test_chunks_match_single_pass(tmp_path):
+    objects = [{"type": "square", "points": [[k - 3, 0], [k - 2, 1]]} for k in range(10)]
+    path = write_jsonl(tmp_path / "s.jsonl", objects)
+    assert clip(path, chunk=3) == clip(path)
+
+
+@pytest.mark.parametrize("obj, message", [
+    ({"type": "line", "points": [[1, 1]]}, ":3: line harus punya 2 titik, bukan 1"),
+    ({"type": "square", "points": [[0, 0], [1, 1], [2, 2]]}, ":3: square harus punya 2 titik"),
+    ({"type": "polygon", "points": [[0, 0], [1, 1]]}, ":3: polygon harus punya minimal 3 titik"),
+    ({"type": "point", "points": []}, ":3: point harus punya minimal 1 titik"),
+    ({"type": "star", "points": [[0, 0]]}, ":3: tipe objek 'star' tidak dikenal"),
+    ({"type": "point"}, ":3: objek tidak punya field type / points"),
+    ({"type": "point", "points": [[0, "x"]]}, "field objek tidak valid"),
+    ({"type": "point", "points": [[0, 0]], "color": 1}, "field objek tidak valid"),
+])
+def test_malformed_record(tmp_path, capsys, obj, message):
+    path = write_jsonl(tmp_path / "bad.jsonl", [
+        {"type": "point", "points": [[1, 1]]},
+        obj,
+        {"type": "point", "points": [[2, 2]]},
+    ])
+    with pytest.raises(SystemExit) as e:
+        clip_stream.main([path, "-o", str(tmp_path / "out.jsonl")])
+    assert message in str(e.value)
+
+
+def test_missing_window(tmp_path):
+    path = tmp_path / "s.jsonl"
+    path.write_text(json.dumps({"type": "point", "points": [[1, 1]]}) + "\n")
+    with pytest.raises(ValueError, match="window"):
+        clip(str(path))
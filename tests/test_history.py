@@ -0,0 +1,140 @@
+import numpy as np
+
+from history import Command, History
+
+
+class Counter(Command):
+    """Perintah uji: menambah ``state["x"]`` sebesar ``delta``."""
+
+    def __init__(self, state, delta, size=0):
+        self.state = state
+        self.delta = delta
+        self.size = size
+        self.released = False
+
+    @property
+    def nbytes(self):
+        return super().nbytes + self.size
+
+    def redo(self):
+        self.state["x"] += self.delta
+
+    def undo(self):
+        self.state["x"] -= self.delta
+
+    def merge(self, other):
+        if type(other) is not Counter:
+            return False
+        self.delta += other.delta
+        return True
+
+    def release(self):
+        self.released = True
+
+
+def do(history, cmd):
+    cmd.redo()
+    history.push(cmd)
+
+
+def test_undo_redo():
+    state = {"x": 0}
+    h = History()
+    for d in (1, 2, 4):
+        do(h, Counter(state, d))
+        h.close()
+    assert state["x"] == 7 and len(h) == 3
+    h.undo()
+    h.undo()
+    assert state["x"] == 1
+    h.redo()
+    assert state["x"] == 3
+    assert h.undo() is not None and h.undo() is not None
+    assert state["x"] == 0 and h.undo() is None
+
+
+def test_push_drops_redo():
+    state = {"x": 0}
+    h = History()
+    first = Counter(state, 1)
+    do(h, first)
+    h.close()
+    h.undo()
+    do(h, Counter(state, 5))
+    assert first.released
+    assert h.redo() is None and state["x"] == 5
+
+
+def test_merge_until_close():
+    state = {"x": 0}
+    h = History()
+    for _ in range(3):
+        do(h, Counter(state, 1))
+    h.close()
+    do(h, Counter(state, 10))
+    assert len(h) == 2
+    h.undo()
+    assert state["x"] == 3
+    h.undo()
+    assert state["x"] == 0
+
+
+def test_budget_drops_oldest():
+    state = {"x": 0}
+    h = History(budget=3 * (64 + 100))
+    cmds = [Counter(state, 1, size=100) for _ in range(5)]
+    for cmd in cmds:
+        do(h, cmd)
+        h.close()
+    assert len(h) == 3 and h.nbytes <= h.budget
+    assert cmds[0].released and cmds[1].released and not cmds[2].released
+
+
+def square(app, p, color, thickness):
+    P = app.Point2D
+    return app.Object2D("square", [P(*p), P(p[0] + 1, p[1] + 1)], color, thickness)
+
+
+def test_create_after_clear_redo(app):
+    P = app.Point2D
+    app.create_object(app.Object2D("point", [P(1, 2)], (1, 0, 0), 3.0))
+    app.history.close()
+    app.do_edit(app.ClearScene())
+    app.history.close()
+    app.create_object(square(app, (0, 0), (0, 1, 0), 2.0))
+    app.history.close()
+
+    app.history.undo()
+    app.history.undo()
+    st = app.scene
+    assert st.n == 1 and app.objects_2d[0].obj_type == "point"
+    assert st.orig[:st.nv].tolist() == [[1, 2]]
+
+    app.history.redo()
+    app.history.redo()
+    assert st.n == 1 and app.objects_2d[0].obj_type == "square"
+    assert st.count[0] == 2 and st.orig[:st.nv].tolist() == [[0, 0], [1, 1]]
+    assert st.color[0].tolist() == [0, 1, 0] and st.thickness[0] == 2.0
+
+
+def test_undo_all_restores_scene(app):
+    for k in range(3):
+        app.create_object(square(app, (k, 0), (1, 0, 0), 1.0))
+        app.history.close()
+    obj = app.objects_2d[1]
+    before = app.transform_state(obj)
+    obj.translation[0] += 2.0
+    app.reclip_shape(obj)
+    app.history.push(app.TransformObject(1, before, app.transform_state(obj)))
+    app.history.close()
+    app.do_edit(app.DeleteObject(0))
+    app.history.close()
+
+    while app.history.undo():
+        pass
+    assert app.scene.n == 0
+    while app.history.redo():
+        pass
+    st = app.scene
+    assert st.n == 3 and st.alive[:3].tolist() == [False, True, True]
+    assert np.allclose(st.translation[1], (2.0, 0.0))
@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+
+import mesh
+
+VERTS = [(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0), (0, 0, 1)]
+# quad 0-1-2-3 lalu segitiga 0-1-4, sebagai segitiga kipas
+TRIS = [(0, 1, 2), (0, 2, 3), (0, 1, 4)]
+COLORS = [(1, 0, 0), (0, 1, 0), (0, 0, 1), (1, 1, 0), (0, 1, 1)]
+
+
+def write(tmp_path, name, data):
+    path = tmp_path / name
+    path.write_bytes(data.encode() if isinstance(data, str) else data)
+    return str(path)
+
+
+def assert_mesh(m, colors=None):
+    np.testing.assert_array_equal(m.vertices, np.array(VERTS, dtype=np.float32))
+    assert m.faces.tolist() == [list(t) for t in TRIS]
+    if colors is None:
+        assert m.colors is None
+    else:
+        np.testing.assert_allclose(m.colors, colors, atol=1e-6)
+    assert m.normals.shape == (5, 3)
+
+
+def obj_text(fmt="{}", colors=False, eol="\n"):
+    lines = ["# model uji", "o kotak"]
+    for k, v in enumerate(VERTS):
+        lines.append("v " + " ".join(map(str, v + (COLORS[k] if colors else ()))))
+    lines.append("vn 0 0 1")
+    lines.append("f " + " ".join(fmt.format(i) for i in (1, 2, 3, 4)))
+    lines.append("f " + " ".join(fmt.format(i) for i in (1, 2, 5)))
+    return eol.join(lines) + eol
+
+
+@pytest.mark.parametrize("fmt", ["{}", "{}/1", "{}/1/1", "{}//1"])
+def test_obj_face_formats(tmp_path, fmt):
+    assert_mesh(mesh.load_obj(write(tmp_path, "m.obj", obj_text(fmt))))
+
+
+def test_obj_colors_crlf_and_no_final_newline(tmp_path):
+    text = obj_text(colors=True, eol="\r\n").rstrip()
+    assert_mesh(mesh.load_obj(write(tmp_path, "m.obj", text)), COLORS)
+
+
+def test_obj_trailing_comments(tmp_path):
+    text = obj_text().replace("v 1 1 0\n", "v 1 1 0 # sudut\n").replace("f 1 2 5\n", "f 1 2 5 # atap\n")
+    assert_mesh(mesh.load_obj(write(tmp_path, "m.obj", text)))
+
+
+def test_obj_negative_indices_across_chunks(tmp_path):
+    text = obj_text().replace("f 1 2 5\n", "f -5 -4 -1\n")
+    path = write(tmp_path, "m.obj", text)
+    assert_mesh(mesh.load_obj(path, chunk_bytes=16))
+    assert_mesh(mesh.load_obj(path))
+
+
+def test_obj_index_out_of_range(tmp_path):
+    path = write(tmp_path, "m.obj", obj_text().replace("f 1 2 5", "f 1 2 9"))
+    with pytest.raises(ValueError, match="di luar jangkauan"):
+        mesh.load_obj(path)
+
+
+def ply_header(fmt, faces=2, colors=False):
+    lines = ["ply", f"format {fmt} 1.0", "comment uji", f"element vertex {len(VERTS)}",
+             "property float x", "property float y", "property float z"]
+    if colors:
+        lines += ["property uchar red", "property uchar green", "property uchar blue"]
+    lines += [f"element face {faces}", "property list uchar int vertex_indices", "end_header"]
+    return ("\n".join(lines) + "\n").encode()
+
+
+FACES = [(0, 1, 2, 3), (0, 1, 4)]
+
+
+def test_ply_ascii(tmp_path):
+    body = "".join(" ".join(map(str, v + tuple(255 * c for c in COLORS[k]))) + "\n"
+                   for k, v in enumerate(VERTS))
+    body += "".join(f"{len(f)} " + " ".join(map(str, f)) + "\n" for f in FACES)
+    path = write(tmp_path, "m.ply", ply_header("ascii", colors=True) + body.encode())
+    assert_mesh(mesh.load_ply(path), COLORS)
+
+
+@pytest.mark.parametrize("order, fmt", [("<", "binary_little_endian"), (">", "binary_big_endian")])
+@pytest.mark.parametrize("faces", [FACES, [(0, 1, 2), (0, 2, 3), (0, 1, 4)]])
+def test_ply_binary(tmp_path, order, fmt, faces):
+    body = np.array(VERTS, dtype=order + "f4").tobytes()
+    for f in faces:
+        body += np.array([len(f)], dtype="u1").tobytes() + np.array(f, dtype=order + "i4").tobytes()
+    path = write(tmp_path, "m.ply", ply_header(fmt, len(faces)) + body)
+    assert_mesh(mesh.load_ply(path))
+
+
+def test_ply_errors(tmp_path):
+    with pytest.raises(ValueError, match="bukan file PLY"):
+        mesh.load_ply(write(tmp_path, "a.ply", "solid x\n"))
+    with pytest.raises(ValueError, match="end_header"):
+        mesh.load_ply(write(tmp_path, "b.ply", "ply\nformat ascii 1.0\n"))
+
+
+def test_load_mesh_dispatch(tmp_path):
+    assert_mesh(mesh.load_mesh(write(tmp_path, "m.OBJ", obj_text())))
+    with pytest.raises(ValueError, match="tidak didukung"):
+        mesh.load_mesh(write(tmp_path, "m.stl", ""))
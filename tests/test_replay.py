@@ -0,0 +1,86 @@
+"""
+Sesi input direkam dengan ``input_log.Recorder`` lalu diputar ulang oleh
+``replay.replay`` di proses terpisah (konteks EGL headless dipilih saat
+OpenGL pertama kali di-import, jadi tidak bisa berbagi proses dengan tes lain).
+"""
+import json
+import os
+import subprocess
+import sys
+
+import pygame
+from pygame.locals import KEYDOWN, K_t, MOUSEBUTTONDOWN, MOUSEBUTTONUP, MOUSEMOTION
+
+import scene_file
+from camera2d import ZOOM_STEP
+from input_log import Recorder
+from scene_store import SceneStore
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+SCRIPT = """
+import json, sys
+import replay
+report = replay.replay(sys.argv[1])
+import TubesGrafkom as app
+print(json.dumps({"translation": app.scene.translation[0].tolist(), "undo": len(app.history),
+                  "truncated": report["truncated"]}))
+"""
+
+
+def record(path, scene, batches):
+    rec = Recorder(str(path), {"args": [str(scene)], "width": 800, "height": 600, "seed": 0,
+                               "event_driven": True, "mouse": [0, 0]})
+    for batch in batches:
+        rec.write(batch)
+    rec.close()
+
+
+def play(path):
+    out = subprocess.run([sys.executable, "-c", SCRIPT, str(path)], cwd=ROOT, check=True,
+                         capture_output=True, text=True)
+    return json.loads(out.stdout.splitlines()[-1])
+
+
+def motion(x, y, dx):
+    return pygame.event.Event(MOUSEMOTION, pos=(x, y), rel=(dx, 0), buttons=(1, 0, 0))
+
+
+def button(etype, x, y, b):
+    return pygame.event.Event(etype, pos=(x, y), button=b)
+
+
+def drag_session(tmp_path, wheel):
+    """Kotak (0, 0)-(2, 2), tombol T, drag 2 x 10 piksel ke kanan; ``wheel`` di antaranya."""
+    store = SceneStore()
+    store.add("square", [(0, 0), (2, 2)], (1, 0, 0), 1.0)
+    scene = tmp_path / "s.gks"
+    scene_file.save(str(scene), store)
+    # dunia (1, 1) = piksel (440, 270) pada tampilan awal (40 x 30 piksel per unit)
+    batches = [
+        [pygame.event.Event(KEYDOWN, key=K_t, mod=0)],
+        [button(MOUSEBUTTONDOWN, 440, 270, 1)],
+        [motion(450, 270, 10)],
+        wheel,
+        [motion(460, 270, 10)],
+        [button(MOUSEBUTTONUP, 460, 270, 1)],
+    ]
+    path = tmp_path / "s.gkr"
+    record(path, scene, batches)
+    return path
+
+
+def test_wheel_zoom_keeps_drag(tmp_path):
+    wheel = [button(MOUSEBUTTONDOWN, 450, 270, 4), button(MOUSEBUTTONUP, 450, 270, 4)]
+    got = play(drag_session(tmp_path, wheel))
+    assert abs(got["translation"][0] - (10 / 40 + 10 / (40 * ZOOM_STEP))) < 1e-9
+    assert got["undo"] == 1
+
+
+def test_truncated_recording(tmp_path):
+    path = drag_session(tmp_path, [])
+    full = play(path)
+    data = path.read_bytes()
+    path.write_bytes(data[:-3])         # potong di tengah batch terakhir (MOUSEBUTTONUP)
+    cut = play(path)
+    assert cut["truncated"] and not full["truncated"]
+    assert cut["translation"] == full["translation"] == [0.5, 0.0]
@@ -0,0 +1,164 @@
+import json
+
+import numpy as np
+import pytest
+
+import scene_file
+from scene_store import SceneStore
+
+WINDOW = ((-1.0, -2.0), (3.0, 4.0))
+
+
+@pytest.fixture
+def store():
+    st = SceneStore()
+    st.add("point", [(0.5, 0.5)], (1, 0, 0), 1.0)
+    st.add("line", [(0, 0), (2, 1)], (0, 1, 0), 3.0)
+    st.add("square", [(1, 1), (2, 2)], (0, 0, 1), 1.5)
+    st.add("ellipse", [(0, 0), (1, 0.5)], (1, 1, 0), 1.0)
+    st.add("polygon", [(0, 0), (1, 0), (1, 1), (0, 1)], (0, 1, 1), 2.0)
+    st.translation[2] = (0.25, -0.5)
+    st.rotation[3] = 30.0
+    st.scale[4] = (2.0, 0.5)
+    return st
+
+
+def columns(st):
+    return {name: getattr(st, name)[:st.nv if name == "orig" else st.n].copy() for name in scene_file.COLUMNS}
+
+
+def assert_same(a, b):
+    assert a.keys() == b.keys()
+    for name in a:
+        np.testing.assert_array_equal(a[name], b[name], err_msg=name)
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_save_load(tmp_path, store, mmap):
+    path = str(tmp_path / "s.gks")
+    scene_file.save(path, store, WINDOW)
+    loaded = SceneStore()
+    assert scene_file.load(path, loaded, mmap=mmap) == WINDOW
+    assert_same(columns(loaded), columns(store))
+    np.testing.assert_array_equal(loaded.disp[:loaded.nv], store.orig[:store.nv])
+
+
+def test_save_skips_deleted(tmp_path, store):
+    store.alive[1] = False
+    path = str(tmp_path / "s.gks")
+    scene_file.save(path, store)
+    loaded = SceneStore()
+    assert scene_file.load(path, loaded) is None
+    assert loaded.n == 4 and loaded.nv == store.nv - 2
+    assert loaded.types[:4].tolist() == [0, 2, 3, 4]
+    np.testing.assert_array_equal(loaded.translation[1], (0.25, -0.5))
+
+
+def test_json_round_trip(tmp_path, store):
+    path = str(tmp_path / "s.json")
+    scene_file.export_json(path, store, WINDOW)
+    loaded = SceneStore()
+    assert scene_file.import_json(path, loaded) == WINDOW
+    assert_same(columns(loaded), columns(store))
+
+
+@pytest.mark.parametrize("suffix", [".jsonl", ".gks"])
+def test_iter_chunks(tmp_path, store, suffix):
+    path = str(tmp_path / f"s{suffix}")
+    (scene_file.export_jsonl if suffix == ".jsonl" else scene_file.save)(path, store, WINDOW)
+    chunks = list(scene_file.iter_chunks(path, 2))
+    assert [n for _, n, _, _ in chunks] == [2, 2, 1]
+    assert all(window == WINDOW for window, _, _, _ in chunks)
+    got = SceneStore()
+    for _, n, nv, cols in chunks:
+        part = SceneStore()
+        part.adopt(n, nv, cols)
+        for i in range(n):
+            got.add(scene_file.TYPE_NAMES[part.types[i]], part.original_points(i).array(),
+                    part.orig_color[i], part.thickness[i])
+            got.translation[got.n - 1] = part.translation[i]
+            got.rotation[got.n - 1] = part.rotation[i]
+            got.scale[got.n - 1] = part.scale[i]
+    assert_same(columns(got), columns(store))
+
+
+def patch_column(path, name, index, value):
+    """Tulis ``value`` ke baris ``index`` kolom ``name`` file .gks."""
+    header, base = scene_file.read_header(path)
+    spec = header["columns"][name]
+    dtype = np.dtype(spec["dtype"])
+    with open(path, "r+b") as f:
+        f.seek(base + spec["offset"] + index * dtype.itemsize)
+        f.write(np.array(value, dtype=dtype).tobytes())
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+@pytest.mark.parametrize("name, index, value, message", [
+    ("types", 2, 9, "kode tipe 9 tidak dikenal"),
+    ("offset", 4, 1000, "objek ke-4: verteks di luar kolom orig"),
+    ("offset", 0, -1, "objek ke-0: verteks di luar kolom orig"),
+    ("count", 1, 1, "objek ke-1: line harus punya 2 titik"),
+])
+def test_load_corrupt(tmp_path, store, mmap, name, index, value, message):
+    path = str(tmp_path / "s.gks")
+    scene_file.save(path, store)
+    patch_column(path, name, index, value)
+    with pytest.raises(ValueError, match=message):
+        scene_file.load(path, SceneStore(), mmap=mmap)
+    with pytest.raises(ValueError, match=message):
+        list(scene_file.iter_chunks(path, 64))
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_load_truncated(tmp_path, store, mmap):
+    path = tmp_path / "s.gks"
+    scene_file.save(str(path), store)
+    data = path.read_bytes()
+    path.write_bytes(data[:len(data) - 64])
+    with pytest.raises(ValueError):
+        scene_file.load(str(path), SceneStore(), mmap=mmap)
+
+
+def test_not_a_scene(tmp_path):
+    path = tmp_path / "x.gks"
+    path.write_bytes(b"hello")
+    with pytest.raises(ValueError, match="bukan file scene"):
+        scene_file.load(str(path), SceneStore())
+
+
+@pytest.mark.parametrize("objects, message", [
+    ("x", "objects harus berupa list"),
+    ([{"type": "point"}], "objek ke-0: objek tidak punya field"),
+    ([{"type": "line", "points": [[0, 0]]}], "objek ke-0: line harus punya 2 titik"),
+    ([{"type": "point", "points": [[0, 0]], "scale": "big"}], "field objek tidak valid"),
+])
+def test_import_json_invalid(tmp_path, objects, message):
+    path = tmp_path / "s.json"
+    path.write_text(json.dumps({"format": "grafkom-scene", "objects": objects}))
+    with pytest.raises(ValueError, match=message):
+        scene_file.import_json(str(path), SceneStore())
+
+
+def test_app_load_failure_keeps_scene(app, tmp_path, store):
+    path = str(tmp_path / "s.gks")
+    scene_file.save(path, store)
+    patch_column(path, "types", 0, 42)
+    app.create_object(app.Object2D("point", [app.Point2D(1, 1)], (1, 0, 0)))
+    app.history.close()
+    with pytest.raises(ValueError):
+        app.load_scene(path)
+    assert app.scene.n == 1 and len(app.history) == 1
+
+
+def test_app_save_load(app, tmp_path):
+    P = app.Point2D
+    app.create_object(app.Object2D("square", [P(0, 0), P(1, 1)], (0, 1, 0), 2.0))
+    app.window_clipping[:] = [P(-1, -1), P(0.5, 0.5)]
+    path = str(tmp_path / "s.gks")
+    app.save_scene(path)
+    app.clear_objects()
+    app.window_clipping.clear()
+    app.load_scene(path)
+    assert app.scene.n == 1 and app.objects_2d[0].obj_type == "square"
+    assert [(p.x, p.y) for p in app.window_clipping] == [(-1, -1), (0.5, 0.5)]
+    assert len(app.history) == 0
@@ -0,0 +1,105 @@
+"""
+Cache teks untuk overlay UI.
+
+Font dibuat sekali, dan setiap string yang pernah digambar disimpan sebagai
+tekstur GL. Frame berikutnya cukup menggambar satu quad bertekstur per baris;
+font.render + tostring + upload hanya terjadi ketika teksnya berubah.
+"""
+from collections import OrderedDict
+
+import pygame
+from OpenGL.GL import *
+
+
+class TextCache:
+    def __init__(self, font_name="Arial", size=18, color=(255, 255, 255), max_entries=64):
+        self.font_name = font_name
+        self.size = size
+        self.color = color
+        self.max_entries = max_entries
+        self._font = None
+        self.entries: OrderedDict = OrderedDict()   # teks -> (tex, w, h)
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def font(self):
+        if self._font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            self._font = pygame.font.SysFont(self.font_name, self.size)
+        return self._font
+
+    def get(self, txt):
+        entry = self.entries.get(txt)
+        if entry is not None:
+            self.hits += 1
+            self.entries.move_to_end(txt)
+            return entry
+
+        self.misses += 1
+        surf = self.font.render(txt, True, self.color)
+        w, h = surf.get_size()
+        data = pygame.image.tostring(surf, "RGBA", True)
+
+        tex = glGenTextures(1)
+        glBindTexture(GL_TEXTURE_2D, tex)
+        glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_NEAREST)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_NEAREST)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, w, h, 0, GL_RGBA, GL_UNSIGNED_BYTE, data)
+        glBindTexture(GL_TEXTURE_2D, 0)
+
+        entry = (tex, w, h)
+        self.entries[txt] = entry
+        if len(self.entries) > self.max_entries:
+            _, (old_tex, _, _) = self.entries.popitem(last=False)
+            glDeleteTextures([old_tex])
+        return entry
+
+    def begin(self, width, height):
+        """Siapkan proyeksi piksel jendela; panggil sekali sebelum beberapa draw()."""
+        glMatrixMode(GL_PROJECTION)
+        glPushMatrix()
+        glLoadIdentity()
+        glOrtho(0, width, 0, height, -1, 1)
+        glMatrixMode(GL_MODELVIEW)
+        glPushMatrix()
+        glLoadIdentity()
+        glEnable(GL_TEXTURE_2D)
+        glTexEnvi(GL_TEXTURE_ENV, GL_TEXTURE_ENV_MODE, GL_REPLACE)
+        glEnable(GL_BLEND)
+        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+
+    def end(self):
+        glDisable(GL_BLEND)
+        glBindTexture(GL_TEXTURE_2D, 0)
+        glDisable(GL_TEXTURE_2D)
+        glMatrixMode(GL_PROJECTION)
+        glPopMatrix()
+        glMatrixMode(GL_MODELVIEW)
+        glPopMatrix()
+
+    def draw(self, x, y, txt):
+        """Gambar teks di window-coords (x, y = pojok kiri bawah), setara draw_text."""
+        if not txt:
+            # font.render("") menghasilkan surface lebar 0/1 piksel, tidak perlu digambar
+            return
+        tex, w, h = self.get(txt)
+        glBindTexture(GL_TEXTURE_2D, tex)
+        glBegin(GL_QUADS)
+        glTexCoord2f(0, 0)
+        glVertex2f(x, y)
+        glTexCoord2f(1, 0)
+        glVertex2f(x + w, y)
+        glTexCoord2f(1, 1)
+        glVertex2f(x + w, y + h)
+        glTexCoord2f(0, 1)
+        glVertex2f(x, y + h)
+        glEnd()
+
+    def invalidate_gl(self):
+        """Konteks GL dibuat ulang: tekstur lama tidak berlaku lagi."""
+        self.entries.clear()